@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compare extracting joint data in batches to extracting it after a full traversal.
+
+Writes robots whose joints carry `NewtonJointAPI`, and reads the Newton joint attributes of every
+joint, either with `extract_layout` followed by a read of each joint (the consumer waits for the
+full traversal), or with `iter_schema_batches`, whose first batch is available early.
+"""
+
+import argparse
+import time
+
+from pxr import Sdf, Usd
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas._schema import schema_definition
+from newton_usd_schemas.batches import iter_schema_batches
+from newton_usd_schemas.extraction import extract_layout
+
+
+def _stage(robots: int, joints: int) -> Usd.Stage:
+    stage = Usd.Stage.CreateInMemory()
+    layer = stage.GetRootLayer()
+    with Sdf.ChangeBlock():
+        Sdf.CreatePrimInLayer(layer, "/World").specifier = Sdf.SpecifierDef
+        for robot in range(robots):
+            parent = Sdf.CreatePrimInLayer(layer, f"/World/Robot{robot}")
+            parent.specifier = Sdf.SpecifierDef
+            for index in range(joints):
+                Sdf.PrimSpec(parent, f"Body{index}", Sdf.SpecifierDef, "Xform")
+                joint = Sdf.PrimSpec(parent, f"Joint{index}", Sdf.SpecifierDef, "PhysicsRevoluteJoint")
+                joint.SetInfo("apiSchemas", Sdf.TokenListOp.Create(prependedItems=["NewtonJointAPI"]))
+                Sdf.AttributeSpec(joint, "newton:armature", Sdf.ValueTypeNames.Float).default = 0.01 * index
+    return stage
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--robots", type=int, default=512, help="number of robots")
+    parser.add_argument("--joints", type=int, default=24, help="joints (and bodies) per robot")
+    parser.add_argument("--batch-size", type=int, default=4096, help="joints per batch")
+    args = parser.parse_args()
+
+    stage = _stage(args.robots, args.joints)
+    names = schema_definition("NewtonJointAPI").GetPropertyNames()
+
+    start = time.perf_counter()
+    layout = extract_layout(stage, ["PhysicsJoint"])
+    for path in layout.paths["PhysicsJoint"]:
+        prim = stage.GetPrimAtPath(path)
+        [prim.GetAttribute(name).Get() for name in names]
+    # no data is available before every joint is read
+    total = time.perf_counter() - start
+    print(f"{'full traversal':<16} first data {total:7.3f} s, total {total:7.3f} s")
+
+    start = time.perf_counter()
+    first = None
+    for _ in iter_schema_batches(stage, {"PhysicsJoint": ("NewtonJointAPI",)}, batch_size=args.batch_size):
+        if first is None:
+            first = time.perf_counter() - start
+    print(f"{'batches':<16} first data {first:7.3f} s, total {time.perf_counter() - start:7.3f} s")
+
+
+if __name__ == "__main__":
+    main()
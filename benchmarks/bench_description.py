@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compare compiling a `NewtonSceneDescription` to unpickling a compiled one.
+
+Writes robots whose bodies, colliders and joints carry Newton schemas, compiles every section
+of their description from the stage, and then pickles and unpickles it, with out-of-band
+buffers (pickle protocol 5) and in-band.
+"""
+
+import argparse
+import pickle
+import time
+
+from pxr import Sdf, Usd
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.description import SCENE_SECTIONS, NewtonSceneDescription
+
+
+def _stage(robots: int, joints: int) -> Usd.Stage:
+    stage = Usd.Stage.CreateInMemory()
+    layer = stage.GetRootLayer()
+    with Sdf.ChangeBlock():
+        Sdf.CreatePrimInLayer(layer, "/World").specifier = Sdf.SpecifierDef
+        Sdf.PrimSpec(layer.GetPrimAtPath("/World"), "PhysicsScene", Sdf.SpecifierDef, "PhysicsScene")
+        for robot in range(robots):
+            parent = Sdf.CreatePrimInLayer(layer, f"/World/Robot{robot}")
+            parent.specifier = Sdf.SpecifierDef
+            for index in range(joints):
+                body = Sdf.PrimSpec(parent, f"Body{index}", Sdf.SpecifierDef, "Xform")
+                body.SetInfo("apiSchemas", Sdf.TokenListOp.Create(prependedItems=["PhysicsRigidBodyAPI", "NewtonMassAPI"]))
+                Sdf.AttributeSpec(body, "physics:mass", Sdf.ValueTypeNames.Float).default = 1.0 + index
+                collider = Sdf.PrimSpec(body, "Collider", Sdf.SpecifierDef, "Cube")
+                collider.SetInfo("apiSchemas", Sdf.TokenListOp.Create(prependedItems=["PhysicsCollisionAPI", "NewtonCollisionAPI"]))
+                joint = Sdf.PrimSpec(parent, f"Joint{index}", Sdf.SpecifierDef, "PhysicsRevoluteJoint")
+                joint.SetInfo("apiSchemas", Sdf.TokenListOp.Create(prependedItems=["NewtonJointAPI"]))
+                Sdf.RelationshipSpec(joint, "physics:body1", custom=False).targetPathList.explicitItems = [body.path]
+                if index:
+                    Sdf.RelationshipSpec(joint, "physics:body0", custom=False).targetPathList.explicitItems = [
+                        parent.path.AppendChild(f"Body{index - 1}")
+                    ]
+                Sdf.AttributeSpec(joint, "newton:armature", Sdf.ValueTypeNames.Float).default = 0.01 * index
+    return stage
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--robots", type=int, default=256, help="number of robots")
+    parser.add_argument("--joints", type=int, default=24, help="joints (and bodies) per robot")
+    args = parser.parse_args()
+
+    stage = _stage(args.robots, args.joints)
+
+    start = time.perf_counter()
+    description = NewtonSceneDescription(stage)
+    for name in SCENE_SECTIONS:
+        description.section(name)
+    print(f"{'compile':<16} {time.perf_counter() - start:9.3f} s")
+
+    start = time.perf_counter()
+    buffers = []
+    data = pickle.dumps(description, protocol=5, buffer_callback=buffers.append)
+    size = len(data) + sum(buffer.raw().nbytes for buffer in buffers)
+    restored = pickle.loads(data, buffers=buffers)
+    for name in SCENE_SECTIONS:
+        restored.section(name)
+    print(f"{'out-of-band':<16} {time.perf_counter() - start:9.3f} s, {size / 1e6:.2f} MB")
+
+    start = time.perf_counter()
+    data = pickle.dumps(description, protocol=4)
+    restored = pickle.loads(data)
+    for name in SCENE_SECTIONS:
+        restored.section(name)
+    print(f"{'in-band':<16} {time.perf_counter() - start:9.3f} s, {len(data) / 1e6:.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
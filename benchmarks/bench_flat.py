@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compare reading a flat asset with and without opening a `Usd.Stage`.
+
+Writes a single-layer `.usdc` asset of robots with `NewtonJointAPI` joints and `NewtonMassAPI`
+bodies, then reads their Newton attributes by opening a stage (`read_stage_values`) and
+directly from the layer's specs (`read_layer_values`). Each reader opens its own copy of the
+asset, so neither benefits from the other's layer being cached in the layer registry.
+"""
+
+import argparse
+import pathlib
+import shutil
+import tempfile
+import time
+
+import numpy as np
+from pxr import Sdf, Usd
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.flat import read_layer_values, read_stage_values
+
+ATTRIBUTES = {
+    "NewtonJointAPI": ["newton:armature", "newton:damping", "newton:friction", "newton:velocityLimit"],
+    "NewtonMassAPI": ["newton:massModel", "newton:inertia"],
+}
+
+
+def _write_asset(path: str, robots: int, joints: int) -> None:
+    layer = Sdf.Layer.CreateNew(path)
+    with Sdf.ChangeBlock():
+        world = Sdf.CreatePrimInLayer(layer, "/World")
+        world.specifier = Sdf.SpecifierDef
+        world.typeName = "Xform"
+        layer.defaultPrim = "World"
+        for robot in range(robots):
+            for index in range(joints):
+                body = Sdf.CreatePrimInLayer(layer, f"/World/Robot{robot}/Body{index}")
+                body.specifier = Sdf.SpecifierDef
+                body.typeName = "Xform"
+                body.SetInfo("apiSchemas", Sdf.TokenListOp.Create(prependedItems=["PhysicsRigidBodyAPI", "NewtonMassAPI"]))
+                joint = Sdf.PrimSpec(body, "Joint", Sdf.SpecifierDef, "PhysicsRevoluteJoint")
+                joint.SetInfo("apiSchemas", Sdf.TokenListOp.Create(prependedItems=["NewtonJointAPI"]))
+                for name in ("newton:armature", "newton:damping", "newton:friction"):
+                    Sdf.AttributeSpec(joint, name, Sdf.ValueTypeNames.Float).default = 0.01 * index
+            Sdf.CreatePrimInLayer(layer, f"/World/Robot{robot}").specifier = Sdf.SpecifierDef
+    layer.Save()
+
+
+def _report(label: str, seconds: float, prims: int) -> None:
+    print(f"{label:<16} {seconds:9.3f} s {prims / seconds / 1e3:10.1f} k prims/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--robots", type=int, default=1024, help="number of robots in the asset")
+    parser.add_argument("--joints", type=int, default=24, help="joints (and bodies) per robot")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        stage_asset = pathlib.Path(directory, "stage.usdc").as_posix()
+        layer_asset = pathlib.Path(directory, "layer.usdc").as_posix()
+        _write_asset(stage_asset, args.robots, args.joints)
+        shutil.copyfile(stage_asset, layer_asset)
+        prims = 2 * args.robots * args.joints
+
+        start = time.perf_counter()
+        composed = read_stage_values(Usd.Stage.Open(stage_asset), ATTRIBUTES)
+        _report("stage", time.perf_counter() - start, prims)
+
+        start = time.perf_counter()
+        flat = read_layer_values(Sdf.Layer.FindOrOpen(layer_asset), ATTRIBUTES)
+        _report("layer", time.perf_counter() - start, prims)
+
+    for schema, names in ATTRIBUTES.items():
+        assert len(flat.layout.paths[schema]) == len(composed.layout.paths[schema])
+        for name in names:
+            assert np.array_equal(flat.values[schema][name], composed.values[schema][name])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compare extraction of instanced robots per instance and per prototype.
+
+Builds a stage of instanceable robot clones, each with `NewtonJointAPI` and `NewtonMassAPI`
+prims, then extracts the `newton:armature` of every joint by traversing every instance proxy
+(`extract_layout`) and by traversing each prototype once (`extract_instanced_layout`).
+"""
+
+import argparse
+import time
+
+import numpy as np
+from pxr import Sdf, Usd, UsdPhysics
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.extraction import extract_layout
+from newton_usd_schemas.instancing import extract_instanced_layout, read_prototype_values
+
+SCHEMAS = ["NewtonJointAPI", "NewtonMassAPI"]
+
+
+def _robot(joints: int) -> Usd.Stage:
+    stage = Usd.Stage.CreateInMemory()
+    stage.SetDefaultPrim(stage.DefinePrim("/Robot", "Xform"))
+    for index in range(joints):
+        body = stage.DefinePrim(f"/Robot/Body{index}", "Xform")
+        body.ApplyAPI("NewtonMassAPI")
+        joint = UsdPhysics.RevoluteJoint.Define(stage, f"/Robot/Body{index}/Joint").GetPrim()
+        joint.ApplyAPI("NewtonJointAPI")
+        joint.GetAttribute("newton:armature").Set(0.01 * index)
+    return stage
+
+
+def _report(label: str, seconds: float, rows: int) -> None:
+    print(f"{label:<32} {seconds:9.3f} s {rows / seconds / 1e3:10.1f} k joints/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--instances", type=int, default=4096, help="number of robot clones")
+    parser.add_argument("--joints", type=int, default=24, help="joints per robot")
+    args = parser.parse_args()
+
+    robot = _robot(args.joints)
+    stage = Usd.Stage.CreateInMemory()
+    with Sdf.ChangeBlock():
+        Sdf.CreatePrimInLayer(stage.GetRootLayer(), "/World").specifier = Sdf.SpecifierDef
+        for index in range(args.instances):
+            spec = Sdf.CreatePrimInLayer(stage.GetRootLayer(), f"/World/Robot{index}")
+            spec.specifier = Sdf.SpecifierDef
+            spec.referenceList.Prepend(Sdf.Reference(robot.GetRootLayer().identifier))
+            spec.SetInfo("instanceable", True)
+    joints = args.instances * args.joints
+
+    start = time.perf_counter()
+    layout = extract_layout(stage, SCHEMAS, Usd.TraverseInstanceProxies(Usd.PrimDefaultPredicate))
+    armature = np.array([stage.GetPrimAtPath(path).GetAttribute("newton:armature").Get() for path in layout.paths["NewtonJointAPI"]])
+    _report("per instance", time.perf_counter() - start, joints)
+
+    start = time.perf_counter()
+    instanced = extract_instanced_layout(stage, SCHEMAS)
+    rows, _ = instanced.instance_rows("NewtonJointAPI")
+    expanded = read_prototype_values(stage, instanced, "NewtonJointAPI", "newton:armature")[rows]
+    _report("per prototype", time.perf_counter() - start, joints)
+
+    assert len(rows) == joints
+    assert np.array_equal(armature, expanded)
+
+
+if __name__ == "__main__":
+    main()
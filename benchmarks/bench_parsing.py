@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compare joining Newton joint data to `UsdPhysics` descriptors by path and by index.
+
+Writes robots whose bodies and joints carry `NewtonMassAPI` and `NewtonJointAPI`, parses them
+with `UsdPhysics.LoadUsdPhysicsFromRange`, and then reads the Newton attributes of each joint
+and body descriptor, either with `extract_layout` and a path-string keyed dictionary (the
+separate pass), or with `load_newton_from_range` (aligned by index).
+"""
+
+import argparse
+import time
+
+from pxr import Sdf, Usd, UsdPhysics
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.extraction import extract_layout
+from newton_usd_schemas.parsing import load_newton_from_range
+
+SCHEMAS = ("NewtonJointAPI", "NewtonMassAPI")
+
+
+def _stage(robots: int, joints: int) -> Usd.Stage:
+    stage = Usd.Stage.CreateInMemory()
+    layer = stage.GetRootLayer()
+    with Sdf.ChangeBlock():
+        for robot in range(robots):
+            for index in range(joints):
+                body = Sdf.CreatePrimInLayer(layer, f"/World/Robot{robot}/Body{index}")
+                body.specifier = Sdf.SpecifierDef
+                body.typeName = "Xform"
+                body.SetInfo("apiSchemas", Sdf.TokenListOp.Create(prependedItems=["PhysicsRigidBodyAPI", "NewtonMassAPI"]))
+                joint = Sdf.PrimSpec(body, "Joint", Sdf.SpecifierDef, "PhysicsRevoluteJoint")
+                joint.SetInfo("apiSchemas", Sdf.TokenListOp.Create(prependedItems=["NewtonJointAPI"]))
+                Sdf.RelationshipSpec(joint, "physics:body1", custom=False).targetPathList.explicitItems = [body.path]
+                Sdf.AttributeSpec(joint, "newton:armature", Sdf.ValueTypeNames.Float).default = 0.01 * index
+            Sdf.CreatePrimInLayer(layer, f"/World/Robot{robot}").specifier = Sdf.SpecifierDef
+        Sdf.CreatePrimInLayer(layer, "/World").specifier = Sdf.SpecifierDef
+    return stage
+
+
+def _by_path(stage: Usd.Stage, physics: dict) -> None:
+    layout = extract_layout(stage, SCHEMAS)
+    values = {}
+    for schema in SCHEMAS:
+        names = Usd.SchemaRegistry().FindAppliedAPIPrimDefinition(schema).GetPropertyNames()
+        for path in layout.paths[schema]:
+            prim = stage.GetPrimAtPath(path)
+            values[str(path)] = {name: prim.GetAttribute(name).Get() for name in names if prim.HasAttribute(name)}
+    for object_type in (UsdPhysics.ObjectType.RevoluteJoint, UsdPhysics.ObjectType.RigidBody):
+        paths, _ = physics[object_type]
+        [values.get(str(path)) for path in paths]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--robots", type=int, default=256, help="number of robots")
+    parser.add_argument("--joints", type=int, default=24, help="joints (and bodies) per robot")
+    args = parser.parse_args()
+
+    stage = _stage(args.robots, args.joints)
+
+    start = time.perf_counter()
+    # `LoadUsdPhysicsFromRange` is deprecated in favor of `UsdPhysicsLoadStageFromPrimRange` in recent USD releases
+    load = getattr(UsdPhysics, "UsdPhysicsLoadStageFromPrimRange", None) or UsdPhysics.LoadUsdPhysicsFromRange
+    physics = load(stage, [Sdf.Path("/World")], [])
+    print(f"{'usd physics':<12} {time.perf_counter() - start:9.3f} s")
+
+    start = time.perf_counter()
+    _by_path(stage, physics)
+    print(f"{'by path':<12} {time.perf_counter() - start:9.3f} s")
+
+    start = time.perf_counter()
+    load_newton_from_range(stage, ["/World"], physics=physics)
+    print(f"{'by index':<12} {time.perf_counter() - start:9.3f} s")
+
+
+if __name__ == "__main__":
+    main()
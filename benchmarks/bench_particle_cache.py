@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compare sequential and random frame access of a particle cache.
+
+Records a synthetic rollout with `write_particle_cache`, then reads every frame in order
+and in a shuffled order, both through `ParticleCache` and through stage value resolution
+(`UsdAttribute.Get`), reporting frame and particle throughput for each.
+"""
+
+import argparse
+import pathlib
+import tempfile
+import time
+
+import numpy as np
+from pxr import Usd, UsdGeom
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.particle_cache import ParticleCache, write_particle_cache
+from newton_usd_schemas.particle_io import ParticleArrays
+
+
+def _frames(particles: int, frames: int, seed: int):
+    rng = np.random.default_rng(seed)
+    points = rng.random((particles, 3), dtype=np.float32)
+    velocities = np.zeros_like(points)
+    for frame in range(frames):
+        yield float(frame), ParticleArrays(points=points + frame, velocities=velocities)
+
+
+def _report(label: str, seconds: float, frames: int, particles: int) -> None:
+    print(f"{label:<32} {seconds:9.3f} s {frames / seconds:10.1f} frames/s {frames * particles / seconds / 1e6:10.1f} M particles/s")
+
+
+def _open(root: pathlib.Path) -> Usd.Stage:
+    stage = Usd.Stage.Open((root / "asset.usda").as_posix())
+    stage.GetSessionLayer().subLayerPaths.append((root / "cache.usda").as_posix())
+    return stage
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--particles", type=int, default=1_000_000, help="particles per frame")
+    parser.add_argument("--frames", type=int, default=64, help="number of recorded frames")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = pathlib.Path(tmpdir)
+        stage = Usd.Stage.CreateNew((root / "asset.usda").as_posix())
+        prim = UsdGeom.Points.Define(stage, "/Particles").GetPrim()
+        prim.ApplyAPI("NewtonPointsDeformableSimAPI")
+        stage.Save()
+
+        start = time.perf_counter()
+        write_particle_cache(root / "cache.usda", "/Particles", _frames(args.particles, args.frames, args.seed))
+        _report("write", time.perf_counter() - start, args.frames, args.particles)
+
+        orders = {
+            "sequential": np.arange(args.frames),
+            "random": np.random.default_rng(args.seed).permutation(args.frames),
+        }
+        # every pass opens a fresh stage, so no pass benefits from clip layers opened by another
+        for name, order in orders.items():
+            playback = _open(root)
+            start = time.perf_counter()
+            cache = ParticleCache(playback.GetPrimAtPath("/Particles"))
+            for index in order:
+                cache.read_frame(int(index)).points.sum()
+            _report(f"ParticleCache {name}", time.perf_counter() - start, args.frames, args.particles)
+
+        for name, order in orders.items():
+            playback = _open(root)
+            points = UsdGeom.Points(playback.GetPrimAtPath("/Particles")).GetPointsAttr()
+            start = time.perf_counter()
+            for index in order:
+                np.asarray(points.Get(float(index))).sum()
+            _report(f"UsdAttribute.Get {name}", time.perf_counter() - start, args.frames, args.particles)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Split a library of render-heavy robot assets, then compare loading them in full and physics-only.
+
+Writes robots whose bodies carry a collider and a dense visual mesh, splits the library with
+`split_assets` using one worker and the default process pool, and then opens every split asset
+with all payloads loaded and with `open_physics_payload`, summing the points of each prim.
+"""
+
+import argparse
+import pathlib
+import tempfile
+import time
+
+import numpy as np
+from pxr import Sdf, Usd, Vt
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.payloads import open_physics_payload, split_assets
+
+
+def _write_robot(path: str, bodies: int, points: int) -> None:
+    layer = Sdf.Layer.CreateNew(path)
+    positions = Vt.Vec3fArray.FromNumpy(np.random.default_rng(0).random((points, 3), dtype=np.float32))
+    with Sdf.ChangeBlock():
+        robot = Sdf.CreatePrimInLayer(layer, "/Robot")
+        robot.specifier = Sdf.SpecifierDef
+        robot.typeName = "Xform"
+        layer.defaultPrim = "Robot"
+        for index in range(bodies):
+            body = Sdf.PrimSpec(robot, f"Body{index}", Sdf.SpecifierDef, "Xform")
+            body.SetInfo("apiSchemas", Sdf.TokenListOp.Create(prependedItems=["PhysicsRigidBodyAPI", "NewtonMassAPI"]))
+            collider = Sdf.PrimSpec(body, "Collider", Sdf.SpecifierDef, "Cube")
+            collider.SetInfo("apiSchemas", Sdf.TokenListOp.Create(prependedItems=["PhysicsCollisionAPI"]))
+            joint = Sdf.PrimSpec(body, "Joint", Sdf.SpecifierDef, "PhysicsRevoluteJoint")
+            joint.SetInfo("apiSchemas", Sdf.TokenListOp.Create(prependedItems=["NewtonJointAPI"]))
+            visual = Sdf.PrimSpec(body, "Visual", Sdf.SpecifierDef, "Mesh")
+            Sdf.AttributeSpec(visual, "points", Sdf.ValueTypeNames.Point3fArray).default = positions
+            Sdf.AttributeSpec(visual, "primvars:st", Sdf.ValueTypeNames.TexCoord2fArray).default = Vt.Vec2fArray(points)
+    layer.Save()
+
+
+def _read(stage: Usd.Stage) -> int:
+    prims = 0
+    for prim in stage.Traverse():
+        prims += 1
+        if prim.HasAttribute("points"):
+            np.asarray(prim.GetAttribute("points").Get()).sum()
+    return prims
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--assets", type=int, default=32, help="number of assets in the library")
+    parser.add_argument("--bodies", type=int, default=32, help="bodies per robot")
+    parser.add_argument("--points", type=int, default=20000, help="points per visual mesh")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        assets = [pathlib.Path(directory, f"robot{index}.usdc").as_posix() for index in range(args.assets)]
+        for asset in assets:
+            _write_robot(asset, args.bodies, args.points)
+
+        for label, workers in (("split serial", 1), ("split pool", None)):
+            start = time.perf_counter()
+            splits = split_assets(assets, pathlib.Path(directory, label.replace(" ", "_")), max_workers=workers)
+            print(f"{label:<14} {time.perf_counter() - start:9.3f} s")
+
+        for label, open_stage in (("load full", lambda root: Usd.Stage.Open(root.as_posix())), ("load physics", open_physics_payload)):
+            start = time.perf_counter()
+            prims = sum(_read(open_stage(split.root)) for split in splits)
+            print(f"{label:<14} {time.perf_counter() - start:9.3f} s {prims:9d} prims")
+
+
+if __name__ == "__main__":
+    main()
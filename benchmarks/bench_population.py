@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compare opening a render-heavy scene in full and with its physics population mask.
+
+Writes a scene of robots (rigid bodies with colliders and joints) next to many render-only
+meshes, looks and lights, computes its physics population mask once, then opens and traverses
+the scene in fresh worker processes, with and without the mask, reporting the time and the
+peak resident memory of each worker.
+"""
+
+import argparse
+import json
+import pathlib
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from pxr import Sdf, Usd, Vt
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.population import physics_population_mask
+
+
+def _write_scene(path: str, robots: int, joints: int, props: int, points: int) -> None:
+    layer = Sdf.Layer.CreateNew(path)
+    positions = Vt.Vec3fArray(points)
+    indices = Vt.IntArray(list(range(points)))
+    counts = Vt.IntArray([3] * (points // 3))
+
+    def define(prim_path: str, type_name: str, api_schemas: tuple[str, ...] = ()) -> Sdf.PrimSpec:
+        spec = Sdf.CreatePrimInLayer(layer, prim_path)
+        spec.specifier = Sdf.SpecifierDef
+        spec.typeName = type_name
+        if api_schemas:
+            spec.SetInfo("apiSchemas", Sdf.TokenListOp.Create(prependedItems=list(api_schemas)))
+        return spec
+
+    def mesh(prim_path: str) -> None:
+        spec = define(prim_path, "Mesh")
+        Sdf.AttributeSpec(spec, "points", Sdf.ValueTypeNames.Point3fArray).default = positions
+        Sdf.AttributeSpec(spec, "faceVertexIndices", Sdf.ValueTypeNames.IntArray).default = indices
+        Sdf.AttributeSpec(spec, "faceVertexCounts", Sdf.ValueTypeNames.IntArray).default = counts
+
+    with Sdf.ChangeBlock():
+        define("/World", "Xform")
+        define("/World/PhysicsScene", "PhysicsScene", ("NewtonSceneAPI",))
+        for robot in range(robots):
+            for index in range(joints):
+                body = f"/World/Robots/Robot{robot}/Body{index}"
+                define(body, "Xform", ("PhysicsRigidBodyAPI", "NewtonMassAPI"))
+                define(f"{body}/Collider", "Cube", ("PhysicsCollisionAPI",))
+                define(f"{body}/Joint", "PhysicsRevoluteJoint", ("NewtonJointAPI",))
+        for prop in range(props):
+            mesh(f"/World/Set/Prop{prop}/Mesh")
+            define(f"/World/Looks/Look{prop}", "Material")
+            define(f"/World/Looks/Look{prop}/Shader", "Shader")
+        for light in range(props // 10):
+            define(f"/World/Lights/Light{light}", "SphereLight")
+        for prim_path in ("/World/Robots", "/World/Set", "/World/Looks", "/World/Lights"):
+            layer.GetPrimAtPath(prim_path).specifier = Sdf.SpecifierDef
+        for robot in range(robots):
+            layer.GetPrimAtPath(f"/World/Robots/Robot{robot}").specifier = Sdf.SpecifierDef
+        for prop in range(props):
+            layer.GetPrimAtPath(f"/World/Set/Prop{prop}").specifier = Sdf.SpecifierDef
+    layer.Save()
+
+
+def _worker(path: str, mask_path: str | None) -> None:
+    start = time.perf_counter()
+    if mask_path:
+        paths = json.loads(pathlib.Path(mask_path).read_text())
+        stage = Usd.Stage.OpenMasked(path, Usd.StagePopulationMask(paths))
+    else:
+        stage = Usd.Stage.Open(path)
+    prims = sum(1 for _ in stage.Traverse())
+    seconds = time.perf_counter() - start
+    print(json.dumps({"seconds": seconds, "prims": prims, "rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}))
+
+
+def _run(path: str, mask_path: str | None) -> dict:
+    args = [sys.executable, __file__, "--worker", path] + (["--mask", mask_path] if mask_path else [])
+    return json.loads(subprocess.run(args, check=True, capture_output=True, text=True).stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--robots", type=int, default=64, help="number of robots")
+    parser.add_argument("--joints", type=int, default=24, help="bodies (and joints) per robot")
+    parser.add_argument("--props", type=int, default=20000, help="number of render-only meshes and looks")
+    parser.add_argument("--points", type=int, default=300, help="points per render mesh")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--mask", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        _worker(args.worker, args.mask)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory, "scene.usdc").as_posix()
+        _write_scene(path, args.robots, args.joints, args.props, args.points)
+
+        start = time.perf_counter()
+        mask = physics_population_mask(path)
+        print(f"{'pre-scan':<8} {time.perf_counter() - start:9.3f} s")
+        mask_path = pathlib.Path(directory, "mask.json").as_posix()
+        pathlib.Path(mask_path).write_text(json.dumps([str(masked) for masked in mask.GetPaths()]))
+
+        for label, worker_mask in (("full", None), ("masked", mask_path)):
+            result = _run(path, worker_mask)
+            print(f"{label:<8} {result['seconds']:9.3f} s {result['prims']:9d} prims {result['rss'] / 1024:9.1f} MiB peak RSS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compare replication of an environment template with `Sdf.CopySpec` and with `Usd` edits.
+
+Authors a robot template with `NewtonJointAPI` joints and `NewtonPDControlAPI` actuators, then
+clones it with per-clone randomized `newton:friction` and `newton:kp`, using `replicate` and
+using one `Usd` edit per prim and attribute, reporting the time to author and compose the clones.
+"""
+
+import argparse
+import time
+
+import numpy as np
+from pxr import Usd, UsdPhysics
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.replication import replicate
+
+
+def _template(stage: Usd.Stage, joints: int) -> None:
+    stage.DefinePrim("/Template", "Xform")
+    for index in range(joints):
+        stage.DefinePrim(f"/Template/Body{index}", "Xform").ApplyAPI("PhysicsRigidBodyAPI")
+        UsdPhysics.RevoluteJoint.Define(stage, f"/Template/Body{index}/Joint").GetPrim().ApplyAPI("NewtonJointAPI")
+        actuator = stage.DefinePrim(f"/Template/Body{index}/Actuator", "NewtonActuator")
+        actuator.ApplyAPI("NewtonPDControlAPI")
+        actuator.GetRelationship("newton:targets").SetTargets([f"/Template/Body{index}/Joint"])
+
+
+def _usd_replicate(stage: Usd.Stage, clones: list[str], friction: np.ndarray, kp: np.ndarray) -> None:
+    template = stage.GetPrimAtPath("/Template")
+    for clone, clone_friction, clone_kp in zip(clones, friction.tolist(), kp.tolist(), strict=True):
+        stage.DefinePrim(clone).GetReferences().AddInternalReference(template.GetPath())
+        stage.GetPrimAtPath(f"{clone}/Body0/Joint").GetAttribute("newton:friction").Set(clone_friction)
+        stage.GetPrimAtPath(f"{clone}/Body0/Actuator").GetAttribute("newton:kp").Set(clone_kp)
+
+
+def _report(label: str, count: int, stage: Usd.Stage, start: float) -> None:
+    authored = time.perf_counter()
+    prims = sum(1 for _ in stage.Traverse())
+    traversed = time.perf_counter()
+    print(f"{label:<10} {count:>6} clones {authored - start:9.3f} s authoring {traversed - authored:9.3f} s traversing {prims} prims")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clones", type=int, nargs="+", default=[4096, 16384], help="numbers of clones")
+    parser.add_argument("--joints", type=int, default=12, help="joints per robot")
+    parser.add_argument("--usd-edits", action="store_true", help="also time one Usd edit per clone, which is much slower")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    for count in args.clones:
+        clones = [f"/World/envs/env_{index}" for index in range(count)]
+        friction = rng.uniform(0.0, 1.0, count).astype(np.float32)
+        kp = rng.uniform(50.0, 150.0, count).astype(np.float32)
+
+        stage = Usd.Stage.CreateInMemory()
+        _template(stage, args.joints)
+        start = time.perf_counter()
+        replicate(stage.GetRootLayer(), "/Template", clones, {"Body0/Joint.newton:friction": friction, "Body0/Actuator.newton:kp": kp})
+        _report("replicate", count, stage, start)
+
+        if args.usd_edits:
+            stage = Usd.Stage.CreateInMemory()
+            _template(stage, args.joints)
+            start = time.perf_counter()
+            _usd_replicate(stage, clones, friction, kp)
+            _report("Usd edits", count, stage, start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compare parsing a stage in every worker to attaching to arrays exported once.
+
+Writes a file with many joints and actuator arrays, then starts `--workers` spawned processes
+which either open the file and extract the joint DOF and actuator arrays themselves, or attach
+to the arrays which the parent exported with `export_shared_arrays`.
+"""
+
+import argparse
+import json
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+
+from pxr import Sdf, Usd
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.actuators import read_actuator_arrays
+from newton_usd_schemas.joints import read_joint_dofs
+from newton_usd_schemas.shared import attach_shared_arrays, export_shared_arrays
+
+
+def _write(path: Path, robots: int, joints: int) -> None:
+    layer = Sdf.Layer.CreateNew(str(path))
+    with Sdf.ChangeBlock():
+        Sdf.CreatePrimInLayer(layer, "/World").specifier = Sdf.SpecifierDef
+        for robot in range(robots):
+            parent = Sdf.CreatePrimInLayer(layer, f"/World/Robot{robot}")
+            parent.specifier = Sdf.SpecifierDef
+            targets = []
+            for index in range(joints):
+                joint = Sdf.PrimSpec(parent, f"Joint{index}", Sdf.SpecifierDef, "PhysicsRevoluteJoint")
+                joint.SetInfo("apiSchemas", Sdf.TokenListOp.Create(prependedItems=["NewtonJointAPI"]))
+                Sdf.AttributeSpec(joint, "newton:armature", Sdf.ValueTypeNames.Float).default = 0.01 * index
+                targets.append(joint.path)
+            actuators = Sdf.PrimSpec(parent, "Actuators", Sdf.SpecifierDef, "NewtonActuatorArray")
+            Sdf.RelationshipSpec(actuators, "newton:targets", custom=False).targetPathList.explicitItems = targets
+            Sdf.AttributeSpec(actuators, "newton:kp", Sdf.ValueTypeNames.FloatArray).default = [100.0] * joints
+    layer.Save()
+
+
+def _parse(path: str, queue) -> None:
+    start = time.perf_counter()
+    stage = Usd.Stage.Open(path)
+    joints = read_joint_dofs(stage)
+    actuators = read_actuator_arrays(stage)
+    queue.put((time.perf_counter() - start, joints.parameters["armature"].sum() + actuators.parameters["kp"].sum()))
+
+
+def _attach(manifest: str, queue) -> None:
+    start = time.perf_counter()
+    with attach_shared_arrays(manifest) as arrays:
+        queue.put((time.perf_counter() - start, arrays["joints"]["parameters/armature"].sum() + arrays["actuators"]["parameters/kp"].sum()))
+
+
+def _run(target, arg: str, workers: int) -> float:
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    processes = [context.Process(target=target, args=(arg, queue)) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    elapsed = [queue.get()[0] for _ in processes]
+    for process in processes:
+        process.join()
+    return max(elapsed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--robots", type=int, default=512, help="number of robots")
+    parser.add_argument("--joints", type=int, default=24, help="joints per robot")
+    parser.add_argument("--workers", type=int, default=4, help="number of worker processes")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "scene.usdc"
+        _write(path, args.robots, args.joints)
+        print(f"{'parse':<8} {_run(_parse, str(path), args.workers):9.3f} s per worker")
+
+        start = time.perf_counter()
+        stage = Usd.Stage.Open(str(path))
+        shared = export_shared_arrays({"joints": read_joint_dofs(stage), "actuators": read_actuator_arrays(stage)})
+        print(f"{'export':<8} {time.perf_counter() - start:9.3f} s once, {shared.manifest['size'] / 1e6:.2f} MB")
+        with shared:
+            print(f"{'attach':<8} {_run(_attach, json.dumps(shared.manifest), args.workers):9.3f} s per worker")
+
+
+if __name__ == "__main__":
+    main()
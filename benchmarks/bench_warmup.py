@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compare the first-access latency of forked workers with and without `warmup`.
+
+Runs a fresh parent process per mode, which imports `newton_usd_schemas`, optionally calls
+`warmup`, and forks workers. Each worker times its first access of Newton schemas: authoring a
+small robot scene and reading back every Newton attribute. Requires a platform with `os.fork`.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+def _first_access() -> float:
+    from pxr import Usd, UsdPhysics
+
+    start = time.perf_counter()
+    stage = Usd.Stage.CreateInMemory()
+    scene = UsdPhysics.Scene.Define(stage, "/Scene").GetPrim()
+    scene.ApplyAPI("NewtonXpbdSceneAPI")
+    for index in range(4):
+        joint = UsdPhysics.RevoluteJoint.Define(stage, f"/Robot/Joint{index}").GetPrim()
+        joint.ApplyAPI("NewtonJointAPI")
+        actuator = stage.DefinePrim(f"/Robot/Actuator{index}", "NewtonActuator")
+        actuator.ApplyAPI("NewtonPDControlAPI")
+        actuator.ApplyAPI("NewtonMaxEffortClampingAPI")
+    for prim in stage.Traverse():
+        for attr in prim.GetAttributes():
+            if attr.GetName().startswith("newton:"):
+                attr.Get()
+    return time.perf_counter() - start
+
+
+def _parent(warm: bool, workers: int) -> None:
+    import newton_usd_schemas
+
+    if warm:
+        newton_usd_schemas.warmup()
+    latencies = []
+    for _ in range(workers):
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read)
+            os.write(write, f"{_first_access()}".encode())
+            os._exit(0)
+        os.close(write)
+        with os.fdopen(read) as pipe:
+            latencies.append(float(pipe.read()))
+        os.waitpid(pid, 0)
+    print(f"{'warm' if warm else 'cold':<6} first access median {statistics.median(latencies) * 1e3:8.2f} ms max {max(latencies) * 1e3:8.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=16, help="workers forked per mode")
+    parser.add_argument("--parent", choices=["cold", "warm"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.parent:
+        _parent(args.parent == "warm", args.workers)
+        return
+    for mode in ("cold", "warm"):
+        subprocess.run([sys.executable, __file__, "--parent", mode, "--workers", str(args.workers)], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ import pathlib
 
 from ._version import __version__
 
-__all__ = ["__version__"]
+__all__ = ["__version__", "warmup"]
 
 try:
     from pxr import Plug
@@ -14,3 +14,53 @@ except ImportError:  # pragma: no cover
 
 # register the newton schema plugin
 Plug.Registry().RegisterPlugins([(pathlib.Path(__file__).parent).absolute().as_posix()])
+
+
+def warmup() -> tuple[str, ...]:
+    """Eagerly build the USD structures of every Newton schema.
+
+    USD builds the schema registry, the prim definitions of applied and typed schemas, and the
+    composed type information of each combination of prim type and applied schemas lazily, on
+    first use. Processes which fork workers (e.g. training launchers) can call `warmup` once in
+    the parent before forking, so that every child inherits the ready-made structures copy-on-write
+    instead of building them again on first access.
+
+    The schema registry is built, along with the `Tf.Type` of every Newton schema, and every
+    property definition, fallback value and metadata field of its prim definition. Each schema
+    is then composed onto a prim of a concrete type it can apply to (or a typeless prim), in a
+    throwaway in-memory stage, which also loads the plugins of the schemas Newton builds on
+    (e.g. `UsdPhysics`).
+
+    Calling `warmup` again is cheap, as every structure is already built.
+
+    Returns:
+        The names of the Newton schemas.
+    """
+    from pxr import Usd
+
+    registry = Usd.SchemaRegistry()
+    types = Plug.Registry().GetPluginWithName("newton").metadata["Types"]
+    stage = Usd.Stage.CreateInMemory()
+    schemas = []
+    for index, info in enumerate(types.values()):
+        schema = info["schemaIdentifier"]
+        schemas.append(schema)
+        registry.GetTypeFromSchemaTypeName(schema)
+        definition = registry.FindAppliedAPIPrimDefinition(schema) or registry.FindConcretePrimDefinition(schema)
+        for name in definition.GetPropertyNames():
+            spec = definition.GetPropertyDefinition(name)
+            for field in spec.ListMetadataFields():
+                spec.GetMetadata(field)
+            if attr := definition.GetAttributeDefinition(name):
+                attr.GetFallbackValue()
+
+        if info["schemaKind"] == "concreteTyped":
+            prim = stage.DefinePrim(f"/Prim{index}", schema)
+        else:
+            # some schemas can only apply to abstract types, e.g. `Gprim`, in which case a typeless prim is used
+            concrete = [name for name in info.get("apiSchemaCanOnlyApplyTo", []) if registry.FindConcretePrimDefinition(name)]
+            prim = stage.DefinePrim(f"/Prim{index}", concrete[0] if concrete else "")
+            prim.ApplyAPI(schema)
+        for attr in prim.GetAttributes():
+            attr.Get()
+    return tuple(schemas)
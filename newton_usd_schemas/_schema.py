@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
+
+from pxr import Sdf, Usd
+
+if TYPE_CHECKING:
+    import numpy as np
+
+TARGET_RELATIONSHIPS = (
+    "material:binding:physics",
+    "physics:body0",
+    "physics:body1",
+    "physics:simulationOwner",
+    "newton:targets",
+    "newton:mpm:materials",
+)
+"""The relationships of physics prims whose targets are part of the physics content of a stage."""
+
+
+def has_api_schema(prim: Usd.Prim, schema_name: str) -> bool:
+    """Check whether an API schema is applied to a prim, even if the schema is not registered.
+
+    `Usd.Prim.HasAPI` and `GetAppliedSchemas` ignore schemas which are unknown to the USD runtime,
+    such as the AOUSD proposed `PhysicsDeformableBodyAPI`, so the composed `apiSchemas` metadata
+    is inspected instead.
+    """
+    op = prim.GetMetadata("apiSchemas")
+    return op is not None and schema_name in op.ApplyOperations([])
+
+
+def schema_definition(schema: str) -> Usd.PrimDefinition | None:
+    """Get the prim definition of an applied API schema or a concrete typed schema, or `None` if it is not registered."""
+    registry = Usd.SchemaRegistry()
+    return registry.FindAppliedAPIPrimDefinition(schema) or registry.FindConcretePrimDefinition(schema)
+
+
+def schema_matcher(schema: str) -> Callable[[Usd.Prim], bool]:
+    """Get a predicate which matches the prims of a typed schema (including derived types) or with an applied API schema."""
+    kind = Usd.SchemaRegistry.GetSchemaKind(schema)
+    if kind in (Usd.SchemaKind.ConcreteTyped, Usd.SchemaKind.AbstractTyped):
+        return lambda prim: prim.IsA(schema)
+    if kind == Usd.SchemaKind.Invalid:
+        return lambda prim: has_api_schema(prim, schema)
+    return lambda prim: prim.HasAPI(schema)
+
+
+def array_view(value) -> "np.ndarray":
+    """Get a numpy array over the elements of a `Vt` array returned by `Usd.Attribute.Get`.
+
+    `Vt` arrays implement the buffer protocol, so the result is a view of the value rather than a copy.
+    Callers which expose the view should mark it read-only, as it shares memory with the value.
+    """
+    import numpy as np
+
+    return np.asarray(value)
+
+
+def stack_values(values: list) -> "np.ndarray":
+    """Stack the values of an attribute read from many prims into one array.
+
+    Values which do not stack into a regular array, such as arrays of different lengths, are kept in an object array.
+    """
+    import numpy as np
+
+    try:
+        return np.asarray(values)
+    except ValueError:
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return array
+
+
+def prim_range(stage: Usd.Stage, include_paths: list[Sdf.Path], exclude_paths: list[Sdf.Path]) -> Iterable[Usd.Prim]:
+    """Traverse the prims of the included subtrees, except for the excluded subtrees, as parsed by `UsdPhysics`.
+
+    Each prim is visited once, even if included subtrees overlap, and instance proxies are traversed.
+    """
+    roots = [path for path in include_paths if not any(path != other and path.HasPrefix(other) for other in include_paths)]
+    for root in dict.fromkeys(roots):
+        prim = stage.GetPrimAtPath(root)
+        if not prim:
+            continue
+        prims = iter(Usd.PrimRange(prim, Usd.TraverseInstanceProxies()))
+        for prim in prims:
+            path = prim.GetPath()
+            if any(path.HasPrefix(excluded) for excluded in exclude_paths):
+                prims.PruneChildren()
+                continue
+            yield prim
@@ -1,4 +1,4 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 The Newton Developers
 # SPDX-License-Identifier: Apache-2.0
 
-__version__ = "0.5.0"
+__version__ = "0.6.0"
@@ -0,0 +1,138 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Batched extraction of `NewtonActuatorArray` controller parameters.
+
+A `NewtonActuatorArray` prim describes one actuator per target of its ordered `newton:targets`
+relationship, with per-target array attributes. `read_actuator_arrays` concatenates the arrays
+of every such prim on a stage into one contiguous array per parameter, so a solver can upload
+them to its kernels directly, without visiting a prim per actuator.
+"""
+
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError("numpy must be installed to use newton_usd_schemas.actuators")  # pragma: no cover
+
+from pxr import Sdf, Usd
+
+from ._schema import array_view, schema_definition
+
+__all__ = [
+    "ACTUATOR_ARRAY_ATTRIBUTES",
+    "ActuatorArrays",
+    "read_actuator_arrays",
+]
+
+ACTUATOR_ARRAY_ATTRIBUTES: dict[str, str] = {
+    "const_effort": "newton:constEffort",
+    "kp": "newton:kp",
+    "kd": "newton:kd",
+    "ki": "newton:ki",
+    "integral_max": "newton:integralMax",
+    "max_effort": "newton:maxEffort",
+    "delay_steps": "newton:delaySteps",
+}
+"""The parameter names of `ActuatorArrays.parameters`, mapped to the array attributes they are read from."""
+
+# the single-actuator API schema whose fallback every actuator of a prim uses if its array attribute is empty
+_FALLBACK_SCHEMAS = {
+    "const_effort": "NewtonPIDControlAPI",
+    "kp": "NewtonPIDControlAPI",
+    "kd": "NewtonPIDControlAPI",
+    "ki": "NewtonPIDControlAPI",
+    "integral_max": "NewtonPIDControlAPI",
+    "max_effort": "NewtonMaxEffortClampingAPI",
+    "delay_steps": "NewtonActuatorDelayAPI",
+}
+
+_DTYPES = {field: np.int32 if field == "delay_steps" else np.float32 for field in ACTUATOR_ARRAY_ATTRIBUTES}
+
+
+@dataclass(frozen=True)
+class ActuatorArrays:
+    """The actuators of every `NewtonActuatorArray` prim on a stage, concatenated in prim order.
+
+    Attributes:
+        prims: The paths of the `NewtonActuatorArray` prims, in traversal order.
+        offsets: `(P + 1,)` int64 offsets, such that the actuators of `prims[i]` are `offsets[i]:offsets[i + 1]`.
+        targets: The joint driven by each actuator.
+        parameters: `(N,)` array of each parameter, keyed by the names of `ACTUATOR_ARRAY_ATTRIBUTES`.
+            `delay_steps` is int32, and every other parameter is float32.
+    """
+
+    prims: tuple[Sdf.Path, ...]
+    offsets: np.ndarray
+    targets: tuple[Sdf.Path, ...]
+    parameters: dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.targets)
+
+    def prim_indices(self) -> np.ndarray:
+        """Get the index into `prims` of every actuator.
+
+        Returns:
+            `(N,)` int32 prim index of each actuator.
+        """
+        return np.repeat(np.arange(len(self.prims), dtype=np.int32), np.diff(self.offsets))
+
+
+def _read_array(prim: Usd.Prim, field: str, count: int, time: Usd.TimeCode) -> np.ndarray | None:
+    name = ACTUATOR_ARRAY_ATTRIBUTES[field]
+    value = prim.GetAttribute(name).Get(time)
+    if value is None or len(value) == 0:
+        return None
+    values = array_view(value)
+    if values.shape[0] != count:
+        raise ValueError(f"{prim.GetPath()}: `{name}` has {values.shape[0]} elements but `newton:targets` has {count}")
+    return values
+
+
+def read_actuator_arrays(stage: Usd.Stage, predicate=Usd.PrimDefaultPredicate, time: Usd.TimeCode = Usd.TimeCode.Default()) -> ActuatorArrays:
+    """Extract the parameters of every `NewtonActuatorArray` prim on a stage.
+
+    Each array attribute is read once per prim, and written into a slice of the
+    concatenated parameter array. Empty array attributes use the fallback of the
+    corresponding single-actuator API schema attribute for every actuator of their prim.
+
+    Args:
+        stage: The stage to traverse.
+        predicate: The prim predicate of the traversal, e.g. to include inactive prims.
+        time: The time to read the parameters at.
+
+    Returns:
+        The concatenated actuators.
+
+    Raises:
+        ValueError: If a prim has no `newton:targets`, or a non-empty array attribute does not
+            have one element per target.
+    """
+    prims = []
+    targets: list[Sdf.Path] = []
+    counts = []
+    arrays: list[dict[str, np.ndarray | None]] = []
+    for prim in stage.Traverse(predicate):
+        if not prim.IsA("NewtonActuatorArray"):
+            continue
+        prim_targets = prim.GetRelationship("newton:targets").GetTargets()
+        if not prim_targets:
+            raise ValueError(f"{prim.GetPath()}: `newton:targets` must be authored")
+        arrays.append({field: _read_array(prim, field, len(prim_targets), time) for field in ACTUATOR_ARRAY_ATTRIBUTES})
+        prims.append(prim.GetPath())
+        targets.extend(prim_targets)
+        counts.append(len(prim_targets))
+
+    offsets = np.zeros(len(prims) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(counts)
+    parameters = {}
+    for field, dtype in _DTYPES.items():
+        fallback = schema_definition(_FALLBACK_SCHEMAS[field]).GetAttributeFallbackValue(ACTUATOR_ARRAY_ATTRIBUTES[field])
+        values = np.full(len(targets), fallback, dtype=dtype)
+        for index, prim_arrays in enumerate(arrays):
+            if prim_arrays[field] is not None:
+                values[offsets[index] : offsets[index + 1]] = prim_arrays[field]
+        parameters[field] = values
+    return ActuatorArrays(prims=tuple(prims), offsets=offsets, targets=tuple(targets), parameters=parameters)
@@ -0,0 +1,165 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Streaming extraction of Newton schema data in batches of prims.
+
+`extract_layout` and the readers built on it traverse the whole stage before returning, so an
+engine build can not allocate anything until the traversal is complete. `iter_schema_batches`
+traverses the stage once and yields the prims of each schema as soon as a batch of them has
+been collected, with their attribute arrays already extracted, e.g. 4096 joints at a time:
+
+    groups = {"PhysicsJoint": ("NewtonJointAPI", "NewtonMimicAPI"), "NewtonActuator": ACTUATOR_SCHEMAS}
+    for batch in iter_schema_batches(stage, groups, batch_size=4096):
+        upload(batch.schema, batch.start, batch.values)
+
+The consumer of the batches can run in another thread, e.g. to set up GPU buffers while the
+next batch is extracted. The rows of each schema follow traversal order, so that batches are
+deterministic and match the rows assigned by `extract_layout` with the same predicate. The DOFs
+of stacked joints (see `newton:jointsAddMobility`) are ordered by traversal as well.
+"""
+
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError("numpy must be installed to use newton_usd_schemas.batches")  # pragma: no cover
+
+from pxr import Sdf, Usd
+
+from ._schema import schema_matcher
+from .parsing import read_newton_descriptors
+
+__all__ = [
+    "BATCH_ORDERS",
+    "PrimBatch",
+    "iter_schema_batches",
+]
+
+BATCH_ORDERS: tuple[str, ...] = ("traversal", "name")
+"""The prim orders of `iter_schema_batches`: the composed namespace order of the stage (as with
+`Usd.Stage.Traverse`), or siblings sorted by name, independent of the order in which they are
+authored or composed. Both visit parents before their descendants."""
+
+
+@dataclass(frozen=True)
+class PrimBatch:
+    """A batch of consecutive prims of a schema, with their extracted Newton schema data.
+
+    Attributes:
+        schema: The schema which the prims of the batch match.
+        start: The row of the first prim of the batch among every prim of the schema, such that
+            row `i` of the batch is row `start + i` of the schema.
+        paths: The prim of each row.
+        applied: `(N,)` bool array of each extracted schema, which is `True` for the rows with the
+            schema applied (or of the schema's type, for typed schemas).
+        values: `(N, ...)` values of each attribute of the extracted schemas, keyed by attribute name,
+            as in `newton_usd_schemas.parsing.NewtonDescriptors.values`.
+        targets: The forwarded targets of each relationship of the extracted schemas, keyed by
+            relationship name, with an empty tuple for rows without targets.
+    """
+
+    schema: str
+    start: int
+    paths: tuple[Sdf.Path, ...]
+    applied: dict[str, np.ndarray]
+    values: dict[str, np.ndarray]
+    targets: dict[str, tuple[tuple[Sdf.Path, ...], ...]]
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+
+def _sorted_range(stage: Usd.Stage, predicate) -> Iterator[tuple[Usd.Prim, Callable[[], None]]]:
+    # a depth-first traversal which visits siblings in name order, yielding each prim with a function which prunes its children
+    stack = sorted(stage.GetPseudoRoot().GetFilteredChildren(predicate), key=lambda prim: prim.GetName(), reverse=True)
+    while stack:
+        prim = stack.pop()
+        pruned = []
+        yield prim, lambda: pruned.append(True)
+        if not pruned:
+            stack.extend(sorted(prim.GetFilteredChildren(predicate), key=lambda child: child.GetName(), reverse=True))
+
+
+def _traversal_range(stage: Usd.Stage, predicate) -> Iterator[tuple[Usd.Prim, Callable[[], None]]]:
+    prims = iter(Usd.PrimRange.Stage(stage, predicate))
+    for prim in prims:
+        yield prim, prims.PruneChildren
+
+
+def iter_schema_batches(
+    stage: Usd.Stage,
+    schemas: Mapping[str, Sequence[str]] | Sequence[str],
+    batch_size: int = 4096,
+    predicate=Usd.PrimDefaultPredicate,
+    prune: Callable[[Usd.Prim], bool] | None = None,
+    order: str = "traversal",
+    time: Usd.TimeCode = Usd.TimeCode.Default(),
+) -> Iterator[PrimBatch]:
+    """Traverse a stage once, and yield its prims in batches per schema, with their extracted data.
+
+    A batch of a schema is yielded as soon as `batch_size` of its prims have been visited, and the
+    remaining prims of every schema are yielded once the traversal is complete, in the order of
+    `schemas`. As with `newton_usd_schemas.parsing.load_newton_from_range`, attributes without
+    opinions hold their schema fallback, and only authored properties are read.
+
+    Args:
+        stage: The stage to traverse.
+        schemas: The schemas whose prims are batched, e.g. `PhysicsJoint` or `NewtonActuator`,
+            each mapped to the registered schemas whose data is extracted for its prims, e.g.
+            `NewtonJointAPI`. A sequence of schemas extracts the data of each schema itself.
+            Applied API schemas match prims with the schema applied, and typed schemas match prims
+            of that type or a derived type.
+        batch_size: The maximum number of prims per batch.
+        predicate: The prim predicate of the traversal, e.g. `Usd.TraverseInstanceProxies()` to
+            include the prims of instances.
+        prune: A function which returns `True` for the prims whose subtree is skipped, including
+            the prim itself, e.g. render-only scopes.
+        order: The prim order, one of `BATCH_ORDERS`.
+        time: The time to read attribute values at.
+
+    Yields:
+        The batches, in which the prims of each schema follow `order`.
+
+    Raises:
+        ValueError: If `batch_size` is not positive or `order` is unknown.
+    """
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    if order not in BATCH_ORDERS:
+        raise ValueError(f"Unknown order `{order}`, expected one of {', '.join(BATCH_ORDERS)}")
+    if not isinstance(schemas, Mapping):
+        schemas = {schema: (schema,) for schema in schemas}
+    groups = {schema: schema_matcher(schema) for schema in schemas}
+    pending: dict[str, list[Usd.Prim]] = {schema: [] for schema in schemas}
+    starts = dict.fromkeys(schemas, 0)
+
+    def batch(schema: str) -> PrimBatch:
+        prims = pending[schema]
+        descriptors = read_newton_descriptors(prims, schemas[schema], time)
+        result = PrimBatch(
+            schema=schema,
+            start=starts[schema],
+            paths=descriptors.paths,
+            applied=descriptors.applied,
+            values=descriptors.values,
+            targets=descriptors.targets,
+        )
+        starts[schema] += len(prims)
+        pending[schema] = []
+        return result
+
+    traversal = _sorted_range if order == "name" else _traversal_range
+    for prim, prune_children in traversal(stage, predicate):
+        if prune is not None and prune(prim):
+            prune_children()
+            continue
+        for schema, matches in groups.items():
+            if matches(prim):
+                pending[schema].append(prim)
+                if len(pending[schema]) == batch_size:
+                    yield batch(schema)
+    for schema in schemas:
+        if pending[schema]:
+            yield batch(schema)
@@ -0,0 +1,177 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Incremental updates of extracted Newton schema data from `Usd.Notice.ObjectsChanged`.
+
+A `ChangeTracker` listens to the change notices of a stage and classifies every edit against
+an `ArrayLayout`. Value edits of schema attributes on extracted prims are collected as typed
+`ParameterDelta` (schema, attribute, rows and new values), so an engine can patch its arrays
+in place. Anything which may change the layout itself, such as adding or removing prims or
+applied schemas, is reported as a resync instead, and requires the layout to be extracted again.
+
+Edits are batched until `ChangeTracker.flush` is called, e.g. once per frame, so repeated edits
+of the same value produce a single delta with the latest value.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError("numpy must be installed to use newton_usd_schemas.changes")  # pragma: no cover
+
+from pxr import Sdf, Tf, Usd
+
+from ._schema import schema_definition, stack_values
+from .extraction import ArrayLayout
+
+__all__ = [
+    "ChangeBatch",
+    "ChangeTracker",
+    "ParameterDelta",
+]
+
+
+@dataclass(frozen=True)
+class ParameterDelta:
+    """New values of one schema attribute for some rows of the extracted arrays.
+
+    Attributes:
+        schema: The schema which defines the attribute.
+        attribute: The attribute name, e.g. `newton:kp`.
+        rows: `(K,)` int64 rows of the changed prims in the layout of `schema`, in increasing order.
+        values: `(K, ...)` new values of the attribute, one per row. Values which do not form a regular
+            NumPy array (e.g. arrays of varying length) are stored in an object array.
+    """
+
+    schema: str
+    attribute: str
+    rows: np.ndarray
+    values: np.ndarray
+
+
+@dataclass(frozen=True)
+class ChangeBatch:
+    """The changes of a stage since the previous flush.
+
+    Attributes:
+        deltas: The value changes of schema attributes on extracted prims, ordered by schema and attribute.
+        resynced_paths: The prim paths whose subtree was resynced, in path order. Schema relationship
+            edits (e.g. `newton:mimicJoint`) are reported here as well, since they change connectivity.
+    """
+
+    deltas: tuple[ParameterDelta, ...] = ()
+    resynced_paths: tuple[Sdf.Path, ...] = ()
+
+    @property
+    def requires_resync(self) -> bool:
+        """Whether the layout must be extracted again, rather than patched with `deltas`."""
+        return bool(self.resynced_paths)
+
+
+class ChangeTracker:
+    """Collect the changes of a stage against a previously extracted `ArrayLayout`.
+
+    The tracker listens to `Usd.Notice.ObjectsChanged` from construction until `close` is
+    called, or the `with` block it is used in exits.
+
+    Edits are classified as follows:
+
+    - Info-only changes of an attribute defined by an extracted schema, on a prim with a row in
+      that schema's layout, produce a delta. Creating (or removing) the attribute's first opinion
+      resyncs the property rather than the prim, which is still a value change of a schema attribute
+      with a fallback, and is treated the same way.
+    - Changes of relationships defined by an extracted schema, and resyncs of prims, are resyncs.
+    - All other changes, e.g. to attributes of other schemas, are ignored.
+
+    Args:
+        stage: The stage to track.
+        layout: The layout the deltas are addressed against.
+        time: The time to read changed values at.
+    """
+
+    # the notice listener only holds a weak reference to the bound callback
+    __slots__ = ("__weakref__", "_attributes", "_layout", "_listener", "_pending", "_relationships", "_resynced", "_stage", "_time")
+
+    def __init__(self, stage: Usd.Stage, layout: ArrayLayout, time: Usd.TimeCode = Usd.TimeCode.Default()):
+        self._stage = stage
+        self._layout = layout
+        self._time = time
+        self._attributes: dict[str, list[str]] = defaultdict(list)
+        self._relationships: dict[str, list[str]] = defaultdict(list)
+        for schema in layout.schemas:
+            definition = schema_definition(schema)
+            if definition is None:
+                continue
+            for name in definition.GetPropertyNames():
+                properties = self._attributes if definition.GetAttributeDefinition(name) else self._relationships
+                properties[name].append(schema)
+        self._pending: dict[tuple[str, str], dict[int, Sdf.Path]] = defaultdict(dict)
+        self._resynced: set[Sdf.Path] = set()
+        self._listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, stage)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def pending(self) -> bool:
+        """Whether any changes were collected since the last flush."""
+        return bool(self._pending or self._resynced)
+
+    def close(self) -> None:
+        """Stop listening to changes of the stage."""
+        if self._listener is not None:
+            self._listener.Revoke()
+            self._listener = None
+
+    def _record(self, path: Sdf.Path) -> None:
+        prim_path = path.GetPrimPath()
+        name = path.name
+        for schema in self._relationships.get(name, ()):
+            if self._layout.row(schema, prim_path) >= 0:
+                self._resynced.add(prim_path)
+        for schema in self._attributes.get(name, ()):
+            row = self._layout.row(schema, prim_path)
+            if row >= 0:
+                self._pending[(schema, name)][row] = prim_path
+
+    def _on_objects_changed(self, notice: Usd.Notice.ObjectsChanged, sender: Usd.Stage) -> None:
+        for path in notice.GetResyncedPaths():
+            if path.IsPropertyPath():
+                self._record(path)
+            else:
+                self._resynced.add(path)
+        for path in notice.GetChangedInfoOnlyPaths():
+            if path.IsPropertyPath():
+                self._record(path)
+
+    def flush(self) -> ChangeBatch:
+        """Get the changes collected since the last flush, and start a new batch.
+
+        Values are read when flushing, so a value edited several times since the last flush
+        produces a single delta with its latest value. Deltas of prims below a resynced path
+        are dropped, since their rows may no longer be valid.
+
+        Returns:
+            The batch of changes.
+        """
+        resynced = tuple(sorted(self._resynced))
+        deltas = []
+        schemas = {schema: index for index, schema in enumerate(self._layout.schemas)}
+        for schema, name in sorted(self._pending, key=lambda key: (schemas[key[0]], key[1])):
+            rows = []
+            values = []
+            for row, prim_path in sorted(self._pending[(schema, name)].items()):
+                if any(prim_path.HasPrefix(path) for path in resynced):
+                    continue
+                rows.append(row)
+                values.append(self._stage.GetPrimAtPath(prim_path).GetAttribute(name).Get(self._time))
+            if rows:
+                deltas.append(ParameterDelta(schema=schema, attribute=name, rows=np.array(rows, dtype=np.int64), values=stack_values(values)))
+        self._pending.clear()
+        self._resynced.clear()
+        return ChangeBatch(deltas=tuple(deltas), resynced_paths=resynced)
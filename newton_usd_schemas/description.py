@@ -0,0 +1,496 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""A compiled, picklable description of the Newton scene of a stage.
+
+A `NewtonSceneDescription` holds the Newton schema data of a stage in one `SceneSection` per kind
+of object: scenes (with their solver settings), articulations, joints, bodies (with their mass
+properties), colliders, materials, actuators, actuator arrays, mimic constraints, sites and
+deformables. The rows of a section are prims, and its columns are NumPy arrays. Relationships,
+e.g. the bodies of joints or the joints of actuators, are resolved to the rows of the section
+they target, so the description holds no USD objects at all:
+
+    description = NewtonSceneDescription(stage)
+    body0 = description.joints.first("physics:body0")
+    mass = description.bodies.values["physics:mass"][body0]
+
+Sections are compiled on first access. The stage is parsed once, with
+`newton_usd_schemas.parsing.load_newton_from_range`, when the first section is accessed, and the
+arrays of each section are built when it is accessed. A description pickles to its arrays, so it
+can be compiled once, and then cached or sent to other processes cheaply. With pickle protocol 5,
+the arrays are passed out-of-band, without copying:
+
+    buffers = []
+    data = pickle.dumps(description, protocol=5, buffer_callback=buffers.append)
+    description = pickle.loads(data, buffers=buffers)
+
+The sections of an unpickled description are rebuilt from their arrays on first access.
+"""
+
+from collections.abc import Iterable, Sequence
+from itertools import pairwise
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError("numpy must be installed to use newton_usd_schemas.description")  # pragma: no cover
+
+from pxr import Sdf, Usd, UsdPhysics
+
+from ._schema import prim_range, schema_definition, schema_matcher
+from .parsing import (
+    ACTUATOR_ARRAY_SCHEMAS,
+    ACTUATOR_SCHEMAS,
+    NEWTON_DESCRIPTOR_SCHEMAS,
+    NewtonDescriptors,
+    NewtonParse,
+    load_newton_from_range,
+    read_newton_descriptors,
+)
+from .relationships import PathIndex
+
+__all__ = [
+    "SCENE_SECTIONS",
+    "NewtonSceneDescription",
+    "SceneSection",
+]
+
+SCENE_SECTIONS: tuple[str, ...] = (
+    "scenes",
+    "articulations",
+    "joints",
+    "bodies",
+    "colliders",
+    "materials",
+    "actuators",
+    "actuator_arrays",
+    "mimic",
+    "sites",
+    "deformables",
+)
+"""The names of the sections of a `NewtonSceneDescription`."""
+
+_ObjectType = UsdPhysics.ObjectType
+
+_JOINT_TYPES = tuple(object_type for object_type, schemas in NEWTON_DESCRIPTOR_SCHEMAS.items() if "NewtonJointAPI" in schemas)
+_SHAPE_TYPES = tuple(object_type for object_type, schemas in NEWTON_DESCRIPTOR_SCHEMAS.items() if "NewtonCollisionAPI" in schemas)
+
+_SCHEMAS: dict[str, tuple[str, ...]] = {
+    "scenes": NEWTON_DESCRIPTOR_SCHEMAS[_ObjectType.Scene],
+    "articulations": NEWTON_DESCRIPTOR_SCHEMAS[_ObjectType.Articulation],
+    "joints": ("NewtonJointAPI",),
+    "bodies": NEWTON_DESCRIPTOR_SCHEMAS[_ObjectType.RigidBody],
+    "colliders": ("NewtonCollisionAPI", "NewtonMeshCollisionAPI", "NewtonSDFCollisionAPI", "NewtonMassAPI"),
+    "materials": NEWTON_DESCRIPTOR_SCHEMAS[_ObjectType.RigidBodyMaterial],
+    "actuators": ACTUATOR_SCHEMAS,
+    "actuator_arrays": ACTUATOR_ARRAY_SCHEMAS,
+    "mimic": ("NewtonMimicAPI",),
+    "sites": ("NewtonSiteAPI",),
+    "deformables": ("NewtonPointsDeformableSimAPI",),
+}
+
+# the sections of prims which UsdPhysics does not parse, which are collected by a traversal of the range
+_TRAVERSED = ("sites", "deformables")
+
+_DTYPES = {
+    "bool": np.bool_,
+    "int": np.int32,
+    "uint": np.uint32,
+    "int64": np.int64,
+    "half": np.float16,
+    "float": np.float32,
+    "double": np.float64,
+    "float2": np.float32,
+    "float3": np.float32,
+    "point3f": np.float32,
+    "vector3f": np.float32,
+    "normal3f": np.float32,
+    "double3": np.float64,
+    "quatf": np.float32,
+    "quatd": np.float64,
+}
+_STRINGS = ("token", "string", "asset")
+
+
+def _plain(scalar: str, value):
+    # a value as NumPy stores it: quaternions as (real, i, j, k) and tokens and asset paths as strings
+    if scalar in ("quatf", "quatd"):
+        return (value.GetReal(), *value.GetImaginary())
+    if scalar == "asset":
+        return value.path if value is not None else ""
+    if scalar in _STRINGS:
+        return str(value) if value is not None else ""
+    return value
+
+
+def _column(attr: Usd.PrimDefinition.Attribute, rows: list) -> np.ndarray:
+    # one row per value, with blocked values replaced by the fallback
+    scalar = str(attr.GetTypeName().scalarType)
+    fallback = _plain(scalar, attr.GetFallbackValue())
+    dtype = str if scalar in _STRINGS else _DTYPES.get(scalar)
+    column = np.array([fallback if value is None else _plain(scalar, value) for value in rows], dtype=dtype)
+    return column.reshape(-1, *np.shape(fallback)) if not rows else column
+
+
+def _ragged(attr: Usd.PrimDefinition.Attribute, rows: list) -> tuple[np.ndarray, np.ndarray]:
+    # the concatenated values of an array attribute, with blocked and missing values as empty rows
+    scalar = str(attr.GetTypeName().scalarType)
+    dtype = str if scalar in _STRINGS else _DTYPES.get(scalar)
+    fallback = attr.GetFallbackValue()
+    pieces = []
+    for value in rows:
+        value = fallback if value is None else value
+        if value is None:
+            pieces.append(np.zeros(0, dtype=dtype))
+        elif scalar in _STRINGS or scalar.startswith("quat"):
+            pieces.append(np.array([_plain(scalar, item) for item in value], dtype=dtype))
+        else:
+            pieces.append(np.asarray(value, dtype=dtype))
+    offsets = np.zeros(len(pieces) + 1, dtype=np.int64)
+    np.cumsum([len(piece) for piece in pieces], out=offsets[1:])
+    return offsets, np.concatenate(pieces) if pieces else np.zeros(0, dtype=dtype)
+
+
+def _pack(paths: Sequence[Sdf.Path]) -> tuple[np.ndarray, np.ndarray]:
+    # the UTF-8 encoded paths, concatenated, with the offsets of each path
+    encoded = [str(path).encode() for path in paths]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(path) for path in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+class SceneSection:
+    """A section of a `NewtonSceneDescription`, with one row per prim and a NumPy array per column.
+
+    Rows are prims in the traversal order of the described range. Rows without a schema hold the
+    schema fallbacks, as do blocked attributes.
+
+    Args:
+        path_data: The UTF-8 encoded prim paths of the rows, concatenated, and the `(N + 1,)` int64
+            offsets of each path.
+        applied: `(N,)` bool array of each schema of the section, which is `True` for the rows with
+            the schema applied (or of the schema's type, for typed schemas).
+        values: `(N, ...)` array of each scalar attribute, keyed by attribute name. Tokens and asset
+            paths are strings, and quaternions are `(real, i, j, k)`. Sections of several
+            `UsdPhysics` object types (joints and colliders) also have a `type` column, with the
+            `UsdPhysics.ObjectType` name of each row.
+        arrays: The `(offsets, data)` of each array attribute, keyed by attribute name, such that the
+            value of row `i` is `data[offsets[i]:offsets[i + 1]]`.
+        targets: The `(offsets, indices)` of each relationship, keyed by name, such that the targets of
+            row `i` are the int32 rows `indices[offsets[i]:offsets[i + 1]]` of the section they refer
+            to, or `-1` for targets which are not in that section.
+    """
+
+    __slots__ = ("_path_data", "_paths", "applied", "arrays", "targets", "values")
+
+    def __init__(
+        self,
+        path_data: tuple[np.ndarray, np.ndarray],
+        applied: dict[str, np.ndarray],
+        values: dict[str, np.ndarray],
+        arrays: dict[str, tuple[np.ndarray, np.ndarray]],
+        targets: dict[str, tuple[np.ndarray, np.ndarray]],
+    ):
+        self._path_data = path_data
+        self._paths: tuple[Sdf.Path, ...] | None = None
+        self.applied = applied
+        self.values = values
+        self.arrays = arrays
+        self.targets = targets
+
+    def __len__(self) -> int:
+        return len(self._path_data[1]) - 1
+
+    def __reduce__(self):
+        return SceneSection, (self._path_data, self.applied, self.values, self.arrays, self.targets)
+
+    @property
+    def paths(self) -> tuple[Sdf.Path, ...]:
+        """The prim path of each row, which are decoded on first access."""
+        if self._paths is None:
+            data, offsets = self._path_data
+            text = data.tobytes()
+            self._paths = tuple(Sdf.Path(text[start:end].decode()) for start, end in pairwise(offsets.tolist()))
+        return self._paths
+
+    def first(self, name: str) -> np.ndarray:
+        """Get the first target of a relationship of each row, e.g. for single target relationships such as `physics:body0`.
+
+        Returns:
+            `(N,)` int32 row of the first target of each row, or `-1` for rows without targets or with a missing first target.
+        """
+        offsets, indices = self.targets[name]
+        first = np.full(len(self), -1, dtype=np.int32)
+        counts = np.diff(offsets)
+        first[counts > 0] = indices[offsets[:-1][counts > 0]]
+        return first
+
+
+_Part = tuple[UsdPhysics.ObjectType | None, NewtonDescriptors, np.ndarray]
+
+
+class _Source:
+    # compiles the sections of a stage, from a single parse of its prim range
+    def __init__(self, stage: Usd.Stage, include_paths: list[Sdf.Path], exclude_paths: list[Sdf.Path], time: Usd.TimeCode):
+        self.stage = stage
+        self.include_paths = include_paths
+        self.exclude_paths = exclude_paths
+        self.time = time
+        self._parse: NewtonParse | None = None
+        self._traversed: dict[str, NewtonDescriptors] | None = None
+        self._indices: dict[str, PathIndex] = {}
+
+    @property
+    def parse(self) -> NewtonParse:
+        if self._parse is None:
+            self._parse = load_newton_from_range(self.stage, self.include_paths, self.exclude_paths, time=self.time)
+        return self._parse
+
+    def traversed(self, section: str) -> NewtonDescriptors:
+        if self._traversed is None:
+            matchers = {name: schema_matcher(_SCHEMAS[name][0]) for name in _TRAVERSED}
+            prims: dict[str, list[Usd.Prim]] = {name: [] for name in _TRAVERSED}
+            for prim in prim_range(self.stage, self.include_paths, self.exclude_paths):
+                for name, matches in matchers.items():
+                    if matches(prim):
+                        prims[name].append(prim)
+            self._traversed = {name: read_newton_descriptors(section_prims, _SCHEMAS[name], self.time) for name, section_prims in prims.items()}
+        return self._traversed[section]
+
+    def parts(self, section: str) -> list[_Part]:
+        # the descriptors which the rows of a section are taken from, with the object type of each, in row order
+        if section in _TRAVERSED:
+            descriptors = self.traversed(section)
+            return [(None, descriptors, np.arange(len(descriptors)))]
+        if section in ("actuators", "actuator_arrays"):
+            descriptors = getattr(self.parse, section)
+            return [(None, descriptors, np.arange(len(descriptors)))]
+        if section == "mimic":
+            return [(object_type, joints, rows[joints.applied["NewtonMimicAPI"][rows]]) for object_type, joints, rows in self.parts("joints")]
+        object_types = {
+            "scenes": (_ObjectType.Scene,),
+            "articulations": (_ObjectType.Articulation,),
+            "joints": _JOINT_TYPES,
+            "bodies": (_ObjectType.RigidBody,),
+            "colliders": _SHAPE_TYPES,
+            "materials": (_ObjectType.RigidBodyMaterial,),
+        }[section]
+        descriptors = self.parse.descriptors
+        object_types = [object_type for object_type in object_types if object_type in descriptors]
+        if len(object_types) < 2:
+            return [(object_type, descriptors[object_type], np.arange(len(descriptors[object_type]))) for object_type in object_types]
+        # the rows of several object types are merged in traversal order, as runs of rows of the same object type
+        order = np.concatenate([self.parse.traversal_order[object_type] for object_type in object_types])
+        parts = np.concatenate([np.full(len(descriptors[object_type]), index) for index, object_type in enumerate(object_types)])
+        rows = np.concatenate([np.arange(len(descriptors[object_type])) for object_type in object_types])
+        if not len(rows):
+            return []
+        sort = np.argsort(order, kind="stable")
+        parts, rows = parts[sort], rows[sort]
+        starts = np.flatnonzero(parts[1:] != parts[:-1]) + 1
+        return [
+            (object_types[part], descriptors[object_types[part]], run)
+            for part, run in zip(parts[np.concatenate(([0], starts))].tolist(), np.split(rows, starts), strict=True)
+        ]
+
+    def index(self, section: str) -> PathIndex:
+        if section not in self._indices:
+            self._indices[section] = PathIndex(descriptors.paths[row] for _, descriptors, rows in self.parts(section) for row in rows)
+        return self._indices[section]
+
+    def _descs(self, parts: list[_Part]) -> list:
+        # the UsdPhysics descriptor of each row
+        return [self.parse.physics[object_type][1][int(row)] for object_type, _, rows in parts for row in rows]
+
+    def targets(self, section: str, parts: list[_Part]) -> dict[str, tuple[list[Sequence[Sdf.Path]], str]]:
+        # the target paths of each relationship of each row, with the section they refer to
+        def newton(name: str) -> list[Sequence[Sdf.Path]]:
+            return [descriptors.targets[name][row] for _, descriptors, rows in parts for row in rows]
+
+        if section == "articulations":
+            descs = self._descs(parts)
+            return {
+                "joints": ([desc.articulatedJoints for desc in descs], "joints"),
+                "bodies": ([desc.articulatedBodies for desc in descs], "bodies"),
+            }
+        if section == "joints":
+            descs = self._descs(parts)
+            return {
+                "physics:body0": ([[desc.body0] if not desc.body0.isEmpty else [] for desc in descs], "bodies"),
+                "physics:body1": ([[desc.body1] if not desc.body1.isEmpty else [] for desc in descs], "bodies"),
+            }
+        if section == "bodies":
+            return {"physics:simulationOwner": ([desc.simulationOwners for desc in self._descs(parts)], "scenes")}
+        if section == "colliders":
+            descs = self._descs(parts)
+            return {
+                "body": ([[desc.rigidBody] if not desc.rigidBody.isEmpty else [] for desc in descs], "bodies"),
+                "material:binding:physics": ([desc.materials for desc in descs], "materials"),
+                "physics:simulationOwner": ([desc.simulationOwners for desc in descs], "scenes"),
+            }
+        if section == "mimic":
+            joints = [[descriptors.paths[row]] for _, descriptors, rows in parts for row in rows]
+            return {"joint": (joints, "joints"), "newton:mimicJoint": (newton("newton:mimicJoint"), "joints")}
+        if section in ("actuators", "actuator_arrays"):
+            return {"newton:targets": (newton("newton:targets"), "joints")}
+        if section == "sites":
+            bodies = self.index("bodies")
+            sites = []
+            for _, descriptors, rows in parts:
+                for row in rows:
+                    path = descriptors.paths[row]
+                    while not path.isEmpty and path not in bodies:
+                        path = path.GetParentPath()
+                    sites.append([path] if not path.isEmpty else [])
+            return {"body": (sites, "bodies")}
+        if section == "deformables":
+            return {"newton:mpm:materials": (newton("newton:mpm:materials"), "materials")}
+        return {}
+
+    def compile(self, section: str) -> SceneSection:
+        parts = self.parts(section)
+        applied = {}
+        values = {}
+        arrays = {}
+        for schema in _SCHEMAS[section]:
+            applied[schema] = (
+                np.concatenate([descriptors.applied[schema][rows] for _, descriptors, rows in parts]) if parts else np.zeros(0, dtype=bool)
+            )
+            definition = schema_definition(schema)
+            for name in definition.GetPropertyNames():
+                attr = definition.GetAttributeDefinition(name)
+                if not attr or name in values or name in arrays:
+                    continue
+                rows_values = [descriptors.values[name][row] for _, descriptors, rows in parts for row in rows]
+                if attr.GetTypeName().isArray:
+                    arrays[name] = _ragged(attr, rows_values)
+                else:
+                    values[name] = _column(attr, rows_values)
+        if section in ("joints", "colliders"):
+            values["type"] = np.array([object_type.name for object_type, _, rows in parts for _ in rows], dtype=str)
+
+        targets = {}
+        for name, (paths, target_section) in self.targets(section, parts).items():
+            resolved = self.index(target_section).resolve(paths, name)
+            targets[name] = (resolved.offsets, resolved.indices)
+        paths = [descriptors.paths[row] for _, descriptors, rows in parts for row in rows]
+        return SceneSection(_pack(paths), applied, values, arrays, targets)
+
+
+def _restore(sections: dict[str, tuple]) -> "NewtonSceneDescription":
+    description = NewtonSceneDescription.__new__(NewtonSceneDescription)
+    description._sections = dict(sections)
+    description._source = None
+    return description
+
+
+class NewtonSceneDescription:
+    """The Newton schema data of a stage, compiled into array-backed sections.
+
+    Sections are compiled on first access, and the stage is released once every section is
+    compiled. Pickling a description compiles its remaining sections.
+
+    Args:
+        stage: The stage to describe.
+        include_paths: The roots of the prim subtrees to describe.
+        exclude_paths: The roots of the prim subtrees to skip.
+        time: The time to read attribute values at.
+    """
+
+    __slots__ = ("_sections", "_source")
+
+    def __init__(
+        self,
+        stage: Usd.Stage,
+        include_paths: Iterable[str | Sdf.Path] = ("/",),
+        exclude_paths: Iterable[str | Sdf.Path] = (),
+        time: Usd.TimeCode = Usd.TimeCode.Default(),
+    ):
+        self._sections: dict[str, SceneSection | tuple] = {}
+        self._source: _Source | None = _Source(stage, [Sdf.Path(path) for path in include_paths], [Sdf.Path(path) for path in exclude_paths], time)
+
+    def __reduce__(self):
+        return _restore, ({name: self.section(name).__reduce__()[1] for name in SCENE_SECTIONS},)
+
+    @property
+    def loaded(self) -> tuple[str, ...]:
+        """The names of the sections which were already compiled (or rebuilt, after unpickling)."""
+        return tuple(name for name in SCENE_SECTIONS if isinstance(self._sections.get(name), SceneSection))
+
+    def section(self, name: str) -> SceneSection:
+        """Get a section by name.
+
+        Args:
+            name: The name of the section, one of `SCENE_SECTIONS`.
+
+        Returns:
+            The section, which is compiled on first access.
+
+        Raises:
+            KeyError: If there is no section with that name.
+        """
+        if name not in SCENE_SECTIONS:
+            raise KeyError(f"There is no `{name}` section, expected one of {', '.join(SCENE_SECTIONS)}")
+        section = self._sections.get(name)
+        if isinstance(section, SceneSection):
+            return section
+        section = SceneSection(*section) if section is not None else self._source.compile(name)
+        self._sections[name] = section
+        if len(self._sections) == len(SCENE_SECTIONS):
+            self._source = None
+        return section
+
+    @property
+    def scenes(self) -> SceneSection:
+        """The `PhysicsScene` prims, with their `NewtonSceneAPI` settings and the settings of the XPBD, Kamino and MPM solvers."""
+        return self.section("scenes")
+
+    @property
+    def articulations(self) -> SceneSection:
+        """The articulation roots, with their `NewtonArticulationRootAPI` settings, and their `joints` and `bodies`."""
+        return self.section("articulations")
+
+    @property
+    def joints(self) -> SceneSection:
+        """The joints, with their `NewtonJointAPI` parameters, their `type`, and their bodies (`physics:body0` and `physics:body1`)."""
+        return self.section("joints")
+
+    @property
+    def bodies(self) -> SceneSection:
+        """The rigid bodies, with their `NewtonMassAPI` mass properties, and their `physics:simulationOwner` scenes."""
+        return self.section("bodies")
+
+    @property
+    def colliders(self) -> SceneSection:
+        """The collision shapes, with their Newton collision and mass settings, their `type`, `body`, physics materials and scenes."""
+        return self.section("colliders")
+
+    @property
+    def materials(self) -> SceneSection:
+        """The physics materials, with their `NewtonMaterialAPI` and `NewtonMPMMaterialAPI` parameters."""
+        return self.section("materials")
+
+    @property
+    def actuators(self) -> SceneSection:
+        """The `NewtonActuator` prims, with their control and clamping parameters, and their target joints."""
+        return self.section("actuators")
+
+    @property
+    def actuator_arrays(self) -> SceneSection:
+        """The `NewtonActuatorArray` prims, with their per-target parameter `arrays`, and their target joints."""
+        return self.section("actuator_arrays")
+
+    @property
+    def mimic(self) -> SceneSection:
+        """The joints with `NewtonMimicAPI`, with their `joint` and the `newton:mimicJoint` they follow."""
+        return self.section("mimic")
+
+    @property
+    def sites(self) -> SceneSection:
+        """The prims with `NewtonSiteAPI`, with the `body` they are attached to (their nearest rigid body ancestor)."""
+        return self.section("sites")
+
+    @property
+    def deformables(self) -> SceneSection:
+        """The prims with `NewtonPointsDeformableSimAPI`, with their per-point arrays and MPM materials."""
+        return self.section("deformables")
@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Array layouts for extracting Newton schema data from a stage.
+
+Engines typically flatten the prims of each schema (joints, actuators, scenes, ...) into
+contiguous arrays. An `ArrayLayout` records which prim occupies each row, so that later
+updates (see `newton_usd_schemas.changes`) can be addressed by row index rather than by path.
+"""
+
+from dataclasses import dataclass, field
+
+from pxr import Sdf, Usd
+
+from ._schema import schema_matcher
+
+__all__ = [
+    "ArrayLayout",
+    "extract_layout",
+]
+
+
+@dataclass(frozen=True)
+class ArrayLayout:
+    """The prim occupying each row of the extracted arrays of each schema.
+
+    Attributes:
+        paths: The prim paths of every extracted schema, in row order.
+    """
+
+    paths: dict[str, tuple[Sdf.Path, ...]]
+    _rows: dict[str, dict[Sdf.Path, int]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_rows", {schema: {path: row for row, path in enumerate(paths)} for schema, paths in self.paths.items()})
+
+    @property
+    def schemas(self) -> tuple[str, ...]:
+        """The extracted schemas."""
+        return tuple(self.paths)
+
+    def row(self, schema: str, path: Sdf.Path) -> int:
+        """Get the row of a prim in the arrays of a schema.
+
+        Returns:
+            The row index, or `-1` if the schema was not extracted or the prim does not have it.
+        """
+        return self._rows.get(schema, {}).get(path, -1)
+
+    def schemas_of(self, path: Sdf.Path) -> list[str]:
+        """Get the extracted schemas which a prim occupies a row of."""
+        return [schema for schema, rows in self._rows.items() if path in rows]
+
+
+def extract_layout(stage: Usd.Stage, schemas: list[str] | tuple[str, ...], predicate=Usd.PrimDefaultPredicate) -> ArrayLayout:
+    """Assign array rows to the prims of each schema, in a single traversal of the stage.
+
+    Applied API schemas match prims with the schema applied (including schemas which are not
+    registered with the USD runtime, such as `PhysicsDeformableBodyAPI`), and typed schemas
+    match prims of that type or a derived type. Rows follow stage traversal order.
+
+    Args:
+        stage: The stage to traverse.
+        schemas: The schema names, e.g. `NewtonJointAPI` or `NewtonActuator`.
+        predicate: The prim predicate of the traversal.
+
+    Returns:
+        The layout.
+    """
+    matchers = {schema: schema_matcher(schema) for schema in schemas}
+    paths: dict[str, list[Sdf.Path]] = {schema: [] for schema in schemas}
+    for prim in stage.Traverse(predicate):
+        for schema, matches in matchers.items():
+            if matches(prim):
+                paths[schema].append(prim.GetPath())
+    return ArrayLayout(paths={schema: tuple(schema_paths) for schema, schema_paths in paths.items()})
@@ -0,0 +1,282 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Fast extraction of Newton schema data from flat, composition-free layers.
+
+Generated assets are commonly single-layer files without sublayers, references, payloads,
+inherits, specializes, variants or value clips. The composed stage of such a layer is the layer
+itself, so `read_layer_values` reads API schema membership (the `apiSchemas` list ops) and
+attribute values directly from its `Sdf` specs, without the cost of opening a `Usd.Stage`.
+Fallback values come from the prim definitions of the schema registry, exactly as on a stage.
+
+`read_asset_values` opens an asset with the `Sdf` path when its root layer is flat, and falls
+back to `read_stage_values` otherwise, e.g.:
+
+    values = read_asset_values("robot.usdc", {"NewtonJointAPI": ["newton:armature", "newton:damping"]})
+    armature = values.values["NewtonJointAPI"]["newton:armature"]
+"""
+
+from collections import defaultdict
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError("numpy must be installed to use newton_usd_schemas.flat")  # pragma: no cover
+
+from pxr import Sdf, Tf, Usd
+
+from ._schema import stack_values
+from .extraction import ArrayLayout, extract_layout
+
+__all__ = [
+    "SchemaValues",
+    "is_composition_free",
+    "read_asset_values",
+    "read_layer_values",
+    "read_stage_values",
+]
+
+# prim metadata which composes opinions from other layers or prims, or reorders children
+_COMPOSITION_KEYS = frozenset(
+    (
+        Sdf.PrimSpec.ReferencesKey,
+        Sdf.PrimSpec.PayloadKey,
+        Sdf.PrimSpec.InheritPathsKey,
+        Sdf.PrimSpec.SpecializesKey,
+        Sdf.PrimSpec.VariantSetNamesKey,
+        Sdf.PrimSpec.VariantSelectionKey,
+        "primOrder",
+        "clips",
+        "clipSets",
+    )
+)
+
+
+@dataclass(frozen=True)
+class SchemaValues:
+    """The attribute values of the prims of each schema.
+
+    Attributes:
+        layout: The prim of each row of each schema, in traversal order.
+        values: `(R, ...)` values of each requested attribute, keyed by schema, then attribute name.
+            Values which do not form a regular NumPy array (e.g. arrays of varying length, or
+            attributes without a value) are stored in an object array.
+        composed: Whether the values were read from a composed `Usd.Stage`, rather than from the specs of a flat layer.
+    """
+
+    layout: ArrayLayout
+    values: dict[str, dict[str, np.ndarray]]
+    composed: bool
+
+
+def _flatten(layer: Sdf.Layer) -> tuple[list[tuple[Sdf.Path, Sdf.PrimSpec, list[str]]], dict[Sdf.Path, dict[str, Sdf.Path]]] | None:
+    # The path, spec and info keys of the prims matched by `Usd.PrimDefaultPredicate` in stage traversal
+    # order, and the paths of the property specs of each prim, or `None` if the layer has composition arcs.
+    if layer.subLayerPaths or layer.HasRelocates() or layer.rootPrimOrder:
+        return None
+    # `Sdf.Layer.Traverse` visits every spec without creating Python spec objects, children (in
+    # namespace order) before their parents
+    paths: list[Sdf.Path] = []
+    layer.Traverse(Sdf.Path.absoluteRootPath, paths.append)
+    prim_paths = []
+    properties: dict[Sdf.Path, dict[str, Sdf.Path]] = defaultdict(dict)
+    for path in paths:
+        if path.IsPrimPath():
+            prim_paths.append(path)
+        elif path.ContainsPrimVariantSelection():
+            return None
+        elif path.IsPrimPropertyPath():
+            properties[path.GetPrimPath()][path.name] = path
+    specs = [layer.GetPrimAtPath(path) for path in prim_paths]
+    keys = [spec.ListInfoKeys() for spec in specs]
+    if any(not _COMPOSITION_KEYS.isdisjoint(prim_keys) for prim_keys in keys):
+        return None
+
+    # The subtree of each prim precedes it in the post-order of `Traverse`, as the block of prims with
+    # a greater path depth, from which the (pre-)order of a stage traversal is rebuilt.
+    subtrees: list[tuple[int, list[int]]] = []
+    for index, (path, spec, prim_keys) in enumerate(zip(prim_paths, specs, keys, strict=True)):
+        depth = path.pathElementCount
+        start = len(subtrees)
+        while start and subtrees[start - 1][0] > depth:
+            start -= 1
+        # `Usd.PrimDefaultPredicate` prunes inactive, undefined and abstract prims, with their descendants
+        if spec.specifier == Sdf.SpecifierDef and ("active" not in prim_keys or spec.active):
+            subtree = [index]
+            for _, child in subtrees[start:]:
+                subtree.extend(child)
+        else:
+            subtree = []
+        del subtrees[start:]
+        subtrees.append((depth, subtree))
+    prims = [(prim_paths[index], specs[index], keys[index]) for _, subtree in subtrees for index in subtree]
+    return prims, properties
+
+
+def is_composition_free(layer: Sdf.Layer) -> bool:
+    """Check whether a layer composes to itself, such that it can be read without a `Usd.Stage`.
+
+    A layer is composition-free if it has no sublayers or relocates, and none of its prims have
+    references, payloads, inherits, specializes, variants, value clips or a `primOrder`.
+
+    Args:
+        layer: The layer to inspect.
+
+    Returns:
+        Whether the layer is composition-free.
+    """
+    return _flatten(layer) is not None
+
+
+def _type_matcher(schema: str) -> Callable[[str], bool]:
+    schema_type = Usd.SchemaRegistry.GetTypeFromName(schema)
+    matches: dict[str, bool] = {}
+
+    def match(type_name: str) -> bool:
+        if type_name not in matches:
+            prim_type = Usd.SchemaRegistry.GetTypeFromName(type_name) if type_name else Tf.Type.Unknown
+            matches[type_name] = prim_type != Tf.Type.Unknown and prim_type.IsA(schema_type)
+        return matches[type_name]
+
+    return match
+
+
+# the row paths of each schema matched by a prim, with the value column, name and fallback of each of its attributes
+_Plan = list[tuple[list[Sdf.Path], list[tuple[list, str, object]]]]
+
+
+def _prim_definition(type_name: str, api_schemas: list[str]) -> Usd.PrimDefinition | None:
+    registry = Usd.SchemaRegistry()
+    if api_schemas:
+        return registry.BuildComposedPrimDefinition(type_name, api_schemas)
+    return registry.FindConcretePrimDefinition(type_name) if type_name else None
+
+
+def _read_specs(
+    layer: Sdf.Layer,
+    prims: list[tuple[Sdf.Path, Sdf.PrimSpec, list[str]]],
+    properties: dict[Sdf.Path, dict[str, Sdf.Path]],
+    attributes: Mapping[str, Sequence[str]],
+) -> SchemaValues:
+    type_matchers = {
+        schema: _type_matcher(schema)
+        for schema in attributes
+        if Usd.SchemaRegistry.GetSchemaKind(schema) in (Usd.SchemaKind.ConcreteTyped, Usd.SchemaKind.AbstractTyped)
+    }
+    paths: dict[str, list[Sdf.Path]] = {schema: [] for schema in attributes}
+    values: dict[str, dict[str, list]] = {schema: {name: [] for name in names} for schema, names in attributes.items()}
+
+    # Assets typically combine a handful of prim types and `apiSchemas` list ops, so the rows, columns
+    # and fallbacks of the schemas matched by each combination are resolved once.
+    plans: dict[tuple[str, Sdf.TokenListOp | None], _Plan] = {}
+
+    def plan(type_name: str, op: Sdf.TokenListOp | None) -> _Plan:
+        api_schemas = op.ApplyOperations([]) if op is not None else []
+        definition = _prim_definition(type_name, api_schemas)
+        # unregistered schemas (e.g. `PhysicsDeformableBodyAPI`) are dropped from the definition,
+        # but are still matched by their `apiSchemas` metadata, as by `has_api_schema`
+        applied = set(api_schemas).union(definition.GetAppliedAPISchemas() if definition else ())
+        matched = []
+        for schema, names in attributes.items():
+            if schema in type_matchers:
+                if not type_matchers[schema](type_name):
+                    continue
+            elif schema not in applied:
+                continue
+            columns = [(values[schema][name], name, definition.GetAttributeFallbackValue(name) if definition else None) for name in names]
+            matched.append((paths[schema], columns))
+        return matched
+
+    for path, spec, keys in prims:
+        type_name = spec.typeName
+        op = spec.GetInfo("apiSchemas") if "apiSchemas" in keys else None
+        matched = plans.get((type_name, op))
+        if matched is None:
+            matched = plans[(type_name, op)] = plan(type_name, op)
+        if not matched:
+            continue
+        authored = properties.get(path, {})
+        for schema_paths, columns in matched:
+            schema_paths.append(path)
+            for column, name, fallback in columns:
+                attr_path = authored.get(name)
+                attr = layer.GetAttributeAtPath(attr_path) if attr_path is not None else None
+                # the default of an attribute spec is `None` if it has none, and a value block if it is blocked
+                value = attr.default if attr is not None else None
+                if value is None:
+                    column.append(fallback)
+                else:
+                    column.append(None if isinstance(value, Sdf.ValueBlock) else value)
+    return SchemaValues(
+        layout=ArrayLayout(paths={schema: tuple(schema_paths) for schema, schema_paths in paths.items()}),
+        values={schema: {name: stack_values(rows) for name, rows in schema_values.items()} for schema, schema_values in values.items()},
+        composed=False,
+    )
+
+
+def read_layer_values(layer: Sdf.Layer, attributes: Mapping[str, Sequence[str]]) -> SchemaValues:
+    """Read the attributes of the prims of each schema from the specs of a composition-free layer.
+
+    Prims are traversed as by `Usd.PrimDefaultPredicate`, and schemas are matched as by
+    `extract_layout`, including the built-in API schemas of prim types. Values are the default
+    values of the attribute specs, or the fallbacks of the prim's composed definition, which
+    is what a stage returns at `Usd.TimeCode.Default()`.
+
+    Args:
+        layer: The composition-free layer.
+        attributes: The attribute names to read, keyed by schema name, e.g. `{"NewtonJointAPI": ["newton:armature"]}`.
+
+    Returns:
+        The values, with `composed` set to `False`.
+
+    Raises:
+        ValueError: If the layer is not composition-free.
+    """
+    flattened = _flatten(layer)
+    if flattened is None:
+        raise ValueError(f"{layer.identifier} has composition arcs, and must be read with `read_stage_values`")
+    return _read_specs(layer, *flattened, attributes)
+
+
+def read_stage_values(stage: Usd.Stage, attributes: Mapping[str, Sequence[str]], predicate=Usd.PrimDefaultPredicate) -> SchemaValues:
+    """Read the attributes of the prims of each schema from a composed stage.
+
+    Args:
+        stage: The stage to traverse.
+        attributes: The attribute names to read, keyed by schema name.
+        predicate: The prim predicate of the traversal.
+
+    Returns:
+        The values at `Usd.TimeCode.Default()`, with `composed` set to `True`.
+    """
+    layout = extract_layout(stage, list(attributes), predicate)
+    values = {}
+    for schema, names in attributes.items():
+        prims = [stage.GetPrimAtPath(path) for path in layout.paths[schema]]
+        values[schema] = {name: stack_values([prim.GetAttribute(name).Get() for prim in prims]) for name in names}
+    return SchemaValues(layout=layout, values=values, composed=True)
+
+
+def read_asset_values(asset: str | Sdf.Layer, attributes: Mapping[str, Sequence[str]]) -> SchemaValues:
+    """Read the attributes of the prims of each schema from an asset, without a stage if it is flat.
+
+    Args:
+        asset: The asset path or root layer.
+        attributes: The attribute names to read, keyed by schema name.
+
+    Returns:
+        The values, read by `read_layer_values` if the root layer is composition-free, or by
+        `read_stage_values` otherwise.
+
+    Raises:
+        ValueError: If the asset cannot be opened.
+    """
+    layer = asset if isinstance(asset, Sdf.Layer) else Sdf.Layer.FindOrOpen(asset)
+    if not layer:
+        raise ValueError(f"Failed to open {asset}")
+    flattened = _flatten(layer)
+    if flattened is not None:
+        return _read_specs(layer, *flattened, attributes)
+    return read_stage_values(Usd.Stage.Open(layer, Usd.Stage.LoadAll), attributes)
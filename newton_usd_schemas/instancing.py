@@ -0,0 +1,160 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Instancing-aware array layouts, which extract each instance prototype once.
+
+Cloned assets are commonly marked `instanceable`, so that every instance shares a single
+prototype. The Newton schema data beneath an instance (e.g. `NewtonJointAPI` or `NewtonMassAPI`
+on its joints and bodies) is therefore identical for all instances of a prototype.
+`extract_instanced_layout` traverses each prototype once, and records which prototype every
+instance uses, so extraction scales with the number of unique prototypes rather than the total
+number of prims. Values are read once per prototype row with `read_prototype_values`, and
+expanded to every instance with a single gather, e.g.:
+
+    layout = extract_instanced_layout(stage, ["NewtonJointAPI"])
+    armature = read_prototype_values(stage, layout, "NewtonJointAPI", "newton:armature")
+    rows, instances = layout.instance_rows("NewtonJointAPI")
+    instance_armature = armature[rows]
+
+Prototypes are an implementation detail of the stage, and their paths (e.g. `/__Prototype_1`)
+may change whenever the stage recomposes, so a layout is only valid until the next resync.
+"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError("numpy must be installed to use newton_usd_schemas.instancing")  # pragma: no cover
+
+from pxr import Sdf, Usd
+
+from ._schema import schema_matcher, stack_values
+from .extraction import ArrayLayout
+
+__all__ = [
+    "InstancedLayout",
+    "extract_instanced_layout",
+    "read_prototype_values",
+]
+
+
+@dataclass(frozen=True)
+class InstancedLayout:
+    """The rows of the prims of each schema, with instanced prims shared by prototype.
+
+    Attributes:
+        layout: The rows of prims which are not beneath an instance, including the instance prims
+            themselves, whose own properties are not shared with other instances.
+        prototype_layout: The rows of the prims beneath every prototype, in prototype order. Prims
+            beneath instances nested in a prototype are rows of the enclosing prototype.
+        prototypes: The paths of the prototypes of `instances`, in order of first use.
+        prototype_offsets: `(Q + 1,)` int64 offsets of each schema, such that the rows of `prototypes[i]`
+            in `prototype_layout` are `offsets[i]:offsets[i + 1]`.
+        instances: The paths of the instance prims, in traversal order.
+        instance_prototypes: `(I,)` int32 index into `prototypes` of each instance.
+    """
+
+    layout: ArrayLayout
+    prototype_layout: ArrayLayout
+    prototypes: tuple[Sdf.Path, ...]
+    prototype_offsets: dict[str, np.ndarray]
+    instances: tuple[Sdf.Path, ...]
+    instance_prototypes: np.ndarray
+
+    def instance_rows(self, schema: str) -> tuple[np.ndarray, np.ndarray]:
+        """Expand the prototype rows of a schema to every instance.
+
+        Returns:
+            `(E,)` int64 row in `prototype_layout` and `(E,)` int32 index into `instances` of every
+            instanced prim with the schema, ordered by instance, then by row.
+        """
+        offsets = self.prototype_offsets[schema]
+        counts = np.diff(offsets)[self.instance_prototypes]
+        starts = offsets[:-1][self.instance_prototypes]
+        # each instance contributes the contiguous rows starts[i]:starts[i] + counts[i]
+        ends = np.cumsum(counts)
+        rows = np.arange(ends[-1] if counts.size else 0, dtype=np.int64) + np.repeat(starts - (ends - counts), counts)
+        instances = np.repeat(np.arange(len(self.instances), dtype=np.int32), counts)
+        return rows, instances
+
+    def instance_proxy_paths(self, schema: str) -> Iterator[Sdf.Path]:
+        """Lazily generate the instance proxy path of each expanded row of `instance_rows`."""
+        rows, instances = self.instance_rows(schema)
+        paths = self.prototype_layout.paths[schema]
+        for row, instance in zip(rows.tolist(), instances.tolist(), strict=True):
+            prototype = self.prototypes[self.instance_prototypes[instance]]
+            yield paths[row].ReplacePrefix(prototype, self.instances[instance])
+
+
+def extract_instanced_layout(stage: Usd.Stage, schemas: list[str] | tuple[str, ...], predicate=Usd.PrimDefaultPredicate) -> InstancedLayout:
+    """Assign array rows to the prims of each schema, traversing each instance prototype once.
+
+    Schemas are matched as by `extract_layout`.
+
+    Args:
+        stage: The stage to traverse.
+        schemas: The schema names, e.g. `NewtonJointAPI` or `NewtonMassAPI`.
+        predicate: The prim predicate of the traversal, which must not traverse instance proxies.
+
+    Returns:
+        The layout.
+    """
+    matchers = {schema: schema_matcher(schema) for schema in schemas}
+    paths: dict[str, list[Sdf.Path]] = {schema: [] for schema in schemas}
+    instances = []
+    instance_prototypes = []
+    prototypes: dict[Sdf.Path, int] = {}
+    for prim in stage.Traverse(predicate):
+        for schema, matches in matchers.items():
+            if matches(prim):
+                paths[schema].append(prim.GetPath())
+        if prim.IsInstance():
+            prototype = prim.GetPrototype().GetPath()
+            instances.append(prim.GetPath())
+            instance_prototypes.append(prototypes.setdefault(prototype, len(prototypes)))
+
+    prototype_paths: dict[str, list[Sdf.Path]] = {schema: [] for schema in schemas}
+    counts = {schema: [] for schema in schemas}
+    for prototype in prototypes:
+        start = {schema: len(schema_paths) for schema, schema_paths in prototype_paths.items()}
+        for prim in Usd.PrimRange(stage.GetPrimAtPath(prototype), Usd.TraverseInstanceProxies(predicate)):
+            for schema, matches in matchers.items():
+                if matches(prim):
+                    prototype_paths[schema].append(prim.GetPath())
+        for schema in schemas:
+            counts[schema].append(len(prototype_paths[schema]) - start[schema])
+
+    offsets = {}
+    for schema in schemas:
+        offsets[schema] = np.zeros(len(prototypes) + 1, dtype=np.int64)
+        offsets[schema][1:] = np.cumsum(counts[schema])
+    return InstancedLayout(
+        layout=ArrayLayout(paths={schema: tuple(schema_paths) for schema, schema_paths in paths.items()}),
+        prototype_layout=ArrayLayout(paths={schema: tuple(schema_paths) for schema, schema_paths in prototype_paths.items()}),
+        prototypes=tuple(prototypes),
+        prototype_offsets=offsets,
+        instances=tuple(instances),
+        instance_prototypes=np.array(instance_prototypes, dtype=np.int32),
+    )
+
+
+def read_prototype_values(
+    stage: Usd.Stage, layout: InstancedLayout, schema: str, attribute: str, time: Usd.TimeCode = Usd.TimeCode.Default()
+) -> np.ndarray:
+    """Read an attribute once per prototype row of a schema.
+
+    Args:
+        stage: The stage the layout was extracted from.
+        layout: The layout.
+        schema: The schema whose prototype rows are read.
+        attribute: The attribute name, e.g. `newton:armature`.
+        time: The time to read the values at.
+
+    Returns:
+        `(R, ...)` values of each row of `layout.prototype_layout`. Values which do not form a regular
+        NumPy array (e.g. arrays of varying length) are stored in an object array.
+    """
+    values = [stage.GetPrimAtPath(path).GetAttribute(attribute).Get(time) for path in layout.prototype_layout.paths[schema]]
+    return stack_values(values)
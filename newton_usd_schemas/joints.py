@@ -0,0 +1,165 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Batched extraction of per-DOF `NewtonJointAPI` parameters.
+
+`NewtonJointAPI` scalars broadcast to every DOF of a joint, while the `newton:dof` array
+attributes provide one value per DOF of multi-DOF joints. `read_joint_dofs` expands both
+forms into one flat array per parameter, with a row per DOF of every joint on a stage,
+in the DOF order documented by the schema.
+"""
+
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError("numpy must be installed to use newton_usd_schemas.joints")  # pragma: no cover
+
+from pxr import Sdf, Usd, UsdPhysics
+
+from ._schema import array_view, schema_definition
+
+__all__ = [
+    "JOINT_DOF_ARRAY_ATTRIBUTES",
+    "JOINT_DOF_ATTRIBUTES",
+    "JointDofArrays",
+    "joint_dof_axes",
+    "read_joint_dofs",
+]
+
+JOINT_DOF_ATTRIBUTES: dict[str, str] = {
+    "armature": "newton:armature",
+    "damping": "newton:damping",
+    "friction": "newton:friction",
+    "velocity_limit": "newton:velocityLimit",
+    "limit_stiffness": "newton:limitStiffness",
+    "limit_damping": "newton:limitDamping",
+}
+"""The parameter names of `JointDofArrays.parameters`, mapped to the scalar attributes they are read from."""
+
+JOINT_DOF_ARRAY_ATTRIBUTES: dict[str, str] = {
+    "armature": "newton:dof:armature",
+    "damping": "newton:dof:damping",
+    "friction": "newton:dof:friction",
+    "velocity_limit": "newton:dof:velocityLimit",
+    "limit_stiffness": "newton:dof:limitStiffness",
+    "limit_damping": "newton:dof:limitDamping",
+}
+"""The parameter names of `JointDofArrays.parameters`, mapped to the per-DOF array attributes overriding the scalars."""
+
+_LINEAR_AXES = (UsdPhysics.Tokens.transX, UsdPhysics.Tokens.transY, UsdPhysics.Tokens.transZ)
+_ANGULAR_AXES = (UsdPhysics.Tokens.rotX, UsdPhysics.Tokens.rotY, UsdPhysics.Tokens.rotZ)
+
+
+def joint_dof_axes(prim: Usd.Prim) -> tuple[str, ...]:
+    """Get the DOFs of a joint, in the order of the `newton:dof` array attributes.
+
+    Args:
+        prim: The `PhysicsJoint` prim.
+
+    Returns:
+        The `PhysicsLimitAPI` axis token of each DOF, e.g. `("rotZ",)` for a revolute joint about Z.
+    """
+    if prim.IsA(UsdPhysics.RevoluteJoint):
+        return (f"rot{UsdPhysics.RevoluteJoint(prim).GetAxisAttr().Get()}",)
+    if prim.IsA(UsdPhysics.PrismaticJoint):
+        return (f"trans{UsdPhysics.PrismaticJoint(prim).GetAxisAttr().Get()}",)
+    if prim.IsA(UsdPhysics.SphericalJoint):
+        return _ANGULAR_AXES
+    if prim.IsA(UsdPhysics.FixedJoint):
+        return ()
+    axes = []
+    for axis in _LINEAR_AXES + _ANGULAR_AXES:
+        if prim.HasAPI(UsdPhysics.LimitAPI, axis):
+            limit = UsdPhysics.LimitAPI(prim, axis)
+            low, high = limit.GetLowAttr().Get(), limit.GetHighAttr().Get()
+            if low is not None and high is not None and low > high:
+                continue
+        axes.append(axis)
+    return tuple(axes)
+
+
+@dataclass(frozen=True)
+class JointDofArrays:
+    """The DOFs of every joint on a stage, concatenated in joint order.
+
+    Attributes:
+        joints: The paths of the `PhysicsJoint` prims, in traversal order.
+        offsets: `(J + 1,)` int64 offsets, such that the DOFs of `joints[i]` are `offsets[i]:offsets[i + 1]`.
+        axes: The `PhysicsLimitAPI` axis token of each DOF, e.g. `transX` or `rotZ`.
+        parameters: `(D,)` float32 array of each parameter, keyed by the names of `JOINT_DOF_ATTRIBUTES`.
+    """
+
+    joints: tuple[Sdf.Path, ...]
+    offsets: np.ndarray
+    axes: tuple[str, ...]
+    parameters: dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.axes)
+
+    def angular(self) -> np.ndarray:
+        """Get whether each DOF is angular, and therefore uses angular units (i.e. degrees).
+
+        Returns:
+            `(D,)` bool array, `True` for rotational DOFs.
+        """
+        return np.array([axis.startswith("rot") for axis in self.axes], dtype=bool)
+
+
+def read_joint_dofs(stage: Usd.Stage, predicate=Usd.PrimDefaultPredicate, time: Usd.TimeCode = Usd.TimeCode.Default()) -> JointDofArrays:
+    """Extract the per-DOF `NewtonJointAPI` parameters of every joint on a stage.
+
+    Every `PhysicsJoint` is included, so that the arrays align with the DOFs of the simulation.
+    The DOFs of a joint with an authored `newton:dof` array use its elements, and otherwise
+    the joint's scalar (or the schema fallback, e.g. for joints without `NewtonJointAPI`)
+    is broadcast to each of its DOFs.
+
+    Args:
+        stage: The stage to traverse.
+        predicate: The prim predicate of the traversal.
+        time: The time to read the parameters at.
+
+    Returns:
+        The per-DOF parameters.
+
+    Raises:
+        ValueError: If a `newton:dof` array does not have one element per DOF of its joint.
+    """
+    definition = schema_definition("NewtonJointAPI")
+    fallbacks = {field: definition.GetAttributeFallbackValue(name) for field, name in JOINT_DOF_ATTRIBUTES.items()}
+
+    joints = []
+    axes: list[str] = []
+    counts = []
+    scalars: dict[str, list[float]] = {field: [] for field in JOINT_DOF_ATTRIBUTES}
+    overrides: dict[str, list[tuple[int, np.ndarray]]] = {field: [] for field in JOINT_DOF_ATTRIBUTES}
+    for prim in stage.Traverse(predicate):
+        if not prim.IsA(UsdPhysics.Joint):
+            continue
+        joint_axes = joint_dof_axes(prim)
+        index = len(joints)
+        joints.append(prim.GetPath())
+        axes.extend(joint_axes)
+        counts.append(len(joint_axes))
+        for field, name in JOINT_DOF_ATTRIBUTES.items():
+            value = prim.GetAttribute(name).Get(time) if prim.HasAttribute(name) else None
+            scalars[field].append(fallbacks[field] if value is None else value)
+            array_name = JOINT_DOF_ARRAY_ATTRIBUTES[field]
+            values = prim.GetAttribute(array_name).Get(time) if prim.HasAttribute(array_name) else None
+            if values is not None and len(values) > 0:
+                values = array_view(values)
+                if values.shape[0] != len(joint_axes):
+                    raise ValueError(f"{prim.GetPath()}: `{array_name}` has {values.shape[0]} elements but the joint has {len(joint_axes)} DOFs")
+                overrides[field].append((index, values))
+
+    offsets = np.zeros(len(joints) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(counts)
+    parameters = {}
+    for field in JOINT_DOF_ATTRIBUTES:
+        values = np.repeat(np.asarray(scalars[field], dtype=np.float32), np.asarray(counts, dtype=np.int64))
+        for index, joint_values in overrides[field]:
+            values[offsets[index] : offsets[index + 1]] = joint_values
+        parameters[field] = values
+    return JointDofArrays(joints=tuple(joints), offsets=offsets, axes=tuple(axes), parameters=parameters)
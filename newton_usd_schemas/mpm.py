@@ -0,0 +1,325 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Planning utilities for scenes with `NewtonMPMSceneAPI` applied.
+
+These scan the `NewtonPointsDeformableSimAPI` prims simulated by an MPM scene to inform the
+background grid configuration (`newton:mpm:voxelSize`, `newton:mpm:gridType`,
+`newton:mpm:gridPadding` and `newton:mpm:maxActiveCellCount`) before any solver runs.
+"""
+
+import math
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError("numpy must be installed to use newton_usd_schemas.mpm")  # pragma: no cover
+
+from pxr import Usd
+
+from .particle_io import iter_particle_chunks, scene_particle_prims
+
+__all__ = [
+    "GridOccupancy",
+    "MPMGridEstimate",
+    "WidthStatistics",
+    "estimate_mpm_grid",
+    "measure_grid_occupancy",
+]
+
+
+@dataclass(frozen=True)
+class WidthStatistics:
+    """Summary statistics of particle widths (diameters).
+
+    Attributes:
+        count: The number of particles with an authored width.
+        min: The smallest width.
+        max: The largest width.
+        mean: The mean width.
+        std: The standard deviation of the widths.
+    """
+
+    count: int
+    min: float
+    max: float
+    mean: float
+    std: float
+
+
+@dataclass(frozen=True)
+class MPMGridEstimate:
+    """Estimated background grid of an MPM scene.
+
+    Attributes:
+        particle_count: The number of particles simulated by the scene.
+        widths: Statistics of the particle widths.
+        bounds: `(2, 3)` lower and upper corners of the particle bounds, padded by the particle radii.
+        proposed_voxel_size: The voxel size derived from the particle widths.
+        voxel_size: The voxel size used for the estimate; the authored `newton:mpm:voxelSize`, or the proposal if it is `-inf`.
+        grid_type: The authored `newton:mpm:gridType`.
+        grid_padding: The authored `newton:mpm:gridPadding`.
+        active_cell_count: The estimated number of allocated grid cells, including padding.
+        memory_bytes: The estimated grid memory, `active_cell_count * bytes_per_cell`.
+    """
+
+    particle_count: int
+    widths: WidthStatistics
+    bounds: np.ndarray
+    proposed_voxel_size: float
+    voxel_size: float
+    grid_type: str
+    grid_padding: int
+    active_cell_count: int
+    memory_bytes: int
+
+
+def _ceil(value: float) -> int:
+    # particle data is single precision, so ignore relative rounding error when counting whole cells
+    return math.ceil(value * (1.0 - 1e-6))
+
+
+def _scan(prims: list[Usd.Prim], chunk_size: int) -> tuple[int, WidthStatistics, np.ndarray, float]:
+    count = 0
+    width_count = 0
+    width_sum = 0.0
+    width_sum_sq = 0.0
+    width_cube_sum = 0.0
+    width_min = math.inf
+    width_max = -math.inf
+    lower = np.full(3, np.inf)
+    upper = np.full(3, -np.inf)
+    for prim in prims:
+        for chunk in iter_particle_chunks(prim, chunk_size):
+            if not len(chunk):
+                continue
+            count += len(chunk)
+            radii = 0.0
+            if chunk.radii is not None:
+                radii = chunk.radii[:, None]
+                widths = chunk.radii.astype(np.float64) * 2.0
+                width_count += widths.shape[0]
+                width_sum += widths.sum()
+                width_sum_sq += np.dot(widths, widths)
+                width_cube_sum += np.sum(widths**3)
+                width_min = min(width_min, widths.min())
+                width_max = max(width_max, widths.max())
+            lower = np.minimum(lower, (chunk.points - radii).min(axis=0))
+            upper = np.maximum(upper, (chunk.points + radii).max(axis=0))
+
+    if width_count == 0:
+        raise ValueError("the MPM scene does not simulate any particles with authored widths")
+    mean = width_sum / width_count
+    std = math.sqrt(max(width_sum_sq / width_count - mean * mean, 0.0))
+    statistics = WidthStatistics(count=width_count, min=float(width_min), max=float(width_max), mean=float(mean), std=std)
+    # particles without widths are assumed to have the mean width
+    volume = width_cube_sum + (count - width_count) * mean**3
+    return count, statistics, np.stack((lower, upper)), volume
+
+
+def estimate_mpm_grid(
+    scene: Usd.Prim,
+    particles_per_cell_axis: float = 2.0,
+    bytes_per_cell: int = 64,
+    chunk_size: int = 1 << 20,
+) -> MPMGridEstimate:
+    """Propose a voxel size for an MPM scene and estimate the size of its background grid.
+
+    All particle prims simulated by the scene (see `particle_io.scene_particle_prims`) are
+    scanned in chunks, accumulating width statistics and bounds in a single vectorized pass.
+
+    The proposed voxel size fits `particles_per_cell_axis` mean particle widths along each
+    cell axis. The grid is then estimated for the authored `newton:mpm:voxelSize` (or the
+    proposal, when the solver default `-inf` is authored):
+
+    - "dense" grids allocate every cell of the particle bounds, grown by `newton:mpm:gridPadding` cells on each side.
+    - "sparse" and "fixed" grids allocate the cells covered by the particle volume (each particle
+      filling a cube of its width), treated as a single compact region grown by the padding.
+
+    The sparse estimate is a lower bound for scattered particles. Use `measure_grid_occupancy`
+    when the exact number of occupied cells is required.
+
+    Args:
+        scene: A `PhysicsScene` prim with `NewtonMPMSceneAPI` applied.
+        particles_per_cell_axis: The number of particle widths per voxel edge.
+        bytes_per_cell: The solver memory per allocated cell, used to estimate the grid footprint.
+            Calibrate this for the engine and basis configuration in use.
+        chunk_size: The number of particles processed at once.
+
+    Returns:
+        The grid estimate.
+
+    Raises:
+        ValueError: If `NewtonMPMSceneAPI` is not applied, or the scene simulates no particles with authored widths.
+    """
+    if not scene.HasAPI("NewtonMPMSceneAPI"):
+        raise ValueError(f"{scene.GetPath()} does not have NewtonMPMSceneAPI applied")
+
+    count, widths, bounds, volume = _scan(scene_particle_prims(scene), chunk_size)
+    proposed = widths.mean * particles_per_cell_axis
+    authored = scene.GetAttribute("newton:mpm:voxelSize").Get()
+    voxel_size = float(authored) if authored is not None and authored > 0.0 else proposed
+    grid_type = str(scene.GetAttribute("newton:mpm:gridType").Get())
+    padding = int(scene.GetAttribute("newton:mpm:gridPadding").Get())
+
+    if grid_type == "dense":
+        active = math.prod(max(_ceil(extent / voxel_size), 1) + 2 * padding for extent in (bounds[1] - bounds[0]).tolist())
+    else:
+        occupied = max(_ceil(volume / voxel_size**3), 1)
+        active = _ceil((occupied ** (1.0 / 3.0) + 2 * padding) ** 3)
+
+    return MPMGridEstimate(
+        particle_count=count,
+        widths=widths,
+        bounds=bounds,
+        proposed_voxel_size=float(proposed),
+        voxel_size=voxel_size,
+        grid_type=grid_type,
+        grid_padding=padding,
+        active_cell_count=active,
+        memory_bytes=active * bytes_per_cell,
+    )
+
+
+@dataclass(frozen=True)
+class GridOccupancy:
+    """Exact background grid occupancy of an MPM scene at a given voxel size.
+
+    Attributes:
+        voxel_size: The voxel size used to bin the particles.
+        grid_padding: The number of padding cells grown around the occupied cells.
+        block_size: The number of cells along each edge of a sparse grid block.
+        particle_count: The number of binned particles.
+        occupied_cell_count: The number of cells containing at least one particle.
+        active_cell_count: The number of cells within `grid_padding` cells of an occupied cell.
+        active_block_count: The number of blocks containing at least one active cell.
+        allocated_cells: The number of cells allocated by each `newton:mpm:gridType` strategy.
+            "sparse" and "fixed" grids allocate whole blocks around the active cells (a "fixed"
+            grid keeps the topology of this particle state), while "dense" grids allocate the
+            padded bounding box of the occupied cells.
+    """
+
+    voxel_size: float
+    grid_padding: int
+    block_size: int
+    particle_count: int
+    occupied_cell_count: int
+    active_cell_count: int
+    active_block_count: int
+    allocated_cells: dict[str, int]
+
+
+# cell coordinates are packed into 21 bits per axis, so a single int64 key identifies each cell
+_KEY_BITS = 21
+_KEY_BIAS = 1 << (_KEY_BITS - 1)
+_KEY_MASK = (1 << _KEY_BITS) - 1
+
+
+def _encode(cells: np.ndarray) -> np.ndarray:
+    biased = cells + _KEY_BIAS
+    if biased.size and (biased.min() < 0 or biased.max() > _KEY_MASK):
+        raise ValueError(f"particles span more than {1 << _KEY_BITS} cells along an axis; increase the voxel size")
+    return (biased[:, 0] << (2 * _KEY_BITS)) | (biased[:, 1] << _KEY_BITS) | biased[:, 2]
+
+
+def _decode(keys: np.ndarray) -> np.ndarray:
+    return np.stack(((keys >> (2 * _KEY_BITS)) & _KEY_MASK, (keys >> _KEY_BITS) & _KEY_MASK, keys & _KEY_MASK), axis=1) - _KEY_BIAS
+
+
+def _unique(keys: np.ndarray) -> np.ndarray:
+    # equivalent to `numpy.unique`, but always sort based, which is much faster for large int64 keys than
+    # the hash based implementation newer NumPy releases select
+    keys = np.sort(keys)
+    mask = np.empty(keys.shape, dtype=bool)
+    mask[:1] = True
+    np.not_equal(keys[1:], keys[:-1], out=mask[1:])
+    return keys[mask]
+
+
+def _dilate(keys: np.ndarray, padding: int) -> np.ndarray:
+    # a cube neighborhood is separable, so dilate one axis at a time rather than by all (2p + 1)^3 offsets
+    cells = _decode(keys)
+    for axis in range(3):
+        shifted = np.repeat(cells[None], 2 * padding + 1, axis=0)
+        shifted[:, :, axis] += np.arange(-padding, padding + 1)[:, None]
+        cells = _decode(_unique(_encode(shifted.reshape(-1, 3))))
+    return _encode(cells)
+
+
+def measure_grid_occupancy(
+    scene: Usd.Prim,
+    voxel_size: float | None = None,
+    block_size: int = 8,
+    chunk_size: int = 1 << 22,
+) -> GridOccupancy:
+    """Bin every particle simulated by an MPM scene into grid cells and count the allocated cells.
+
+    Particles are streamed in chunks. Each chunk is binned by hashing its cell coordinates into
+    int64 keys and reducing them to unique keys; the unique keys of consecutive chunks are
+    merged lazily, so memory scales with the number of occupied cells rather than particles.
+
+    Args:
+        scene: A `PhysicsScene` prim with `NewtonMPMSceneAPI` applied. Its `newton:mpm:gridPadding` is honored.
+        voxel_size: The voxel size to bin at. Defaults to the authored `newton:mpm:voxelSize`.
+        block_size: The number of cells along each edge of a sparse grid block.
+        chunk_size: The number of particles binned at once.
+
+    Returns:
+        The grid occupancy.
+
+    Raises:
+        ValueError: If `NewtonMPMSceneAPI` is not applied, no positive voxel size is given or authored,
+            or the particles span too many cells.
+    """
+    if not scene.HasAPI("NewtonMPMSceneAPI"):
+        raise ValueError(f"{scene.GetPath()} does not have NewtonMPMSceneAPI applied")
+    if voxel_size is None:
+        voxel_size = scene.GetAttribute("newton:mpm:voxelSize").Get()
+    if voxel_size is None or not voxel_size > 0.0:
+        raise ValueError(f"{scene.GetPath()} does not author a positive newton:mpm:voxelSize; provide a voxel size")
+    if block_size < 1:
+        raise ValueError(f"block_size must be positive, got {block_size}")
+    padding = int(scene.GetAttribute("newton:mpm:gridPadding").Get())
+
+    count = 0
+    occupied = np.empty(0, dtype=np.int64)
+    pending = []
+    pending_size = 0
+    lower = np.full(3, np.iinfo(np.int64).max)
+    upper = np.full(3, np.iinfo(np.int64).min)
+    inverse_voxel_size = 1.0 / voxel_size
+    for prim in scene_particle_prims(scene):
+        for chunk in iter_particle_chunks(prim, chunk_size):
+            if not len(chunk):
+                continue
+            count += len(chunk)
+            cells = np.floor(chunk.points * inverse_voxel_size).astype(np.int64)
+            lower = np.minimum(lower, cells.min(axis=0))
+            upper = np.maximum(upper, cells.max(axis=0))
+            keys = _unique(_encode(cells))
+            pending.append(keys)
+            pending_size += keys.shape[0]
+            # merge once the pending keys outgrow the merged set, which keeps merging amortized linear
+            if pending_size > max(occupied.shape[0], chunk_size):
+                occupied = _unique(np.concatenate([occupied, *pending]))
+                pending = []
+                pending_size = 0
+    if pending:
+        occupied = _unique(np.concatenate([occupied, *pending]))
+
+    active = _dilate(occupied, padding) if padding and occupied.size else occupied
+    blocks = _unique(_encode(np.floor_divide(_decode(active), block_size))) if active.size else active
+    dense = math.prod((upper - lower + 1 + 2 * padding).tolist()) if count else 0
+    sparse = blocks.shape[0] * block_size**3
+
+    return GridOccupancy(
+        voxel_size=float(voxel_size),
+        grid_padding=padding,
+        block_size=block_size,
+        particle_count=count,
+        occupied_cell_count=occupied.shape[0],
+        active_cell_count=active.shape[0],
+        active_block_count=blocks.shape[0],
+        allocated_cells={"sparse": sparse, "fixed": sparse, "dense": dense},
+    )
@@ -0,0 +1,237 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Batched extraction of `NewtonMPMMaterialAPI` parameters for the particles of an MPM scene.
+
+Physics material bindings are resolved once for every particle prim (and every `materialBind`
+`GeomSubset` of those prims), and the bound materials, along with the `newton:mpm:materials`
+selected per point by `newton:mpm:materialIndices`, are reduced to a deduplicated table of
+constitutive parameters. Solvers can then assign a material to every particle with a single
+gather, `table.materials[table.particle_materials()]`, rather than resolving bindings per
+particle, or use `table.particle_parameters()` to also apply per-point parameter arrays.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError("numpy must be installed to use newton_usd_schemas.mpm_materials")  # pragma: no cover
+
+from pxr import Sdf, Usd, UsdGeom, UsdShade
+
+from ._schema import array_view
+from .particle_io import scene_particle_prims
+
+__all__ = [
+    "MPM_MATERIAL_ATTRIBUTES",
+    "MPM_MATERIAL_DTYPE",
+    "MPM_POINT_ATTRIBUTES",
+    "MPMMaterialTable",
+    "read_mpm_materials",
+]
+
+MPM_MATERIAL_ATTRIBUTES: dict[str, str] = {
+    "density": "physics:density",
+    "youngs_modulus": "newton:mpm:youngsModulus",
+    "poissons_ratio": "newton:mpm:poissonsRatio",
+    "elastic_damping": "newton:mpm:elasticDamping",
+    "internal_friction": "newton:mpm:internalFriction",
+    "yield_pressure": "newton:mpm:yieldPressure",
+    "tensile_yield_ratio": "newton:mpm:tensileYieldRatio",
+    "yield_stress": "newton:mpm:yieldStress",
+    "viscosity": "newton:mpm:viscosity",
+    "initial_plastic_volume_strain": "newton:mpm:initialPlasticVolumeStrain",
+    "hardening": "newton:mpm:hardening",
+    "hardening_rate": "newton:mpm:hardeningRate",
+    "softening_rate": "newton:mpm:softeningRate",
+    "dilatancy": "newton:mpm:dilatancy",
+}
+"""The field names of `MPM_MATERIAL_DTYPE`, mapped to the material attributes they are read from."""
+
+MPM_MATERIAL_DTYPE = np.dtype([(field, np.float32) for field in MPM_MATERIAL_ATTRIBUTES])
+"""The structured dtype of a row of `MPMMaterialTable.materials`."""
+
+MPM_POINT_ATTRIBUTES: dict[str, str] = {field: MPM_MATERIAL_ATTRIBUTES[field] for field in ("youngs_modulus", "internal_friction", "yield_pressure")}
+"""The fields which `NewtonPointsDeformableSimAPI` can override per point, mapped to their array attributes."""
+
+# `physics:density` of 0 is ignored by UsdPhysics, every other attribute defers to the engine with `-inf`
+_SENTINELS = {field: 0.0 if field == "density" else -np.inf for field in MPM_MATERIAL_ATTRIBUTES}
+
+
+@dataclass(frozen=True)
+class MPMMaterialTable:
+    """Deduplicated MPM materials of the particle prims simulated by a scene.
+
+    Attributes:
+        materials: `(M,)` structured array of `MPM_MATERIAL_DTYPE`, one row per distinct set of parameters.
+        material_paths: The path of a material prim which produced each row. Particles without a bound
+            material use the schema fallback values, and their row has an empty path (unless a bound
+            material resolves to the same parameters).
+        prims: The particle prims, in the order of `scene_particle_prims`.
+        prim_materials: `(P,)` int32 row of the material bound to each particle prim.
+        point_counts: `(P,)` int64 number of particles of each prim.
+        subsets: `(prim index, point indices, row)` for every `materialBind` subset of a particle prim,
+            whose bound material overrides the prim's material for the listed particles.
+        point_materials: `(prim index, rows)` for every particle prim authoring `newton:mpm:materialIndices`,
+            with the `(N,)` int32 row of each particle's material. These take precedence over `subsets`.
+    """
+
+    materials: np.ndarray
+    material_paths: tuple[Sdf.Path, ...]
+    prims: tuple[Usd.Prim, ...]
+    prim_materials: np.ndarray
+    point_counts: np.ndarray
+    subsets: tuple[tuple[int, np.ndarray, int], ...]
+    point_materials: tuple[tuple[int, np.ndarray], ...] = ()
+
+    def particle_materials(self) -> np.ndarray:
+        """Get the material row of every particle.
+
+        Returns:
+            `(N,)` int32 rows into `materials` for the particles of all `prims`, concatenated in order.
+        """
+        rows = np.repeat(self.prim_materials, self.point_counts)
+        offsets = np.concatenate(([0], np.cumsum(self.point_counts)))
+        for prim_index, indices, row in self.subsets:
+            rows[offsets[prim_index] + indices] = row
+        for prim_index, prim_rows in self.point_materials:
+            rows[offsets[prim_index] : offsets[prim_index + 1]] = prim_rows
+        return rows
+
+    def particle_parameters(self) -> np.ndarray:
+        """Get the material parameters of every particle, including per-point overrides.
+
+        This gathers the row of each particle from `materials`, then applies the per-point
+        `MPM_POINT_ATTRIBUTES` arrays authored on the particle prims.
+
+        Returns:
+            `(N,)` structured array of `MPM_MATERIAL_DTYPE` for the particles of all `prims`, concatenated in order.
+
+        Raises:
+            ValueError: If a per-point array does not match the number of points of its prim.
+        """
+        parameters = self.materials[self.particle_materials()]
+        offsets = np.concatenate(([0], np.cumsum(self.point_counts)))
+        for prim_index, prim in enumerate(self.prims):
+            count = int(self.point_counts[prim_index])
+            for field, name in MPM_POINT_ATTRIBUTES.items():
+                values = _point_array(prim, name, count)
+                if values is not None:
+                    parameters[field][offsets[prim_index] : offsets[prim_index + 1]] = values
+        return parameters
+
+
+def _point_array(prim: Usd.Prim, name: str, count: int) -> np.ndarray | None:
+    attr = prim.GetAttribute(name)
+    if not attr or not attr.HasAuthoredValue():
+        return None
+    values = array_view(attr.Get())
+    if values.shape[0] != count:
+        raise ValueError(f"{prim.GetPath()}: `{name}` has {values.shape[0]} elements but `points` has {count}")
+    return values
+
+
+def _resolve(material: Usd.Prim | None, fallbacks: dict[str, float], defaults: Mapping[str, float]) -> tuple[float, ...]:
+    row = []
+    for field, name in MPM_MATERIAL_ATTRIBUTES.items():
+        value = None
+        if material is not None and (attr := material.GetAttribute(name)):
+            value = attr.Get()
+        if value is None:
+            value = fallbacks[field]
+        if value == _SENTINELS[field]:
+            value = defaults.get(field, value)
+        # deduplicate on the stored precision
+        row.append(float(np.float32(value)))
+    return tuple(row)
+
+
+def read_mpm_materials(scene: Usd.Prim, defaults: Mapping[str, float] | None = None) -> MPMMaterialTable:
+    """Extract the MPM materials bound to the particles simulated by a scene.
+
+    The `physics` purpose material binding of every particle prim, and of every `point`
+    `GeomSubset` in its `materialBind` family, is resolved in a single batched query. Particles
+    of prims which author `newton:mpm:materialIndices` use the selected `newton:mpm:materials`
+    target instead. Attributes which are not authored (or not defined, e.g. on a material
+    without `NewtonMPMMaterialAPI`) use the schema fallback values.
+
+    Sentinel values, `-inf` (or `0` for `physics:density`), which defer the choice to the
+    solver, are replaced by `defaults`. This is the solver's policy; sentinels for fields it
+    does not provide are kept, so that the solver can detect them. Rows are deduplicated after
+    the defaults are applied, so materials which differ only in explicitly authoring a default
+    share a row.
+
+    Args:
+        scene: The `PhysicsScene` prim, usually with `NewtonMPMSceneAPI` applied.
+        defaults: The solver defaults, keyed by field name of `MPM_MATERIAL_DTYPE`.
+
+    Returns:
+        The material table.
+
+    Raises:
+        ValueError: If `defaults` contains an unknown field, a subset indexes past the points of its prim,
+            or `newton:mpm:materialIndices` does not match the points of its prim or its `newton:mpm:materials`.
+    """
+    defaults = dict(defaults or {})
+    unknown = sorted(set(defaults) - set(MPM_MATERIAL_ATTRIBUTES))
+    if unknown:
+        raise ValueError(f"unknown MPM material fields in defaults: {unknown}")
+    definition = Usd.SchemaRegistry().FindAppliedAPIPrimDefinition("NewtonMPMMaterialAPI")
+    fallbacks = {field: definition.GetAttributeFallbackValue(name) for field, name in MPM_MATERIAL_ATTRIBUTES.items()}
+
+    prims = scene_particle_prims(scene)
+    subset_prims = []
+    subset_owners = []
+    for index, prim in enumerate(prims):
+        for subset in UsdShade.MaterialBindingAPI(prim).GetMaterialBindSubsets():
+            if subset.GetElementTypeAttr().Get() == UsdGeom.Tokens.point:
+                subset_prims.append(subset)
+                subset_owners.append(index)
+    bound, _ = UsdShade.MaterialBindingAPI.ComputeBoundMaterials(prims + [subset.GetPrim() for subset in subset_prims], "physics")
+
+    rows: dict[tuple[float, ...], int] = {}
+    paths: list[Sdf.Path] = []
+    resolved: dict[Sdf.Path, int] = {}
+
+    def row_of(material: UsdShade.Material) -> int:
+        path = material.GetPath() if material else Sdf.Path.emptyPath
+        if path not in resolved:
+            values = _resolve(material.GetPrim() if material else None, fallbacks, defaults)
+            if values not in rows:
+                rows[values] = len(paths)
+                paths.append(path)
+            resolved[path] = rows[values]
+        return resolved[path]
+
+    prim_materials = np.array([row_of(material) for material in bound[: len(prims)]], dtype=np.int32)
+    point_counts = np.array([len(UsdGeom.Points(prim).GetPointsAttr().Get() or ()) for prim in prims], dtype=np.int64)
+
+    subsets = []
+    for owner, subset, material in zip(subset_owners, subset_prims, bound[len(prims) :], strict=True):
+        indices = np.asarray(subset.GetIndicesAttr().Get() or (), dtype=np.int64)
+        if indices.size and (indices.min() < 0 or indices.max() >= point_counts[owner]):
+            raise ValueError(f"{subset.GetPath()} indexes outside the {point_counts[owner]} points of {prims[owner].GetPath()}")
+        subsets.append((owner, indices, row_of(material)))
+
+    point_materials = []
+    for index, prim in enumerate(prims):
+        indices = _point_array(prim, "newton:mpm:materialIndices", int(point_counts[index]))
+        if indices is None:
+            continue
+        targets = prim.GetRelationship("newton:mpm:materials").GetForwardedTargets() if prim.HasRelationship("newton:mpm:materials") else []
+        if indices.size and (indices.min() < 0 or indices.max() >= len(targets)):
+            raise ValueError(f"{prim.GetPath()}: `newton:mpm:materialIndices` must be in [0, {len(targets)}) to select from `newton:mpm:materials`")
+        lookup = np.array([row_of(UsdShade.Material(prim.GetStage().GetPrimAtPath(target))) for target in targets], dtype=np.int32)
+        point_materials.append((index, lookup[indices] if indices.size else np.empty(0, dtype=np.int32)))
+
+    return MPMMaterialTable(
+        materials=np.array(list(rows), dtype=MPM_MATERIAL_DTYPE),
+        material_paths=tuple(paths),
+        prims=tuple(prims),
+        prim_materials=prim_materials,
+        point_counts=point_counts,
+        subsets=tuple(subsets),
+        point_materials=tuple(point_materials),
+    )
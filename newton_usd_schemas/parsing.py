@@ -0,0 +1,289 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Parsing of Newton schema data aligned with the descriptors of `UsdPhysics.LoadUsdPhysicsFromRange`.
+
+`UsdPhysics` parses the standard physics descriptors (scenes, bodies, shapes, joints, ...) of a
+prim range in a single optimized pass, which returns the prim paths and descriptors of each
+`UsdPhysics.ObjectType`. `load_newton_from_range` parses the Newton API schemas of the same
+prims, such as `NewtonJointAPI`, `NewtonMimicAPI`, `NewtonMassAPI` and `NewtonCollisionAPI`, in
+one further traversal of the range, and returns them in the same order as the `UsdPhysics`
+descriptors, so the two can be joined by index rather than by path:
+
+    parsed = load_newton_from_range(stage, ["/World"])
+    paths, joints = parsed.physics[UsdPhysics.ObjectType.RevoluteJoint]
+    armature = parsed.descriptors[UsdPhysics.ObjectType.RevoluteJoint].values["newton:armature"]
+    # armature[i] belongs to joints[i], the joint at paths[i]
+
+`NewtonActuator` and `NewtonActuatorArray` prims, which `UsdPhysics` does not parse, are
+collected by the same traversal.
+"""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError("numpy must be installed to use newton_usd_schemas.parsing")  # pragma: no cover
+
+from pxr import Sdf, Usd, UsdPhysics
+
+from ._schema import prim_range, schema_definition, schema_matcher, stack_values
+
+__all__ = [
+    "ACTUATOR_ARRAY_SCHEMAS",
+    "ACTUATOR_SCHEMAS",
+    "NEWTON_DESCRIPTOR_SCHEMAS",
+    "NewtonDescriptors",
+    "NewtonParse",
+    "load_newton_from_range",
+    "read_newton_descriptors",
+]
+
+_ObjectType = UsdPhysics.ObjectType
+
+_JOINT_SCHEMAS = ("NewtonJointAPI", "NewtonMimicAPI")
+_SHAPE_SCHEMAS = ("NewtonCollisionAPI", "NewtonMeshCollisionAPI", "NewtonSDFCollisionAPI", "NewtonMassAPI", "NewtonSiteAPI")
+
+NEWTON_DESCRIPTOR_SCHEMAS: dict[UsdPhysics.ObjectType, tuple[str, ...]] = {
+    _ObjectType.Scene: ("NewtonSceneAPI", "NewtonXpbdSceneAPI", "NewtonKaminoSceneAPI", "NewtonMPMSceneAPI"),
+    _ObjectType.RigidBody: ("NewtonMassAPI",),
+    _ObjectType.Articulation: ("NewtonArticulationRootAPI",),
+    _ObjectType.RigidBodyMaterial: ("NewtonMaterialAPI", "NewtonMPMMaterialAPI"),
+    **dict.fromkeys(
+        (
+            _ObjectType.FixedJoint,
+            _ObjectType.RevoluteJoint,
+            _ObjectType.PrismaticJoint,
+            _ObjectType.SphericalJoint,
+            _ObjectType.DistanceJoint,
+            _ObjectType.D6Joint,
+            _ObjectType.CustomJoint,
+        ),
+        _JOINT_SCHEMAS,
+    ),
+    **dict.fromkeys(
+        (
+            _ObjectType.SphereShape,
+            _ObjectType.CubeShape,
+            _ObjectType.CapsuleShape,
+            _ObjectType.Capsule1Shape,
+            _ObjectType.CylinderShape,
+            _ObjectType.Cylinder1Shape,
+            _ObjectType.ConeShape,
+            _ObjectType.MeshShape,
+            _ObjectType.PlaneShape,
+            _ObjectType.CustomShape,
+            _ObjectType.SpherePointsShape,
+        ),
+        _SHAPE_SCHEMAS,
+    ),
+}
+"""The Newton API schemas parsed for the descriptors of each `UsdPhysics.ObjectType`."""
+
+ACTUATOR_SCHEMAS: tuple[str, ...] = (
+    "NewtonActuator",
+    "NewtonActuatorDelayAPI",
+    "NewtonPDControlAPI",
+    "NewtonPIDControlAPI",
+    "NewtonNeuralControlAPI",
+    "NewtonMaxEffortClampingAPI",
+    "NewtonDCMotorClampingAPI",
+    "NewtonPositionBasedClampingAPI",
+)
+"""The schemas parsed for `NewtonActuator` prims."""
+
+ACTUATOR_ARRAY_SCHEMAS: tuple[str, ...] = ("NewtonActuatorArray",)
+"""The schemas parsed for `NewtonActuatorArray` prims.
+
+These are parsed separately from `ACTUATOR_SCHEMAS`, as their parameters are arrays with the same
+names as the scalar parameters of `NewtonActuator`, e.g. `newton:kp`.
+"""
+
+_PhysicsResult = dict[UsdPhysics.ObjectType, tuple[Sequence[Sdf.Path], object]]
+
+
+@dataclass(frozen=True)
+class NewtonDescriptors:
+    """The Newton schema data of a list of prims, one row per prim.
+
+    Attributes:
+        paths: The prim of each row.
+        applied: `(N,)` bool array of each parsed schema, which is `True` for the rows with the schema applied
+            (or of the schema's type, for typed schemas).
+        values: `(N, ...)` values of each attribute of the parsed schemas, keyed by attribute name. Rows
+            without the schema hold the schema fallback. Values which do not form a regular NumPy array
+            (e.g. arrays of varying length, or blocked values, which are `None`) are stored in an object array.
+        targets: The forwarded targets of each relationship of the parsed schemas, keyed by relationship
+            name, with an empty tuple for rows without targets.
+    """
+
+    paths: tuple[Sdf.Path, ...]
+    applied: dict[str, np.ndarray]
+    values: dict[str, np.ndarray]
+    targets: dict[str, tuple[tuple[Sdf.Path, ...], ...]]
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+
+@dataclass(frozen=True)
+class NewtonParse:
+    """The `UsdPhysics` descriptors of a prim range, with the Newton schema data of each descriptor.
+
+    Attributes:
+        physics: The result of `UsdPhysics.LoadUsdPhysicsFromRange`, i.e. the prim paths and
+            descriptors of each object type.
+        descriptors: The Newton data of each object type of `physics` with Newton schemas (see
+            `NEWTON_DESCRIPTOR_SCHEMAS`), whose row `i` belongs to descriptor `i` of that type.
+        actuators: The `NewtonActuator` prims of the range, in traversal order (see `ACTUATOR_SCHEMAS`).
+        actuator_arrays: The `NewtonActuatorArray` prims of the range, in traversal order (see
+            `ACTUATOR_ARRAY_SCHEMAS`), with one array of per-target values per row.
+        traversal_order: The `(N,)` int64 positions in the traversal of the range of the prims of the
+            rows of each object type of `descriptors`, e.g. to merge the rows of several object types
+            in traversal order, with `-1` for prims outside of the range.
+    """
+
+    physics: _PhysicsResult
+    descriptors: dict[UsdPhysics.ObjectType, NewtonDescriptors]
+    actuators: NewtonDescriptors
+    actuator_arrays: NewtonDescriptors
+    traversal_order: dict[UsdPhysics.ObjectType, np.ndarray]
+
+
+class _Rows:
+    # accumulates the rows of a `NewtonDescriptors`, starting from the schema fallbacks
+    def __init__(self, paths: Sequence[Sdf.Path], schemas: Iterable[str]):
+        self.paths = tuple(paths)
+        count = len(self.paths)
+        self.schemas: dict[str, tuple[list[str], list[str]]] = {}
+        self.applied = {}
+        self.values = {}
+        self.targets = {}
+        for schema in schemas:
+            definition = schema_definition(schema)
+            attributes, relationships = [], []
+            for name in definition.GetPropertyNames():
+                if attr := definition.GetAttributeDefinition(name):
+                    attributes.append(name)
+                    self.values.setdefault(name, [attr.GetFallbackValue()] * count)
+                else:
+                    relationships.append(name)
+                    self.targets.setdefault(name, [()] * count)
+            self.schemas[schema] = (attributes, relationships)
+            self.applied[schema] = np.zeros(count, dtype=bool)
+
+    def read(self, row: int, prim: Usd.Prim, schemas: Iterable[str], time: Usd.TimeCode) -> None:
+        # attributes without opinions keep their fallback, which is what `Get` would return
+        authored = None
+        for schema in schemas:
+            attributes, relationships = self.schemas[schema]
+            self.applied[schema][row] = True
+            if authored is None:
+                authored = frozenset(prim.GetAuthoredPropertyNames())
+            for name in attributes:
+                if name in authored:
+                    self.values[name][row] = prim.GetAttribute(name).Get(time)
+            for name in relationships:
+                if name in authored:
+                    self.targets[name][row] = tuple(prim.GetRelationship(name).GetForwardedTargets())
+
+    def build(self) -> NewtonDescriptors:
+        return NewtonDescriptors(
+            paths=self.paths,
+            applied=self.applied,
+            values={name: stack_values(values) for name, values in self.values.items()},
+            targets={name: tuple(targets) for name, targets in self.targets.items()},
+        )
+
+
+def _load_physics(stage: Usd.Stage, include_paths: list[Sdf.Path], exclude_paths: list[Sdf.Path]) -> _PhysicsResult:
+    # `LoadUsdPhysicsFromRange` is deprecated in favor of `UsdPhysicsLoadStageFromPrimRange` in recent USD releases
+    load = getattr(UsdPhysics, "UsdPhysicsLoadStageFromPrimRange", None) or UsdPhysics.LoadUsdPhysicsFromRange
+    return load(stage, include_paths, exclude_paths)
+
+
+def read_newton_descriptors(prims: Sequence[Usd.Prim], schemas: Iterable[str], time: Usd.TimeCode = Usd.TimeCode.Default()) -> NewtonDescriptors:
+    """Read the Newton schema data of a list of prims, e.g. of prims which `UsdPhysics` does not parse.
+
+    Args:
+        prims: The prim of each row.
+        schemas: The registered schemas to read. Applied API schemas are read from the prims with
+            the schema applied, and typed schemas from the prims of that type or a derived type.
+        time: The time to read attribute values at.
+
+    Returns:
+        The Newton data of the prims, in the same layout as the data `load_newton_from_range` parses.
+    """
+    matchers = {schema: schema_matcher(schema) for schema in schemas}
+    rows = _Rows([prim.GetPath() for prim in prims], matchers)
+    for row, prim in enumerate(prims):
+        rows.read(row, prim, [schema for schema, matches in matchers.items() if matches(prim)], time)
+    return rows.build()
+
+
+def load_newton_from_range(
+    stage: Usd.Stage,
+    include_paths: Sequence[str | Sdf.Path],
+    exclude_paths: Sequence[str | Sdf.Path] = (),
+    physics: _PhysicsResult | None = None,
+    time: Usd.TimeCode = Usd.TimeCode.Default(),
+) -> NewtonParse:
+    """Parse the Newton schemas of a prim range, aligned with its `UsdPhysics` descriptors.
+
+    The range is traversed once, including instance proxies. The Newton API schemas of each
+    object type (see `NEWTON_DESCRIPTOR_SCHEMAS`) are read from the prims of its descriptors,
+    and `NewtonActuator` and `NewtonActuatorArray` prims are collected along the way.
+
+    Args:
+        stage: The stage to parse.
+        include_paths: The roots of the prim subtrees to parse.
+        exclude_paths: The roots of the prim subtrees to skip.
+        physics: The result of `UsdPhysics.LoadUsdPhysicsFromRange` for the same range, which is
+            parsed if omitted, e.g. to reuse a result parsed with custom tokens or simulation owners.
+        time: The time to read attribute values at.
+
+    Returns:
+        The `UsdPhysics` descriptors and the Newton data of each descriptor.
+    """
+    include_paths = [Sdf.Path(path) for path in include_paths]
+    exclude_paths = [Sdf.Path(path) for path in exclude_paths]
+    if physics is None:
+        physics = _load_physics(stage, include_paths, exclude_paths)
+
+    accumulators: dict[UsdPhysics.ObjectType, _Rows] = {}
+    order: dict[UsdPhysics.ObjectType, np.ndarray] = {}
+    rows: dict[Sdf.Path, list[tuple[UsdPhysics.ObjectType, int]]] = {}
+    for object_type, (paths, _) in physics.items():
+        schemas = NEWTON_DESCRIPTOR_SCHEMAS.get(object_type)
+        if schemas is None:
+            continue
+        accumulator = accumulators[object_type] = _Rows(paths, schemas)
+        order[object_type] = np.full(len(accumulator.paths), -1, dtype=np.int64)
+        for row, path in enumerate(accumulator.paths):
+            rows.setdefault(path, []).append((object_type, row))
+
+    actuator_prims = []
+    array_prims = []
+    for position, prim in enumerate(prim_range(stage, include_paths, exclude_paths)):
+        if prim.IsA("NewtonActuator"):
+            actuator_prims.append(prim)
+        elif prim.IsA("NewtonActuatorArray"):
+            array_prims.append(prim)
+        prim_rows = rows.get(prim.GetPath())
+        if prim_rows is None:
+            continue
+        applied = frozenset(prim.GetAppliedSchemas())
+        for object_type, row in prim_rows:
+            accumulator = accumulators[object_type]
+            accumulator.read(row, prim, [schema for schema in accumulator.schemas if schema in applied], time)
+            order[object_type][row] = position
+
+    return NewtonParse(
+        physics=physics,
+        descriptors={object_type: accumulator.build() for object_type, accumulator in accumulators.items()},
+        actuators=read_newton_descriptors(actuator_prims, ACTUATOR_SCHEMAS, time),
+        actuator_arrays=read_newton_descriptors(array_prims, ACTUATOR_ARRAY_SCHEMAS, time),
+        traversal_order=order,
+    )
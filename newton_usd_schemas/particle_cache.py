@@ -0,0 +1,241 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Per-frame particle caches for `NewtonPointsDeformableSimAPI` prims, stored as USD value clips.
+
+Each recorded frame is written to its own `.usdc` clip layer containing the time varying
+`points` and `velocities` of the particle prim. A small override layer carries the `clips`
+metadata, so any USD runtime can play the cache back by inserting that layer into a stage.
+
+Because every frame lives in a separate layer, USD (and `ParticleCache`) only ever opens the
+layers of the frames around the requested time. Random access does not depend on the frame
+index, and earlier frames never need to be loaded.
+"""
+
+import os
+import pathlib
+from collections import OrderedDict
+from collections.abc import Iterable
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError("numpy must be installed to use newton_usd_schemas.particle_cache")  # pragma: no cover
+
+from pxr import Sdf, Usd, UsdGeom, Vt
+
+from .particle_io import ParticleArrays
+
+__all__ = [
+    "ParticleCache",
+    "write_particle_cache",
+]
+
+_CACHED_ATTRIBUTES = (
+    (UsdGeom.Tokens.points, Sdf.ValueTypeNames.Point3fArray),
+    (UsdGeom.Tokens.velocities, Sdf.ValueTypeNames.Vector3fArray),
+)
+
+
+def _clip_prim(layer: Sdf.Layer, specifier: Sdf.Specifier) -> Sdf.PrimSpec:
+    spec = Sdf.CreatePrimInLayer(layer, "/Particles")
+    spec.specifier = specifier
+    layer.defaultPrim = spec.name
+    return spec
+
+
+def _write_manifest(path: str) -> None:
+    layer = Sdf.Layer.CreateNew(path)
+    spec = _clip_prim(layer, Sdf.SpecifierOver)
+    for name, type_name in _CACHED_ATTRIBUTES:
+        Sdf.AttributeSpec(spec, name, type_name, Sdf.VariabilityVarying)
+    layer.Save()
+
+
+def _write_frame(path: str, time: float, frame: ParticleArrays) -> None:
+    layer = Sdf.Layer.CreateNew(path)
+    spec = _clip_prim(layer, Sdf.SpecifierOver)
+    points = Vt.Vec3fArray.FromNumpy(np.ascontiguousarray(frame.points, dtype=np.float32))
+    layer.SetTimeSample(Sdf.AttributeSpec(spec, *_CACHED_ATTRIBUTES[0]).path, time, points)
+    if frame.velocities is not None:
+        if frame.velocities.shape[0] != len(frame):
+            raise ValueError(f"frame at time {time}: `velocities` has {frame.velocities.shape[0]} elements but `points` has {len(frame)}")
+        velocities = Vt.Vec3fArray.FromNumpy(np.ascontiguousarray(frame.velocities, dtype=np.float32))
+        layer.SetTimeSample(Sdf.AttributeSpec(spec, *_CACHED_ATTRIBUTES[1]).path, time, velocities)
+    layer.Save()
+
+
+def write_particle_cache(
+    path: str | os.PathLike,
+    prim_path: str | Sdf.Path,
+    frames: Iterable[tuple[float, ParticleArrays]],
+    clip_set: str = "default",
+) -> Sdf.Layer:
+    """Record per-frame particle state of a `NewtonPointsDeformableSimAPI` prim as value clips.
+
+    Writes one `<stem>.frame<index>.usdc` clip layer per frame and a `<stem>.manifest.usda`
+    clip manifest next to `path`, and saves an override layer at `path` which authors the
+    `clips` metadata on `prim_path`. Frames are consumed one at a time, so a rollout can be
+    streamed straight from a simulator without holding it in memory.
+
+    To play the cache back, sublayer the returned layer above the asset, e.g. from a new root
+    layer or the session layer of the stage. Value clips are weaker than `points` or `velocities`
+    values authored in the layer that anchors them, and a root layer is stronger than its
+    sublayers, so the cache layer must be stronger than any layer authoring those attributes.
+
+    Args:
+        path: The file path of the override layer.
+        prim_path: The path of the particle prim on the stage the cache will be applied to.
+        frames: Pairs of time code and particle state, in strictly increasing time order.
+            Only `points` and `velocities` are recorded; other particle attributes are expected
+            to be constant and authored on the prim itself.
+        clip_set: The name of the clip set to author.
+
+    Returns:
+        The saved override layer.
+
+    Raises:
+        ValueError: If there are no frames, or the frame times are not strictly increasing.
+    """
+    path = pathlib.Path(path)
+    asset_paths = []
+    active = []
+    times = []
+    for index, (time, frame) in enumerate(frames):
+        time = float(time)
+        if times and time <= times[-1][0]:
+            raise ValueError(f"frame times must be strictly increasing, got {time} after {times[-1][0]}")
+        frame_path = path.with_name(f"{path.stem}.frame{index:05d}.usdc")
+        _write_frame(frame_path.as_posix(), time, frame)
+        asset_paths.append(Sdf.AssetPath(f"./{frame_path.name}"))
+        active.append((time, float(index)))
+        times.append((time, time))
+    if not asset_paths:
+        raise ValueError("a particle cache requires at least one frame")
+
+    manifest_path = path.with_name(f"{path.stem}.manifest.usda")
+    _write_manifest(manifest_path.as_posix())
+
+    layer = Sdf.Layer.CreateNew(path.as_posix())
+    spec = Sdf.CreatePrimInLayer(layer, Sdf.Path(prim_path))
+    spec.specifier = Sdf.SpecifierOver
+    spec.SetInfo(
+        "clips",
+        {
+            clip_set: {
+                "assetPaths": Sdf.AssetPathArray(asset_paths),
+                "primPath": "/Particles",
+                "active": Vt.Vec2dArray(active),
+                "times": Vt.Vec2dArray(times),
+                "manifestAssetPath": Sdf.AssetPath(f"./{manifest_path.name}"),
+            }
+        },
+    )
+    layer.startTimeCode = times[0][0]
+    layer.endTimeCode = times[-1][0]
+    layer.Save()
+    return layer
+
+
+class ParticleCache:
+    """Random access reader for a particle cache authored by `write_particle_cache`.
+
+    Frames are read straight from their clip layer rather than through stage value resolution,
+    so a read opens exactly one layer and returns NumPy views of its arrays. Looking up a frame
+    by time is a binary search over the (sorted) clip activation times, and `read_time` resolves
+    times between frames the same way the stage does.
+
+    The most recently read frame layers are kept open. Arrays read from `.usdc` layers may be
+    mapped straight from the file, and closing a layer while its arrays are still referenced
+    forces USD to copy them, so frames should be consumed before `max_open_layers` further
+    frames are read.
+
+    Args:
+        prim: The particle prim, on a stage which includes the cache override layer.
+        clip_set: The name of the clip set to read.
+        max_open_layers: The number of frame layers to keep open.
+
+    Raises:
+        ValueError: If the prim does not author the clip set.
+    """
+
+    __slots__ = ("_asset_paths", "_clip_indices", "_clip_prim_path", "_layers", "_max_open_layers", "_stage", "_times")
+
+    def __init__(self, prim: Usd.Prim, clip_set: str = "default", max_open_layers: int = 2):
+        if max_open_layers < 1:
+            raise ValueError(f"max_open_layers must be positive, got {max_open_layers}")
+        self._layers: OrderedDict[int, Sdf.Layer] = OrderedDict()
+        self._max_open_layers = max_open_layers
+        clips = Usd.ClipsAPI(prim)
+        if clip_set not in clips.GetClips():
+            raise ValueError(f"{prim.GetPath()} does not author the `{clip_set}` clip set")
+        self._asset_paths = [asset.resolvedPath or asset.path for asset in clips.GetClipAssetPaths(clip_set)]
+        active = np.asarray(clips.GetClipActive(clip_set), dtype=np.float64).reshape(-1, 2)
+        self._times = active[:, 0].copy()
+        self._clip_indices = active[:, 1].astype(np.int64)
+        self._clip_prim_path = Sdf.Path(clips.GetClipPrimPath(clip_set))
+        self._stage = prim.GetStage()
+
+    def __len__(self) -> int:
+        return self._times.shape[0]
+
+    @property
+    def times(self) -> np.ndarray:
+        """The time code of every cached frame, in increasing order."""
+        return self._times
+
+    def frame_index(self, time: float) -> int:
+        """Get the index of the frame which is active at a given time.
+
+        As with value clips, times before the first frame resolve to the first frame, and
+        times between frames resolve to the most recent frame. The stage (and `read_time`)
+        interpolates between that frame and the next one.
+        """
+        return max(int(np.searchsorted(self._times, time, side="right")) - 1, 0)
+
+    def read_frame(self, index: int) -> ParticleArrays:
+        """Read the cached `points` and `velocities` of a frame.
+
+        Args:
+            index: The frame index, in the range `[0, len(self))`. Negative indices count from the end.
+
+        Returns:
+            The particle arrays of the frame, with only `points` and `velocities` populated.
+        """
+        clip = int(self._clip_indices[index])
+        layer = self._layers.pop(clip, None) or Sdf.Layer.FindOrOpen(self._asset_paths[clip])
+        self._layers[clip] = layer
+        if len(self._layers) > self._max_open_layers:
+            self._layers.popitem(last=False)
+        time = self._times[index]
+        arrays = {}
+        for name, _ in _CACHED_ATTRIBUTES:
+            value = layer.QueryTimeSample(self._clip_prim_path.AppendProperty(name), time)
+            if value is not None:
+                arrays[name] = np.asarray(value)
+                arrays[name].flags.writeable = False
+        if UsdGeom.Tokens.points not in arrays:
+            arrays[UsdGeom.Tokens.points] = np.empty((0, 3), dtype=np.float32)
+        return ParticleArrays(**arrays)
+
+    def read_time(self, time: float) -> ParticleArrays:
+        """Read the cached particle state at a given time, as the stage resolves it.
+
+        Between two frames, arrays are linearly interpolated when the stage interpolation type
+        is `Usd.InterpolationTypeLinear` and both frames author the array with the same number
+        of elements. Otherwise, as with stage value resolution, the array of the earlier frame
+        is held. Interpolated arrays are new arrays rather than views of the clip layers.
+        """
+        index = self.frame_index(time)
+        frame = self.read_frame(index)
+        if index + 1 == len(self) or time <= self._times[index] or self._stage.GetInterpolationType() != Usd.InterpolationTypeLinear:
+            return frame
+        following = self.read_frame(index + 1)
+        weight = (time - self._times[index]) / (self._times[index + 1] - self._times[index])
+        arrays = {}
+        for name, _ in _CACHED_ATTRIBUTES:
+            value, next_value = getattr(frame, name), getattr(following, name)
+            if value is not None and next_value is not None and value.shape == next_value.shape:
+                value = value + (next_value - value) * np.float32(weight)
+            arrays[name] = value
+        return ParticleArrays(**arrays)
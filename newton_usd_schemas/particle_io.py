@@ -0,0 +1,330 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Bulk particle IO for `Points` prims with `NewtonPointsDeformableSimAPI` applied.
+
+Arrays are exposed as read-only NumPy views over the `Vt` array buffers returned by
+USD, so reading tens of millions of particles does not copy elements in python.
+Only derived quantities (e.g. radii, which are computed from the authored diameters)
+allocate new memory.
+
+Large particle assets can be written incrementally with `write_particle_asset`, which
+stores each chunk as a separate `Points` payload beneath a single deformable body.
+"""
+
+import os
+import pathlib
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError("numpy must be installed to use newton_usd_schemas.particle_io")  # pragma: no cover
+
+from pxr import Sdf, Usd, UsdGeom, UsdPhysics, Vt
+
+from ._schema import array_view, has_api_schema
+
+__all__ = [
+    "ParticleArrays",
+    "body_particle_prims",
+    "iter_particle_chunks",
+    "particle_body",
+    "read_particles",
+    "scene_particle_prims",
+    "write_particle_asset",
+]
+
+
+@dataclass(frozen=True)
+class ParticleArrays:
+    """Particle state of a `NewtonPointsDeformableSimAPI` prim (or a contiguous chunk of it).
+
+    Attributes which are not authored on the prim are `None`.
+
+    Attributes:
+        points: `(N, 3)` float32 positions, a read-only view of `points`.
+        velocities: `(N, 3)` float32 velocities, a read-only view of `velocities`.
+        radii: `(N,)` float32 radii, computed as `width / 2` from `primvars:widths` or `widths`.
+        ids: `(N,)` int64 stable identifiers, a read-only view of `ids`.
+        masses: `(N,)` float32 masses, a read-only view of `physics:masses`.
+    """
+
+    points: np.ndarray
+    velocities: np.ndarray | None = None
+    radii: np.ndarray | None = None
+    ids: np.ndarray | None = None
+    masses: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return self.points.shape[0]
+
+
+def _view(attr: Usd.Attribute, time: Usd.TimeCode) -> np.ndarray | None:
+    if not attr or not attr.HasAuthoredValue():
+        return None
+    value = attr.Get(time)
+    if value is None:
+        return None
+    view = array_view(value)
+    view.flags.writeable = False
+    return view
+
+
+def _widths_attr(prim: Usd.Prim) -> Usd.Attribute:
+    # As with normals, `primvars:widths` takes precedence over `widths` when both are authored.
+    primvar = UsdGeom.PrimvarsAPI(prim).GetPrimvar(UsdGeom.Tokens.widths)
+    if primvar and primvar.HasAuthoredValue():
+        return primvar.GetAttr()
+    return UsdGeom.Points(prim).GetWidthsAttr()
+
+
+def _check_length(name: str, array: np.ndarray | None, count: int, prim: Usd.Prim) -> None:
+    if array is not None and array.shape[0] != count:
+        raise ValueError(f"{prim.GetPath()}: `{name}` has {array.shape[0]} elements but `points` has {count}")
+
+
+def _read_views(prim: Usd.Prim, time: Usd.TimeCode) -> tuple[np.ndarray, dict[str, np.ndarray | None], np.ndarray | None]:
+    if not prim.HasAPI("NewtonPointsDeformableSimAPI"):
+        raise ValueError(f"{prim.GetPath()} does not have NewtonPointsDeformableSimAPI applied")
+
+    points_schema = UsdGeom.Points(prim)
+    points = _view(points_schema.GetPointsAttr(), time)
+    if points is None:
+        points = np.empty((0, 3), dtype=np.float32)
+    count = points.shape[0]
+
+    attrs = {
+        "velocities": points_schema.GetVelocitiesAttr(),
+        "ids": points_schema.GetIdsAttr(),
+        "masses": prim.GetAttribute("physics:masses"),
+    }
+    views = {}
+    for name, attr in attrs.items():
+        views[name] = _view(attr, time)
+        _check_length(attr.GetName(), views[name], count, prim)
+
+    widths = _view(_widths_attr(prim), time)
+    # constant interpolation authors a single width shared by every point
+    if widths is not None and widths.shape[0] == 1:
+        widths = np.broadcast_to(widths, (count,))
+    _check_length("widths", widths, count, prim)
+
+    return points, views, widths
+
+
+def _radii(widths: np.ndarray | None) -> np.ndarray | None:
+    if widths is None:
+        return None
+    return np.multiply(widths, 0.5, dtype=np.float32)
+
+
+def read_particles(prim: Usd.Prim, time: Usd.TimeCode = Usd.TimeCode.Default()) -> ParticleArrays:
+    """Read all particles of a `NewtonPointsDeformableSimAPI` prim.
+
+    Args:
+        prim: A `Points` prim with `NewtonPointsDeformableSimAPI` applied.
+        time: The time at which to read the attributes.
+
+    Returns:
+        The particle arrays. All arrays other than `radii` are views of USD owned memory.
+
+    Raises:
+        ValueError: If the API is not applied, or if any per-point array length does not match `points`.
+    """
+    points, views, widths = _read_views(prim, time)
+    return ParticleArrays(points=points, radii=_radii(widths), **views)
+
+
+def iter_particle_chunks(prim: Usd.Prim, chunk_size: int, time: Usd.TimeCode = Usd.TimeCode.Default()) -> Iterator[ParticleArrays]:
+    """Iterate over the particles of a `NewtonPointsDeformableSimAPI` prim in contiguous chunks.
+
+    USD resolves array attributes as a whole, so the source arrays are read once and each
+    chunk is a slice view into them. Radii are computed per chunk, which bounds the extra
+    memory to `chunk_size` elements regardless of the particle count.
+
+    Args:
+        prim: A `Points` prim with `NewtonPointsDeformableSimAPI` applied.
+        chunk_size: The maximum number of particles per chunk.
+        time: The time at which to read the attributes.
+
+    Yields:
+        The particle arrays of each chunk, in point order.
+
+    Raises:
+        ValueError: If `chunk_size` is not positive, the API is not applied, or any per-point array length does not match `points`.
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    points, views, widths = _read_views(prim, time)
+    for start in range(0, points.shape[0], chunk_size):
+        window = slice(start, start + chunk_size)
+        yield ParticleArrays(
+            points=points[window],
+            radii=_radii(None if widths is None else widths[window]),
+            **{name: None if view is None else view[window] for name, view in views.items()},
+        )
+
+
+def body_particle_prims(body: Usd.Prim) -> list[Usd.Prim]:
+    """Get the `NewtonPointsDeformableSimAPI` prims which make up a deformable body.
+
+    The simulation geometry is either the body prim itself, or its immediate children
+    (e.g. the chunks authored by `write_particle_asset`), in namespace order.
+
+    Args:
+        body: The prim with `PhysicsDeformableBodyAPI` applied.
+
+    Returns:
+        The particle prims of the body, which may be empty (e.g. if the payloads are not loaded).
+    """
+    if body.HasAPI("NewtonPointsDeformableSimAPI"):
+        return [body]
+    return [child for child in body.GetChildren() if child.HasAPI("NewtonPointsDeformableSimAPI")]
+
+
+def particle_body(prim: Usd.Prim) -> Usd.Prim | None:
+    """Get the deformable body of a `NewtonPointsDeformableSimAPI` prim.
+
+    Args:
+        prim: The particle prim.
+
+    Returns:
+        The prim itself or its parent, whichever has `PhysicsDeformableBodyAPI` applied, or `None` if neither does.
+    """
+    for candidate in (prim, prim.GetParent()):
+        if candidate and has_api_schema(candidate, "PhysicsDeformableBodyAPI"):
+            return candidate
+    return None
+
+
+def scene_particle_prims(scene: Usd.Prim) -> list[Usd.Prim]:
+    """Get every `NewtonPointsDeformableSimAPI` prim simulated by a `PhysicsScene`.
+
+    A particle prim belongs to the scene targeted by the `physics:simulationOwner` relationship
+    of its deformable body. As with rigid bodies, a body which does not author an owner is
+    simulated by the first `PhysicsScene` found when traversing the stage. Particle prims
+    without a deformable body are not simulated and are skipped.
+
+    Args:
+        scene: The `PhysicsScene` prim.
+
+    Returns:
+        The particle prims owned by the scene, in traversal order.
+    """
+    scene_path = scene.GetPath()
+    default_scene = None
+    candidates = []
+    for prim in scene.GetStage().Traverse():
+        if default_scene is None and prim.IsA(UsdPhysics.Scene):
+            default_scene = prim.GetPath()
+        if prim.HasAPI("NewtonPointsDeformableSimAPI"):
+            candidates.append(prim)
+
+    owned = []
+    for prim in candidates:
+        body = particle_body(prim)
+        if body is None:
+            continue
+        owners = body.GetRelationship("physics:simulationOwner").GetTargets() if body.HasRelationship("physics:simulationOwner") else []
+        if scene_path in owners or (not owners and scene_path == default_scene):
+            owned.append(prim)
+    return owned
+
+
+def _author_array(spec: Sdf.PrimSpec, name: str, type_name: Sdf.ValueTypeName, value, interpolation: str | None = None) -> None:
+    attr = Sdf.AttributeSpec(spec, name, type_name)
+    attr.default = value
+    if interpolation is not None:
+        attr.SetInfo(UsdGeom.Tokens.interpolation, interpolation)
+
+
+def _write_chunk_layer(path: str, chunk: ParticleArrays) -> None:
+    count = len(chunk)
+    for name in ("velocities", "radii", "ids", "masses"):
+        value = getattr(chunk, name)
+        if value is not None and value.shape[0] != count:
+            raise ValueError(f"chunk `{name}` has {value.shape[0]} elements but `points` has {count}")
+
+    layer = Sdf.Layer.CreateNew(path)
+    spec = Sdf.CreatePrimInLayer(layer, "/Particles")
+    spec.specifier = Sdf.SpecifierDef
+    spec.typeName = "Points"
+    spec.SetInfo("apiSchemas", Sdf.TokenListOp.Create(prependedItems=["NewtonPointsDeformableSimAPI"]))
+    layer.defaultPrim = spec.name
+
+    points = np.ascontiguousarray(chunk.points, dtype=np.float32)
+    _author_array(spec, UsdGeom.Tokens.points, Sdf.ValueTypeNames.Point3fArray, Vt.Vec3fArray.FromNumpy(points))
+    if chunk.velocities is not None:
+        velocities = np.ascontiguousarray(chunk.velocities, dtype=np.float32)
+        _author_array(spec, UsdGeom.Tokens.velocities, Sdf.ValueTypeNames.Vector3fArray, Vt.Vec3fArray.FromNumpy(velocities))
+    if chunk.radii is not None:
+        widths = np.multiply(chunk.radii, 2.0, dtype=np.float32)
+        _author_array(spec, UsdGeom.Tokens.widths, Sdf.ValueTypeNames.FloatArray, Vt.FloatArray.FromNumpy(widths), UsdGeom.Tokens.vertex)
+    if chunk.ids is not None:
+        ids = np.ascontiguousarray(chunk.ids, dtype=np.int64)
+        _author_array(spec, UsdGeom.Tokens.ids, Sdf.ValueTypeNames.Int64Array, Vt.Int64Array.FromNumpy(ids))
+    if chunk.masses is not None:
+        masses = np.ascontiguousarray(chunk.masses, dtype=np.float32)
+        _author_array(spec, "physics:masses", Sdf.ValueTypeNames.FloatArray, Vt.FloatArray.FromNumpy(masses))
+
+    if count:
+        padding = 0.0 if chunk.radii is None else np.asarray(chunk.radii, dtype=np.float32)[:, None]
+        extent = np.stack(((points - padding).min(axis=0), (points + padding).max(axis=0)))
+        _author_array(spec, UsdGeom.Tokens.extent, Sdf.ValueTypeNames.Float3Array, Vt.Vec3fArray.FromNumpy(extent))
+
+    layer.Save()
+
+
+def write_particle_asset(
+    path: str | os.PathLike,
+    chunks: Iterable[ParticleArrays],
+    body_name: str = "Particles",
+    simulation_owner: str | Sdf.Path | None = None,
+    chunk_format: str = "usdc",
+) -> Sdf.Layer:
+    """Write a particle asset from a stream of chunks, without holding all particles in memory.
+
+    Each chunk is written to its own `<stem>.chunk<index>.<chunk_format>` layer next to `path`,
+    containing a single `Points` prim with `NewtonPointsDeformableSimAPI` applied. The chunk
+    layer is saved & released before the next chunk is consumed, so peak memory is bounded by
+    the largest chunk rather than the total particle count.
+
+    The root layer defines `body_name` as the default prim, with `PhysicsDeformableBodyAPI`
+    applied, and one child prim per chunk which payloads the chunk layer. Consumers therefore
+    see a single deformable body whose simulation geometry is the union of its child `Points`
+    (see `body_particle_prims`), and may defer loading the particles by not loading payloads.
+
+    Args:
+        path: The file path of the root layer.
+        chunks: The particle chunks, e.g. a generator. `radii` are authored as `widths` (diameters).
+        body_name: The name of the deformable body prim.
+        simulation_owner: The optional `PhysicsScene` path to author as `physics:simulationOwner` on the body.
+        chunk_format: The file format extension of the chunk layers.
+
+    Returns:
+        The saved root layer.
+
+    Raises:
+        ValueError: If a chunk's per-point arrays do not match the length of its `points`.
+    """
+    path = pathlib.Path(path)
+    root = Sdf.Layer.CreateNew(path.as_posix())
+    body = Sdf.CreatePrimInLayer(root, Sdf.Path.absoluteRootPath.AppendChild(body_name))
+    body.specifier = Sdf.SpecifierDef
+    body.typeName = "Xform"
+    body.SetInfo("apiSchemas", Sdf.TokenListOp.Create(prependedItems=["PhysicsDeformableBodyAPI"]))
+    if simulation_owner is not None:
+        owner = Sdf.RelationshipSpec(body, "physics:simulationOwner", custom=False)
+        owner.targetPathList.explicitItems = [Sdf.Path(simulation_owner)]
+    root.defaultPrim = body_name
+
+    for index, chunk in enumerate(chunks):
+        chunk_path = path.with_name(f"{path.stem}.chunk{index:04d}.{chunk_format}")
+        _write_chunk_layer(chunk_path.as_posix(), chunk)
+        child = Sdf.PrimSpec(body, f"Chunk{index:04d}", Sdf.SpecifierDef)
+        child.payloadList.Prepend(Sdf.Payload(f"./{chunk_path.name}"))
+
+    root.Save()
+    return root
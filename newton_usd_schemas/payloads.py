@@ -0,0 +1,298 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Splitting of assets into a physics payload and a render payload.
+
+Simulation workers only need the prims and properties which Newton consumes, yet assets carry
+their render meshes, looks and primvars alongside them. `split_asset` flattens the default prim
+of an asset and writes its physics content (prims with a `Physics*` or `Newton*` type or API
+schema, such as rigid bodies, colliders, joints and `NewtonPointsDeformableSimAPI` points, the
+`GeomSubset` children binding physics materials to parts of them, the targets of their physics
+relationships, and the transforms of their ancestors) to a physics
+payload, and everything else to a render payload. A lightweight root layer recomposes both:
+
+    asset = split_asset("robot.usd", "split")
+    stage = open_physics_payload(asset.root)  # only loads split/robot.physics.usdc
+
+The root layer payloads the physics layer on the default prim, and each render-only subtree
+(e.g. the visual meshes beneath a rigid body, or a scope of looks) from the render layer, so a
+stage opened with `Usd.Stage.LoadAll` composes the whole asset, whereas loading the default prim
+without its descendants only composes its physics content. USD loads payloads per prim, and an
+unloaded prim hides its descendants from traversals, so the few render properties of physics
+prims and their ancestors (e.g. the `primvars:displayColor` of a collider) are authored in the
+root layer itself. `split_assets` splits an asset library in parallel, with a process pool.
+"""
+
+import os
+import pathlib
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.context import BaseContext
+
+from pxr import Sdf, Usd, UsdGeom
+
+from ._schema import TARGET_RELATIONSHIPS
+from .population import is_physics_prim
+
+__all__ = [
+    "SplitAsset",
+    "open_physics_payload",
+    "split_asset",
+    "split_assets",
+]
+
+# properties of physics prims which only affect rendering, except for the `_PHYSICS_PROPERTIES` among them
+_RENDER_PROPERTIES = ("primvars:", "material:binding", "normals", "doubleSided")
+_PHYSICS_COLLECTION_BINDING = "material:binding:collection:physics:"
+_PHYSICS_PROPERTIES = ("primvars:widths", "material:binding:physics", _PHYSICS_COLLECTION_BINDING)
+
+# layer metadata which is not copied from the asset to the split layers
+_LAYER_KEYS = frozenset(("defaultPrim", "doc", "subLayers", "subLayerOffsets", "primChildren"))
+
+
+@dataclass(frozen=True)
+class SplitAsset:
+    """The layers of a split asset.
+
+    Attributes:
+        root: The root layer, which payloads the physics and render layers.
+        physics: The physics payload layer.
+        render: The render payload layer.
+    """
+
+    root: pathlib.Path
+    physics: pathlib.Path
+    render: pathlib.Path
+
+
+def _is_render_property(name: str) -> bool:
+    return name.startswith(_RENDER_PROPERTIES) and not name.startswith(_PHYSICS_PROPERTIES)
+
+
+def _is_transform_property(name: str) -> bool:
+    return name.startswith("xformOp")
+
+
+def _flatten(stage: Usd.Stage) -> Sdf.Layer:
+    # instances are made uninstanceable in the session layer, so their prims are flattened in place
+    # rather than into prototypes outside the default prim
+    instances = [prim.GetPath() for prim in stage.Traverse(Usd.TraverseInstanceProxies(Usd.PrimAllPrimsPredicate)) if prim.IsInstance()]
+    with Usd.EditContext(stage, stage.GetSessionLayer()), Sdf.ChangeBlock():
+        for path in instances:
+            stage.GetPrimAtPath(path).SetInstanceable(False)
+    layer = stage.Flatten(addSourceFileComment=False)
+    with Sdf.ChangeBlock():
+        for path in instances:
+            spec = layer.GetPrimAtPath(path)
+            if spec:
+                spec.ClearInfo("instanceable")
+    return layer
+
+
+def _targets(prim: Usd.Prim) -> list[Sdf.Path]:
+    # the targets of a physics collection binding are its collection and material
+    rels = [rel for rel in prim.GetRelationships() if rel.GetName() in TARGET_RELATIONSHIPS or rel.GetName().startswith(_PHYSICS_COLLECTION_BINDING)]
+    return [target.GetPrimPath() for rel in rels for target in rel.GetForwardedTargets()]
+
+
+def _physics_paths(root: Usd.Prim) -> set[Sdf.Path]:
+    physics = set()
+    for prim in Usd.PrimRange(root, Usd.TraverseInstanceProxies(Usd.PrimAllPrimsPredicate)):
+        if is_physics_prim(prim):
+            targets = _targets(prim)
+        elif prim.IsA(UsdGeom.Subset) and is_physics_prim(prim.GetParent()):
+            # physics materials of subsets of particles or faces are bound to the `GeomSubset` prims
+            targets = _targets(prim)
+            if not targets:
+                continue
+        else:
+            continue
+        outside = [target for target in targets if not target.HasPrefix(root.GetPath())]
+        if outside:
+            # the payloads only compose the default prim, so the targets would not resolve
+            raise ValueError(f"{prim.GetPath()} targets {outside[0]}, which is outside the default prim {root.GetPath()}")
+        physics.add(prim.GetPath())
+        physics.update(targets)
+    return physics
+
+
+def _copy_prim(source: Sdf.PrimSpec, layer: Sdf.Layer) -> Sdf.PrimSpec:
+    # the prim's metadata without its properties or children
+    spec = Sdf.CreatePrimInLayer(layer, source.path)
+    for key in source.ListInfoKeys():
+        spec.SetInfo(key, source.GetInfo(key))
+    return spec
+
+
+def _copy_properties(source: Sdf.PrimSpec, layer: Sdf.Layer, names: list[str]) -> None:
+    if names:
+        Sdf.CreatePrimInLayer(layer, source.path)
+        for name in names:
+            Sdf.CopySpec(source.layer, source.path.AppendProperty(name), layer, source.path.AppendProperty(name))
+
+
+def _split(source: Sdf.PrimSpec, kept: set[Sdf.Path], physics_prims: set[Sdf.Path], physics: Sdf.Layer, render: Sdf.Layer, root: Sdf.Layer) -> None:
+    if source.path not in kept:
+        # render-only subtrees are payloaded individually, so that they can be left unloaded
+        Sdf.CreatePrimInLayer(render, source.path.GetParentPath())
+        Sdf.CopySpec(source.layer, source.path, render, source.path)
+        Sdf.CreatePrimInLayer(root, source.path).payloadList.Prepend(Sdf.Payload(f"./{pathlib.Path(render.realPath).name}", source.path))
+        return
+    _copy_prim(source, physics)
+    names = list(source.properties.keys())
+    is_render = _is_render_property if source.path in physics_prims else lambda name: not _is_transform_property(name)
+    _copy_properties(source, physics, [name for name in names if not is_render(name)])
+    # a payload would hide the physics prim (and its descendants) from traversals until it is loaded,
+    # so the render properties of physics prims are authored in the root layer
+    _copy_properties(source, root, [name for name in names if is_render(name)])
+    children = source.nameChildren
+    if len({child.path in kept for child in children}) > 1:
+        # children of the root layer are ordered after those of the physics payload, unless reordered
+        Sdf.CreatePrimInLayer(root, source.path).SetInfo("primOrder", [child.name for child in children])
+    for child in children:
+        _split(child, kept, physics_prims, physics, render, root)
+
+
+def _layer_paths(asset: pathlib.Path, output_dir: pathlib.Path, physics_format: str, render_format: str) -> SplitAsset:
+    stem = asset.name.split(".")[0]
+    return SplitAsset(
+        root=output_dir / f"{stem}.usda",
+        physics=output_dir / f"{stem}.physics.{physics_format}",
+        render=output_dir / f"{stem}.render.{render_format}",
+    )
+
+
+def split_asset(asset: str | os.PathLike, output_dir: str | os.PathLike, physics_format: str = "usdc", render_format: str = "usdc") -> SplitAsset:
+    """Split the default prim of an asset into a physics payload and a render payload.
+
+    The asset is composed with every payload loaded and flattened, with instances expanded in
+    place. Its physics prims (see `newton_usd_schemas.population.is_physics_prim`), and the
+    targets of their physics relationships (e.g. bound physics materials and joint bodies), are
+    written to the physics layer with their properties, except for render properties such as
+    `primvars:displayColor`, `normals` or `material:binding`. Material bindings with the `physics`
+    purpose, including `material:binding:collection:physics:*` collection bindings, are physics
+    properties. Their ancestors are written to the
+    physics layer with their metadata and `xformOp` properties only. The remaining subtrees are
+    written to the render layer, and the remaining properties to the root layer.
+
+    The layers are written to `output_dir` as `<stem>.usda` (the root layer),
+    `<stem>.physics.<physics_format>` and `<stem>.render.<render_format>`, and each carries the
+    layer metadata of the asset (e.g. `metersPerUnit`). The composed prims of the root layer
+    are ordered as in the asset.
+
+    Args:
+        asset: The path of the asset, which must have a default prim.
+        output_dir: The directory to write the split layers to, which must not contain the asset's layers.
+        physics_format: The file format extension of the physics layer.
+        render_format: The file format extension of the render layer.
+
+    Returns:
+        The paths of the split layers.
+
+    Raises:
+        ValueError: If the asset cannot be opened, has no default prim, or would be overwritten,
+            or if a physics relationship targets a prim outside the default prim.
+    """
+    asset = pathlib.Path(asset)
+    output_dir = pathlib.Path(output_dir)
+    paths = _layer_paths(asset, output_dir, physics_format, render_format)
+    if asset.resolve() in (paths.root.resolve(), paths.physics.resolve(), paths.render.resolve()):
+        raise ValueError(f"Splitting {asset} to {output_dir} would overwrite it")
+    layer = Sdf.Layer.FindOrOpen(asset.as_posix())
+    if not layer:
+        raise ValueError(f"Failed to open {asset}")
+    stage = Usd.Stage.Open(layer, Usd.Stage.LoadAll)
+    default = stage.GetDefaultPrim()
+    if not default:
+        raise ValueError(f"{asset} has no default prim")
+    root_path = default.GetPath()
+    physics_prims = _physics_paths(default)
+    kept = {root_path}
+    for path in physics_prims:
+        kept.update(path.GetAncestorsRange())
+    flat = _flatten(stage)
+    del stage
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    physics = Sdf.Layer.CreateNew(paths.physics.as_posix())
+    render = Sdf.Layer.CreateNew(paths.render.as_posix())
+    root = Sdf.Layer.CreateNew(paths.root.as_posix())
+    source = flat.GetPrimAtPath(root_path)
+    with Sdf.ChangeBlock():
+        for split_layer in (root, physics, render):
+            for key in flat.pseudoRoot.ListInfoKeys():
+                if key not in _LAYER_KEYS:
+                    split_layer.pseudoRoot.SetInfo(key, flat.pseudoRoot.GetInfo(key))
+            split_layer.defaultPrim = root_path.name
+        root_spec = Sdf.PrimSpec(root, root_path.name, Sdf.SpecifierDef, source.typeName)
+        root_spec.payloadList.Prepend(Sdf.Payload(f"./{paths.physics.name}"))
+        _split(source, kept, physics_prims, physics, render, root)
+
+    for split_layer in (physics, render, root):
+        split_layer.Save()
+    return paths
+
+
+def _split_asset(arguments: tuple[str, str, str, str]) -> SplitAsset:
+    return split_asset(*arguments)
+
+
+def split_assets(
+    assets: Iterable[str | os.PathLike],
+    output_dir: str | os.PathLike,
+    physics_format: str = "usdc",
+    render_format: str = "usdc",
+    max_workers: int | None = None,
+    mp_context: BaseContext | None = None,
+) -> list[SplitAsset]:
+    """Split an asset library in parallel, with a process pool.
+
+    Each asset is split by `split_asset` in a worker process, since composing and flattening
+    stages holds the GIL for much of its time.
+
+    Args:
+        assets: The paths of the assets.
+        output_dir: The directory to write the split layers to.
+        physics_format: The file format extension of the physics layers.
+        render_format: The file format extension of the render layers.
+        max_workers: The maximum number of worker processes, defaulting to the number of CPUs.
+        mp_context: The multiprocessing context of the workers, defaulting to the platform's default.
+
+    Returns:
+        The paths of the split layers of each asset, in the order of `assets`.
+
+    Raises:
+        ValueError: If two assets share a file stem, or an asset fails to split.
+    """
+    assets = [pathlib.Path(asset) for asset in assets]
+    stems = [asset.name.split(".")[0] for asset in assets]
+    duplicates = sorted({stem for stem in stems if stems.count(stem) > 1})
+    if duplicates:
+        raise ValueError(f"Assets must have distinct file stems, found duplicates {duplicates}")
+    arguments = [(asset.as_posix(), pathlib.Path(output_dir).as_posix(), physics_format, render_format) for asset in assets]
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor:
+        return list(executor.map(_split_asset, arguments))
+
+
+def open_physics_payload(root: str | os.PathLike) -> Usd.Stage:
+    """Open a split asset with only its physics payload loaded.
+
+    Args:
+        root: The path of the root layer of the split asset.
+
+    Returns:
+        The stage, with the default prim loaded without its descendants.
+
+    Raises:
+        ValueError: If the root layer cannot be opened or has no default prim.
+    """
+    layer = Sdf.Layer.FindOrOpen(pathlib.Path(root).as_posix())
+    if not layer:
+        raise ValueError(f"Failed to open {root}")
+    stage = Usd.Stage.Open(layer, Usd.Stage.LoadNone)
+    default = stage.GetDefaultPrim()
+    if not default:
+        raise ValueError(f"{root} has no default prim")
+    stage.Load(default.GetPath(), Usd.LoadWithoutDescendants)
+    return stage
@@ -0,0 +1,195 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Physics-only population masks, for loading stages without their render-only content.
+
+Headless simulation workers only need the prims which Newton simulates, yet production stages
+are full of render meshes, looks and lights. `compute_physics_mask` scans a stage once for
+physics scenes, joints, actuators and every prim with a `Physics*` or `Newton*` schema (bodies,
+articulation roots, colliders, sites, deformables, ...), plus the physics materials bound to
+them, and returns a `Usd.StagePopulationMask` of those prims. `open_physics_stage` opens an
+asset with that mask, so composition, memory and traversal only cover the masked prims:
+
+    stage = open_physics_stage("scene.usd")
+
+The pre-scan opens the asset without loading its payloads, and masks every prim with an
+unloaded payload whole, since its contents cannot be scanned. Masks are cached per asset,
+until a layer of its stage is modified, so the pre-scan runs once per process. A mask
+includes the descendants of its paths (e.g. the visual meshes beneath a rigid body), and
+the ancestors of its paths without their other children. Its paths can be stored (e.g. as
+strings) and passed to worker processes, which can then open the asset with
+`Usd.Stage.OpenMasked`.
+"""
+
+import pathlib
+
+from pxr import Sdf, Usd, UsdPhysics, UsdShade
+
+from ._schema import TARGET_RELATIONSHIPS
+
+__all__ = [
+    "clear_physics_mask_cache",
+    "compute_physics_mask",
+    "is_physics_prim",
+    "open_physics_stage",
+    "physics_population_mask",
+]
+
+_SCHEMA_PREFIXES = ("Physics", "Newton")
+
+# typed schemas which Newton simulates, matched by type rather than by an applied API schema
+_PHYSICS_TYPES = (UsdPhysics.Scene, UsdPhysics.Joint, UsdPhysics.CollisionGroup)
+
+_MASKS: dict[str, tuple[dict[str, float | None], Usd.StagePopulationMask]] = {}
+
+
+def _is_material_schema(schema: str) -> bool:
+    # materials are populated where they are bound, rather than wherever they are defined
+    return schema.endswith("MaterialAPI")
+
+
+def _is_physics_material(prim: Usd.Prim) -> bool:
+    op = prim.GetMetadata("apiSchemas")
+    return op is not None and any(schema.startswith(_SCHEMA_PREFIXES) and _is_material_schema(schema) for schema in op.ApplyOperations([]))
+
+
+def is_physics_prim(prim: Usd.Prim) -> bool:
+    """Check whether a prim is simulated by Newton.
+
+    Physics prims are physics scenes, joints and collision groups, prims of a `Physics*` or
+    `Newton*` type (e.g. `NewtonActuator`), and prims with an applied `Physics*` or `Newton*`
+    API schema other than a material API schema. Unregistered schemas, such as
+    `PhysicsDeformableBodyAPI`, are matched by the `apiSchemas` metadata.
+
+    Args:
+        prim: The prim to check.
+
+    Returns:
+        Whether the prim is a physics prim.
+    """
+    if prim.GetTypeName().startswith(_SCHEMA_PREFIXES) or any(prim.IsA(schema) for schema in _PHYSICS_TYPES):
+        return True
+    op = prim.GetMetadata("apiSchemas")
+    if op is None:
+        return False
+    return any(schema.startswith(_SCHEMA_PREFIXES) and not _is_material_schema(schema) for schema in op.ApplyOperations([]))
+
+
+def _instance(prim: Usd.Prim) -> Usd.Prim:
+    # the outermost instance of an instance proxy, since the prims beneath instances are shared prototypes
+    instance = prim
+    while prim.IsInstanceProxy():
+        prim = prim.GetParent()
+        if prim.IsInstance():
+            instance = prim
+    return instance
+
+
+def compute_physics_mask(stage: Usd.Stage, predicate=Usd.PrimDefaultPredicate) -> Usd.StagePopulationMask:
+    """Compute the population mask of the physics prims of a stage.
+
+    The mask includes every physics prim (see `is_physics_prim`) with its descendants, the
+    targets of the physics relationships (e.g. `newton:mpm:materials` or `physics:body0`) of
+    those prims and their descendants, and the physics materials bound to them, including by
+    their ancestors, by `material:binding:collection:physics:*` collections, or by all-purpose
+    bindings, as resolved by `UsdShade.MaterialBindingAPI.ComputeBoundMaterials`. Physics prims
+    beneath an instance include the instance. Prims with an unloaded payload are included whole,
+    if their parent is scanned, since their contents cannot be scanned.
+
+    Args:
+        stage: The stage to scan.
+        predicate: The prim predicate of the scan, which always traverses instance proxies.
+
+    Returns:
+        The population mask.
+    """
+    mask = Usd.StagePopulationMask()
+    # the unloaded payloads, keyed by the parent which scans them
+    unloaded: dict[Sdf.Path, list[Sdf.Path]] = {}
+    for path in set(stage.FindLoadable()) - set(stage.GetLoadSet()):
+        unloaded.setdefault(path.GetParentPath(), []).append(path)
+
+    bound: list[Usd.Prim] = []
+    masked: Sdf.Path | None = None
+    for prim in Usd.PrimRange.Stage(stage, Usd.TraverseInstanceProxies(predicate)):
+        path = prim.GetPath()
+        # the descendants of a masked prim are populated, so they are only scanned for relationship targets
+        if masked is None or not path.HasPrefix(masked):
+            masked = None
+            if is_physics_prim(prim):
+                masked = _instance(prim).GetPath() if prim.IsInstanceProxy() else path
+                mask.Add(masked)
+            for payload in unloaded.get(path, ()):
+                child = stage.GetPrimAtPath(payload)
+                mask.Add(_instance(child).GetPath() if child.IsInstanceProxy() else payload)
+        if masked is None:
+            continue
+        bound.append(prim)
+        for name in TARGET_RELATIONSHIPS:
+            rel = prim.GetRelationship(name)
+            if rel:
+                for target in rel.GetForwardedTargets():
+                    mask.Add(target.GetPrimPath())
+
+    # physics materials may also be bound by ancestors, collections, or all-purpose bindings
+    materials, bindings = UsdShade.MaterialBindingAPI.ComputeBoundMaterials(bound, "physics")
+    for material, binding in zip(materials, bindings):
+        if material and _is_physics_material(material.GetPrim()):
+            # the targets of a collection binding are its collection and material
+            for target in binding.GetTargets():
+                mask.Add(target.GetPrimPath())
+    return mask
+
+
+def _modification_time(real_path: str) -> float | None:
+    path = pathlib.Path(real_path) if real_path else None
+    return path.stat().st_mtime if path and path.exists() else None
+
+
+def physics_population_mask(asset: str | Sdf.Layer, refresh: bool = False) -> Usd.StagePopulationMask:
+    """Get the physics population mask of an asset, computing it on first use.
+
+    The mask is computed by `compute_physics_mask` on the stage of the asset, opened without
+    loading its payloads, and cached by the identifier of its root layer, until the file of
+    any layer of that stage (e.g. a sublayer or a referenced layer) is modified.
+
+    Args:
+        asset: The asset path or root layer.
+        refresh: Whether to recompute the mask even if it is cached.
+
+    Returns:
+        The population mask.
+
+    Raises:
+        ValueError: If the asset cannot be opened.
+    """
+    layer = asset if isinstance(asset, Sdf.Layer) else Sdf.Layer.FindOrOpen(asset)
+    if not layer:
+        raise ValueError(f"Failed to open {asset}")
+    cached = _MASKS.get(layer.identifier)
+    if cached is None or refresh or any(_modification_time(path) != modified for path, modified in cached[0].items()):
+        stage = Usd.Stage.Open(layer, Usd.Stage.LoadNone)
+        modified = {used.realPath: _modification_time(used.realPath) for used in stage.GetUsedLayers() if used.realPath}
+        cached = _MASKS[layer.identifier] = (modified, compute_physics_mask(stage))
+    return cached[1]
+
+
+def open_physics_stage(asset: str | Sdf.Layer, load: Usd.Stage.InitialLoadSet = Usd.Stage.LoadAll) -> Usd.Stage:
+    """Open an asset with only its physics prims populated.
+
+    Args:
+        asset: The asset path or root layer.
+        load: The initial load set of the stage's payloads.
+
+    Returns:
+        The stage, masked by `physics_population_mask`.
+
+    Raises:
+        ValueError: If the asset cannot be opened.
+    """
+    return Usd.Stage.OpenMasked(asset, physics_population_mask(asset), load)
+
+
+def clear_physics_mask_cache() -> None:
+    """Forget the cached population masks of all assets."""
+    _MASKS.clear()
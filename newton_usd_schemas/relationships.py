@@ -0,0 +1,164 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Bulk resolution of relationship targets to dense array indices.
+
+Newton connects its prims through relationships: `physics:body0` and `physics:body1` of joints,
+`newton:targets` of actuators, `newton:mimicJoint` of `NewtonMimicAPI` and
+`physics:simulationOwner` of deformable bodies. Solvers need those connections as indices into
+the arrays of the targeted prims (bodies, joints, scenes, ...) rather than as paths.
+
+A `PathIndex` maps the paths of the targeted prims to their dense indices, e.g. the rows of an
+extracted schema, once per extraction. It then resolves every relationship of a given name in
+bulk, into int32 index arrays with `-1` for missing or dangling targets:
+
+    bodies = PathIndex(layout.paths["PhysicsRigidBodyAPI"])
+    body0 = bodies.resolve_relationship(stage, layout.paths["PhysicsJoint"], "physics:body0")
+    if body0.dangling:
+        warnings.warn(body0.summary())
+
+Targets which were already collected, e.g. by `newton_usd_schemas.parsing.load_newton_from_range`
+or `newton_usd_schemas.actuators.read_actuator_arrays`, are resolved with `PathIndex.resolve`.
+"""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError("numpy must be installed to use newton_usd_schemas.relationships")  # pragma: no cover
+
+from pxr import Sdf, Usd
+
+__all__ = [
+    "PathIndex",
+    "ResolvedTargets",
+]
+
+# the number of dangling targets listed by `ResolvedTargets.summary`
+_SUMMARY_EXAMPLES = 5
+
+
+@dataclass(frozen=True)
+class ResolvedTargets:
+    """The targets of a relationship of each source prim, resolved to indices.
+
+    Attributes:
+        name: The name of the relationship.
+        sources: The source prim of each row.
+        offsets: `(N + 1,)` int64 offsets, such that the targets of `sources[i]` are `indices[offsets[i]:offsets[i + 1]]`.
+        indices: `(M,)` int32 index of each target, or `-1` if the target is not in the `PathIndex`.
+        dangling: The `(source, target)` paths of every target which is not in the `PathIndex`, in row order.
+    """
+
+    name: str
+    sources: tuple[Sdf.Path, ...]
+    offsets: np.ndarray
+    indices: np.ndarray
+    dangling: tuple[tuple[Sdf.Path, Sdf.Path], ...]
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    def first(self) -> np.ndarray:
+        """Get the index of the first target of each row, e.g. for single target relationships such as `physics:body0`.
+
+        Returns:
+            `(N,)` int32 index of the first target of each row, or `-1` for rows without targets or with a dangling first target.
+        """
+        first = np.full(len(self.sources), -1, dtype=np.int32)
+        counts = np.diff(self.offsets)
+        first[counts > 0] = self.indices[self.offsets[:-1][counts > 0]]
+        return first
+
+    def summary(self) -> str:
+        """Describe the dangling targets, e.g. to log a single warning for the whole relationship.
+
+        Returns:
+            The number of dangling targets and the first few of them, or an empty string if there are none.
+        """
+        if not self.dangling:
+            return ""
+        examples = ", ".join(f"{source} -> {target}" for source, target in self.dangling[:_SUMMARY_EXAMPLES])
+        more = f", and {len(self.dangling) - _SUMMARY_EXAMPLES} more" if len(self.dangling) > _SUMMARY_EXAMPLES else ""
+        return f"{len(self.dangling)} of {len(self.indices)} `{self.name}` targets of {len(self.sources)} prims are dangling: {examples}{more}"
+
+
+class PathIndex:
+    """The dense index of each of a sequence of prim paths, such as the rows of an extracted schema.
+
+    Args:
+        paths: The paths, whose index is their position in the sequence. Repeated paths keep their first index.
+    """
+
+    def __init__(self, paths: Iterable[Sdf.Path]):
+        self._indices: dict[Sdf.Path, int] = {}
+        self._count = 0
+        for path in paths:
+            self._indices.setdefault(path, self._count)
+            self._count += 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, path: Sdf.Path) -> bool:
+        return path in self._indices
+
+    def index(self, path: Sdf.Path) -> int:
+        """Get the index of a path.
+
+        Returns:
+            The index, or `-1` if the path is not indexed.
+        """
+        return self._indices.get(path, -1)
+
+    def resolve(self, targets: Sequence[Sequence[Sdf.Path]], name: str = "", sources: Sequence[Sdf.Path] | None = None) -> ResolvedTargets:
+        """Resolve already collected relationship targets to indices.
+
+        Args:
+            targets: The target paths of each source prim.
+            name: The name of the relationship, used by `ResolvedTargets.summary`.
+            sources: The source prim of each row of `targets`, used to report dangling targets.
+
+        Returns:
+            The resolved targets.
+
+        Raises:
+            ValueError: If `sources` does not have one path per row of `targets`.
+        """
+        if sources is None:
+            sources = (Sdf.Path.emptyPath,) * len(targets)
+        elif len(sources) != len(targets):
+            raise ValueError(f"`sources` has {len(sources)} paths but `targets` has {len(targets)} rows")
+        lookup = self._indices.get
+        offsets = np.zeros(len(targets) + 1, dtype=np.int64)
+        np.cumsum([len(row) for row in targets], out=offsets[1:])
+        indices = np.fromiter((lookup(target, -1) for row in targets for target in row), dtype=np.int32, count=int(offsets[-1]))
+        dangling = []
+        if (indices < 0).any():
+            rows = np.repeat(np.arange(len(targets)), np.diff(offsets))
+            flat = [target for row in targets for target in row]
+            dangling = [(sources[rows[position]], flat[position]) for position in np.flatnonzero(indices < 0)]
+        return ResolvedTargets(name=name, sources=tuple(sources), offsets=offsets, indices=indices, dangling=tuple(dangling))
+
+    def resolve_relationship(self, stage: Usd.Stage, sources: Sequence[Sdf.Path], name: str) -> ResolvedTargets:
+        """Resolve a relationship of every source prim to indices.
+
+        Targets are forwarded through relationships which target other relationships. Sources
+        without the relationship (or which are not on the stage) have no targets.
+
+        Args:
+            stage: The stage of the source prims.
+            sources: The source prim paths, e.g. the rows of an extracted schema.
+            name: The name of the relationship, e.g. `physics:body0`.
+
+        Returns:
+            The resolved targets.
+        """
+        targets = []
+        for source in sources:
+            prim = stage.GetPrimAtPath(source)
+            rel = prim.GetRelationship(name) if prim else None
+            targets.append(rel.GetForwardedTargets() if rel else ())
+        return self.resolve(targets, name, sources)
@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Replication of a template environment, with per-clone Newton parameter overrides.
+
+Training setups commonly clone one robot and scene template thousands of times, and
+randomize Newton parameters per clone (e.g. `newton:friction`, `newton:mpm:internalFriction`
+or PD gains). Authoring each clone with `Usd` edits recomposes the stage after every edit.
+`replicate` instead copies the template's specs with `Sdf.CopySpec` inside a single
+`Sdf.ChangeBlock`, then writes the override of every clone directly to its attribute spec
+from NumPy arrays, so the stage recomposes once.
+"""
+
+import functools
+from collections.abc import Callable, Mapping, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError("numpy must be installed to use newton_usd_schemas.replication")  # pragma: no cover
+
+from pxr import Sdf, Usd
+
+__all__ = [
+    "replicate",
+]
+
+
+def _attribute_type(layer: Sdf.Layer, template: Sdf.Path, path: Sdf.Path, composed: Callable[[], Usd.Stage]) -> Sdf.ValueTypeName:
+    attr = layer.GetAttributeAtPath(path)
+    if attr:
+        return attr.typeName
+    prim = layer.GetPrimAtPath(path.GetPrimPath())
+    if prim:
+        api_schemas = prim.GetInfo("apiSchemas").ApplyOperations([]) if prim.HasInfo("apiSchemas") else []
+        registry = Usd.SchemaRegistry()
+        if api_schemas:
+            definition = registry.BuildComposedPrimDefinition(prim.typeName, api_schemas)
+        else:
+            definition = registry.FindConcretePrimDefinition(prim.typeName) if prim.typeName else None
+        attr_definition = definition.GetAttributeDefinition(path.name) if definition else None
+        if attr_definition:
+            return attr_definition.GetTypeName()
+    # the prim or its type may only come from a reference, payload or inherit of the template
+    attr = composed().GetAttributeAtPath(path)
+    if attr:
+        return attr.GetTypeName()
+    raise ValueError(f"`{path.MakeRelativePath(template)}` is neither authored on the template nor defined by the schemas of its composed prim")
+
+
+def _converter(type_name: Sdf.ValueTypeName, values: np.ndarray):
+    python_class = type_name.type.pythonClass
+    if type_name.isArray:
+        return lambda row: python_class.FromNumpy(np.ascontiguousarray(row))
+    if values.ndim > 1:
+        return lambda row: python_class(*row.tolist())
+    return lambda value: value
+
+
+def _create_ancestors(layer: Sdf.Layer, parent: Sdf.Path) -> None:
+    for ancestor in parent.GetPrefixes():
+        if not layer.GetPrimAtPath(ancestor):
+            Sdf.CreatePrimInLayer(layer, ancestor).specifier = Sdf.SpecifierDef
+
+
+def replicate(
+    layer: Sdf.Layer,
+    template: Sdf.Path | str,
+    clones: Sequence[Sdf.Path | str],
+    overrides: Mapping[str, np.ndarray] | None = None,
+    template_layer: Sdf.Layer | None = None,
+) -> tuple[Sdf.Path, ...]:
+    """Copy a template prim and its descendants to many clones, with per-clone attribute values.
+
+    The clones are copies of the template's specs, so they carry all of its opinions, including
+    references and payloads, which are shared rather than duplicated. Missing ancestors of the
+    clones are defined as typeless prims. Existing specs at the clone paths are replaced.
+
+    Overrides are keyed by property paths relative to the template, e.g. `Joint0.newton:friction`
+    or `.newton:kp` for the template prim itself. The value type is taken from the template's
+    attribute spec or, if the attribute is not authored, from the schemas of its prim spec. For
+    prims and attributes which the template only gets through composition, e.g. a reference, the
+    type is taken from the composed template prim.
+
+    Args:
+        layer: The layer to author the clones in.
+        template: The path of the template prim.
+        clones: The paths of the clones.
+        overrides: The value of an attribute for every clone, with shape `(N,)` for scalars,
+            `(N, K)` for tuple types such as `float3` or for arrays of `K` elements.
+        template_layer: The layer holding the template, if it is not `layer`.
+
+    Returns:
+        The paths of the clones.
+
+    Raises:
+        ValueError: If the template does not exist, the number of override values does not match
+            the number of clones, or the type of an overridden attribute cannot be determined.
+    """
+    template = Sdf.Path(template)
+    template_layer = template_layer or layer
+    clones = tuple(Sdf.Path(clone) for clone in clones)
+    if not template_layer.GetPrimAtPath(template):
+        raise ValueError(f"{template} is not a prim spec of {template_layer.identifier}")
+
+    # only opened if an overridden attribute needs composition to be typed
+    composed = functools.cache(lambda: Usd.Stage.OpenMasked(template_layer, Usd.StagePopulationMask([template])))
+    properties = {}
+    for name, values in (overrides or {}).items():
+        values = np.asarray(values)
+        if values.shape[0] != len(clones):
+            raise ValueError(f"`{name}` has {values.shape[0]} values but there are {len(clones)} clones")
+        path = Sdf.Path(name).MakeAbsolutePath(template)
+        type_name = _attribute_type(template_layer, template, path, composed)
+        convert = _converter(type_name, values)
+        rows = values if type_name.isArray or values.ndim > 1 else values.tolist()
+        properties[path.MakeRelativePath(template)] = (type_name, [convert(row) for row in rows])
+
+    if not clones:
+        return clones
+    with Sdf.ChangeBlock():
+        for parent in dict.fromkeys(clone.GetParentPath() for clone in clones):
+            _create_ancestors(layer, parent)
+        first = clones[0]
+        Sdf.CopySpec(template_layer, template, layer, first)
+        # create the overridden attribute specs once, so every other clone copies them
+        for relative, (type_name, _) in properties.items():
+            path = relative.MakeAbsolutePath(first)
+            if not layer.GetAttributeAtPath(path):
+                # prims which only come from composition get an `over`
+                Sdf.AttributeSpec(Sdf.CreatePrimInLayer(layer, path.GetPrimPath()), path.name, type_name)
+        for clone in clones[1:]:
+            Sdf.CopySpec(layer, first, layer, clone)
+        for relative, (_, values) in properties.items():
+            for clone, value in zip(clones, values, strict=True):
+                layer.GetAttributeAtPath(relative.MakeAbsolutePath(clone)).default = value
+    return clones
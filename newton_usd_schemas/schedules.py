@@ -0,0 +1,151 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Precompiled schedules of time-sampled scene parameters.
+
+Non-uniform scene attributes, such as `newton:gravityEnabled` or `physics:gravityMagnitude`,
+may be time sampled to change the simulation over time, e.g. over a training curriculum. A
+`SceneSchedule` reads the time samples once and evaluates them with a binary search over a
+sorted keyframe array, so stepping a simulation never needs to query USD.
+
+Evaluation matches USD value resolution: values before the first and after the last time
+sample are held, and numeric values are linearly interpolated between samples if the stage
+interpolation is linear, while other values (e.g. `bool`) are always held.
+"""
+
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError("numpy must be installed to use newton_usd_schemas.schedules")  # pragma: no cover
+
+from pxr import Sdf, Usd
+
+__all__ = [
+    "ParameterSchedule",
+    "SceneSchedule",
+    "compile_scene_schedule",
+]
+
+
+@dataclass(frozen=True)
+class ParameterSchedule:
+    """The keyframes of a single attribute.
+
+    Attributes:
+        attribute: The attribute name.
+        times: `(K,)` float64 time codes of the keyframes, in increasing order.
+        values: `(K, ...)` values of the keyframes.
+        linear: Whether values are linearly interpolated between keyframes, rather than held.
+    """
+
+    attribute: str
+    times: np.ndarray
+    values: np.ndarray
+    linear: bool = False
+
+    def evaluate(self, time: float | np.ndarray) -> np.ndarray:
+        """Evaluate the schedule at one or more times.
+
+        Each lookup is a binary search, `O(log K)` in the number of keyframes.
+
+        Args:
+            time: The time code, or an array of time codes, e.g. one per environment.
+
+        Returns:
+            The value of each time, with shape `np.shape(time) + values.shape[1:]`.
+        """
+        time = np.asarray(time, dtype=np.float64)
+        index = np.clip(np.searchsorted(self.times, time, side="right") - 1, 0, self.times.shape[0] - 1)
+        if not self.linear or self.times.shape[0] == 1:
+            return self.values[index]
+        upper = np.minimum(index + 1, self.times.shape[0] - 1)
+        span = self.times[upper] - self.times[index]
+        alpha = np.clip(np.divide(time - self.times[index], span, out=np.zeros_like(time), where=span > 0), 0.0, 1.0)
+        alpha = alpha.reshape(alpha.shape + (1,) * (self.values.ndim - 1))
+        lower = self.values[index]
+        return (lower + (self.values[upper] - lower) * alpha).astype(self.values.dtype, copy=False)
+
+
+@dataclass(frozen=True)
+class SceneSchedule:
+    """The schedules of the time-varying parameters of a scene.
+
+    Attributes:
+        scene_path: The path of the scene prim.
+        parameters: The schedule of each attribute, keyed by attribute name.
+    """
+
+    scene_path: Sdf.Path
+    parameters: dict[str, ParameterSchedule]
+
+    @property
+    def keyframe_times(self) -> np.ndarray:
+        """The sorted, unique time codes at which any parameter has a keyframe."""
+        times = [schedule.times for schedule in self.parameters.values()]
+        return np.unique(np.concatenate(times)) if times else np.empty(0, dtype=np.float64)
+
+    def evaluate(self, time: float | np.ndarray) -> dict[str, np.ndarray]:
+        """Evaluate every parameter at one or more times.
+
+        Args:
+            time: The time code, or an array of time codes.
+
+        Returns:
+            The value of each parameter, keyed by attribute name.
+        """
+        return {name: schedule.evaluate(time) for name, schedule in self.parameters.items()}
+
+
+def _is_numeric(values: np.ndarray) -> bool:
+    return values.dtype.kind in "fc"
+
+
+def compile_scene_schedule(scene: Usd.Prim, attributes: list[str] | tuple[str, ...] | None = None) -> SceneSchedule:
+    """Compile the time samples of the non-uniform attributes of a scene into keyframe arrays.
+
+    Attributes without time samples are compiled to a single keyframe holding their value.
+    Uniform attributes (e.g. `newton:maxSolverIterations`) cannot vary over time, so they are
+    not scheduled.
+
+    Args:
+        scene: The `PhysicsScene` prim.
+        attributes: The attribute names to schedule. By default, every non-uniform attribute defined
+            by the schemas of the prim, e.g. `newton:gravityEnabled`, `physics:gravityDirection`
+            and `physics:gravityMagnitude`.
+
+    Returns:
+        The schedule of the scene.
+
+    Raises:
+        ValueError: If a requested attribute does not exist, is uniform, or has no value.
+    """
+    if attributes is None:
+        definition = scene.GetPrimDefinition()
+        attributes = [
+            name
+            for name in definition.GetPropertyNames()
+            if definition.GetAttributeDefinition(name) and definition.GetAttributeDefinition(name).GetVariability() == Sdf.VariabilityVarying
+        ]
+    linear = scene.GetStage().GetInterpolationType() == Usd.InterpolationTypeLinear
+
+    parameters = {}
+    for name in attributes:
+        attr = scene.GetAttribute(name)
+        if not attr:
+            raise ValueError(f"{scene.GetPath()} does not have `{name}`")
+        if attr.GetVariability() == Sdf.VariabilityUniform:
+            raise ValueError(f"`{name}` is uniform and cannot be time sampled")
+        times = attr.GetTimeSamples()
+        samples = [attr.Get(time) for time in times] if times else [attr.Get()]
+        if samples[0] is None:
+            raise ValueError(f"{attr.GetPath()} has no value to schedule")
+        values = np.asarray(samples)
+        parameters[name] = ParameterSchedule(
+            attribute=name,
+            times=np.asarray(times if times else [0.0], dtype=np.float64),
+            values=values,
+            linear=linear and _is_numeric(values),
+        )
+    return SceneSchedule(scene_path=scene.GetPath(), parameters=parameters)
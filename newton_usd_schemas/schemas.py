@@ -0,0 +1,1668 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Typed wrappers of the Newton schemas.
+
+GENERATED FILE: do not edit. Run `python tools/generate_schema_wrappers.py` to regenerate it
+from `generatedSchema.usda` whenever the schemas change.
+
+The Newton schemas are codeless, so this module provides lightweight wrapper classes in the
+style of the compiled USD schema classes, e.g. `NewtonJointAPI(prim).GetArmatureAttr()` or
+`NewtonJointAPI.Apply(prim)`. Every schema, property and allowed token name is a constant of
+`Tokens`, interned once at import, so loops never build or retype property names.
+
+The USD Python bindings convert names to `TfToken` on every call, so hot loops should resolve
+an attribute once (e.g. with `Get*Attr`) and reuse the `Usd.Attribute`, rather than looking it
+up by name per prim and per frame.
+"""
+
+import sys
+from typing import TypeVar
+
+from pxr import Sdf, Usd
+
+__all__ = [
+    "NewtonActuator",
+    "NewtonActuatorArray",
+    "NewtonActuatorClampingBaseAPI",
+    "NewtonActuatorControlBaseAPI",
+    "NewtonActuatorDelayAPI",
+    "NewtonArticulationRootAPI",
+    "NewtonCollisionAPI",
+    "NewtonCurvesDeformableMaterialAPI",
+    "NewtonDCMotorClampingAPI",
+    "NewtonJointAPI",
+    "NewtonKaminoSceneAPI",
+    "NewtonMPMMaterialAPI",
+    "NewtonMPMSceneAPI",
+    "NewtonMassAPI",
+    "NewtonMaterialAPI",
+    "NewtonMaxEffortClampingAPI",
+    "NewtonMeshCollisionAPI",
+    "NewtonMimicAPI",
+    "NewtonNeuralControlAPI",
+    "NewtonPDControlAPI",
+    "NewtonPIDControlAPI",
+    "NewtonPointsDeformableSimAPI",
+    "NewtonPositionBasedClampingAPI",
+    "NewtonSDFCollisionAPI",
+    "NewtonSceneAPI",
+    "NewtonSiteAPI",
+    "NewtonXpbdSceneAPI",
+    "Tokens",
+]
+
+_Schema = TypeVar("_Schema", bound="_SchemaBase")
+
+
+class Tokens:
+    """The names of the Newton schemas, their properties and allowed token values."""
+
+    __slots__ = ()
+
+    NewtonSceneAPI = sys.intern("NewtonSceneAPI")
+    newtonMaxSolverIterations = sys.intern("newton:maxSolverIterations")
+    newtonTimeStepsPerSecond = sys.intern("newton:timeStepsPerSecond")
+    newtonGravityEnabled = sys.intern("newton:gravityEnabled")
+    NewtonXpbdSceneAPI = sys.intern("NewtonXpbdSceneAPI")
+    newtonXpbdSoftBodyRelaxation = sys.intern("newton:xpbd:softBodyRelaxation")
+    newtonXpbdSoftContactRelaxation = sys.intern("newton:xpbd:softContactRelaxation")
+    newtonXpbdJointLinearRelaxation = sys.intern("newton:xpbd:jointLinearRelaxation")
+    newtonXpbdJointAngularRelaxation = sys.intern("newton:xpbd:jointAngularRelaxation")
+    newtonXpbdJointLinearCompliance = sys.intern("newton:xpbd:jointLinearCompliance")
+    newtonXpbdJointAngularCompliance = sys.intern("newton:xpbd:jointAngularCompliance")
+    newtonXpbdRigidContactRelaxation = sys.intern("newton:xpbd:rigidContactRelaxation")
+    newtonXpbdRigidContactConWeighting = sys.intern("newton:xpbd:rigidContactConWeighting")
+    newtonXpbdAngularDamping = sys.intern("newton:xpbd:angularDamping")
+    newtonXpbdRestitutionEnabled = sys.intern("newton:xpbd:restitutionEnabled")
+    NewtonKaminoSceneAPI = sys.intern("NewtonKaminoSceneAPI")
+    newtonKaminoPadmmPrimalTolerance = sys.intern("newton:kamino:padmm:primalTolerance")
+    newtonKaminoPadmmDualTolerance = sys.intern("newton:kamino:padmm:dualTolerance")
+    newtonKaminoPadmmComplementarityTolerance = sys.intern("newton:kamino:padmm:complementarityTolerance")
+    newtonKaminoPadmmWarmstarting = sys.intern("newton:kamino:padmm:warmstarting")
+    none = sys.intern("none")
+    internal = sys.intern("internal")
+    containers = sys.intern("containers")
+    newtonKaminoPadmmUseAcceleration = sys.intern("newton:kamino:padmm:useAcceleration")
+    newtonKaminoConstraintsUsePreconditioning = sys.intern("newton:kamino:constraints:usePreconditioning")
+    newtonKaminoConstraintsAlpha = sys.intern("newton:kamino:constraints:alpha")
+    newtonKaminoConstraintsBeta = sys.intern("newton:kamino:constraints:beta")
+    newtonKaminoConstraintsGamma = sys.intern("newton:kamino:constraints:gamma")
+    newtonKaminoJointCorrection = sys.intern("newton:kamino:jointCorrection")
+    twopi = sys.intern("twopi")
+    continuous = sys.intern("continuous")
+    NewtonMPMSceneAPI = sys.intern("NewtonMPMSceneAPI")
+    newtonMpmTolerance = sys.intern("newton:mpm:tolerance")
+    newtonMpmRheologySolvers = sys.intern("newton:mpm:rheologySolvers")
+    auto = sys.intern("auto")
+    gaussSeidel = sys.intern("gauss-seidel")
+    gaussSeidelSoa = sys.intern("gauss-seidel-soa")
+    gaussSeidelBatched = sys.intern("gauss-seidel-batched")
+    jacobi = sys.intern("jacobi")
+    conjugateGradient = sys.intern("conjugate-gradient")
+    conjugateResidual = sys.intern("conjugate-residual")
+    generalizedMinimalResidual = sys.intern("generalized-minimal-residual")
+    newtonMpmVoxelSize = sys.intern("newton:mpm:voxelSize")
+    newtonMpmGridType = sys.intern("newton:mpm:gridType")
+    sparse = sys.intern("sparse")
+    dense = sys.intern("dense")
+    fixed = sys.intern("fixed")
+    newtonMpmGridPadding = sys.intern("newton:mpm:gridPadding")
+    newtonMpmMaxActiveCellCount = sys.intern("newton:mpm:maxActiveCellCount")
+    newtonMpmTransferScheme = sys.intern("newton:mpm:transferScheme")
+    apic = sys.intern("apic")
+    pic = sys.intern("pic")
+    newtonMpmIntegrationScheme = sys.intern("newton:mpm:integrationScheme")
+    gimp = sys.intern("gimp")
+    newtonMpmCriticalFraction = sys.intern("newton:mpm:criticalFraction")
+    newtonMpmAirDrag = sys.intern("newton:mpm:airDrag")
+    newtonMpmColliderBasisType = sys.intern("newton:mpm:colliderBasisType")
+    linear = sys.intern("linear")
+    trilinear = sys.intern("trilinear")
+    bspline = sys.intern("bspline")
+    serendipity = sys.intern("serendipity")
+    particle = sys.intern("particle")
+    newtonMpmColliderBasisOrder = sys.intern("newton:mpm:colliderBasisOrder")
+    newtonMpmColliderDiscontinuousBasis = sys.intern("newton:mpm:colliderDiscontinuousBasis")
+    newtonMpmStrainBasisType = sys.intern("newton:mpm:strainBasisType")
+    newtonMpmStrainBasisOrder = sys.intern("newton:mpm:strainBasisOrder")
+    newtonMpmStrainDiscontinuousBasis = sys.intern("newton:mpm:strainDiscontinuousBasis")
+    newtonMpmVelocityBasisType = sys.intern("newton:mpm:velocityBasisType")
+    newtonMpmVelocityBasisOrder = sys.intern("newton:mpm:velocityBasisOrder")
+    NewtonArticulationRootAPI = sys.intern("NewtonArticulationRootAPI")
+    newtonSelfCollisionEnabled = sys.intern("newton:selfCollisionEnabled")
+    newtonJointsAddMobility = sys.intern("newton:jointsAddMobility")
+    NewtonJointAPI = sys.intern("NewtonJointAPI")
+    newtonArmature = sys.intern("newton:armature")
+    newtonDamping = sys.intern("newton:damping")
+    newtonFriction = sys.intern("newton:friction")
+    newtonVelocityLimit = sys.intern("newton:velocityLimit")
+    newtonLimitStiffness = sys.intern("newton:limitStiffness")
+    newtonLimitDamping = sys.intern("newton:limitDamping")
+    newtonDofArmature = sys.intern("newton:dof:armature")
+    newtonDofDamping = sys.intern("newton:dof:damping")
+    newtonDofFriction = sys.intern("newton:dof:friction")
+    newtonDofVelocityLimit = sys.intern("newton:dof:velocityLimit")
+    newtonDofLimitStiffness = sys.intern("newton:dof:limitStiffness")
+    newtonDofLimitDamping = sys.intern("newton:dof:limitDamping")
+    NewtonMassAPI = sys.intern("NewtonMassAPI")
+    newtonInertia = sys.intern("newton:inertia")
+    newtonMassModel = sys.intern("newton:massModel")
+    solid = sys.intern("solid")
+    shell = sys.intern("shell")
+    newtonShellThickness = sys.intern("newton:shellThickness")
+    NewtonCollisionAPI = sys.intern("NewtonCollisionAPI")
+    newtonContactMargin = sys.intern("newton:contactMargin")
+    newtonContactGap = sys.intern("newton:contactGap")
+    NewtonMeshCollisionAPI = sys.intern("NewtonMeshCollisionAPI")
+    newtonMaxHullVertices = sys.intern("newton:maxHullVertices")
+    NewtonSDFCollisionAPI = sys.intern("NewtonSDFCollisionAPI")
+    newtonSdfMaxResolution = sys.intern("newton:sdfMaxResolution")
+    newtonSdfTargetVoxelSize = sys.intern("newton:sdfTargetVoxelSize")
+    newtonSdfNarrowBandInner = sys.intern("newton:sdfNarrowBandInner")
+    newtonSdfNarrowBandOuter = sys.intern("newton:sdfNarrowBandOuter")
+    newtonSdfTextureFormat = sys.intern("newton:sdfTextureFormat")
+    uint8 = sys.intern("uint8")
+    uint16 = sys.intern("uint16")
+    float32 = sys.intern("float32")
+    newtonSdfPadding = sys.intern("newton:sdfPadding")
+    newtonHydroelasticEnabled = sys.intern("newton:hydroelasticEnabled")
+    newtonHydroelasticStiffness = sys.intern("newton:hydroelasticStiffness")
+    NewtonSiteAPI = sys.intern("NewtonSiteAPI")
+    NewtonPointsDeformableSimAPI = sys.intern("NewtonPointsDeformableSimAPI")
+    physicsMasses = sys.intern("physics:masses")
+    newtonMpmMaterials = sys.intern("newton:mpm:materials")
+    newtonMpmMaterialIndices = sys.intern("newton:mpm:materialIndices")
+    newtonMpmYoungsModulus = sys.intern("newton:mpm:youngsModulus")
+    newtonMpmInternalFriction = sys.intern("newton:mpm:internalFriction")
+    newtonMpmYieldPressure = sys.intern("newton:mpm:yieldPressure")
+    NewtonMaterialAPI = sys.intern("NewtonMaterialAPI")
+    newtonTorsionalFriction = sys.intern("newton:torsionalFriction")
+    newtonRollingFriction = sys.intern("newton:rollingFriction")
+    newtonContactStiffness = sys.intern("newton:contactStiffness")
+    newtonContactDamping = sys.intern("newton:contactDamping")
+    newtonContactFrictionGain = sys.intern("newton:contactFrictionGain")
+    newtonContactAdhesion = sys.intern("newton:contactAdhesion")
+    NewtonMPMMaterialAPI = sys.intern("NewtonMPMMaterialAPI")
+    newtonMpmPoissonsRatio = sys.intern("newton:mpm:poissonsRatio")
+    newtonMpmElasticDamping = sys.intern("newton:mpm:elasticDamping")
+    newtonMpmTensileYieldRatio = sys.intern("newton:mpm:tensileYieldRatio")
+    newtonMpmYieldStress = sys.intern("newton:mpm:yieldStress")
+    newtonMpmViscosity = sys.intern("newton:mpm:viscosity")
+    newtonMpmInitialPlasticVolumeStrain = sys.intern("newton:mpm:initialPlasticVolumeStrain")
+    newtonMpmHardening = sys.intern("newton:mpm:hardening")
+    newtonMpmHardeningRate = sys.intern("newton:mpm:hardeningRate")
+    newtonMpmSofteningRate = sys.intern("newton:mpm:softeningRate")
+    newtonMpmDilatancy = sys.intern("newton:mpm:dilatancy")
+    NewtonCurvesDeformableMaterialAPI = sys.intern("NewtonCurvesDeformableMaterialAPI")
+    newtonCurvesStretchDamping = sys.intern("newton:curvesStretchDamping")
+    newtonCurvesShearDamping = sys.intern("newton:curvesShearDamping")
+    newtonCurvesBendDamping = sys.intern("newton:curvesBendDamping")
+    newtonCurvesTwistDamping = sys.intern("newton:curvesTwistDamping")
+    NewtonMimicAPI = sys.intern("NewtonMimicAPI")
+    newtonMimicEnabled = sys.intern("newton:mimicEnabled")
+    newtonMimicJoint = sys.intern("newton:mimicJoint")
+    newtonMimicCoef0 = sys.intern("newton:mimicCoef0")
+    newtonMimicCoef1 = sys.intern("newton:mimicCoef1")
+    NewtonActuator = sys.intern("NewtonActuator")
+    newtonTargets = sys.intern("newton:targets")
+    NewtonActuatorDelayAPI = sys.intern("NewtonActuatorDelayAPI")
+    newtonDelaySteps = sys.intern("newton:delaySteps")
+    NewtonActuatorControlBaseAPI = sys.intern("NewtonActuatorControlBaseAPI")
+    NewtonPDControlAPI = sys.intern("NewtonPDControlAPI")
+    newtonConstEffort = sys.intern("newton:constEffort")
+    newtonKp = sys.intern("newton:kp")
+    newtonKd = sys.intern("newton:kd")
+    NewtonPIDControlAPI = sys.intern("NewtonPIDControlAPI")
+    newtonKi = sys.intern("newton:ki")
+    newtonIntegralMax = sys.intern("newton:integralMax")
+    NewtonNeuralControlAPI = sys.intern("NewtonNeuralControlAPI")
+    newtonModelPath = sys.intern("newton:modelPath")
+    NewtonActuatorClampingBaseAPI = sys.intern("NewtonActuatorClampingBaseAPI")
+    NewtonMaxEffortClampingAPI = sys.intern("NewtonMaxEffortClampingAPI")
+    newtonMaxEffort = sys.intern("newton:maxEffort")
+    NewtonDCMotorClampingAPI = sys.intern("NewtonDCMotorClampingAPI")
+    newtonMaxMotorEffort = sys.intern("newton:maxMotorEffort")
+    newtonSaturationEffort = sys.intern("newton:saturationEffort")
+    NewtonPositionBasedClampingAPI = sys.intern("NewtonPositionBasedClampingAPI")
+    newtonLookupPositions = sys.intern("newton:lookupPositions")
+    newtonLookupEfforts = sys.intern("newton:lookupEfforts")
+    NewtonActuatorArray = sys.intern("NewtonActuatorArray")
+
+
+class _SchemaBase:
+    __slots__ = ("_prim",)
+
+    schemaName = ""
+    _attributeNames: tuple[str, ...] = ()
+    _relationshipNames: tuple[str, ...] = ()
+
+    def __init__(self, prim: Usd.Prim | None = None):
+        self._prim = Usd.Prim() if prim is None else prim
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._prim})"
+
+    def GetPrim(self) -> Usd.Prim:
+        """Get the wrapped prim."""
+        return self._prim
+
+    def GetPath(self) -> Sdf.Path:
+        """Get the path of the wrapped prim."""
+        return self._prim.GetPath()
+
+    @classmethod
+    def Get(cls: type[_Schema], stage: Usd.Stage, path: Sdf.Path | str) -> _Schema:
+        """Wrap the prim at `path` on `stage`, which may be invalid."""
+        return cls(stage.GetPrimAtPath(path))
+
+    @classmethod
+    def GetSchemaAttributeNames(cls) -> tuple[str, ...]:
+        """Get the names of the attributes declared by this schema, excluding those of included API schemas."""
+        return cls._attributeNames
+
+    @classmethod
+    def GetSchemaRelationshipNames(cls) -> tuple[str, ...]:
+        """Get the names of the relationships declared by this schema, excluding those of included API schemas."""
+        return cls._relationshipNames
+
+    def _CreateAttr(self, name: str, type_name: Sdf.ValueTypeName, variability: Sdf.Variability, default_value) -> Usd.Attribute:
+        attr = self._prim.CreateAttribute(name, type_name, False, variability)
+        if default_value is not None:
+            attr.Set(default_value)
+        return attr
+
+
+class _APISchemaBase(_SchemaBase):
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return self._prim.IsValid() and self._prim.HasAPI(self.schemaName)
+
+    @classmethod
+    def CanApply(cls, prim: Usd.Prim) -> bool:
+        """Check whether the schema can be applied to `prim`."""
+        return prim.CanApplyAPI(cls.schemaName)
+
+    @classmethod
+    def Apply(cls: type[_Schema], prim: Usd.Prim) -> _Schema:
+        """Apply the schema to `prim`, returning an invalid wrapper if it could not be applied."""
+        return cls(prim) if prim.IsValid() and prim.ApplyAPI(cls.schemaName) else cls()
+
+
+class _TypedSchemaBase(_SchemaBase):
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return self._prim.IsValid() and self._prim.IsA(self.schemaName)
+
+    @classmethod
+    def Define(cls: type[_Schema], stage: Usd.Stage, path: Sdf.Path | str) -> _Schema:
+        """Define a prim of this type at `path` on `stage`."""
+        return cls(stage.DefinePrim(path, cls.schemaName))
+
+
+class NewtonSceneAPI(_APISchemaBase):
+    """`NewtonSceneAPI` applies on top of a `PhysicsScene` prim, providing attributes to control a Newton solver."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonSceneAPI
+    _attributeNames = (Tokens.newtonMaxSolverIterations, Tokens.newtonTimeStepsPerSecond, Tokens.newtonGravityEnabled)
+
+    def GetMaxSolverIterationsAttr(self) -> Usd.Attribute:
+        """Get the `uniform int newton:maxSolverIterations` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMaxSolverIterations)
+
+    def CreateMaxSolverIterationsAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:maxSolverIterations` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMaxSolverIterations, Sdf.ValueTypeNames.Int, Sdf.VariabilityUniform, defaultValue)
+
+    def GetTimeStepsPerSecondAttr(self) -> Usd.Attribute:
+        """Get the `uniform int newton:timeStepsPerSecond` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonTimeStepsPerSecond)
+
+    def CreateTimeStepsPerSecondAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:timeStepsPerSecond` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonTimeStepsPerSecond, Sdf.ValueTypeNames.Int, Sdf.VariabilityUniform, defaultValue)
+
+    def GetGravityEnabledAttr(self) -> Usd.Attribute:
+        """Get the `bool newton:gravityEnabled` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonGravityEnabled)
+
+    def CreateGravityEnabledAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:gravityEnabled` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonGravityEnabled, Sdf.ValueTypeNames.Bool, Sdf.VariabilityVarying, defaultValue)
+
+
+class NewtonXpbdSceneAPI(_APISchemaBase):
+    """Provides Newton's XPBD (eXtended Position-Based Dynamics) solver configuration."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonXpbdSceneAPI
+    _attributeNames = (
+        Tokens.newtonXpbdSoftBodyRelaxation,
+        Tokens.newtonXpbdSoftContactRelaxation,
+        Tokens.newtonXpbdJointLinearRelaxation,
+        Tokens.newtonXpbdJointAngularRelaxation,
+        Tokens.newtonXpbdJointLinearCompliance,
+        Tokens.newtonXpbdJointAngularCompliance,
+        Tokens.newtonXpbdRigidContactRelaxation,
+        Tokens.newtonXpbdRigidContactConWeighting,
+        Tokens.newtonXpbdAngularDamping,
+        Tokens.newtonXpbdRestitutionEnabled,
+    )
+
+    def GetXpbdSoftBodyRelaxationAttr(self) -> Usd.Attribute:
+        """Get the `uniform float newton:xpbd:softBodyRelaxation` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonXpbdSoftBodyRelaxation)
+
+    def CreateXpbdSoftBodyRelaxationAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:xpbd:softBodyRelaxation` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonXpbdSoftBodyRelaxation, Sdf.ValueTypeNames.Float, Sdf.VariabilityUniform, defaultValue)
+
+    def GetXpbdSoftContactRelaxationAttr(self) -> Usd.Attribute:
+        """Get the `uniform float newton:xpbd:softContactRelaxation` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonXpbdSoftContactRelaxation)
+
+    def CreateXpbdSoftContactRelaxationAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:xpbd:softContactRelaxation` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonXpbdSoftContactRelaxation, Sdf.ValueTypeNames.Float, Sdf.VariabilityUniform, defaultValue)
+
+    def GetXpbdJointLinearRelaxationAttr(self) -> Usd.Attribute:
+        """Get the `uniform float newton:xpbd:jointLinearRelaxation` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonXpbdJointLinearRelaxation)
+
+    def CreateXpbdJointLinearRelaxationAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:xpbd:jointLinearRelaxation` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonXpbdJointLinearRelaxation, Sdf.ValueTypeNames.Float, Sdf.VariabilityUniform, defaultValue)
+
+    def GetXpbdJointAngularRelaxationAttr(self) -> Usd.Attribute:
+        """Get the `uniform float newton:xpbd:jointAngularRelaxation` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonXpbdJointAngularRelaxation)
+
+    def CreateXpbdJointAngularRelaxationAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:xpbd:jointAngularRelaxation` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonXpbdJointAngularRelaxation, Sdf.ValueTypeNames.Float, Sdf.VariabilityUniform, defaultValue)
+
+    def GetXpbdJointLinearComplianceAttr(self) -> Usd.Attribute:
+        """Get the `uniform float newton:xpbd:jointLinearCompliance` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonXpbdJointLinearCompliance)
+
+    def CreateXpbdJointLinearComplianceAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:xpbd:jointLinearCompliance` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonXpbdJointLinearCompliance, Sdf.ValueTypeNames.Float, Sdf.VariabilityUniform, defaultValue)
+
+    def GetXpbdJointAngularComplianceAttr(self) -> Usd.Attribute:
+        """Get the `uniform float newton:xpbd:jointAngularCompliance` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonXpbdJointAngularCompliance)
+
+    def CreateXpbdJointAngularComplianceAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:xpbd:jointAngularCompliance` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonXpbdJointAngularCompliance, Sdf.ValueTypeNames.Float, Sdf.VariabilityUniform, defaultValue)
+
+    def GetXpbdRigidContactRelaxationAttr(self) -> Usd.Attribute:
+        """Get the `uniform float newton:xpbd:rigidContactRelaxation` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonXpbdRigidContactRelaxation)
+
+    def CreateXpbdRigidContactRelaxationAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:xpbd:rigidContactRelaxation` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonXpbdRigidContactRelaxation, Sdf.ValueTypeNames.Float, Sdf.VariabilityUniform, defaultValue)
+
+    def GetXpbdRigidContactConWeightingAttr(self) -> Usd.Attribute:
+        """Get the `uniform bool newton:xpbd:rigidContactConWeighting` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonXpbdRigidContactConWeighting)
+
+    def CreateXpbdRigidContactConWeightingAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:xpbd:rigidContactConWeighting` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonXpbdRigidContactConWeighting, Sdf.ValueTypeNames.Bool, Sdf.VariabilityUniform, defaultValue)
+
+    def GetXpbdAngularDampingAttr(self) -> Usd.Attribute:
+        """Get the `uniform float newton:xpbd:angularDamping` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonXpbdAngularDamping)
+
+    def CreateXpbdAngularDampingAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:xpbd:angularDamping` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonXpbdAngularDamping, Sdf.ValueTypeNames.Float, Sdf.VariabilityUniform, defaultValue)
+
+    def GetXpbdRestitutionEnabledAttr(self) -> Usd.Attribute:
+        """Get the `uniform bool newton:xpbd:restitutionEnabled` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonXpbdRestitutionEnabled)
+
+    def CreateXpbdRestitutionEnabledAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:xpbd:restitutionEnabled` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonXpbdRestitutionEnabled, Sdf.ValueTypeNames.Bool, Sdf.VariabilityUniform, defaultValue)
+
+
+class NewtonKaminoSceneAPI(_APISchemaBase):
+    """Provides Newton's Kamino solver configuration."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonKaminoSceneAPI
+    _attributeNames = (
+        Tokens.newtonKaminoPadmmPrimalTolerance,
+        Tokens.newtonKaminoPadmmDualTolerance,
+        Tokens.newtonKaminoPadmmComplementarityTolerance,
+        Tokens.newtonKaminoPadmmWarmstarting,
+        Tokens.newtonKaminoPadmmUseAcceleration,
+        Tokens.newtonKaminoConstraintsUsePreconditioning,
+        Tokens.newtonKaminoConstraintsAlpha,
+        Tokens.newtonKaminoConstraintsBeta,
+        Tokens.newtonKaminoConstraintsGamma,
+        Tokens.newtonKaminoJointCorrection,
+    )
+
+    def GetKaminoPadmmPrimalToleranceAttr(self) -> Usd.Attribute:
+        """Get the `uniform float newton:kamino:padmm:primalTolerance` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonKaminoPadmmPrimalTolerance)
+
+    def CreateKaminoPadmmPrimalToleranceAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:kamino:padmm:primalTolerance` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonKaminoPadmmPrimalTolerance, Sdf.ValueTypeNames.Float, Sdf.VariabilityUniform, defaultValue)
+
+    def GetKaminoPadmmDualToleranceAttr(self) -> Usd.Attribute:
+        """Get the `uniform float newton:kamino:padmm:dualTolerance` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonKaminoPadmmDualTolerance)
+
+    def CreateKaminoPadmmDualToleranceAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:kamino:padmm:dualTolerance` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonKaminoPadmmDualTolerance, Sdf.ValueTypeNames.Float, Sdf.VariabilityUniform, defaultValue)
+
+    def GetKaminoPadmmComplementarityToleranceAttr(self) -> Usd.Attribute:
+        """Get the `uniform float newton:kamino:padmm:complementarityTolerance` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonKaminoPadmmComplementarityTolerance)
+
+    def CreateKaminoPadmmComplementarityToleranceAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:kamino:padmm:complementarityTolerance` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonKaminoPadmmComplementarityTolerance, Sdf.ValueTypeNames.Float, Sdf.VariabilityUniform, defaultValue)
+
+    def GetKaminoPadmmWarmstartingAttr(self) -> Usd.Attribute:
+        """Get the `uniform token newton:kamino:padmm:warmstarting` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonKaminoPadmmWarmstarting)
+
+    def CreateKaminoPadmmWarmstartingAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:kamino:padmm:warmstarting` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonKaminoPadmmWarmstarting, Sdf.ValueTypeNames.Token, Sdf.VariabilityUniform, defaultValue)
+
+    def GetKaminoPadmmUseAccelerationAttr(self) -> Usd.Attribute:
+        """Get the `uniform bool newton:kamino:padmm:useAcceleration` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonKaminoPadmmUseAcceleration)
+
+    def CreateKaminoPadmmUseAccelerationAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:kamino:padmm:useAcceleration` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonKaminoPadmmUseAcceleration, Sdf.ValueTypeNames.Bool, Sdf.VariabilityUniform, defaultValue)
+
+    def GetKaminoConstraintsUsePreconditioningAttr(self) -> Usd.Attribute:
+        """Get the `uniform bool newton:kamino:constraints:usePreconditioning` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonKaminoConstraintsUsePreconditioning)
+
+    def CreateKaminoConstraintsUsePreconditioningAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:kamino:constraints:usePreconditioning` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonKaminoConstraintsUsePreconditioning, Sdf.ValueTypeNames.Bool, Sdf.VariabilityUniform, defaultValue)
+
+    def GetKaminoConstraintsAlphaAttr(self) -> Usd.Attribute:
+        """Get the `uniform float newton:kamino:constraints:alpha` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonKaminoConstraintsAlpha)
+
+    def CreateKaminoConstraintsAlphaAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:kamino:constraints:alpha` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonKaminoConstraintsAlpha, Sdf.ValueTypeNames.Float, Sdf.VariabilityUniform, defaultValue)
+
+    def GetKaminoConstraintsBetaAttr(self) -> Usd.Attribute:
+        """Get the `uniform float newton:kamino:constraints:beta` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonKaminoConstraintsBeta)
+
+    def CreateKaminoConstraintsBetaAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:kamino:constraints:beta` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonKaminoConstraintsBeta, Sdf.ValueTypeNames.Float, Sdf.VariabilityUniform, defaultValue)
+
+    def GetKaminoConstraintsGammaAttr(self) -> Usd.Attribute:
+        """Get the `uniform float newton:kamino:constraints:gamma` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonKaminoConstraintsGamma)
+
+    def CreateKaminoConstraintsGammaAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:kamino:constraints:gamma` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonKaminoConstraintsGamma, Sdf.ValueTypeNames.Float, Sdf.VariabilityUniform, defaultValue)
+
+    def GetKaminoJointCorrectionAttr(self) -> Usd.Attribute:
+        """Get the `uniform token newton:kamino:jointCorrection` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonKaminoJointCorrection)
+
+    def CreateKaminoJointCorrectionAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:kamino:jointCorrection` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonKaminoJointCorrection, Sdf.ValueTypeNames.Token, Sdf.VariabilityUniform, defaultValue)
+
+
+class NewtonMPMSceneAPI(_APISchemaBase):
+    """Provides configuration for an implicit Material Point Method (MPM) solver."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonMPMSceneAPI
+    _attributeNames = (
+        Tokens.newtonMpmTolerance,
+        Tokens.newtonMpmRheologySolvers,
+        Tokens.newtonMpmVoxelSize,
+        Tokens.newtonMpmGridType,
+        Tokens.newtonMpmGridPadding,
+        Tokens.newtonMpmMaxActiveCellCount,
+        Tokens.newtonMpmTransferScheme,
+        Tokens.newtonMpmIntegrationScheme,
+        Tokens.newtonMpmCriticalFraction,
+        Tokens.newtonMpmAirDrag,
+        Tokens.newtonMpmColliderBasisType,
+        Tokens.newtonMpmColliderBasisOrder,
+        Tokens.newtonMpmColliderDiscontinuousBasis,
+        Tokens.newtonMpmStrainBasisType,
+        Tokens.newtonMpmStrainBasisOrder,
+        Tokens.newtonMpmStrainDiscontinuousBasis,
+        Tokens.newtonMpmVelocityBasisType,
+        Tokens.newtonMpmVelocityBasisOrder,
+    )
+
+    def GetMpmToleranceAttr(self) -> Usd.Attribute:
+        """Get the `uniform float newton:mpm:tolerance` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmTolerance)
+
+    def CreateMpmToleranceAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:tolerance` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmTolerance, Sdf.ValueTypeNames.Float, Sdf.VariabilityUniform, defaultValue)
+
+    def GetMpmRheologySolversAttr(self) -> Usd.Attribute:
+        """Get the `uniform token[] newton:mpm:rheologySolvers` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmRheologySolvers)
+
+    def CreateMpmRheologySolversAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:rheologySolvers` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmRheologySolvers, Sdf.ValueTypeNames.TokenArray, Sdf.VariabilityUniform, defaultValue)
+
+    def GetMpmVoxelSizeAttr(self) -> Usd.Attribute:
+        """Get the `uniform float newton:mpm:voxelSize` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmVoxelSize)
+
+    def CreateMpmVoxelSizeAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:voxelSize` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmVoxelSize, Sdf.ValueTypeNames.Float, Sdf.VariabilityUniform, defaultValue)
+
+    def GetMpmGridTypeAttr(self) -> Usd.Attribute:
+        """Get the `uniform token newton:mpm:gridType` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmGridType)
+
+    def CreateMpmGridTypeAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:gridType` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmGridType, Sdf.ValueTypeNames.Token, Sdf.VariabilityUniform, defaultValue)
+
+    def GetMpmGridPaddingAttr(self) -> Usd.Attribute:
+        """Get the `uniform int newton:mpm:gridPadding` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmGridPadding)
+
+    def CreateMpmGridPaddingAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:gridPadding` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmGridPadding, Sdf.ValueTypeNames.Int, Sdf.VariabilityUniform, defaultValue)
+
+    def GetMpmMaxActiveCellCountAttr(self) -> Usd.Attribute:
+        """Get the `uniform int newton:mpm:maxActiveCellCount` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmMaxActiveCellCount)
+
+    def CreateMpmMaxActiveCellCountAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:maxActiveCellCount` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmMaxActiveCellCount, Sdf.ValueTypeNames.Int, Sdf.VariabilityUniform, defaultValue)
+
+    def GetMpmTransferSchemeAttr(self) -> Usd.Attribute:
+        """Get the `uniform token newton:mpm:transferScheme` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmTransferScheme)
+
+    def CreateMpmTransferSchemeAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:transferScheme` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmTransferScheme, Sdf.ValueTypeNames.Token, Sdf.VariabilityUniform, defaultValue)
+
+    def GetMpmIntegrationSchemeAttr(self) -> Usd.Attribute:
+        """Get the `uniform token newton:mpm:integrationScheme` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmIntegrationScheme)
+
+    def CreateMpmIntegrationSchemeAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:integrationScheme` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmIntegrationScheme, Sdf.ValueTypeNames.Token, Sdf.VariabilityUniform, defaultValue)
+
+    def GetMpmCriticalFractionAttr(self) -> Usd.Attribute:
+        """Get the `uniform float newton:mpm:criticalFraction` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmCriticalFraction)
+
+    def CreateMpmCriticalFractionAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:criticalFraction` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmCriticalFraction, Sdf.ValueTypeNames.Float, Sdf.VariabilityUniform, defaultValue)
+
+    def GetMpmAirDragAttr(self) -> Usd.Attribute:
+        """Get the `uniform float newton:mpm:airDrag` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmAirDrag)
+
+    def CreateMpmAirDragAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:airDrag` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmAirDrag, Sdf.ValueTypeNames.Float, Sdf.VariabilityUniform, defaultValue)
+
+    def GetMpmColliderBasisTypeAttr(self) -> Usd.Attribute:
+        """Get the `uniform token newton:mpm:colliderBasisType` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmColliderBasisType)
+
+    def CreateMpmColliderBasisTypeAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:colliderBasisType` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmColliderBasisType, Sdf.ValueTypeNames.Token, Sdf.VariabilityUniform, defaultValue)
+
+    def GetMpmColliderBasisOrderAttr(self) -> Usd.Attribute:
+        """Get the `uniform int newton:mpm:colliderBasisOrder` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmColliderBasisOrder)
+
+    def CreateMpmColliderBasisOrderAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:colliderBasisOrder` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmColliderBasisOrder, Sdf.ValueTypeNames.Int, Sdf.VariabilityUniform, defaultValue)
+
+    def GetMpmColliderDiscontinuousBasisAttr(self) -> Usd.Attribute:
+        """Get the `uniform bool newton:mpm:colliderDiscontinuousBasis` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmColliderDiscontinuousBasis)
+
+    def CreateMpmColliderDiscontinuousBasisAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:colliderDiscontinuousBasis` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmColliderDiscontinuousBasis, Sdf.ValueTypeNames.Bool, Sdf.VariabilityUniform, defaultValue)
+
+    def GetMpmStrainBasisTypeAttr(self) -> Usd.Attribute:
+        """Get the `uniform token newton:mpm:strainBasisType` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmStrainBasisType)
+
+    def CreateMpmStrainBasisTypeAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:strainBasisType` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmStrainBasisType, Sdf.ValueTypeNames.Token, Sdf.VariabilityUniform, defaultValue)
+
+    def GetMpmStrainBasisOrderAttr(self) -> Usd.Attribute:
+        """Get the `uniform int newton:mpm:strainBasisOrder` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmStrainBasisOrder)
+
+    def CreateMpmStrainBasisOrderAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:strainBasisOrder` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmStrainBasisOrder, Sdf.ValueTypeNames.Int, Sdf.VariabilityUniform, defaultValue)
+
+    def GetMpmStrainDiscontinuousBasisAttr(self) -> Usd.Attribute:
+        """Get the `uniform bool newton:mpm:strainDiscontinuousBasis` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmStrainDiscontinuousBasis)
+
+    def CreateMpmStrainDiscontinuousBasisAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:strainDiscontinuousBasis` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmStrainDiscontinuousBasis, Sdf.ValueTypeNames.Bool, Sdf.VariabilityUniform, defaultValue)
+
+    def GetMpmVelocityBasisTypeAttr(self) -> Usd.Attribute:
+        """Get the `uniform token newton:mpm:velocityBasisType` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmVelocityBasisType)
+
+    def CreateMpmVelocityBasisTypeAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:velocityBasisType` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmVelocityBasisType, Sdf.ValueTypeNames.Token, Sdf.VariabilityUniform, defaultValue)
+
+    def GetMpmVelocityBasisOrderAttr(self) -> Usd.Attribute:
+        """Get the `uniform int newton:mpm:velocityBasisOrder` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmVelocityBasisOrder)
+
+    def CreateMpmVelocityBasisOrderAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:velocityBasisOrder` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmVelocityBasisOrder, Sdf.ValueTypeNames.Int, Sdf.VariabilityUniform, defaultValue)
+
+
+class NewtonArticulationRootAPI(_APISchemaBase):
+    """NewtonArticulationRootAPI extends the `PhysicsArticulationRootAPI` with additional attributes for Newton."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonArticulationRootAPI
+    _attributeNames = (Tokens.newtonSelfCollisionEnabled, Tokens.newtonJointsAddMobility)
+
+    def GetSelfCollisionEnabledAttr(self) -> Usd.Attribute:
+        """Get the `bool newton:selfCollisionEnabled` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonSelfCollisionEnabled)
+
+    def CreateSelfCollisionEnabledAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:selfCollisionEnabled` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonSelfCollisionEnabled, Sdf.ValueTypeNames.Bool, Sdf.VariabilityVarying, defaultValue)
+
+    def GetJointsAddMobilityAttr(self) -> Usd.Attribute:
+        """Get the `uniform bool newton:jointsAddMobility` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonJointsAddMobility)
+
+    def CreateJointsAddMobilityAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:jointsAddMobility` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonJointsAddMobility, Sdf.ValueTypeNames.Bool, Sdf.VariabilityUniform, defaultValue)
+
+
+class NewtonJointAPI(_APISchemaBase):
+    """`NewtonJointAPI` applies on top of a `PhysicsJoint`, providing joint configuration for solver behavior, passive dynamics, and limit spring
+    response.
+    """
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonJointAPI
+    _attributeNames = (
+        Tokens.newtonArmature,
+        Tokens.newtonDamping,
+        Tokens.newtonFriction,
+        Tokens.newtonVelocityLimit,
+        Tokens.newtonLimitStiffness,
+        Tokens.newtonLimitDamping,
+        Tokens.newtonDofArmature,
+        Tokens.newtonDofDamping,
+        Tokens.newtonDofFriction,
+        Tokens.newtonDofVelocityLimit,
+        Tokens.newtonDofLimitStiffness,
+        Tokens.newtonDofLimitDamping,
+    )
+
+    def GetArmatureAttr(self) -> Usd.Attribute:
+        """Get the `float newton:armature` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonArmature)
+
+    def CreateArmatureAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:armature` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonArmature, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetDampingAttr(self) -> Usd.Attribute:
+        """Get the `float newton:damping` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonDamping)
+
+    def CreateDampingAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:damping` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonDamping, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetFrictionAttr(self) -> Usd.Attribute:
+        """Get the `float newton:friction` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonFriction)
+
+    def CreateFrictionAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:friction` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonFriction, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetVelocityLimitAttr(self) -> Usd.Attribute:
+        """Get the `float newton:velocityLimit` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonVelocityLimit)
+
+    def CreateVelocityLimitAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:velocityLimit` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonVelocityLimit, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetLimitStiffnessAttr(self) -> Usd.Attribute:
+        """Get the `float newton:limitStiffness` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonLimitStiffness)
+
+    def CreateLimitStiffnessAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:limitStiffness` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonLimitStiffness, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetLimitDampingAttr(self) -> Usd.Attribute:
+        """Get the `float newton:limitDamping` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonLimitDamping)
+
+    def CreateLimitDampingAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:limitDamping` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonLimitDamping, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetDofArmatureAttr(self) -> Usd.Attribute:
+        """Get the `float[] newton:dof:armature` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonDofArmature)
+
+    def CreateDofArmatureAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:dof:armature` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonDofArmature, Sdf.ValueTypeNames.FloatArray, Sdf.VariabilityVarying, defaultValue)
+
+    def GetDofDampingAttr(self) -> Usd.Attribute:
+        """Get the `float[] newton:dof:damping` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonDofDamping)
+
+    def CreateDofDampingAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:dof:damping` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonDofDamping, Sdf.ValueTypeNames.FloatArray, Sdf.VariabilityVarying, defaultValue)
+
+    def GetDofFrictionAttr(self) -> Usd.Attribute:
+        """Get the `float[] newton:dof:friction` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonDofFriction)
+
+    def CreateDofFrictionAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:dof:friction` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonDofFriction, Sdf.ValueTypeNames.FloatArray, Sdf.VariabilityVarying, defaultValue)
+
+    def GetDofVelocityLimitAttr(self) -> Usd.Attribute:
+        """Get the `float[] newton:dof:velocityLimit` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonDofVelocityLimit)
+
+    def CreateDofVelocityLimitAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:dof:velocityLimit` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonDofVelocityLimit, Sdf.ValueTypeNames.FloatArray, Sdf.VariabilityVarying, defaultValue)
+
+    def GetDofLimitStiffnessAttr(self) -> Usd.Attribute:
+        """Get the `float[] newton:dof:limitStiffness` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonDofLimitStiffness)
+
+    def CreateDofLimitStiffnessAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:dof:limitStiffness` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonDofLimitStiffness, Sdf.ValueTypeNames.FloatArray, Sdf.VariabilityVarying, defaultValue)
+
+    def GetDofLimitDampingAttr(self) -> Usd.Attribute:
+        """Get the `float[] newton:dof:limitDamping` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonDofLimitDamping)
+
+    def CreateDofLimitDampingAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:dof:limitDamping` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonDofLimitDamping, Sdf.ValueTypeNames.FloatArray, Sdf.VariabilityVarying, defaultValue)
+
+
+class NewtonMassAPI(_APISchemaBase):
+    """`NewtonMassAPI` applies on top of an `Xformable`, providing extra mass attributes for Newton."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonMassAPI
+    _attributeNames = (Tokens.newtonInertia, Tokens.newtonMassModel, Tokens.newtonShellThickness)
+
+    def GetInertiaAttr(self) -> Usd.Attribute:
+        """Get the `double[] newton:inertia` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonInertia)
+
+    def CreateInertiaAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:inertia` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonInertia, Sdf.ValueTypeNames.DoubleArray, Sdf.VariabilityVarying, defaultValue)
+
+    def GetMassModelAttr(self) -> Usd.Attribute:
+        """Get the `uniform token newton:massModel` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMassModel)
+
+    def CreateMassModelAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:massModel` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMassModel, Sdf.ValueTypeNames.Token, Sdf.VariabilityUniform, defaultValue)
+
+    def GetShellThicknessAttr(self) -> Usd.Attribute:
+        """Get the `float newton:shellThickness` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonShellThickness)
+
+    def CreateShellThicknessAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:shellThickness` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonShellThickness, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+
+class NewtonCollisionAPI(_APISchemaBase):
+    """`NewtonCollisionAPI` applies on top of a `Gprim`, providing extra collision attributes for Newton."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonCollisionAPI
+    _attributeNames = (Tokens.newtonContactMargin, Tokens.newtonContactGap)
+
+    def GetContactMarginAttr(self) -> Usd.Attribute:
+        """Get the `float newton:contactMargin` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonContactMargin)
+
+    def CreateContactMarginAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:contactMargin` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonContactMargin, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetContactGapAttr(self) -> Usd.Attribute:
+        """Get the `float newton:contactGap` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonContactGap)
+
+    def CreateContactGapAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:contactGap` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonContactGap, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+
+class NewtonMeshCollisionAPI(_APISchemaBase):
+    """`NewtonMeshCollisionAPI` applies on top of a `Mesh`, providing extra mesh collision attributes for Newton."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonMeshCollisionAPI
+    _attributeNames = (Tokens.newtonMaxHullVertices,)
+
+    def GetMaxHullVerticesAttr(self) -> Usd.Attribute:
+        """Get the `uniform int newton:maxHullVertices` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMaxHullVertices)
+
+    def CreateMaxHullVerticesAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:maxHullVertices` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMaxHullVertices, Sdf.ValueTypeNames.Int, Sdf.VariabilityUniform, defaultValue)
+
+
+class NewtonSDFCollisionAPI(_APISchemaBase):
+    """Configures SDF-based collision (and optional hydroelastic contact)."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonSDFCollisionAPI
+    _attributeNames = (
+        Tokens.newtonSdfMaxResolution,
+        Tokens.newtonSdfTargetVoxelSize,
+        Tokens.newtonSdfNarrowBandInner,
+        Tokens.newtonSdfNarrowBandOuter,
+        Tokens.newtonSdfTextureFormat,
+        Tokens.newtonSdfPadding,
+        Tokens.newtonHydroelasticEnabled,
+        Tokens.newtonHydroelasticStiffness,
+    )
+
+    def GetSdfMaxResolutionAttr(self) -> Usd.Attribute:
+        """Get the `uniform int newton:sdfMaxResolution` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonSdfMaxResolution)
+
+    def CreateSdfMaxResolutionAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:sdfMaxResolution` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonSdfMaxResolution, Sdf.ValueTypeNames.Int, Sdf.VariabilityUniform, defaultValue)
+
+    def GetSdfTargetVoxelSizeAttr(self) -> Usd.Attribute:
+        """Get the `uniform float newton:sdfTargetVoxelSize` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonSdfTargetVoxelSize)
+
+    def CreateSdfTargetVoxelSizeAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:sdfTargetVoxelSize` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonSdfTargetVoxelSize, Sdf.ValueTypeNames.Float, Sdf.VariabilityUniform, defaultValue)
+
+    def GetSdfNarrowBandInnerAttr(self) -> Usd.Attribute:
+        """Get the `uniform float newton:sdfNarrowBandInner` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonSdfNarrowBandInner)
+
+    def CreateSdfNarrowBandInnerAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:sdfNarrowBandInner` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonSdfNarrowBandInner, Sdf.ValueTypeNames.Float, Sdf.VariabilityUniform, defaultValue)
+
+    def GetSdfNarrowBandOuterAttr(self) -> Usd.Attribute:
+        """Get the `uniform float newton:sdfNarrowBandOuter` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonSdfNarrowBandOuter)
+
+    def CreateSdfNarrowBandOuterAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:sdfNarrowBandOuter` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonSdfNarrowBandOuter, Sdf.ValueTypeNames.Float, Sdf.VariabilityUniform, defaultValue)
+
+    def GetSdfTextureFormatAttr(self) -> Usd.Attribute:
+        """Get the `uniform token newton:sdfTextureFormat` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonSdfTextureFormat)
+
+    def CreateSdfTextureFormatAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:sdfTextureFormat` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonSdfTextureFormat, Sdf.ValueTypeNames.Token, Sdf.VariabilityUniform, defaultValue)
+
+    def GetSdfPaddingAttr(self) -> Usd.Attribute:
+        """Get the `uniform float newton:sdfPadding` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonSdfPadding)
+
+    def CreateSdfPaddingAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:sdfPadding` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonSdfPadding, Sdf.ValueTypeNames.Float, Sdf.VariabilityUniform, defaultValue)
+
+    def GetHydroelasticEnabledAttr(self) -> Usd.Attribute:
+        """Get the `bool newton:hydroelasticEnabled` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonHydroelasticEnabled)
+
+    def CreateHydroelasticEnabledAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:hydroelasticEnabled` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonHydroelasticEnabled, Sdf.ValueTypeNames.Bool, Sdf.VariabilityVarying, defaultValue)
+
+    def GetHydroelasticStiffnessAttr(self) -> Usd.Attribute:
+        """Get the `float newton:hydroelasticStiffness` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonHydroelasticStiffness)
+
+    def CreateHydroelasticStiffnessAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:hydroelasticStiffness` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonHydroelasticStiffness, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+
+class NewtonSiteAPI(_APISchemaBase):
+    """`NewtonSiteAPI` applies on top of a `Gprim`, marking it as a non-colliding, massless reference frame used for sensing, attachment, or
+    coordinate queries.
+    """
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonSiteAPI
+
+
+class NewtonPointsDeformableSimAPI(_APISchemaBase):
+    """Marks a `UsdGeomPoints` prim as deformable simulation geometry."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonPointsDeformableSimAPI
+    _attributeNames = (
+        Tokens.physicsMasses,
+        Tokens.newtonMpmMaterialIndices,
+        Tokens.newtonMpmYoungsModulus,
+        Tokens.newtonMpmInternalFriction,
+        Tokens.newtonMpmYieldPressure,
+    )
+    _relationshipNames = (Tokens.newtonMpmMaterials,)
+
+    def GetMassesAttr(self) -> Usd.Attribute:
+        """Get the `float[] physics:masses` attribute."""
+        return self._prim.GetAttribute(Tokens.physicsMasses)
+
+    def CreateMassesAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `physics:masses` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.physicsMasses, Sdf.ValueTypeNames.FloatArray, Sdf.VariabilityVarying, defaultValue)
+
+    def GetMpmMaterialsRel(self) -> Usd.Relationship:
+        """Get the `newton:mpm:materials` relationship."""
+        return self._prim.GetRelationship(Tokens.newtonMpmMaterials)
+
+    def CreateMpmMaterialsRel(self) -> Usd.Relationship:
+        """Create the `newton:mpm:materials` relationship."""
+        return self._prim.CreateRelationship(Tokens.newtonMpmMaterials, False)
+
+    def GetMpmMaterialIndicesAttr(self) -> Usd.Attribute:
+        """Get the `int[] newton:mpm:materialIndices` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmMaterialIndices)
+
+    def CreateMpmMaterialIndicesAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:materialIndices` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmMaterialIndices, Sdf.ValueTypeNames.IntArray, Sdf.VariabilityVarying, defaultValue)
+
+    def GetMpmYoungsModulusAttr(self) -> Usd.Attribute:
+        """Get the `float[] newton:mpm:youngsModulus` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmYoungsModulus)
+
+    def CreateMpmYoungsModulusAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:youngsModulus` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmYoungsModulus, Sdf.ValueTypeNames.FloatArray, Sdf.VariabilityVarying, defaultValue)
+
+    def GetMpmInternalFrictionAttr(self) -> Usd.Attribute:
+        """Get the `float[] newton:mpm:internalFriction` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmInternalFriction)
+
+    def CreateMpmInternalFrictionAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:internalFriction` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmInternalFriction, Sdf.ValueTypeNames.FloatArray, Sdf.VariabilityVarying, defaultValue)
+
+    def GetMpmYieldPressureAttr(self) -> Usd.Attribute:
+        """Get the `float[] newton:mpm:yieldPressure` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmYieldPressure)
+
+    def CreateMpmYieldPressureAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:yieldPressure` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmYieldPressure, Sdf.ValueTypeNames.FloatArray, Sdf.VariabilityVarying, defaultValue)
+
+
+class NewtonMaterialAPI(_APISchemaBase):
+    """`NewtonMaterialAPI` applies on top of a `Material`, providing extra physical material attributes for Newton."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonMaterialAPI
+    _attributeNames = (
+        Tokens.newtonTorsionalFriction,
+        Tokens.newtonRollingFriction,
+        Tokens.newtonContactStiffness,
+        Tokens.newtonContactDamping,
+        Tokens.newtonContactFrictionGain,
+        Tokens.newtonContactAdhesion,
+    )
+
+    def GetTorsionalFrictionAttr(self) -> Usd.Attribute:
+        """Get the `float newton:torsionalFriction` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonTorsionalFriction)
+
+    def CreateTorsionalFrictionAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:torsionalFriction` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonTorsionalFriction, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetRollingFrictionAttr(self) -> Usd.Attribute:
+        """Get the `float newton:rollingFriction` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonRollingFriction)
+
+    def CreateRollingFrictionAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:rollingFriction` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonRollingFriction, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetContactStiffnessAttr(self) -> Usd.Attribute:
+        """Get the `float newton:contactStiffness` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonContactStiffness)
+
+    def CreateContactStiffnessAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:contactStiffness` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonContactStiffness, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetContactDampingAttr(self) -> Usd.Attribute:
+        """Get the `float newton:contactDamping` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonContactDamping)
+
+    def CreateContactDampingAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:contactDamping` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonContactDamping, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetContactFrictionGainAttr(self) -> Usd.Attribute:
+        """Get the `float newton:contactFrictionGain` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonContactFrictionGain)
+
+    def CreateContactFrictionGainAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:contactFrictionGain` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonContactFrictionGain, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetContactAdhesionAttr(self) -> Usd.Attribute:
+        """Get the `float newton:contactAdhesion` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonContactAdhesion)
+
+    def CreateContactAdhesionAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:contactAdhesion` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonContactAdhesion, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+
+class NewtonMPMMaterialAPI(_APISchemaBase):
+    """Provides constitutive parameters for an implicit MPM solver."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonMPMMaterialAPI
+    _attributeNames = (
+        Tokens.newtonMpmYoungsModulus,
+        Tokens.newtonMpmPoissonsRatio,
+        Tokens.newtonMpmElasticDamping,
+        Tokens.newtonMpmInternalFriction,
+        Tokens.newtonMpmYieldPressure,
+        Tokens.newtonMpmTensileYieldRatio,
+        Tokens.newtonMpmYieldStress,
+        Tokens.newtonMpmViscosity,
+        Tokens.newtonMpmInitialPlasticVolumeStrain,
+        Tokens.newtonMpmHardening,
+        Tokens.newtonMpmHardeningRate,
+        Tokens.newtonMpmSofteningRate,
+        Tokens.newtonMpmDilatancy,
+    )
+
+    def GetMpmYoungsModulusAttr(self) -> Usd.Attribute:
+        """Get the `float newton:mpm:youngsModulus` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmYoungsModulus)
+
+    def CreateMpmYoungsModulusAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:youngsModulus` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmYoungsModulus, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetMpmPoissonsRatioAttr(self) -> Usd.Attribute:
+        """Get the `float newton:mpm:poissonsRatio` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmPoissonsRatio)
+
+    def CreateMpmPoissonsRatioAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:poissonsRatio` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmPoissonsRatio, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetMpmElasticDampingAttr(self) -> Usd.Attribute:
+        """Get the `float newton:mpm:elasticDamping` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmElasticDamping)
+
+    def CreateMpmElasticDampingAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:elasticDamping` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmElasticDamping, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetMpmInternalFrictionAttr(self) -> Usd.Attribute:
+        """Get the `float newton:mpm:internalFriction` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmInternalFriction)
+
+    def CreateMpmInternalFrictionAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:internalFriction` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmInternalFriction, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetMpmYieldPressureAttr(self) -> Usd.Attribute:
+        """Get the `float newton:mpm:yieldPressure` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmYieldPressure)
+
+    def CreateMpmYieldPressureAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:yieldPressure` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmYieldPressure, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetMpmTensileYieldRatioAttr(self) -> Usd.Attribute:
+        """Get the `float newton:mpm:tensileYieldRatio` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmTensileYieldRatio)
+
+    def CreateMpmTensileYieldRatioAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:tensileYieldRatio` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmTensileYieldRatio, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetMpmYieldStressAttr(self) -> Usd.Attribute:
+        """Get the `float newton:mpm:yieldStress` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmYieldStress)
+
+    def CreateMpmYieldStressAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:yieldStress` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmYieldStress, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetMpmViscosityAttr(self) -> Usd.Attribute:
+        """Get the `float newton:mpm:viscosity` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmViscosity)
+
+    def CreateMpmViscosityAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:viscosity` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmViscosity, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetMpmInitialPlasticVolumeStrainAttr(self) -> Usd.Attribute:
+        """Get the `float newton:mpm:initialPlasticVolumeStrain` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmInitialPlasticVolumeStrain)
+
+    def CreateMpmInitialPlasticVolumeStrainAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:initialPlasticVolumeStrain` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmInitialPlasticVolumeStrain, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetMpmHardeningAttr(self) -> Usd.Attribute:
+        """Get the `float newton:mpm:hardening` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmHardening)
+
+    def CreateMpmHardeningAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:hardening` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmHardening, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetMpmHardeningRateAttr(self) -> Usd.Attribute:
+        """Get the `float newton:mpm:hardeningRate` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmHardeningRate)
+
+    def CreateMpmHardeningRateAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:hardeningRate` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmHardeningRate, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetMpmSofteningRateAttr(self) -> Usd.Attribute:
+        """Get the `float newton:mpm:softeningRate` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmSofteningRate)
+
+    def CreateMpmSofteningRateAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:softeningRate` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmSofteningRate, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetMpmDilatancyAttr(self) -> Usd.Attribute:
+        """Get the `float newton:mpm:dilatancy` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMpmDilatancy)
+
+    def CreateMpmDilatancyAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mpm:dilatancy` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMpmDilatancy, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+
+class NewtonCurvesDeformableMaterialAPI(_APISchemaBase):
+    """`NewtonCurvesDeformableMaterialAPI` applies on top of a `Material`, providing extra damping attributes for Newton's curve deformables."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonCurvesDeformableMaterialAPI
+    _attributeNames = (
+        Tokens.newtonCurvesStretchDamping,
+        Tokens.newtonCurvesShearDamping,
+        Tokens.newtonCurvesBendDamping,
+        Tokens.newtonCurvesTwistDamping,
+    )
+
+    def GetCurvesStretchDampingAttr(self) -> Usd.Attribute:
+        """Get the `float newton:curvesStretchDamping` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonCurvesStretchDamping)
+
+    def CreateCurvesStretchDampingAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:curvesStretchDamping` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonCurvesStretchDamping, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetCurvesShearDampingAttr(self) -> Usd.Attribute:
+        """Get the `float newton:curvesShearDamping` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonCurvesShearDamping)
+
+    def CreateCurvesShearDampingAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:curvesShearDamping` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonCurvesShearDamping, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetCurvesBendDampingAttr(self) -> Usd.Attribute:
+        """Get the `float newton:curvesBendDamping` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonCurvesBendDamping)
+
+    def CreateCurvesBendDampingAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:curvesBendDamping` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonCurvesBendDamping, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetCurvesTwistDampingAttr(self) -> Usd.Attribute:
+        """Get the `float newton:curvesTwistDamping` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonCurvesTwistDamping)
+
+    def CreateCurvesTwistDampingAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:curvesTwistDamping` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonCurvesTwistDamping, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+
+class NewtonMimicAPI(_APISchemaBase):
+    """`NewtonMimicAPI` applies on top of a `PhysicsJoint`, adding additional constraints to mimic the DOFs of another joint."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonMimicAPI
+    _attributeNames = (Tokens.newtonMimicEnabled, Tokens.newtonMimicCoef0, Tokens.newtonMimicCoef1)
+    _relationshipNames = (Tokens.newtonMimicJoint,)
+
+    def GetMimicEnabledAttr(self) -> Usd.Attribute:
+        """Get the `bool newton:mimicEnabled` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMimicEnabled)
+
+    def CreateMimicEnabledAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mimicEnabled` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMimicEnabled, Sdf.ValueTypeNames.Bool, Sdf.VariabilityVarying, defaultValue)
+
+    def GetMimicJointRel(self) -> Usd.Relationship:
+        """Get the `newton:mimicJoint` relationship."""
+        return self._prim.GetRelationship(Tokens.newtonMimicJoint)
+
+    def CreateMimicJointRel(self) -> Usd.Relationship:
+        """Create the `newton:mimicJoint` relationship."""
+        return self._prim.CreateRelationship(Tokens.newtonMimicJoint, False)
+
+    def GetMimicCoef0Attr(self) -> Usd.Attribute:
+        """Get the `float newton:mimicCoef0` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMimicCoef0)
+
+    def CreateMimicCoef0Attr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mimicCoef0` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMimicCoef0, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetMimicCoef1Attr(self) -> Usd.Attribute:
+        """Get the `float newton:mimicCoef1` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMimicCoef1)
+
+    def CreateMimicCoef1Attr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:mimicCoef1` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMimicCoef1, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+
+class NewtonActuator(_TypedSchemaBase):
+    """Defines a physical actuator that computes effort to apply to a joint."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonActuator
+    _relationshipNames = (Tokens.newtonTargets,)
+
+    def GetTargetsRel(self) -> Usd.Relationship:
+        """Get the `newton:targets` relationship."""
+        return self._prim.GetRelationship(Tokens.newtonTargets)
+
+    def CreateTargetsRel(self) -> Usd.Relationship:
+        """Create the `newton:targets` relationship."""
+        return self._prim.CreateRelationship(Tokens.newtonTargets, False)
+
+
+class NewtonActuatorDelayAPI(_APISchemaBase):
+    """Adds command input delay to an actuator to model communication or processing lag."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonActuatorDelayAPI
+    _attributeNames = (Tokens.newtonDelaySteps,)
+
+    def GetDelayStepsAttr(self) -> Usd.Attribute:
+        """Get the `int newton:delaySteps` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonDelaySteps)
+
+    def CreateDelayStepsAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:delaySteps` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonDelaySteps, Sdf.ValueTypeNames.Int, Sdf.VariabilityVarying, defaultValue)
+
+
+class NewtonActuatorControlBaseAPI(_APISchemaBase):
+    """Base API for all actuator control laws."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonActuatorControlBaseAPI
+
+
+class NewtonPDControlAPI(_APISchemaBase):
+    """Stateless PD (Proportional-Derivative) controller."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonPDControlAPI
+    _attributeNames = (Tokens.newtonConstEffort, Tokens.newtonKp, Tokens.newtonKd)
+
+    def GetConstEffortAttr(self) -> Usd.Attribute:
+        """Get the `float newton:constEffort` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonConstEffort)
+
+    def CreateConstEffortAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:constEffort` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonConstEffort, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetKpAttr(self) -> Usd.Attribute:
+        """Get the `float newton:kp` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonKp)
+
+    def CreateKpAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:kp` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonKp, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetKdAttr(self) -> Usd.Attribute:
+        """Get the `float newton:kd` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonKd)
+
+    def CreateKdAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:kd` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonKd, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+
+class NewtonPIDControlAPI(_APISchemaBase):
+    """Stateful PID (Proportional-Integral-Derivative) controller."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonPIDControlAPI
+    _attributeNames = (Tokens.newtonConstEffort, Tokens.newtonKp, Tokens.newtonKd, Tokens.newtonKi, Tokens.newtonIntegralMax)
+
+    def GetConstEffortAttr(self) -> Usd.Attribute:
+        """Get the `float newton:constEffort` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonConstEffort)
+
+    def CreateConstEffortAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:constEffort` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonConstEffort, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetKpAttr(self) -> Usd.Attribute:
+        """Get the `float newton:kp` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonKp)
+
+    def CreateKpAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:kp` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonKp, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetKdAttr(self) -> Usd.Attribute:
+        """Get the `float newton:kd` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonKd)
+
+    def CreateKdAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:kd` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonKd, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetKiAttr(self) -> Usd.Attribute:
+        """Get the `float newton:ki` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonKi)
+
+    def CreateKiAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:ki` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonKi, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetIntegralMaxAttr(self) -> Usd.Attribute:
+        """Get the `float newton:integralMax` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonIntegralMax)
+
+    def CreateIntegralMaxAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:integralMax` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonIntegralMax, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+
+class NewtonNeuralControlAPI(_APISchemaBase):
+    """Neural-network actuator controller."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonNeuralControlAPI
+    _attributeNames = (Tokens.newtonModelPath,)
+
+    def GetModelPathAttr(self) -> Usd.Attribute:
+        """Get the `asset newton:modelPath` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonModelPath)
+
+    def CreateModelPathAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:modelPath` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonModelPath, Sdf.ValueTypeNames.Asset, Sdf.VariabilityVarying, defaultValue)
+
+
+class NewtonActuatorClampingBaseAPI(_APISchemaBase):
+    """Base API for all actuator clamping strategies."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonActuatorClampingBaseAPI
+
+
+class NewtonMaxEffortClampingAPI(_APISchemaBase):
+    """Symmetric clamp on actuator output effort."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonMaxEffortClampingAPI
+    _attributeNames = (Tokens.newtonMaxEffort,)
+
+    def GetMaxEffortAttr(self) -> Usd.Attribute:
+        """Get the `float newton:maxEffort` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMaxEffort)
+
+    def CreateMaxEffortAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:maxEffort` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMaxEffort, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+
+class NewtonDCMotorClampingAPI(_APISchemaBase):
+    """DC motor four-quadrant effort clamp."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonDCMotorClampingAPI
+    _attributeNames = (Tokens.newtonMaxMotorEffort, Tokens.newtonSaturationEffort, Tokens.newtonVelocityLimit)
+
+    def GetMaxMotorEffortAttr(self) -> Usd.Attribute:
+        """Get the `float newton:maxMotorEffort` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMaxMotorEffort)
+
+    def CreateMaxMotorEffortAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:maxMotorEffort` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMaxMotorEffort, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetSaturationEffortAttr(self) -> Usd.Attribute:
+        """Get the `float newton:saturationEffort` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonSaturationEffort)
+
+    def CreateSaturationEffortAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:saturationEffort` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonSaturationEffort, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+    def GetVelocityLimitAttr(self) -> Usd.Attribute:
+        """Get the `float newton:velocityLimit` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonVelocityLimit)
+
+    def CreateVelocityLimitAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:velocityLimit` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonVelocityLimit, Sdf.ValueTypeNames.Float, Sdf.VariabilityVarying, defaultValue)
+
+
+class NewtonPositionBasedClampingAPI(_APISchemaBase):
+    """Position-dependent effort clamping via lookup table."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonPositionBasedClampingAPI
+    _attributeNames = (Tokens.newtonLookupPositions, Tokens.newtonLookupEfforts)
+
+    def GetLookupPositionsAttr(self) -> Usd.Attribute:
+        """Get the `float[] newton:lookupPositions` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonLookupPositions)
+
+    def CreateLookupPositionsAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:lookupPositions` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonLookupPositions, Sdf.ValueTypeNames.FloatArray, Sdf.VariabilityVarying, defaultValue)
+
+    def GetLookupEffortsAttr(self) -> Usd.Attribute:
+        """Get the `float[] newton:lookupEfforts` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonLookupEfforts)
+
+    def CreateLookupEffortsAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:lookupEfforts` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonLookupEfforts, Sdf.ValueTypeNames.FloatArray, Sdf.VariabilityVarying, defaultValue)
+
+
+class NewtonActuatorArray(_TypedSchemaBase):
+    """Defines a batch of physical actuators, each computing effort to apply to one joint."""
+
+    __slots__ = ()
+
+    schemaName = Tokens.NewtonActuatorArray
+    _attributeNames = (
+        Tokens.newtonConstEffort,
+        Tokens.newtonKp,
+        Tokens.newtonKd,
+        Tokens.newtonKi,
+        Tokens.newtonIntegralMax,
+        Tokens.newtonMaxEffort,
+        Tokens.newtonDelaySteps,
+    )
+    _relationshipNames = (Tokens.newtonTargets,)
+
+    def GetTargetsRel(self) -> Usd.Relationship:
+        """Get the `newton:targets` relationship."""
+        return self._prim.GetRelationship(Tokens.newtonTargets)
+
+    def CreateTargetsRel(self) -> Usd.Relationship:
+        """Create the `newton:targets` relationship."""
+        return self._prim.CreateRelationship(Tokens.newtonTargets, False)
+
+    def GetConstEffortAttr(self) -> Usd.Attribute:
+        """Get the `float[] newton:constEffort` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonConstEffort)
+
+    def CreateConstEffortAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:constEffort` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonConstEffort, Sdf.ValueTypeNames.FloatArray, Sdf.VariabilityVarying, defaultValue)
+
+    def GetKpAttr(self) -> Usd.Attribute:
+        """Get the `float[] newton:kp` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonKp)
+
+    def CreateKpAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:kp` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonKp, Sdf.ValueTypeNames.FloatArray, Sdf.VariabilityVarying, defaultValue)
+
+    def GetKdAttr(self) -> Usd.Attribute:
+        """Get the `float[] newton:kd` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonKd)
+
+    def CreateKdAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:kd` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonKd, Sdf.ValueTypeNames.FloatArray, Sdf.VariabilityVarying, defaultValue)
+
+    def GetKiAttr(self) -> Usd.Attribute:
+        """Get the `float[] newton:ki` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonKi)
+
+    def CreateKiAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:ki` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonKi, Sdf.ValueTypeNames.FloatArray, Sdf.VariabilityVarying, defaultValue)
+
+    def GetIntegralMaxAttr(self) -> Usd.Attribute:
+        """Get the `float[] newton:integralMax` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonIntegralMax)
+
+    def CreateIntegralMaxAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:integralMax` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonIntegralMax, Sdf.ValueTypeNames.FloatArray, Sdf.VariabilityVarying, defaultValue)
+
+    def GetMaxEffortAttr(self) -> Usd.Attribute:
+        """Get the `float[] newton:maxEffort` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonMaxEffort)
+
+    def CreateMaxEffortAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:maxEffort` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonMaxEffort, Sdf.ValueTypeNames.FloatArray, Sdf.VariabilityVarying, defaultValue)
+
+    def GetDelayStepsAttr(self) -> Usd.Attribute:
+        """Get the `int[] newton:delaySteps` attribute."""
+        return self._prim.GetAttribute(Tokens.newtonDelaySteps)
+
+    def CreateDelayStepsAttr(self, defaultValue=None) -> Usd.Attribute:
+        """Create the `newton:delaySteps` attribute, and set its value if `defaultValue` is not `None`."""
+        return self._CreateAttr(Tokens.newtonDelaySteps, Sdf.ValueTypeNames.IntArray, Sdf.VariabilityVarying, defaultValue)
@@ -0,0 +1,278 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Sharing of extracted Newton arrays between the processes of a node.
+
+Environment workers on one node commonly parse the same stage into identical arrays. Instead,
+one process can extract the arrays once and publish them with `export_shared_arrays`, which
+copies them into a single `multiprocessing.shared_memory` block, described by a small
+JSON-serializable manifest. Workers receive the manifest (e.g. as a process argument) and call
+`attach_shared_arrays`, which returns read-only NumPy views of the block, without copying:
+
+    # in the parent
+    shared = export_shared_arrays({"joints": read_joint_dofs(stage), "actuators": read_actuator_arrays(stage)})
+    start_workers(json.dumps(shared.manifest))
+
+    # in each worker
+    with attach_shared_arrays(json.loads(manifest)) as arrays:
+        kp = arrays["actuators"]["parameters/kp"].copy()
+
+The exporting process owns the block, and unlinks it when the `SharedArrays` is closed. Views
+keep the block mapped, so they must be released (or copied) before their object is closed.
+"""
+
+import json
+import math
+import sys
+import threading
+from collections.abc import Mapping
+from dataclasses import fields, is_dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError("numpy must be installed to use newton_usd_schemas.shared")  # pragma: no cover
+
+from pxr import Gf
+
+__all__ = [
+    "AttachedArrays",
+    "SharedArrays",
+    "attach_shared_arrays",
+    "collect_arrays",
+    "export_shared_arrays",
+]
+
+_MANIFEST_VERSION = 1
+
+# arrays are aligned for vectorized loads
+_ALIGNMENT = 64
+
+_ATTACH_LOCK = threading.Lock()
+
+_QUATERNION_DTYPES = {Gf.Quath: np.float16, Gf.Quatf: np.float32, Gf.Quatd: np.float64}
+
+
+def _quaternions(array: Any) -> Any:
+    # quaternion columns, e.g. `physics:principalAxes`, are object arrays, which are converted to `(N, 4)` (real, i, j, k) arrays
+    if not isinstance(array, np.ndarray) or not array.dtype.hasobject or array.size == 0:
+        return array
+    dtypes = {_QUATERNION_DTYPES.get(type(item)) for item in array.flat}
+    if len(dtypes) != 1 or None in dtypes:
+        return array
+    return np.array([(item.GetReal(), *item.GetImaginary()) for item in array.flat], dtype=dtypes.pop()).reshape(*array.shape, 4)
+
+
+def collect_arrays(value: Any) -> dict[str, np.ndarray]:
+    """Collect the arrays of an extraction result, keyed by the names they are shared with.
+
+    Args:
+        value: A mapping of array names to arrays, or a dataclass such as `ActuatorArrays`,
+            `JointDofArrays`, `ParticleArrays` or `NewtonDescriptors`. The NumPy array fields of a
+            dataclass are collected by their field name, and the arrays of its mapping fields as
+            `<field>/<key>`, e.g. `parameters/kp`. Other fields (e.g. paths) and `None` are skipped.
+
+    Quaternion columns, such as the `physics:principalAxes` of a `NewtonDescriptors`, are converted
+    to `(N, 4)` arrays of `(real, i, j, k)`. Other object arrays of a dataclass (e.g. arrays of
+    varying length, asset paths or blocked values) can not be shared, and are skipped.
+
+    Returns:
+        The arrays, keyed by name.
+
+    Raises:
+        TypeError: If `value` is neither a mapping nor a dataclass.
+    """
+    if isinstance(value, Mapping):
+        return {str(name): _quaternions(array) for name, array in value.items() if array is not None}
+    if not is_dataclass(value) or isinstance(value, type):
+        raise TypeError(f"Expected a mapping of arrays or a dataclass, got {type(value).__name__}")
+    arrays = {}
+    for field in fields(value):
+        member = getattr(value, field.name)
+        if isinstance(member, np.ndarray):
+            arrays[field.name] = _quaternions(member)
+        elif isinstance(member, Mapping):
+            arrays.update({f"{field.name}/{key}": _quaternions(array) for key, array in member.items() if isinstance(array, np.ndarray)})
+    return {name: array for name, array in arrays.items() if not array.dtype.hasobject}
+
+
+def _dtype_to_json(dtype: np.dtype) -> str | list:
+    return dtype.str if dtype.fields is None else dtype.descr
+
+
+def _dtype_from_json(value: str | list) -> np.dtype:
+    def field(item: list) -> tuple:
+        name, kind, *shape = item
+        kind = kind if isinstance(kind, str) else [field(member) for member in kind]
+        return (name, kind, tuple(shape[0])) if shape else (name, kind)
+
+    return np.dtype(value if isinstance(value, str) else [field(item) for item in value])
+
+
+def _attach(name: str) -> SharedMemory:
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    # before Python 3.13, attaching registers the block with the resource tracker, which would unlink
+    # it when the attaching process exits, although that process does not own it. The registration
+    # can not be undone afterwards either, as child processes share the tracker of their parent,
+    # where the exporting process registered the same block, so it is suppressed instead, for the
+    # attaching thread only: other threads registering resources meanwhile are passed through.
+    thread = threading.get_ident()
+    with _ATTACH_LOCK:
+        register = resource_tracker.register
+
+        def _register(name: str, rtype: str) -> None:
+            if rtype != "shared_memory" or threading.get_ident() != thread:
+                register(name, rtype)
+
+        resource_tracker.register = _register
+        try:
+            return SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+class _Views(Mapping):
+    # read-only views of the arrays of a manifest, in a shared memory block
+    def __init__(self, memory: SharedMemory, manifest: dict):
+        self._memory = memory
+        self.manifest = manifest
+        self._groups: dict[str, dict[str, np.ndarray]] = {}
+        for group, arrays in manifest["groups"].items():
+            views = self._groups[group] = {}
+            for name, info in arrays.items():
+                # unlike `np.ndarray(buffer=...)`, `np.frombuffer` holds an export of the buffer, so the block
+                # can not be closed beneath a live view
+                shape = tuple(info["shape"])
+                view = np.frombuffer(memory.buf, dtype=_dtype_from_json(info["dtype"]), count=math.prod(shape), offset=info["offset"]).reshape(shape)
+                view.flags.writeable = False
+                views[name] = view
+
+    def __getitem__(self, group: str) -> dict[str, np.ndarray]:
+        return self._groups[group]
+
+    def __iter__(self):
+        return iter(self._groups)
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory block."""
+        return self._memory.name
+
+    def close(self) -> None:
+        """Release the views and close this process' handle of the block.
+
+        Raises:
+            BufferError: If views (or arrays derived from them without copying) are still referenced.
+        """
+        self._groups.clear()
+        self._memory.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class SharedArrays(_Views):
+    """Arrays published in a shared memory block by `export_shared_arrays`, owned by this process.
+
+    The object maps each group name to its arrays, which are read-only views of the block.
+
+    Attributes:
+        manifest: The JSON-serializable description of the block, to pass to `attach_shared_arrays`.
+    """
+
+    _unlinked = False
+
+    def close(self) -> None:
+        """Release the views, and unlink the block, so it is freed once every attached process has closed it.
+
+        The block is unlinked even if this process' handle cannot be closed yet, so its memory is
+        freed once the remaining views are released.
+
+        Raises:
+            BufferError: If views (or arrays derived from them without copying) are still referenced.
+        """
+        try:
+            super().close()
+        finally:
+            if not self._unlinked:
+                self._unlinked = True
+                self._memory.unlink()
+
+
+class AttachedArrays(_Views):
+    """Arrays attached from a shared memory block by `attach_shared_arrays`.
+
+    The object maps each group name to its arrays, which are read-only views of the block. The
+    block remains owned by the exporting process.
+
+    Attributes:
+        manifest: The description of the block.
+    """
+
+
+def export_shared_arrays(groups: Mapping[str, Any], name: str | None = None) -> SharedArrays:
+    """Copy extracted arrays into a new shared memory block.
+
+    Args:
+        groups: The arrays to share, keyed by group name, e.g. `{"joints": read_joint_dofs(stage)}`.
+            Each group is a mapping of arrays or a dataclass, whose arrays are collected by
+            `collect_arrays`.
+        name: The name of the shared memory block, or `None` for a unique name.
+
+    Returns:
+        The shared arrays, whose `manifest` describes the block.
+
+    Raises:
+        ValueError: If an array has an object dtype, which can not be shared.
+    """
+    collected = {group: collect_arrays(value) for group, value in groups.items()}
+    layout: dict[str, dict[str, dict]] = {}
+    size = 0
+    for group, arrays in collected.items():
+        layout[group] = {}
+        for array_name, array in arrays.items():
+            array = np.asarray(array)
+            if array.dtype.hasobject:
+                raise ValueError(f"`{group}/{array_name}` has an object dtype, which can not be shared")
+            size = -(-size // _ALIGNMENT) * _ALIGNMENT
+            layout[group][array_name] = {"offset": size, "shape": list(array.shape), "dtype": _dtype_to_json(array.dtype)}
+            size += array.nbytes
+
+    memory = SharedMemory(name=name, create=True, size=max(size, 1))
+    manifest = {"version": _MANIFEST_VERSION, "name": memory.name, "size": size, "groups": layout}
+    for group, arrays in collected.items():
+        for array_name, array in arrays.items():
+            array = np.asarray(array)
+            info = layout[group][array_name]
+            np.ndarray(array.shape, dtype=array.dtype, buffer=memory.buf, offset=info["offset"])[...] = array
+    return SharedArrays(memory, manifest)
+
+
+def attach_shared_arrays(manifest: Mapping | str) -> AttachedArrays:
+    """Attach to arrays published by `export_shared_arrays`, in any process of the node.
+
+    Args:
+        manifest: The manifest of the shared arrays, or its JSON string.
+
+    Returns:
+        The attached arrays. The block remains mapped until they are closed, even if the exporting
+        process closes its `SharedArrays` (and thereby unlinks the block) in the meantime.
+
+    Raises:
+        ValueError: If the manifest has an unsupported version.
+        FileNotFoundError: If the shared memory block no longer exists.
+    """
+    manifest = json.loads(manifest) if isinstance(manifest, str) else dict(manifest)
+    if manifest.get("version") != _MANIFEST_VERSION:
+        raise ValueError(f"Unsupported shared array manifest version {manifest.get('version')}")
+    return AttachedArrays(_attach(manifest["name"]), manifest)
@@ -0,0 +1,279 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Scene parameter sweeps authored as lightweight override layers.
+
+Rather than exporting a whole scene per variant, each variant is a tiny layer which sublayers
+the unmodified asset and only authors `over` opinions for the swept scene attributes. Opening
+a variant layer as the root layer of a stage therefore composes the asset with the variant's
+parameters, in any USD runtime.
+
+Variant layers are authored with the `Sdf` API alone, so generating hundreds of variants never
+composes a stage. They can be written to disk, or kept as anonymous layers and opened directly,
+in which case the asset is opened once and shared by every variant through the layer registry.
+"""
+
+import itertools
+import json
+import os
+import pathlib
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from pxr import Sdf, Usd
+
+from ._schema import schema_definition
+
+__all__ = [
+    "SceneVariant",
+    "iter_scene_sweep",
+    "write_rheology_sweep",
+    "write_sweep_manifest",
+]
+
+
+@dataclass(frozen=True)
+class SceneVariant:
+    """A variant of a scene, authored as an override layer.
+
+    Attributes:
+        name: The name of the variant, unique within its sweep.
+        path: The file path of the variant layer, or `None` for an anonymous variant.
+        parameters: The attribute values authored by the variant, keyed by attribute name.
+        scene_path: The path of the scene prim overridden by the variant.
+        layer: The anonymous variant layer, or `None` if the variant was written to `path`.
+    """
+
+    name: str
+    path: pathlib.Path | None
+    parameters: dict[str, Any]
+    scene_path: Sdf.Path
+    layer: Sdf.Layer | None = None
+
+    @property
+    def identifier(self) -> str:
+        """The layer identifier to open the variant with, e.g. `Usd.Stage.Open(variant.identifier)`."""
+        return self.path.as_posix() if self.path is not None else self.layer.identifier
+
+
+def _find_scene(asset: str, schema: str) -> Sdf.Path:
+    # scene prims are not expected inside payloads, which usually hold the heavy geometry
+    stage = Usd.Stage.Open(asset, Usd.Stage.LoadNone)
+    scenes = [prim.GetPath() for prim in stage.Traverse() if prim.HasAPI(schema)]
+    if len(scenes) != 1:
+        raise ValueError(f"expected exactly one prim with {schema} applied in {asset}, found {len(scenes)}")
+    return scenes[0]
+
+
+def _check_tokens(definition: Usd.PrimDefinition, name: str, value: Any) -> None:
+    allowed = definition.GetAttributeDefinition(name).GetMetadata("allowedTokens")
+    if allowed:
+        tokens = [value] if isinstance(value, str) else list(value)
+        invalid = [token for token in tokens if token not in allowed]
+        if invalid:
+            raise ValueError(f"`{name}` does not allow {invalid}, expected tokens from {list(allowed)}")
+
+
+def _hard_limits(definition: Usd.PrimDefinition, name: str) -> tuple[Any, Any]:
+    hard = (definition.GetAttributeDefinition(name).GetMetadata("limits") or {}).get("hard", {})
+    return hard.get("minimum"), hard.get("maximum")
+
+
+def _check_value(definition: Usd.PrimDefinition, name: str, value: Any) -> None:
+    _check_tokens(definition, name, value)
+    minimum, maximum = _hard_limits(definition, name)
+    if minimum is not None and value < minimum:
+        raise ValueError(f"`{name}` must be at least {minimum}, got {value}")
+    if maximum is not None and value > maximum:
+        raise ValueError(f"`{name}` must be at most {maximum}, got {value}")
+
+
+def _clamp_value(definition: Usd.PrimDefinition, name: str, value: Any) -> Any:
+    _check_tokens(definition, name, value)
+    minimum, maximum = _hard_limits(definition, name)
+    if minimum is not None and value < minimum:
+        return minimum
+    if maximum is not None and value > maximum:
+        return maximum
+    return value
+
+
+def _variant_layer(asset: str, prim_path: Sdf.Path, definition: Usd.PrimDefinition, parameters: Mapping[str, Any]) -> Sdf.Layer:
+    layer = Sdf.Layer.CreateAnonymous()
+    layer.subLayerPaths.append(asset)
+    spec = Sdf.CreatePrimInLayer(layer, prim_path)
+    spec.specifier = Sdf.SpecifierOver
+    for name, value in parameters.items():
+        attr = definition.GetAttributeDefinition(name)
+        Sdf.AttributeSpec(spec, name, attr.GetTypeName(), attr.GetVariability()).default = value
+    return layer
+
+
+def iter_scene_sweep(
+    asset: str | os.PathLike,
+    schema: str,
+    parameters: Mapping[str, Iterable[Any]] | Iterable[Mapping[str, Any]],
+    output_dir: str | os.PathLike | None = None,
+    scene_path: str | Sdf.Path | None = None,
+) -> Iterator[SceneVariant]:
+    """Generate variants of the scene parameters of an asset.
+
+    Variants are produced lazily, one override layer at a time, so arbitrarily large sweeps
+    (or sweeps driven by an optimizer) never hold more than the current variant in memory.
+    Numeric values are clamped to the hard limits of the schema, and the clamped value is the
+    one reported in `SceneVariant.parameters`.
+
+    With an `output_dir`, each variant is written to `<asset stem>.variant<index>.usda` and
+    sublayers the asset by relative path. Otherwise each variant is an anonymous layer which
+    sublayers the asset by its identifier. The asset layer is opened once and kept open while
+    the generator is alive, so stages opened from the variants share it through the layer
+    registry rather than reading it again.
+
+    Args:
+        asset: The file path of the scene to sweep.
+        schema: The applied API schema which defines the swept attributes, e.g. `NewtonXpbdSceneAPI`
+            or `NewtonKaminoSceneAPI`. Attributes of the schemas it includes, such as `NewtonSceneAPI`,
+            may be swept as well.
+        parameters: Either a grid mapping each attribute name to the values to sweep, in which case every
+            combination is generated, or an iterable of explicit `{attribute name: value}` variants.
+        output_dir: The directory to write the variant layers to, or `None` for anonymous variants.
+        scene_path: The prim to override. By default, the only prim in the asset with `schema` applied.
+
+    Yields:
+        The variants, in order.
+
+    Raises:
+        ValueError: If `schema` is not registered or does not define a swept attribute, if a token value
+            is not allowed, or if `scene_path` is not given and the asset does not contain exactly one
+            prim with `schema` applied.
+    """
+    definition = schema_definition(schema)
+    if definition is None or Usd.SchemaRegistry.GetSchemaKind(schema) != Usd.SchemaKind.SingleApplyAPI:
+        raise ValueError(f"{schema} is not a registered API schema")
+    asset_path = pathlib.Path(asset).absolute()
+    base = Sdf.Layer.FindOrOpen(asset_path.as_posix())
+    if base is None:
+        raise ValueError(f"unable to open {asset_path}")
+    prim_path = Sdf.Path(scene_path) if scene_path is not None else _find_scene(base.identifier, schema)
+    if output_dir is not None:
+        output_dir = pathlib.Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        sublayer = pathlib.Path(os.path.relpath(asset_path, output_dir.absolute())).as_posix()
+    else:
+        sublayer = base.identifier
+
+    if isinstance(parameters, Mapping):
+        names = list(parameters)
+        parameters = (dict(zip(names, values, strict=True)) for values in itertools.product(*parameters.values()))
+    properties = set(definition.GetPropertyNames())
+
+    for index, values in enumerate(parameters):
+        unknown = sorted(set(values) - properties)
+        if unknown:
+            raise ValueError(f"{schema} does not define {unknown}")
+        values = {name: _clamp_value(definition, name, value) for name, value in values.items()}
+        name = f"variant{index:04d}"
+        layer = _variant_layer(sublayer, prim_path, definition, values)
+        if output_dir is None:
+            yield SceneVariant(name=name, path=None, parameters=values, scene_path=prim_path, layer=layer)
+        else:
+            # exporting an anonymous layer overwrites previous sweeps, even if their layers are still open
+            path = output_dir / f"{asset_path.stem}.{name}.usda"
+            layer.Export(path.as_posix())
+            yield SceneVariant(name=name, path=path, parameters=values, scene_path=prim_path)
+
+
+def write_sweep_manifest(path: str | os.PathLike, variants: Iterable[SceneVariant]) -> list[SceneVariant]:
+    """Write a JSON manifest of variants written to disk, for batch execution by any engine.
+
+    The manifest lists the swept asset and scene prim, and the layer file and parameters of
+    every variant. File paths are relative to the manifest. Variants are consumed one at a
+    time, so a generator from `iter_scene_sweep` is streamed to disk before the manifest is
+    written.
+
+    Args:
+        path: The file path of the manifest.
+        variants: The variants, which must all be written to disk and sweep the same scene.
+
+    Returns:
+        The listed variants.
+
+    Raises:
+        ValueError: If a variant is anonymous, or the variants sweep different assets or scenes.
+    """
+    path = pathlib.Path(path)
+    root = path.parent.absolute()
+    listed = []
+    entries = []
+    sweep = None
+    for variant in variants:
+        if variant.path is None:
+            raise ValueError(f"{variant.name} is anonymous, only variants written to disk can be listed in a manifest")
+        layer = Sdf.Layer.OpenAsAnonymous(variant.path.as_posix(), metadataOnly=True)
+        asset = os.path.normpath(variant.path.parent.absolute() / layer.subLayerPaths[0])
+        scene = (pathlib.Path(os.path.relpath(asset, root)).as_posix(), str(variant.scene_path))
+        if sweep is None:
+            sweep = scene
+        elif scene != sweep:
+            raise ValueError(f"{variant.name} sweeps {scene[1]} of {scene[0]} rather than {sweep[1]} of {sweep[0]}")
+        entries.append(
+            {
+                "name": variant.name,
+                "layer": pathlib.Path(os.path.relpath(variant.path.absolute(), root)).as_posix(),
+                "parameters": variant.parameters,
+            }
+        )
+        listed.append(variant)
+    asset, scene = sweep or (None, None)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"asset": asset, "scene": scene, "variants": entries}, indent=2) + "\n")
+    return listed
+
+
+def write_rheology_sweep(
+    asset: str | os.PathLike,
+    output_dir: str | os.PathLike,
+    solver_sequences: Iterable[Sequence[str]],
+    tolerances: Iterable[float] | None = None,
+    max_iterations: Iterable[int] | None = None,
+    scene_path: str | Sdf.Path | None = None,
+) -> list[SceneVariant]:
+    """Write a variant per combination of MPM rheology solver settings.
+
+    Every combination of `newton:mpm:rheologySolvers`, `newton:mpm:tolerance` and
+    `newton:maxSolverIterations` is written to `<asset stem>.variant<index>.usda` in
+    `output_dir` (see `iter_scene_sweep`). A `manifest.json` lists the asset, the scene prim,
+    and the layer file and parameters of every variant, so the sweep can be batch executed by
+    any engine. Unlike `iter_scene_sweep`, values outside the hard limits are rejected rather
+    than clamped.
+
+    Args:
+        asset: The file path of the scene to sweep, e.g. `tests/assets/sand.usda`.
+        output_dir: The directory to write the variant layers and manifest to. It is created if needed.
+        solver_sequences: The ordered rheology solver sequences to compare.
+        tolerances: The convergence tolerances to compare, or `None` to keep the authored tolerance.
+        max_iterations: The iteration limits to compare, or `None` to keep the authored limit.
+        scene_path: The `NewtonMPMSceneAPI` prim to override. By default, the only such prim in the asset.
+
+    Returns:
+        The variants, in the order listed by the manifest.
+
+    Raises:
+        ValueError: If a solver sequence is empty or a value violates the schema's allowed tokens or hard
+            limits, or if `scene_path` is not given and the asset does not contain exactly one MPM scene.
+    """
+    definition = schema_definition("NewtonMPMSceneAPI")
+    axes = {"newton:mpm:rheologySolvers": [list(sequence) for sequence in solver_sequences]}
+    if any(not sequence for sequence in axes["newton:mpm:rheologySolvers"]):
+        raise ValueError("each rheology solver sequence must contain at least one solver")
+    if tolerances is not None:
+        axes["newton:mpm:tolerance"] = [float(tolerance) for tolerance in tolerances]
+    if max_iterations is not None:
+        axes["newton:maxSolverIterations"] = [int(iterations) for iterations in max_iterations]
+    for name, values in axes.items():
+        for value in values:
+            _check_value(definition, name, value)
+
+    variants = iter_scene_sweep(asset, "NewtonMPMSceneAPI", axes, output_dir, scene_path)
+    return write_sweep_manifest(pathlib.Path(output_dir) / "manifest.json", variants)
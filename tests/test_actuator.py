@@ -470,5 +470,60 @@ class TestNewtonPositionBasedClampingAPI(unittest.TestCase):
         self.assertFalse(xform.CanApplyAPI("NewtonPositionBasedClampingAPI"))
 
 
+class TestNewtonActuatorArray(unittest.TestCase):
+    def setUp(self):
+        self.stage: Usd.Stage = Usd.Stage.CreateInMemory()
+        self.prim: Usd.Prim = self.stage.DefinePrim("/Actuators", "NewtonActuatorArray")
+
+    def test_typed_schema_registered(self):
+        plug_type = Plug.Registry().FindTypeByName("NewtonPhysicsActuatorArray")
+        self.assertEqual(plug_type.typeName, "NewtonPhysicsActuatorArray")
+        schema_type = Usd.SchemaRegistry().GetSchemaTypeName("NewtonPhysicsActuatorArray")
+        self.assertEqual(schema_type, "NewtonActuatorArray")
+
+    def test_properties(self):
+        self.assertFalse(self.prim.IsA(UsdGeom.Imageable))
+        self.assertFalse(self.prim.IsA("NewtonActuator"))
+        definition = Usd.SchemaRegistry().FindConcretePrimDefinition("NewtonActuatorArray")
+        self.assertEqual(
+            sorted(definition.GetPropertyNames()),
+            [
+                "newton:constEffort",
+                "newton:delaySteps",
+                "newton:integralMax",
+                "newton:kd",
+                "newton:ki",
+                "newton:kp",
+                "newton:maxEffort",
+                "newton:targets",
+            ],
+        )
+
+    def test_targets_relationship(self):
+        rel = self.prim.GetRelationship("newton:targets")
+        self.assertFalse(rel.HasAuthoredTargets())
+        rel.SetTargets([Sdf.Path("/World/Hip"), Sdf.Path("/World/Knee")])
+        self.assertEqual(rel.GetTargets(), [Sdf.Path("/World/Hip"), Sdf.Path("/World/Knee")])
+
+    def test_array_attributes(self):
+        for name in ("newton:constEffort", "newton:kp", "newton:kd", "newton:ki", "newton:integralMax", "newton:maxEffort"):
+            attr = self.prim.GetAttribute(name)
+            self.assertEqual(attr.GetTypeName(), Sdf.ValueTypeNames.FloatArray, name)
+            self.assertFalse(attr.HasAuthoredValue(), name)
+            self.assertEqual(attr.Get(), [], name)
+        attr = self.prim.GetAttribute("newton:delaySteps")
+        self.assertEqual(attr.GetTypeName(), Sdf.ValueTypeNames.IntArray)
+        self.assertEqual(attr.Get(), [])
+
+        attr = self.prim.GetAttribute("newton:maxEffort")
+        attr.Set([10.0, math.inf])
+        self.assertEqual(list(attr.Get()), [10.0, math.inf])
+
+    def test_control_apis_not_applicable(self):
+        # the control law and clamping of an actuator array are defined by its array attributes
+        self.assertFalse(self.prim.CanApplyAPI("NewtonPDControlAPI"))
+        self.assertFalse(self.prim.CanApplyAPI("NewtonMaxEffortClampingAPI"))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+import math
+import unittest
+
+import numpy as np
+from pxr import Sdf, Usd
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.actuators import ACTUATOR_ARRAY_ATTRIBUTES, read_actuator_arrays
+
+
+class TestReadActuatorArrays(unittest.TestCase):
+    def setUp(self):
+        self.stage: Usd.Stage = Usd.Stage.CreateInMemory()
+
+    def define(self, path: str, joints: list[str], **arrays) -> Usd.Prim:
+        prim = self.stage.DefinePrim(path, "NewtonActuatorArray")
+        prim.GetRelationship("newton:targets").SetTargets([Sdf.Path(joint) for joint in joints])
+        for field, values in arrays.items():
+            prim.GetAttribute(ACTUATOR_ARRAY_ATTRIBUTES[field]).Set(values)
+        return prim
+
+    def test_empty_stage(self):
+        actuators = read_actuator_arrays(self.stage)
+        self.assertEqual(len(actuators), 0)
+        np.testing.assert_array_equal(actuators.offsets, [0])
+        self.assertEqual(actuators.parameters["kp"].shape, (0,))
+
+    def test_concatenated(self):
+        self.define("/Robot0/Actuators", ["/Robot0/Hip", "/Robot0/Knee"], kp=[100.0, 50.0], kd=[1.0, 2.0], delay_steps=[0, 3])
+        self.define("/Robot1/Actuators", ["/Robot1/Hip", "/Robot1/Knee", "/Robot1/Ankle"], kp=[10.0, 20.0, 30.0], max_effort=[5.0, 5.0, 1.0])
+        # single target actuators are not part of the arrays
+        self.stage.DefinePrim("/Robot1/Wrist", "NewtonActuator")
+
+        actuators = read_actuator_arrays(self.stage)
+        self.assertEqual(len(actuators), 5)
+        self.assertEqual(actuators.prims, (Sdf.Path("/Robot0/Actuators"), Sdf.Path("/Robot1/Actuators")))
+        np.testing.assert_array_equal(actuators.offsets, [0, 2, 5])
+        np.testing.assert_array_equal(actuators.prim_indices(), [0, 0, 1, 1, 1])
+        self.assertEqual(actuators.targets[2], Sdf.Path("/Robot1/Hip"))
+        self.assertEqual(set(actuators.parameters), set(ACTUATOR_ARRAY_ATTRIBUTES))
+
+        kp = actuators.parameters["kp"]
+        self.assertEqual(kp.dtype, np.float32)
+        self.assertTrue(kp.flags.c_contiguous)
+        np.testing.assert_allclose(kp, [100.0, 50.0, 10.0, 20.0, 30.0])
+        # empty arrays use the schema fallback for every actuator of the prim
+        np.testing.assert_allclose(actuators.parameters["kd"], [1.0, 2.0, 0.0, 0.0, 0.0])
+        np.testing.assert_allclose(actuators.parameters["max_effort"], [math.inf, math.inf, 5.0, 5.0, 1.0])
+        np.testing.assert_allclose(actuators.parameters["integral_max"], [math.inf] * 5)
+        delay_steps = actuators.parameters["delay_steps"]
+        self.assertEqual(delay_steps.dtype, np.int32)
+        # an empty `newton:delaySteps` delays by the `NewtonActuatorDelayAPI` fallback, as the schema documents
+        np.testing.assert_array_equal(delay_steps, [0, 3, 1, 1, 1])
+
+    def test_predicate(self):
+        self.define("/Active", ["/Joint"])
+        self.define("/Inactive", ["/Joint"]).SetActive(False)
+        self.assertEqual(read_actuator_arrays(self.stage).prims, (Sdf.Path("/Active"),))
+        self.assertEqual(len(read_actuator_arrays(self.stage, Usd.PrimAllPrimsPredicate)), 2)
+
+    def test_time_samples(self):
+        prim = self.define("/Actuators", ["/Joint"])
+        attr = prim.GetAttribute("newton:kp")
+        attr.Set([1.0], 0.0)
+        attr.Set([3.0], 10.0)
+        np.testing.assert_allclose(read_actuator_arrays(self.stage, time=Usd.TimeCode(5.0)).parameters["kp"], [2.0])
+
+    def test_invalid(self):
+        prim = self.stage.DefinePrim("/Actuators", "NewtonActuatorArray")
+        with self.assertRaisesRegex(ValueError, "must be authored"):
+            read_actuator_arrays(self.stage)
+        prim.GetRelationship("newton:targets").SetTargets(["/Joint0", "/Joint1"])
+        prim.GetAttribute("newton:ki").Set([1.0, 2.0, 3.0])
+        with self.assertRaisesRegex(ValueError, "`newton:ki` has 3 elements but `newton:targets` has 2"):
+            read_actuator_arrays(self.stage)
+
+    def test_schema_limits(self):
+        # each array attribute has the hard limits of the single-actuator attribute it batches
+        array = Usd.SchemaRegistry().FindConcretePrimDefinition("NewtonActuatorArray")
+        for schema in ("NewtonPIDControlAPI", "NewtonMaxEffortClampingAPI", "NewtonActuatorDelayAPI"):
+            definition = Usd.SchemaRegistry().FindAppliedAPIPrimDefinition(schema)
+            for name in definition.GetPropertyNames():
+                if name not in ACTUATOR_ARRAY_ATTRIBUTES.values():
+                    continue
+                with self.subTest(schema=schema, name=name):
+                    self.assertEqual(array.GetPropertyMetadata(name, "limits"), definition.GetPropertyMetadata(name, "limits"))
+
+
+if __name__ == "__main__":
+    unittest.main()
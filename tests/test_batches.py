@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+import numpy as np
+from pxr import Sdf, Usd, UsdGeom, UsdPhysics
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.batches import iter_schema_batches
+from newton_usd_schemas.extraction import extract_layout
+from newton_usd_schemas.parsing import ACTUATOR_SCHEMAS
+
+
+def _stage() -> Usd.Stage:
+    stage = Usd.Stage.CreateInMemory()
+    for robot in ("RobotB", "RobotA"):
+        UsdGeom.Xform.Define(stage, f"/World/{robot}")
+        # joints are authored in reverse name order
+        for index in reversed(range(5)):
+            joint = UsdPhysics.RevoluteJoint.Define(stage, f"/World/{robot}/Joint{index}").GetPrim()
+            if index % 2:
+                joint.ApplyAPI("NewtonJointAPI")
+                joint.GetAttribute("newton:armature").Set(float(index))
+        actuator = stage.DefinePrim(f"/World/{robot}/Actuator", "NewtonActuator")
+        actuator.ApplyAPI("NewtonPDControlAPI")
+        actuator.GetAttribute("newton:kp").Set(10.0)
+        actuator.GetRelationship("newton:targets").SetTargets([f"/World/{robot}/Joint1"])
+    UsdPhysics.RevoluteJoint.Define(stage, "/World/Render/Joint")
+    return stage
+
+
+class TestIterSchemaBatches(unittest.TestCase):
+    def test_batches(self):
+        stage = _stage()
+        groups = {"PhysicsJoint": ("NewtonJointAPI",), "NewtonActuator": ACTUATOR_SCHEMAS}
+        batches = list(iter_schema_batches(stage, groups, batch_size=4))
+        self.assertEqual([(batch.schema, batch.start, len(batch)) for batch in batches[:2]], [("PhysicsJoint", 0, 4), ("PhysicsJoint", 4, 4)])
+        self.assertEqual([(batch.schema, batch.start, len(batch)) for batch in batches[2:]], [("PhysicsJoint", 8, 3), ("NewtonActuator", 0, 2)])
+
+        # rows match the layout of a full traversal
+        layout = extract_layout(stage, list(groups))
+        for schema in groups:
+            self.assertEqual(tuple(path for batch in batches if batch.schema == schema for path in batch.paths), layout.paths[schema])
+
+        joints = batches[0]
+        self.assertEqual(joints.paths[0], Sdf.Path("/World/RobotB/Joint4"))
+        np.testing.assert_array_equal(joints.applied["NewtonJointAPI"], [False, True, False, True])
+        np.testing.assert_array_equal(joints.values["newton:armature"], [0.0, 3.0, 0.0, 1.0])
+        actuators = batches[-1]
+        self.assertTrue(actuators.applied["NewtonActuator"].all())
+        self.assertTrue(actuators.applied["NewtonPDControlAPI"].all())
+        self.assertFalse(actuators.applied["NewtonPIDControlAPI"].any())
+        np.testing.assert_array_equal(actuators.values["newton:kp"], [10.0, 10.0])
+        self.assertEqual(actuators.targets["newton:targets"][1], (Sdf.Path("/World/RobotA/Joint1"),))
+
+    def test_streaming(self):
+        stage = _stage()
+        visited = []
+        batches = iter_schema_batches(stage, ["NewtonJointAPI"], batch_size=2, prune=lambda prim: visited.append(prim.GetPath()))
+        first = next(batches)
+        self.assertEqual(first.paths, (Sdf.Path("/World/RobotB/Joint3"), Sdf.Path("/World/RobotB/Joint1")))
+        self.assertEqual(first.values["newton:armature"].tolist(), [3.0, 1.0])
+        # the first batch is yielded before the traversal reaches the later robot
+        self.assertEqual(visited[-1], Sdf.Path("/World/RobotB/Joint1"))
+        self.assertEqual([len(batch) for batch in batches], [2])
+        self.assertIn(Sdf.Path("/World/RobotA"), visited)
+
+    def test_order_and_prune(self):
+        stage = _stage()
+        batches = iter_schema_batches(stage, ["PhysicsJoint"], order="name", prune=lambda prim: prim.GetName() == "Render")
+        paths = [path for batch in batches for path in batch.paths]
+        self.assertEqual(paths, [Sdf.Path(f"/World/{robot}/Joint{index}") for robot in ("RobotA", "RobotB") for index in range(5)])
+
+        with self.assertRaises(ValueError):
+            next(iter_schema_batches(stage, ["PhysicsJoint"], batch_size=0))
+        with self.assertRaises(ValueError):
+            next(iter_schema_batches(stage, ["PhysicsJoint"], order="random"))
+
+    def test_instance_proxies(self):
+        stage = Usd.Stage.CreateInMemory()
+        stage.CreateClassPrim("/Prototype")
+        stage.DefinePrim("/Prototype/Actuator", "NewtonActuator")
+        for index in range(2):
+            instance = stage.DefinePrim(f"/World/Robot{index}")
+            instance.GetReferences().AddInternalReference("/Prototype")
+            instance.SetInstanceable(True)
+        self.assertEqual(list(iter_schema_batches(stage, ["NewtonActuator"])), [])
+        batches = list(iter_schema_batches(stage, ["NewtonActuator"], predicate=Usd.TraverseInstanceProxies()))
+        self.assertEqual(batches[0].paths, (Sdf.Path("/World/Robot0/Actuator"), Sdf.Path("/World/Robot1/Actuator")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+import numpy as np
+from pxr import Sdf, Usd, UsdPhysics
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.changes import ChangeTracker
+from newton_usd_schemas.extraction import extract_layout
+
+
+class TestChangeTracker(unittest.TestCase):
+    def setUp(self):
+        self.stage: Usd.Stage = Usd.Stage.CreateInMemory()
+        self.scene = UsdPhysics.Scene.Define(self.stage, "/Scene").GetPrim()
+        self.scene.ApplyAPI("NewtonXpbdSceneAPI")
+        self.actuators = []
+        for index in range(3):
+            actuator = self.stage.DefinePrim(f"/Actuator{index}", "NewtonActuator")
+            actuator.ApplyAPI("NewtonPDControlAPI")
+            self.actuators.append(actuator)
+        # an actuator with a different control law is not extracted for NewtonPDControlAPI
+        self.stage.DefinePrim("/Unextracted", "NewtonActuator").ApplyAPI("NewtonPIDControlAPI")
+        self.layout = extract_layout(self.stage, ["NewtonXpbdSceneAPI", "NewtonActuator", "NewtonPDControlAPI"])
+        self.tracker = ChangeTracker(self.stage, self.layout)
+
+    def tearDown(self):
+        self.tracker.close()
+
+    def test_layout(self):
+        self.assertEqual(self.layout.schemas, ("NewtonXpbdSceneAPI", "NewtonActuator", "NewtonPDControlAPI"))
+        self.assertEqual(
+            self.layout.paths["NewtonActuator"], tuple(Sdf.Path(f"/{name}") for name in ("Actuator0", "Actuator1", "Actuator2", "Unextracted"))
+        )
+        self.assertEqual(self.layout.row("NewtonPDControlAPI", Sdf.Path("/Actuator2")), 2)
+        self.assertEqual(self.layout.row("NewtonPDControlAPI", Sdf.Path("/Unextracted")), -1)
+        self.assertEqual(self.layout.row("NewtonJointAPI", Sdf.Path("/Actuator2")), -1)
+        self.assertEqual(self.layout.schemas_of(Sdf.Path("/Actuator1")), ["NewtonActuator", "NewtonPDControlAPI"])
+
+    def test_value_deltas(self):
+        self.assertFalse(self.tracker.pending)
+        # the first opinion on a schema attribute resyncs the property
+        self.actuators[2].GetAttribute("newton:kp").Set(10.0)
+        self.actuators[0].GetAttribute("newton:kp").Set(20.0)
+        self.actuators[0].GetAttribute("newton:kd").Set(1.0)
+        # later edits are info-only, and only the latest value is reported
+        self.actuators[0].GetAttribute("newton:kp").Set(30.0)
+        self.scene.GetAttribute("newton:xpbd:jointLinearRelaxation").Set(0.5)
+        # attributes of other schemas, or prims without a row, are ignored
+        self.actuators[1].CreateAttribute("custom:gain", Sdf.ValueTypeNames.Float).Set(1.0)
+        self.stage.GetPrimAtPath("/Unextracted").GetAttribute("newton:kp").Set(5.0)
+        self.assertTrue(self.tracker.pending)
+
+        batch = self.tracker.flush()
+        self.assertFalse(batch.requires_resync)
+        self.assertEqual(
+            [(delta.schema, delta.attribute) for delta in batch.deltas],
+            [
+                ("NewtonXpbdSceneAPI", "newton:xpbd:jointLinearRelaxation"),
+                ("NewtonPDControlAPI", "newton:kd"),
+                ("NewtonPDControlAPI", "newton:kp"),
+            ],
+        )
+        relaxation, kd, kp = batch.deltas
+        np.testing.assert_array_equal(relaxation.rows, [0])
+        np.testing.assert_allclose(relaxation.values, [0.5])
+        np.testing.assert_array_equal(kd.rows, [0])
+        np.testing.assert_array_equal(kp.rows, [0, 2])
+        np.testing.assert_allclose(kp.values, [30.0, 10.0])
+
+        self.assertFalse(self.tracker.pending)
+        self.assertEqual(self.tracker.flush().deltas, ())
+
+    def test_batched_change_block(self):
+        with Sdf.ChangeBlock():
+            for index, actuator in enumerate(self.actuators):
+                actuator.GetAttribute("newton:kp").Set(float(index))
+        (delta,) = self.tracker.flush().deltas
+        np.testing.assert_array_equal(delta.rows, [0, 1, 2])
+        np.testing.assert_allclose(delta.values, [0.0, 1.0, 2.0])
+
+    def test_removed_opinion(self):
+        attr = self.actuators[1].GetAttribute("newton:kp")
+        attr.Set(4.0)
+        self.tracker.flush()
+        attr.Clear()
+        (delta,) = self.tracker.flush().deltas
+        # the value falls back to the schema default
+        np.testing.assert_allclose(delta.values, [0.0])
+
+    def test_resyncs(self):
+        self.actuators[0].GetAttribute("newton:kp").Set(1.0)
+        self.actuators[1].GetAttribute("newton:kp").Set(1.0)
+        self.stage.RemovePrim("/Actuator1")
+        self.stage.DefinePrim("/Actuator3", "NewtonActuator")
+        self.actuators[2].GetRelationship("newton:targets").SetTargets(["/Joint"])
+
+        batch = self.tracker.flush()
+        self.assertTrue(batch.requires_resync)
+        self.assertEqual(batch.resynced_paths, (Sdf.Path("/Actuator1"), Sdf.Path("/Actuator2"), Sdf.Path("/Actuator3")))
+        # deltas below resynced paths are dropped
+        (delta,) = batch.deltas
+        np.testing.assert_array_equal(delta.rows, [0])
+
+    def test_close(self):
+        with ChangeTracker(self.stage, self.layout) as tracker:
+            self.actuators[0].GetAttribute("newton:kp").Set(1.0)
+        self.actuators[1].GetAttribute("newton:kp").Set(1.0)
+        (delta,) = tracker.flush().deltas
+        np.testing.assert_array_equal(delta.rows, [0])
+
+    def test_array_values(self):
+        stage = Usd.Stage.CreateInMemory()
+        first = UsdPhysics.RevoluteJoint.Define(stage, "/First").GetPrim()
+        second = UsdPhysics.RevoluteJoint.Define(stage, "/Second").GetPrim()
+        for joint in (first, second):
+            joint.ApplyAPI("NewtonMassAPI")
+        layout = extract_layout(stage, ["NewtonMassAPI"])
+        with ChangeTracker(stage, layout) as tracker:
+            first.GetAttribute("newton:inertia").Set([1.0, 1.0, 1.0, 0.0, 0.0, 0.0])
+            second.GetAttribute("newton:inertia").Set([2.0, 2.0, 2.0, 0.0, 0.0, 0.0])
+            (delta,) = tracker.flush().deltas
+            self.assertEqual(delta.values.shape, (2, 6))
+            second.GetAttribute("newton:inertia").Set([])
+            first.GetAttribute("newton:inertia").Set([3.0, 3.0, 3.0, 0.0, 0.0, 0.0])
+            (delta,) = tracker.flush().deltas
+            self.assertEqual(delta.values.dtype, object)
+            self.assertEqual(len(delta.values[1]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,235 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+import pickle
+import unittest
+
+import numpy as np
+from pxr import Sdf, Usd, UsdGeom, UsdPhysics, UsdShade
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.description import SCENE_SECTIONS, NewtonSceneDescription, SceneSection
+
+
+def _robot(stage: Usd.Stage, root: str, links: int, material: UsdShade.Material) -> None:
+    UsdPhysics.ArticulationRootAPI.Apply(UsdGeom.Xform.Define(stage, root).GetPrim())
+    for index in range(links):
+        body = UsdGeom.Xform.Define(stage, f"{root}/Body{index}").GetPrim()
+        UsdPhysics.RigidBodyAPI.Apply(body)
+        body.ApplyAPI("NewtonMassAPI")
+        body.GetAttribute("physics:mass").Set(1.0 + index)
+        collider = UsdGeom.Cube.Define(stage, f"{root}/Body{index}/Collider").GetPrim()
+        UsdPhysics.CollisionAPI.Apply(collider)
+        UsdShade.MaterialBindingAPI.Apply(collider).Bind(material, UsdShade.Tokens.weakerThanDescendants, "physics")
+        joint = UsdPhysics.RevoluteJoint.Define(stage, f"{root}/Joint{index}")
+        joint.CreateBody1Rel().SetTargets([f"{root}/Body{index}"])
+        if index:
+            joint.CreateBody0Rel().SetTargets([f"{root}/Body{index - 1}"])
+            joint.GetPrim().ApplyAPI("NewtonJointAPI")
+            joint.GetPrim().GetAttribute("newton:armature").Set(0.5 * index)
+    UsdGeom.Sphere.Define(stage, f"{root}/Body{links - 1}/Tip").GetPrim().ApplyAPI("NewtonSiteAPI")
+    mimic = stage.GetPrimAtPath(f"{root}/Joint{links - 1}")
+    mimic.ApplyAPI("NewtonMimicAPI")
+    mimic.GetRelationship("newton:mimicJoint").SetTargets([f"{root}/Joint1"])
+    mimic.GetAttribute("newton:mimicCoef1").Set(-1.0)
+    actuator = stage.DefinePrim(f"{root}/Actuator", "NewtonActuator")
+    actuator.GetRelationship("newton:targets").SetTargets([f"{root}/Joint1", f"{root}/Joint2"])
+    actuator.ApplyAPI("NewtonPDControlAPI")
+    actuator.GetAttribute("newton:kp").Set(100.0)
+    actuators = stage.DefinePrim(f"{root}/Actuators", "NewtonActuatorArray")
+    actuators.GetRelationship("newton:targets").SetTargets([f"{root}/Joint{index}" for index in range(links)])
+    actuators.GetAttribute("newton:kd").Set([float(index) for index in range(links)])
+
+
+def _stage() -> Usd.Stage:
+    stage = Usd.Stage.CreateInMemory()
+    scene = UsdPhysics.Scene.Define(stage, "/World/PhysicsScene").GetPrim()
+    scene.ApplyAPI("NewtonSceneAPI")
+    scene.ApplyAPI("NewtonMPMSceneAPI")
+    scene.GetAttribute("newton:mpm:gridType").Set("dense")
+    material = UsdShade.Material.Define(stage, "/World/Steel")
+    UsdPhysics.MaterialAPI.Apply(material.GetPrim())
+    material.GetPrim().ApplyAPI("NewtonMaterialAPI")
+    material.GetPrim().ApplyAPI("NewtonMPMMaterialAPI")
+    material.GetPrim().GetAttribute("newton:mpm:youngsModulus").Set(2.0e11)
+    _robot(stage, "/World/RobotA", 4, material)
+    _robot(stage, "/World/RobotB", 3, material)
+    sand = UsdGeom.Points.Define(stage, "/World/Sand").GetPrim()
+    sand.ApplyAPI("NewtonPointsDeformableSimAPI")
+    sand.GetAttribute("physics:masses").Set([0.1, 0.2, 0.3])
+    sand.GetRelationship("newton:mpm:materials").SetTargets([material.GetPath()])
+    UsdGeom.Points.Define(stage, "/World/Dust").GetPrim().ApplyAPI("NewtonPointsDeformableSimAPI")
+    return stage
+
+
+class TestNewtonSceneDescription(unittest.TestCase):
+    def test_sections(self):
+        stage = _stage()
+        description = NewtonSceneDescription(stage)
+        self.assertEqual(description.loaded, ())
+
+        joints = description.joints
+        self.assertEqual(description.loaded, ("joints",))
+        self.assertEqual(len(joints), 7)
+        self.assertTrue((joints.values["type"] == "RevoluteJoint").all())
+        self.assertEqual(joints.values["newton:armature"].dtype, np.float32)
+        row = joints.paths.index(Sdf.Path("/World/RobotA/Joint2"))
+        self.assertEqual(joints.values["newton:armature"][row], 1.0)
+        offsets, data = joints.arrays["newton:dof:armature"]
+        self.assertEqual((offsets[-1], data.dtype), (0, np.float32))
+
+        bodies = description.bodies
+        body0 = joints.first("physics:body0")
+        body1 = joints.first("physics:body1")
+        self.assertEqual(bodies.paths[body0[row]], Sdf.Path("/World/RobotA/Body1"))
+        self.assertEqual(bodies.paths[body1[row]], Sdf.Path("/World/RobotA/Body2"))
+        self.assertEqual(body0[joints.paths.index(Sdf.Path("/World/RobotA/Joint0"))], -1)
+        self.assertEqual(bodies.values["physics:mass"][body1[row]], 3.0)
+        self.assertEqual(bodies.values["physics:principalAxes"].shape, (7, 4))
+        np.testing.assert_array_equal(bodies.first("physics:simulationOwner"), -1)
+
+        colliders = description.colliders
+        self.assertTrue((colliders.values["type"] == "CubeShape").all())
+        self.assertEqual([bodies.paths[body] for body in colliders.first("body")], [path.GetParentPath() for path in colliders.paths])
+        np.testing.assert_array_equal(colliders.first("material:binding:physics"), 0)
+
+        materials = description.materials
+        self.assertEqual(materials.paths, (Sdf.Path("/World/Steel"),))
+        self.assertEqual(materials.values["newton:mpm:youngsModulus"][0], 2.0e11)
+
+        scenes = description.scenes
+        self.assertTrue(scenes.applied["NewtonMPMSceneAPI"][0])
+        self.assertFalse(scenes.applied["NewtonXpbdSceneAPI"][0])
+        self.assertEqual(scenes.values["newton:mpm:gridType"][0], "dense")
+        offsets, solvers = scenes.arrays["newton:mpm:rheologySolvers"]
+        self.assertEqual(solvers.dtype.kind, "U")
+
+        articulations = description.articulations
+        self.assertEqual(len(articulations), 2)
+        offsets, indices = articulations.targets["joints"]
+        self.assertEqual(
+            sorted(joints.paths[index] for index in indices[offsets[1] : offsets[2]]), [Sdf.Path(f"/World/RobotB/Joint{index}") for index in range(3)]
+        )
+
+        mimic = description.mimic
+        self.assertEqual(
+            [joints.paths[joint] for joint in mimic.first("joint")], [Sdf.Path("/World/RobotA/Joint3"), Sdf.Path("/World/RobotB/Joint2")]
+        )
+        self.assertEqual(
+            [joints.paths[joint] for joint in mimic.first("newton:mimicJoint")], [Sdf.Path("/World/RobotA/Joint1"), Sdf.Path("/World/RobotB/Joint1")]
+        )
+        np.testing.assert_array_equal(mimic.values["newton:mimicCoef1"], -1.0)
+
+        actuators = description.actuators
+        offsets, indices = actuators.targets["newton:targets"]
+        np.testing.assert_array_equal(offsets, [0, 2, 4])
+        self.assertEqual(joints.paths[indices[3]], Sdf.Path("/World/RobotB/Joint2"))
+        self.assertTrue(actuators.applied["NewtonPDControlAPI"].all())
+        np.testing.assert_array_equal(actuators.values["newton:kp"], 100.0)
+        self.assertEqual(actuators.values["newton:modelPath"].tolist(), ["", ""])
+
+        actuator_arrays = description.actuator_arrays
+        self.assertEqual(actuator_arrays.paths, (Sdf.Path("/World/RobotA/Actuators"), Sdf.Path("/World/RobotB/Actuators")))
+        offsets, kd = actuator_arrays.arrays["newton:kd"]
+        np.testing.assert_array_equal(offsets, [0, 4, 7])
+        self.assertEqual(kd.dtype, np.float32)
+        np.testing.assert_array_equal(kd, [0.0, 1.0, 2.0, 3.0, 0.0, 1.0, 2.0])
+        self.assertEqual(actuator_arrays.arrays["newton:kp"][1].shape, (0,))
+        offsets, indices = actuator_arrays.targets["newton:targets"]
+        self.assertEqual(
+            [joints.paths[index] for index in indices[offsets[1] : offsets[2]]], [Sdf.Path(f"/World/RobotB/Joint{index}") for index in range(3)]
+        )
+
+        sites = description.sites
+        self.assertEqual(sites.paths, (Sdf.Path("/World/RobotA/Body3/Tip"), Sdf.Path("/World/RobotB/Body2/Tip")))
+        self.assertEqual([bodies.paths[body] for body in sites.first("body")], [path.GetParentPath() for path in sites.paths])
+
+        deformables = description.deformables
+        self.assertEqual(deformables.paths, (Sdf.Path("/World/Sand"), Sdf.Path("/World/Dust")))
+        offsets, masses = deformables.arrays["physics:masses"]
+        np.testing.assert_array_equal(offsets, [0, 3, 3])
+        np.testing.assert_allclose(masses, [0.1, 0.2, 0.3])
+        np.testing.assert_array_equal(deformables.first("newton:mpm:materials"), [0, -1])
+
+        self.assertEqual(description.loaded, SCENE_SECTIONS)
+        with self.assertRaises(KeyError):
+            description.section("cameras")
+
+    def test_traversal_order(self):
+        stage = Usd.Stage.CreateInMemory()
+        kinds = (UsdPhysics.RevoluteJoint, UsdPhysics.PrismaticJoint, UsdPhysics.RevoluteJoint, UsdPhysics.FixedJoint, UsdPhysics.PrismaticJoint)
+        for index, kind in enumerate(kinds):
+            body = UsdGeom.Xform.Define(stage, f"/World/Body{index}").GetPrim()
+            UsdPhysics.RigidBodyAPI.Apply(body)
+            shape = (UsdGeom.Cube, UsdGeom.Sphere)[index % 2].Define(stage, f"/World/Body{index}/Collider").GetPrim()
+            UsdPhysics.CollisionAPI.Apply(shape)
+            kind.Define(stage, f"/World/Joint{index}").CreateBody1Rel().SetTargets([body.GetPath()])
+        mimic = stage.GetPrimAtPath("/World/Joint4")
+        mimic.ApplyAPI("NewtonMimicAPI")
+        mimic.GetRelationship("newton:mimicJoint").SetTargets(["/World/Joint1"])
+        stage.GetPrimAtPath("/World/Joint2").ApplyAPI("NewtonMimicAPI")
+
+        description = NewtonSceneDescription(stage)
+        joints = description.joints
+        # the rows of joints of different types are in traversal order, rather than grouped by type
+        self.assertEqual(joints.paths, tuple(Sdf.Path(f"/World/Joint{index}") for index in range(5)))
+        self.assertEqual(joints.values["type"].tolist(), ["RevoluteJoint", "PrismaticJoint", "RevoluteJoint", "FixedJoint", "PrismaticJoint"])
+        np.testing.assert_array_equal(joints.first("physics:body1"), range(5))
+        colliders = description.colliders
+        self.assertEqual(colliders.paths, tuple(Sdf.Path(f"/World/Body{index}/Collider") for index in range(5)))
+        self.assertEqual(colliders.values["type"].tolist(), ["CubeShape", "SphereShape"] * 2 + ["CubeShape"])
+        np.testing.assert_array_equal(colliders.first("body"), range(5))
+        mimic = description.mimic
+        self.assertEqual(mimic.paths, (Sdf.Path("/World/Joint2"), Sdf.Path("/World/Joint4")))
+        np.testing.assert_array_equal(mimic.first("joint"), [2, 4])
+        np.testing.assert_array_equal(mimic.first("newton:mimicJoint"), [-1, 1])
+
+    def test_empty(self):
+        description = NewtonSceneDescription(Usd.Stage.CreateInMemory())
+        for name in SCENE_SECTIONS:
+            section = description.section(name)
+            self.assertEqual(len(section), 0)
+            self.assertEqual(section.paths, ())
+        self.assertEqual(description.bodies.values["physics:centerOfMass"].shape, (0, 3))
+        self.assertEqual(description.joints.first("physics:body0").shape, (0,))
+
+    def test_exclude_paths(self):
+        description = NewtonSceneDescription(_stage(), ["/World"], ["/World/RobotB"])
+        self.assertEqual(len(description.joints), 4)
+        self.assertEqual(len(description.sites), 1)
+        np.testing.assert_array_equal(description.actuators.targets["newton:targets"][1], [1, 2])
+
+    def test_pickle(self):
+        stage = _stage()
+        description = NewtonSceneDescription(stage)
+        description.joints
+        buffers = []
+        data = pickle.dumps(description, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(description.loaded, SCENE_SECTIONS)
+        self.assertGreater(len(buffers), 0)
+
+        restored = pickle.loads(data, buffers=buffers)
+        self.assertEqual(restored.loaded, ())
+        self.assertIsInstance(restored.joints, SceneSection)
+        self.assertEqual(restored.loaded, ("joints",))
+        # the arrays were passed out-of-band, so they share the memory of the original arrays
+        self.assertTrue(np.shares_memory(restored.joints.values["newton:armature"], description.joints.values["newton:armature"]))
+        for name in SCENE_SECTIONS:
+            original, copy = description.section(name), restored.section(name)
+            self.assertEqual(copy.paths, original.paths)
+            for column in ("applied", "values"):
+                self.assertEqual(getattr(copy, column).keys(), getattr(original, column).keys())
+                for key, values in getattr(original, column).items():
+                    np.testing.assert_array_equal(getattr(copy, column)[key], values)
+            for column in ("arrays", "targets"):
+                for key, (offsets, values) in getattr(original, column).items():
+                    np.testing.assert_array_equal(getattr(copy, column)[key][0], offsets)
+                    np.testing.assert_array_equal(getattr(copy, column)[key][1], values)
+
+        # older protocols pickle the arrays in-band
+        copy = pickle.loads(pickle.dumps(description, protocol=4))
+        np.testing.assert_array_equal(copy.joints.first("physics:body1"), description.joints.first("physics:body1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+import pathlib
+import tempfile
+import unittest
+
+import numpy as np
+from pxr import Sdf, Usd, UsdPhysics
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.flat import is_composition_free, read_asset_values, read_layer_values, read_stage_values
+
+ATTRIBUTES = {
+    "NewtonJointAPI": ["newton:armature", "newton:velocityLimit", "newton:dof:damping"],
+    "PhysicsJoint": ["physics:jointEnabled"],
+    "NewtonActuatorArray": ["newton:kp"],
+    "PhysicsDeformableBodyAPI": [],
+}
+
+
+def _flat_stage() -> Usd.Stage:
+    stage = Usd.Stage.CreateInMemory()
+    stage.SetDefaultPrim(stage.DefinePrim("/World", "Xform"))
+    for index in range(3):
+        joint = UsdPhysics.RevoluteJoint.Define(stage, f"/World/Joint{index}").GetPrim()
+        joint.ApplyAPI("NewtonJointAPI")
+        if index != 1:
+            joint.GetAttribute("newton:armature").Set(0.5 * index)
+    stage.GetPrimAtPath("/World/Joint2").GetAttribute("newton:velocityLimit").Block()
+    stage.GetPrimAtPath("/World/Joint0").CreateAttribute("newton:dof:damping", Sdf.ValueTypeNames.FloatArray).Set([1.0])
+    UsdPhysics.FixedJoint.Define(stage, "/World/Fixed").GetPrim().GetAttribute("physics:jointEnabled").Set(False)
+    actuators = stage.DefinePrim("/World/Actuators", "NewtonActuatorArray")
+    actuators.GetAttribute("newton:kp").Set([1.0, 2.0])
+    body = stage.DefinePrim("/World/Body", "Mesh")
+    body.SetMetadata("apiSchemas", Sdf.TokenListOp.Create(prependedItems=["PhysicsDeformableBodyAPI"]))
+    # pruned by the default predicate
+    stage.OverridePrim("/World/Over").ApplyAPI("NewtonJointAPI")
+    under_over = Sdf.CreatePrimInLayer(stage.GetRootLayer(), "/World/Over/Joint")
+    under_over.specifier = Sdf.SpecifierDef
+    under_over.typeName = "PhysicsRevoluteJoint"
+    under_over.SetInfo("apiSchemas", Sdf.TokenListOp.Create(prependedItems=["NewtonJointAPI"]))
+    stage.CreateClassPrim("/Class").ApplyAPI("NewtonJointAPI")
+    inactive = UsdPhysics.RevoluteJoint.Define(stage, "/World/Inactive").GetPrim()
+    inactive.ApplyAPI("NewtonJointAPI")
+    inactive.SetActive(False)
+    return stage
+
+
+def _assert_values_equal(test: unittest.TestCase, actual: np.ndarray, expected: np.ndarray) -> None:
+    test.assertEqual(actual.shape, expected.shape)
+    for actual_value, expected_value in zip(actual.tolist(), expected.tolist(), strict=True):
+        if hasattr(expected_value, "__len__"):
+            test.assertEqual(list(actual_value), list(expected_value))
+        else:
+            test.assertEqual(actual_value, expected_value)
+
+
+class TestFlatReader(unittest.TestCase):
+    def test_matches_stage(self):
+        stage = _flat_stage()
+        flat = read_layer_values(stage.GetRootLayer(), ATTRIBUTES)
+        composed = read_stage_values(stage, ATTRIBUTES)
+        self.assertFalse(flat.composed)
+        self.assertTrue(composed.composed)
+        self.assertEqual(flat.layout.paths, composed.layout.paths)
+        for schema, names in ATTRIBUTES.items():
+            for name in names:
+                _assert_values_equal(self, flat.values[schema][name], composed.values[schema][name])
+
+    def test_values(self):
+        stage = _flat_stage()
+        values = read_layer_values(stage.GetRootLayer(), ATTRIBUTES)
+        self.assertEqual(values.layout.paths["NewtonJointAPI"], tuple(Sdf.Path(f"/World/Joint{index}") for index in range(3)))
+        self.assertEqual(values.layout.paths["PhysicsJoint"], (*values.layout.paths["NewtonJointAPI"], Sdf.Path("/World/Fixed")))
+        self.assertEqual(values.layout.paths["PhysicsDeformableBodyAPI"], (Sdf.Path("/World/Body"),))
+        # authored values and fallbacks
+        np.testing.assert_allclose(values.values["NewtonJointAPI"]["newton:armature"], [0.0, 0.0, 1.0])
+        # a blocked value has no fallback
+        velocity_limit = values.values["NewtonJointAPI"]["newton:velocityLimit"]
+        self.assertIsNone(velocity_limit[2])
+        self.assertEqual(list(values.values["NewtonJointAPI"]["newton:dof:damping"][0]), [1.0])
+        np.testing.assert_array_equal(values.values["PhysicsJoint"]["physics:jointEnabled"], [True, True, True, False])
+        self.assertEqual(list(values.values["NewtonActuatorArray"]["newton:kp"][0]), [1.0, 2.0])
+
+    def test_composition_free(self):
+        stage = _flat_stage()
+        self.assertTrue(is_composition_free(stage.GetRootLayer()))
+
+        referencing = Usd.Stage.CreateInMemory()
+        referencing.DefinePrim("/World/Robot").GetReferences().AddReference(stage.GetRootLayer().identifier)
+        self.assertFalse(is_composition_free(referencing.GetRootLayer()))
+        with self.assertRaises(ValueError):
+            read_layer_values(referencing.GetRootLayer(), ATTRIBUTES)
+
+        sublayered = Usd.Stage.CreateInMemory()
+        sublayered.GetRootLayer().subLayerPaths.append(stage.GetRootLayer().identifier)
+        self.assertFalse(is_composition_free(sublayered.GetRootLayer()))
+
+        variants = Usd.Stage.CreateInMemory()
+        variants.DefinePrim("/World/Robot").GetVariantSets().AddVariantSet("model").AddVariant("a")
+        self.assertFalse(is_composition_free(variants.GetRootLayer()))
+
+        ordered = Usd.Stage.CreateInMemory()
+        ordered.DefinePrim("/World/B")
+        ordered.DefinePrim("/World/A")
+        ordered.GetPrimAtPath("/World").SetMetadata("primOrder", ["A", "B"])
+        self.assertFalse(is_composition_free(ordered.GetRootLayer()))
+
+    def test_read_asset_values(self):
+        with tempfile.TemporaryDirectory() as directory:
+            robot = pathlib.Path(directory, "robot.usdc").as_posix()
+            flat_stage = _flat_stage()
+            flat_stage.GetRootLayer().Export(robot)
+            scene = pathlib.Path(directory, "scene.usda").as_posix()
+            stage = Usd.Stage.CreateNew(scene)
+            stage.DefinePrim("/Robot").GetReferences().AddReference(robot, "/World")
+            stage.Save()
+
+            flat = read_asset_values(robot, ATTRIBUTES)
+            self.assertFalse(flat.composed)
+            self.assertEqual(len(flat.layout.paths["NewtonJointAPI"]), 3)
+
+            composed = read_asset_values(scene, ATTRIBUTES)
+            self.assertTrue(composed.composed)
+            self.assertEqual(composed.layout.paths["NewtonJointAPI"], tuple(Sdf.Path(f"/Robot/Joint{index}") for index in range(3)))
+            np.testing.assert_allclose(composed.values["NewtonJointAPI"]["newton:armature"], [0.0, 0.0, 1.0])
+
+        with self.assertRaises(ValueError):
+            read_asset_values(pathlib.Path(directory, "missing.usda").as_posix(), ATTRIBUTES)
+
+
+if __name__ == "__main__":
+    unittest.main()
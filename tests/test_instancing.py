@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+import numpy as np
+from pxr import Sdf, Usd, UsdPhysics
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.extraction import extract_layout
+from newton_usd_schemas.instancing import extract_instanced_layout, read_prototype_values
+
+
+def _robot(joints: int, armature: float) -> Usd.Stage:
+    stage = Usd.Stage.CreateInMemory()
+    stage.SetDefaultPrim(stage.DefinePrim("/Robot", "Xform"))
+    for index in range(joints):
+        joint = UsdPhysics.RevoluteJoint.Define(stage, f"/Robot/Joint{index}").GetPrim()
+        joint.ApplyAPI("NewtonJointAPI")
+        joint.GetAttribute("newton:armature").Set(armature + index)
+    return stage
+
+
+class TestInstancedLayout(unittest.TestCase):
+    def setUp(self):
+        # keep the referenced stages alive, so their anonymous layers stay in the registry
+        self.robots = [_robot(2, 1.0), _robot(3, 10.0)]
+        self.stage: Usd.Stage = Usd.Stage.CreateInMemory()
+        for index, robot in enumerate((0, 1, 0, 0)):
+            prim = self.stage.DefinePrim(f"/World/Robot{index}", "Xform")
+            prim.GetReferences().AddReference(self.robots[robot].GetRootLayer().identifier)
+            prim.SetInstanceable(True)
+        # an uninstanced clone is extracted as usual
+        self.stage.DefinePrim("/World/Unique").GetReferences().AddReference(self.robots[0].GetRootLayer().identifier)
+        joint = UsdPhysics.RevoluteJoint.Define(self.stage, "/World/Joint").GetPrim()
+        joint.ApplyAPI("NewtonJointAPI")
+        self.layout = extract_instanced_layout(self.stage, ["NewtonJointAPI", "Xform"])
+
+    def test_layout(self):
+        layout = self.layout
+        self.assertEqual(layout.instances, tuple(Sdf.Path(f"/World/Robot{index}") for index in range(4)))
+        self.assertEqual(len(layout.prototypes), 2)
+        np.testing.assert_array_equal(layout.instance_prototypes, [0, 1, 0, 0])
+        self.assertEqual(
+            layout.layout.paths["NewtonJointAPI"], (Sdf.Path("/World/Unique/Joint0"), Sdf.Path("/World/Unique/Joint1"), Sdf.Path("/World/Joint"))
+        )
+        # the instance prims themselves are not shared
+        self.assertEqual(layout.layout.paths["Xform"], (*layout.instances, Sdf.Path("/World/Unique")))
+        # each prototype is extracted once
+        self.assertEqual(len(layout.prototype_layout.paths["NewtonJointAPI"]), 5)
+        np.testing.assert_array_equal(layout.prototype_offsets["NewtonJointAPI"], [0, 2, 5])
+        np.testing.assert_array_equal(layout.prototype_offsets["Xform"], [0, 0, 0])
+
+    def test_instance_rows(self):
+        rows, instances = self.layout.instance_rows("NewtonJointAPI")
+        np.testing.assert_array_equal(rows, [0, 1, 2, 3, 4, 0, 1, 0, 1])
+        np.testing.assert_array_equal(instances, [0, 0, 1, 1, 1, 2, 2, 3, 3])
+        rows, instances = self.layout.instance_rows("Xform")
+        self.assertEqual(rows.shape, (0,))
+        self.assertEqual(instances.shape, (0,))
+
+    def test_instance_proxy_paths(self):
+        paths = list(self.layout.instance_proxy_paths("NewtonJointAPI"))
+        self.assertEqual(paths[:3], [Sdf.Path("/World/Robot0/Joint0"), Sdf.Path("/World/Robot0/Joint1"), Sdf.Path("/World/Robot1/Joint0")])
+        self.assertEqual(paths[-1], Sdf.Path("/World/Robot3/Joint1"))
+        # expanding the prototypes matches a traversal of every instance proxy
+        expanded = extract_layout(self.stage, ["NewtonJointAPI"], Usd.TraverseInstanceProxies(Usd.PrimDefaultPredicate))
+        instanced = [path for path in expanded.paths["NewtonJointAPI"] if self.stage.GetPrimAtPath(path).IsInstanceProxy()]
+        self.assertEqual(paths, instanced)
+
+    def test_prototype_values(self):
+        armature = read_prototype_values(self.stage, self.layout, "NewtonJointAPI", "newton:armature")
+        np.testing.assert_allclose(armature, [1.0, 2.0, 10.0, 11.0, 12.0])
+        rows, _ = self.layout.instance_rows("NewtonJointAPI")
+        np.testing.assert_allclose(armature[rows], [1.0, 2.0, 10.0, 11.0, 12.0, 1.0, 2.0, 1.0, 2.0])
+
+    def test_nested_instances(self):
+        stage = Usd.Stage.CreateInMemory()
+        stage.SetDefaultPrim(stage.DefinePrim("/Team", "Xform"))
+        for index in range(2):
+            member = stage.DefinePrim(f"/Team/Robot{index}", "Xform")
+            member.GetReferences().AddReference(self.robots[0].GetRootLayer().identifier)
+            member.SetInstanceable(True)
+        self.robots.append(stage)
+        for index in range(3):
+            team = self.stage.DefinePrim(f"/Teams/Team{index}", "Xform")
+            team.GetReferences().AddReference(stage.GetRootLayer().identifier)
+            team.SetInstanceable(True)
+
+        layout = extract_instanced_layout(self.stage, ["NewtonJointAPI"])
+        # the robots nested in a team are rows of the team prototype
+        team = layout.instance_prototypes[-1]
+        offsets = layout.prototype_offsets["NewtonJointAPI"]
+        self.assertEqual(offsets[team + 1] - offsets[team], 4)
+        rows, _ = layout.instance_rows("NewtonJointAPI")
+        self.assertEqual(rows.shape, (9 + 3 * 4,))
+        self.assertIn(Sdf.Path("/Teams/Team2/Robot1/Joint1"), list(layout.instance_proxy_paths("NewtonJointAPI")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,7 @@
 import math
 import unittest
 
-from pxr import Plug, Usd, UsdPhysics
+from pxr import Plug, Sdf, Usd, UsdPhysics
 
 import newton_usd_schemas  # noqa: F401
 
@@ -152,6 +152,22 @@ class TestNewtonJointAPI(unittest.TestCase):
         self.assertTrue(attr.HasAuthoredValue())
         self.assertAlmostEqual(attr.Get(), 0.1745)
 
+    def test_dof_arrays(self):
+        spherical = UsdPhysics.SphericalJoint.Define(self.stage, "/Spherical").GetPrim()
+        spherical.ApplyAPI("NewtonJointAPI")
+        for name in ("armature", "damping", "friction", "velocityLimit", "limitStiffness", "limitDamping"):
+            attr = spherical.GetAttribute(f"newton:dof:{name}")
+            self.assertTrue(attr, name)
+            self.assertEqual(attr.GetTypeName(), Sdf.ValueTypeNames.FloatArray, name)
+            self.assertFalse(attr.HasAuthoredValue(), name)
+            self.assertEqual(attr.Get(), [], name)
+
+        attr = spherical.GetAttribute("newton:dof:damping")
+        self.assertTrue(attr.Set([1.0, 2.0, 3.0]))
+        self.assertEqual(list(attr.Get()), [1.0, 2.0, 3.0])
+        # the scalar is unaffected, and only applies where no array is authored
+        self.assertEqual(spherical.GetAttribute("newton:damping").Get(), 0.0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+import math
+import unittest
+
+import numpy as np
+from pxr import Sdf, Usd, UsdPhysics
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.joints import JOINT_DOF_ATTRIBUTES, joint_dof_axes, read_joint_dofs
+
+
+class TestJointDofAxes(unittest.TestCase):
+    def setUp(self):
+        self.stage: Usd.Stage = Usd.Stage.CreateInMemory()
+
+    def test_single_dof(self):
+        revolute = UsdPhysics.RevoluteJoint.Define(self.stage, "/Revolute")
+        revolute.CreateAxisAttr("Z")
+        prismatic = UsdPhysics.PrismaticJoint.Define(self.stage, "/Prismatic")
+        self.assertEqual(joint_dof_axes(revolute.GetPrim()), ("rotZ",))
+        self.assertEqual(joint_dof_axes(prismatic.GetPrim()), ("transX",))
+
+    def test_spherical_and_fixed(self):
+        self.assertEqual(joint_dof_axes(UsdPhysics.SphericalJoint.Define(self.stage, "/Spherical").GetPrim()), ("rotX", "rotY", "rotZ"))
+        self.assertEqual(joint_dof_axes(UsdPhysics.FixedJoint.Define(self.stage, "/Fixed").GetPrim()), ())
+
+    def test_d6(self):
+        d6 = UsdPhysics.Joint.Define(self.stage, "/D6").GetPrim()
+        self.assertEqual(joint_dof_axes(d6), ("transX", "transY", "transZ", "rotX", "rotY", "rotZ"))
+        for axis in ("transX", "transY", "transZ", "rotY"):
+            limit = UsdPhysics.LimitAPI.Apply(d6, axis)
+            limit.CreateLowAttr(1.0)
+            limit.CreateHighAttr(-1.0)
+        # a limited axis which is not locked is still a DOF
+        limit = UsdPhysics.LimitAPI.Apply(d6, "rotZ")
+        limit.CreateLowAttr(-45.0)
+        limit.CreateHighAttr(45.0)
+        self.assertEqual(joint_dof_axes(d6), ("rotX", "rotZ"))
+
+
+class TestReadJointDofs(unittest.TestCase):
+    def setUp(self):
+        self.stage: Usd.Stage = Usd.Stage.CreateInMemory()
+
+    def test_empty_stage(self):
+        dofs = read_joint_dofs(self.stage)
+        self.assertEqual(len(dofs), 0)
+        np.testing.assert_array_equal(dofs.offsets, [0])
+        self.assertEqual(set(dofs.parameters), set(JOINT_DOF_ATTRIBUTES))
+
+    def test_scalars_and_arrays(self):
+        revolute = UsdPhysics.RevoluteJoint.Define(self.stage, "/Robot/Revolute").GetPrim()
+        revolute.ApplyAPI("NewtonJointAPI")
+        revolute.GetAttribute("newton:armature").Set(0.5)
+        UsdPhysics.FixedJoint.Define(self.stage, "/Robot/Fixed")
+        spherical = UsdPhysics.SphericalJoint.Define(self.stage, "/Robot/Spherical").GetPrim()
+        spherical.ApplyAPI("NewtonJointAPI")
+        spherical.GetAttribute("newton:armature").Set(0.1)
+        spherical.GetAttribute("newton:damping").Set(2.0)
+        spherical.GetAttribute("newton:dof:damping").Set([1.0, 2.0, 3.0])
+        spherical.GetAttribute("newton:dof:limitStiffness").Set([math.inf, -math.inf, 10.0])
+        # joints without NewtonJointAPI use the schema fallbacks
+        UsdPhysics.PrismaticJoint.Define(self.stage, "/Robot/Prismatic")
+
+        dofs = read_joint_dofs(self.stage)
+        self.assertEqual(dofs.joints, tuple(Sdf.Path(f"/Robot/{name}") for name in ("Revolute", "Fixed", "Spherical", "Prismatic")))
+        np.testing.assert_array_equal(dofs.offsets, [0, 1, 1, 4, 5])
+        self.assertEqual(dofs.axes, ("rotX", "rotX", "rotY", "rotZ", "transX"))
+        np.testing.assert_array_equal(dofs.angular(), [True, True, True, True, False])
+
+        armature = dofs.parameters["armature"]
+        self.assertEqual(armature.dtype, np.float32)
+        np.testing.assert_allclose(armature, [0.5, 0.1, 0.1, 0.1, 0.0])
+        # per-DOF arrays take precedence over the scalar
+        np.testing.assert_allclose(dofs.parameters["damping"], [0.0, 1.0, 2.0, 3.0, 0.0])
+        np.testing.assert_array_equal(dofs.parameters["limit_stiffness"], [-math.inf, math.inf, -math.inf, 10.0, -math.inf])
+        np.testing.assert_array_equal(dofs.parameters["velocity_limit"], [math.inf] * 5)
+
+    def test_invalid_length(self):
+        d6 = UsdPhysics.Joint.Define(self.stage, "/D6").GetPrim()
+        d6.ApplyAPI("NewtonJointAPI")
+        d6.GetAttribute("newton:dof:friction").Set([1.0, 2.0])
+        with self.assertRaisesRegex(ValueError, "`newton:dof:friction` has 2 elements but the joint has 6 DOFs"):
+            read_joint_dofs(self.stage)
+
+
+if __name__ == "__main__":
+    unittest.main()
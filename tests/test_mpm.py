@@ -0,0 +1,191 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+import math
+import pathlib
+import unittest
+
+import numpy as np
+from pxr import Sdf, Usd, UsdGeom, UsdPhysics, Vt
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas import mpm, particle_io
+
+SAND_FIXTURE = pathlib.Path(__file__).parent / "assets" / "sand.usda"
+
+
+def _define_particles(stage: Usd.Stage, path: str, points: np.ndarray, width: float, owner: str | None = None) -> Usd.Prim:
+    prim = UsdGeom.Points.Define(stage, path).GetPrim()
+    prim.ApplyAPI("NewtonPointsDeformableSimAPI")
+    prim.SetMetadata("apiSchemas", Sdf.TokenListOp.Create(prependedItems=["NewtonPointsDeformableSimAPI", "PhysicsDeformableBodyAPI"]))
+    points_schema = UsdGeom.Points(prim)
+    points_schema.GetPointsAttr().Set(Vt.Vec3fArray.FromNumpy(points.astype(np.float32)))
+    points_schema.GetWidthsAttr().Set(Vt.FloatArray.FromNumpy(np.full(points.shape[0], width, dtype=np.float32)))
+    if owner is not None:
+        prim.CreateRelationship("physics:simulationOwner").SetTargets([owner])
+    return prim
+
+
+class TestSceneParticlePrims(unittest.TestCase):
+    def setUp(self):
+        self.stage: Usd.Stage = Usd.Stage.CreateInMemory()
+        self.first = UsdPhysics.Scene.Define(self.stage, "/First").GetPrim()
+        self.second = UsdPhysics.Scene.Define(self.stage, "/Second").GetPrim()
+
+    def test_ownership(self):
+        owned = _define_particles(self.stage, "/Owned", np.zeros((1, 3)), 0.1, owner="/Second")
+        unowned = _define_particles(self.stage, "/Unowned", np.zeros((1, 3)), 0.1)
+        orphan = UsdGeom.Points.Define(self.stage, "/Orphan").GetPrim()
+        orphan.ApplyAPI("NewtonPointsDeformableSimAPI")
+
+        self.assertEqual(particle_io.scene_particle_prims(self.second), [owned])
+        # bodies without an owner are simulated by the first scene on the stage
+        self.assertEqual(particle_io.scene_particle_prims(self.first), [unowned])
+        self.assertIsNone(particle_io.particle_body(orphan))
+
+    def test_parent_body(self):
+        body = self.stage.DefinePrim("/Body", "Xform")
+        body.SetMetadata("apiSchemas", Sdf.TokenListOp.Create(prependedItems=["PhysicsDeformableBodyAPI"]))
+        body.CreateRelationship("physics:simulationOwner").SetTargets(["/Second"])
+        child = UsdGeom.Points.Define(self.stage, "/Body/Chunk").GetPrim()
+        child.ApplyAPI("NewtonPointsDeformableSimAPI")
+        self.assertEqual(particle_io.particle_body(child), body)
+        self.assertEqual(particle_io.scene_particle_prims(self.second), [child])
+
+
+class TestEstimateMPMGrid(unittest.TestCase):
+    def setUp(self):
+        self.stage: Usd.Stage = Usd.Stage.CreateInMemory()
+        self.scene: Usd.Prim = UsdPhysics.Scene.Define(self.stage, "/Scene").GetPrim()
+        self.scene.ApplyAPI("NewtonMPMSceneAPI")
+        # a 10 x 10 x 10 lattice of touching particles
+        axis = np.arange(10) * 0.1
+        self.points = np.stack(np.meshgrid(axis, axis, axis, indexing="ij"), axis=-1).reshape(-1, 3)
+        _define_particles(self.stage, "/Particles", self.points, 0.1)
+
+    def test_sand_fixture(self):
+        stage = Usd.Stage.Open(SAND_FIXTURE.as_posix())
+        estimate = mpm.estimate_mpm_grid(stage.GetPrimAtPath("/World/PhysicsScene"))
+        self.assertEqual(estimate.particle_count, 4)
+        self.assertEqual(estimate.widths.count, 4)
+        self.assertAlmostEqual(estimate.widths.mean, 0.05)
+        self.assertAlmostEqual(estimate.widths.std, 0.0, places=6)
+        self.assertAlmostEqual(estimate.proposed_voxel_size, 0.1)
+        # the authored voxel size takes precedence over the proposal
+        self.assertAlmostEqual(estimate.voxel_size, 0.05)
+        self.assertEqual(estimate.grid_type, "sparse")
+        self.assertEqual(estimate.active_cell_count, 4)
+        np.testing.assert_allclose(estimate.bounds, [[-0.05, -0.05, 0.475], [0.05, 0.05, 0.525]], atol=1e-6)
+
+    def test_proposed_voxel_size(self):
+        estimate = mpm.estimate_mpm_grid(self.scene, chunk_size=128)
+        self.assertEqual(estimate.particle_count, 1000)
+        self.assertAlmostEqual(estimate.widths.min, 0.1, places=6)
+        self.assertAlmostEqual(estimate.widths.max, 0.1, places=6)
+        self.assertAlmostEqual(estimate.proposed_voxel_size, 0.2, places=6)
+        self.assertAlmostEqual(estimate.voxel_size, 0.2, places=6)
+        # 1000 particles of width 0.1 fill 125 cells of 0.2
+        self.assertEqual(estimate.active_cell_count, 125)
+        self.assertEqual(estimate.memory_bytes, 125 * 64)
+
+    def test_sparse_padding(self):
+        self.scene.GetAttribute("newton:mpm:gridPadding").Set(1)
+        estimate = mpm.estimate_mpm_grid(self.scene, bytes_per_cell=100)
+        self.assertEqual(estimate.grid_padding, 1)
+        self.assertEqual(estimate.active_cell_count, 7**3)
+        self.assertEqual(estimate.memory_bytes, 7**3 * 100)
+
+    def test_dense(self):
+        self.scene.GetAttribute("newton:mpm:gridType").Set("dense")
+        self.scene.GetAttribute("newton:mpm:gridPadding").Set(2)
+        self.scene.GetAttribute("newton:mpm:voxelSize").Set(0.25)
+        estimate = mpm.estimate_mpm_grid(self.scene)
+        # bounds span [-0.05, 0.95] on each axis, which is 4 cells of 0.25 plus 2 padding cells per side
+        self.assertEqual(estimate.active_cell_count, 8**3)
+
+    def test_widths_required(self):
+        stage = Usd.Stage.CreateInMemory()
+        scene = UsdPhysics.Scene.Define(stage, "/Scene").GetPrim()
+        scene.ApplyAPI("NewtonMPMSceneAPI")
+        with self.assertRaisesRegex(ValueError, "widths"):
+            mpm.estimate_mpm_grid(scene)
+
+    def test_requires_mpm_scene(self):
+        scene = UsdPhysics.Scene.Define(self.stage, "/Plain").GetPrim()
+        with self.assertRaisesRegex(ValueError, "NewtonMPMSceneAPI"):
+            mpm.estimate_mpm_grid(scene)
+        self.assertTrue(math.isinf(self.scene.GetAttribute("newton:mpm:voxelSize").Get()))
+
+
+class TestMeasureGridOccupancy(unittest.TestCase):
+    def setUp(self):
+        self.stage: Usd.Stage = Usd.Stage.CreateInMemory()
+        self.scene: Usd.Prim = UsdPhysics.Scene.Define(self.stage, "/Scene").GetPrim()
+        self.scene.ApplyAPI("NewtonMPMSceneAPI")
+        # a 10 x 10 x 10 lattice, with particles centered between cell boundaries
+        axis = (np.arange(10) + 0.5) * 0.1
+        points = np.stack(np.meshgrid(axis, axis, axis, indexing="ij"), axis=-1).reshape(-1, 3)
+        _define_particles(self.stage, "/Particles", points, 0.1)
+
+    def test_sand_fixture(self):
+        stage = Usd.Stage.Open(SAND_FIXTURE.as_posix())
+        occupancy = mpm.measure_grid_occupancy(stage.GetPrimAtPath("/World/PhysicsScene"))
+        self.assertAlmostEqual(occupancy.voxel_size, 0.05)
+        self.assertEqual(occupancy.particle_count, 4)
+        self.assertEqual(occupancy.occupied_cell_count, 4)
+        self.assertEqual(occupancy.active_cell_count, 4)
+        self.assertEqual(occupancy.active_block_count, 4)
+        self.assertEqual(occupancy.allocated_cells["dense"], 4)
+
+    def test_lattice(self):
+        occupancy = mpm.measure_grid_occupancy(self.scene, voxel_size=0.2, block_size=4, chunk_size=100)
+        self.assertEqual(occupancy.particle_count, 1000)
+        self.assertEqual(occupancy.occupied_cell_count, 125)
+        self.assertEqual(occupancy.active_cell_count, 125)
+        # cells 0..4 on each axis touch blocks 0..1
+        self.assertEqual(occupancy.active_block_count, 8)
+        self.assertEqual(occupancy.allocated_cells, {"sparse": 8 * 64, "fixed": 8 * 64, "dense": 125})
+
+    def test_padding(self):
+        self.scene.GetAttribute("newton:mpm:gridPadding").Set(1)
+        occupancy = mpm.measure_grid_occupancy(self.scene, voxel_size=0.2, block_size=4)
+        self.assertEqual(occupancy.grid_padding, 1)
+        self.assertEqual(occupancy.occupied_cell_count, 125)
+        self.assertEqual(occupancy.active_cell_count, 7**3)
+        # cells -1..5 on each axis touch blocks -1..1
+        self.assertEqual(occupancy.active_block_count, 27)
+        self.assertEqual(occupancy.allocated_cells["dense"], 7**3)
+
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(7)
+        clusters = [rng.normal(center, 0.3, size=(500, 3)) for center in ((-3, 0, 0), (4, 4, 1))]
+        for index, cluster in enumerate(clusters):
+            _define_particles(self.stage, f"/Cluster{index}", cluster, 0.05)
+        self.scene.GetAttribute("newton:mpm:gridPadding").Set(2)
+        occupancy = mpm.measure_grid_occupancy(self.scene, voxel_size=0.1, chunk_size=64)
+
+        points = np.concatenate([particle_io.read_particles(prim).points for prim in particle_io.scene_particle_prims(self.scene)])
+        occupied = {tuple(cell) for cell in np.floor(points / np.float32(0.1)).astype(int).tolist()}
+        offsets = [(x, y, z) for x in range(-2, 3) for y in range(-2, 3) for z in range(-2, 3)]
+        active = {(cell[0] + x, cell[1] + y, cell[2] + z) for cell in occupied for x, y, z in offsets}
+        blocks = {(x // 8, y // 8, z // 8) for x, y, z in active}
+        self.assertEqual(occupancy.particle_count, 2000)
+        self.assertEqual(occupancy.occupied_cell_count, len(occupied))
+        self.assertEqual(occupancy.active_cell_count, len(active))
+        self.assertEqual(occupancy.active_block_count, len(blocks))
+        # the clusters are far apart, so a dense grid allocates far more than a sparse one
+        self.assertGreater(occupancy.allocated_cells["dense"], occupancy.active_cell_count)
+
+    def test_voxel_size_required(self):
+        with self.assertRaisesRegex(ValueError, "voxelSize"):
+            mpm.measure_grid_occupancy(self.scene)
+        with self.assertRaisesRegex(ValueError, "block_size"):
+            mpm.measure_grid_occupancy(self.scene, voxel_size=0.1, block_size=0)
+
+    def test_too_many_cells(self):
+        with self.assertRaisesRegex(ValueError, "voxel size"):
+            mpm.measure_grid_occupancy(self.scene, voxel_size=1e-7)
+
+
+if __name__ == "__main__":
+    unittest.main()
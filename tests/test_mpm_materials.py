@@ -0,0 +1,161 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+import math
+import pathlib
+import unittest
+
+import numpy as np
+from pxr import Sdf, Usd, UsdGeom, UsdPhysics, UsdShade, Vt
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.mpm_materials import MPM_MATERIAL_DTYPE, read_mpm_materials
+
+SAND_FIXTURE = pathlib.Path(__file__).parent / "assets" / "sand.usda"
+
+
+class TestReadMPMMaterials(unittest.TestCase):
+    def setUp(self):
+        self.stage: Usd.Stage = Usd.Stage.CreateInMemory()
+        self.scene: Usd.Prim = UsdPhysics.Scene.Define(self.stage, "/Scene").GetPrim()
+        self.scene.ApplyAPI("NewtonMPMSceneAPI")
+
+    def _define_material(self, path: str, **values: float) -> UsdShade.Material:
+        material = UsdShade.Material.Define(self.stage, path)
+        material.GetPrim().ApplyAPI("NewtonMPMMaterialAPI")
+        for name, value in values.items():
+            material.GetPrim().GetAttribute(name).Set(value)
+        return material
+
+    def _define_particles(self, path: str, count: int, material: UsdShade.Material | None = None) -> Usd.Prim:
+        prim = UsdGeom.Points.Define(self.stage, path).GetPrim()
+        prim.SetMetadata("apiSchemas", Sdf.TokenListOp.Create(prependedItems=["NewtonPointsDeformableSimAPI", "PhysicsDeformableBodyAPI"]))
+        UsdGeom.Points(prim).GetPointsAttr().Set(Vt.Vec3fArray.FromNumpy(np.zeros((count, 3), dtype=np.float32)))
+        if material is not None:
+            UsdShade.MaterialBindingAPI.Apply(prim).Bind(material, materialPurpose="physics")
+        return prim
+
+    def test_sand_fixture(self):
+        stage = Usd.Stage.Open(SAND_FIXTURE.as_posix())
+        table = read_mpm_materials(stage.GetPrimAtPath("/World/PhysicsScene"))
+        self.assertEqual(table.materials.dtype, MPM_MATERIAL_DTYPE)
+        self.assertEqual(table.material_paths, (Sdf.Path("/World/SandMaterial"), Sdf.Path("/World/DenseSandMaterial")))
+        np.testing.assert_array_equal(table.prim_materials, [0])
+        np.testing.assert_array_equal(table.point_counts, [4])
+        np.testing.assert_array_equal(table.particle_materials(), [0, 0, 1, 1])
+
+        particles = table.materials[table.particle_materials()]
+        np.testing.assert_allclose(particles["density"], [1600, 1600, 1900, 1900])
+        np.testing.assert_allclose(particles["youngs_modulus"], [1e7, 1e7, 2e7, 2e7])
+        # unauthored attributes use the schema fallbacks
+        np.testing.assert_allclose(table.materials["hardening_rate"], 1.0)
+
+    def test_deduplication(self):
+        first = self._define_material("/First", **{"newton:mpm:youngsModulus": 1e6, "physics:density": 1000})
+        second = self._define_material("/Second", **{"newton:mpm:youngsModulus": 1e6, "physics:density": 1000})
+        third = self._define_material("/Third", **{"newton:mpm:youngsModulus": 5e6, "physics:density": 1000})
+        self._define_particles("/A", 2, first)
+        self._define_particles("/B", 3, second)
+        self._define_particles("/C", 1, third)
+        self._define_particles("/D", 1, first)
+
+        table = read_mpm_materials(self.scene)
+        self.assertEqual(len(table.materials), 2)
+        self.assertEqual(table.material_paths, (Sdf.Path("/First"), Sdf.Path("/Third")))
+        np.testing.assert_array_equal(table.prim_materials, [0, 0, 1, 0])
+        np.testing.assert_array_equal(table.particle_materials(), [0, 0, 0, 0, 0, 1, 0])
+
+    def test_solver_defaults(self):
+        unset = self._define_material("/Unset")
+        explicit = self._define_material("/Explicit", **{"newton:mpm:youngsModulus": 1e9, "physics:density": 2000})
+        self._define_particles("/A", 1, unset)
+        self._define_particles("/B", 1, explicit)
+
+        table = read_mpm_materials(self.scene)
+        self.assertEqual(len(table.materials), 2)
+        self.assertEqual(table.materials["youngs_modulus"][0], -math.inf)
+        self.assertEqual(table.materials["yield_pressure"][0], -math.inf)
+        self.assertEqual(table.materials["density"][0], 0.0)
+
+        # once the sentinels resolve to the same values, both materials share a row
+        table = read_mpm_materials(self.scene, {"youngs_modulus": 1e9, "density": 2000, "yield_pressure": 1e12})
+        self.assertEqual(len(table.materials), 1)
+        np.testing.assert_array_equal(table.prim_materials, [0, 0])
+        self.assertEqual(table.materials["yield_pressure"][0], np.float32(1e12))
+
+        with self.assertRaisesRegex(ValueError, "bogus"):
+            read_mpm_materials(self.scene, {"bogus": 1.0})
+
+    def test_unbound_and_inherited(self):
+        material = self._define_material("/Material", **{"physics:density": 1500})
+        body = self.stage.DefinePrim("/Body", "Xform")
+        body.SetMetadata("apiSchemas", Sdf.TokenListOp.Create(prependedItems=["PhysicsDeformableBodyAPI"]))
+        UsdShade.MaterialBindingAPI.Apply(body).Bind(material, materialPurpose="physics")
+        chunk = UsdGeom.Points.Define(self.stage, "/Body/Chunk").GetPrim()
+        chunk.ApplyAPI("NewtonPointsDeformableSimAPI")
+        UsdGeom.Points(chunk).GetPointsAttr().Set(Vt.Vec3fArray.FromNumpy(np.zeros((2, 3), dtype=np.float32)))
+        self._define_particles("/Unbound", 1)
+
+        table = read_mpm_materials(self.scene)
+        self.assertEqual(table.material_paths, (Sdf.Path("/Material"), Sdf.Path.emptyPath))
+        np.testing.assert_array_equal(table.particle_materials(), [0, 0, 1])
+        self.assertEqual(table.materials["density"][1], 0.0)
+        self.assertAlmostEqual(float(table.materials["poissons_ratio"][1]), 0.3, places=6)
+
+    def test_subset_out_of_range(self):
+        material = self._define_material("/Material")
+        prim = self._define_particles("/Particles", 2, material)
+        UsdShade.MaterialBindingAPI(prim).CreateMaterialBindSubset("Subset", Vt.IntArray([1, 2]), UsdGeom.Tokens.point)
+        with self.assertRaisesRegex(ValueError, "Subset"):
+            read_mpm_materials(self.scene)
+
+    def test_material_indices(self):
+        bound = self._define_material("/Bound", **{"physics:density": 1000})
+        soft = self._define_material("/Soft", **{"newton:mpm:youngsModulus": 1e5})
+        stiff = self._define_material("/Stiff", **{"newton:mpm:youngsModulus": 1e8})
+        self._define_particles("/A", 2, bound)
+        prim = self._define_particles("/B", 4, bound)
+        prim.CreateRelationship("newton:mpm:materials").SetTargets([stiff.GetPath(), soft.GetPath()])
+        indices = prim.GetAttribute("newton:mpm:materialIndices")
+        indices.Set(Vt.IntArray([1, 0, 0, 1]))
+
+        table = read_mpm_materials(self.scene)
+        self.assertEqual(table.material_paths, (Sdf.Path("/Bound"), Sdf.Path("/Stiff"), Sdf.Path("/Soft")))
+        # the material indices take precedence over the prim's bound material
+        np.testing.assert_array_equal(table.particle_materials(), [0, 0, 2, 1, 1, 2])
+        np.testing.assert_allclose(table.materials[table.particle_materials()]["youngs_modulus"][2:], [1e5, 1e8, 1e8, 1e5])
+
+        indices.Set(Vt.IntArray([0, 1, 2, 0]))
+        with self.assertRaisesRegex(ValueError, "materialIndices"):
+            read_mpm_materials(self.scene)
+        indices.Set(Vt.IntArray([0, 1]))
+        with self.assertRaisesRegex(ValueError, "has 2 elements"):
+            read_mpm_materials(self.scene)
+
+    def test_point_parameters(self):
+        material = self._define_material("/Material", **{"newton:mpm:internalFriction": 0.6, "newton:mpm:youngsModulus": 1e6})
+        self._define_particles("/Uniform", 2, material)
+        graded = self._define_particles("/Graded", 3, material)
+        graded.GetAttribute("newton:mpm:internalFriction").Set(Vt.FloatArray([0.2, 0.4, 0.8]))
+
+        table = read_mpm_materials(self.scene)
+        self.assertEqual(len(table.materials), 1)
+        parameters = table.particle_parameters()
+        self.assertEqual(parameters.dtype, MPM_MATERIAL_DTYPE)
+        np.testing.assert_allclose(parameters["internal_friction"], [0.6, 0.6, 0.2, 0.4, 0.8], rtol=1e-6)
+        np.testing.assert_allclose(parameters["youngs_modulus"], 1e6)
+        # the table itself is not modified
+        self.assertAlmostEqual(float(table.materials["internal_friction"][0]), 0.6, places=6)
+
+        graded.GetAttribute("newton:mpm:yieldPressure").Set(Vt.FloatArray([1.0]))
+        with self.assertRaisesRegex(ValueError, "yieldPressure"):
+            table.particle_parameters()
+
+    def test_empty_scene(self):
+        table = read_mpm_materials(self.scene)
+        self.assertEqual(len(table.materials), 0)
+        self.assertEqual(table.particle_materials().shape, (0,))
+
+
+if __name__ == "__main__":
+    unittest.main()
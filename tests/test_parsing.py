@@ -0,0 +1,151 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+import numpy as np
+from pxr import Sdf, Usd, UsdGeom, UsdPhysics
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.parsing import NEWTON_DESCRIPTOR_SCHEMAS, load_newton_from_range, read_newton_descriptors
+
+ObjectType = UsdPhysics.ObjectType
+
+
+def _robot(stage: Usd.Stage, root: str, links: int) -> None:
+    UsdGeom.Xform.Define(stage, root)
+    for index in range(links):
+        body = UsdGeom.Xform.Define(stage, f"{root}/Body{index}").GetPrim()
+        UsdPhysics.RigidBodyAPI.Apply(body)
+        body.ApplyAPI("NewtonMassAPI")
+        collider = UsdGeom.Cube.Define(stage, f"{root}/Body{index}/Collider").GetPrim()
+        UsdPhysics.CollisionAPI.Apply(collider)
+        if index % 2:
+            collider.ApplyAPI("NewtonCollisionAPI")
+        joint = UsdPhysics.RevoluteJoint.Define(stage, f"{root}/Joint{index}")
+        joint.CreateBody1Rel().SetTargets([f"{root}/Body{index}"])
+        if index:
+            joint.CreateBody0Rel().SetTargets([f"{root}/Body{index - 1}"])
+            joint.GetPrim().ApplyAPI("NewtonJointAPI")
+            joint.GetPrim().GetAttribute("newton:armature").Set(0.5 * index)
+    mimic = stage.GetPrimAtPath(f"{root}/Joint{links - 1}")
+    mimic.ApplyAPI("NewtonMimicAPI")
+    mimic.GetRelationship("newton:mimicJoint").SetTargets([f"{root}/Joint1"])
+    mimic.GetAttribute("newton:mimicCoef1").Set(-1.0)
+    actuator = stage.DefinePrim(f"{root}/Actuator", "NewtonActuator")
+    actuator.GetRelationship("newton:targets").SetTargets([f"{root}/Joint1"])
+    actuator.ApplyAPI("NewtonPDControlAPI")
+    actuator.GetAttribute("newton:kp").Set(100.0)
+
+
+def _stage() -> Usd.Stage:
+    stage = Usd.Stage.CreateInMemory()
+    UsdPhysics.Scene.Define(stage, "/World/PhysicsScene").GetPrim().ApplyAPI("NewtonSceneAPI")
+    _robot(stage, "/World/RobotA", 4)
+    _robot(stage, "/World/RobotB", 3)
+    return stage
+
+
+class TestLoadNewtonFromRange(unittest.TestCase):
+    def test_aligned_with_usd_physics(self):
+        stage = _stage()
+        parsed = load_newton_from_range(stage, ["/World"])
+        self.assertEqual(set(parsed.descriptors), {ObjectType.Scene, ObjectType.RigidBody, ObjectType.CubeShape, ObjectType.RevoluteJoint})
+        for object_type, descriptors in parsed.descriptors.items():
+            paths, physics = parsed.physics[object_type]
+            self.assertEqual(descriptors.paths, tuple(paths))
+            self.assertEqual(len(descriptors), len(physics))
+            self.assertEqual(set(descriptors.applied), set(NEWTON_DESCRIPTOR_SCHEMAS[object_type]))
+            # every row matches the prim of its descriptor
+            for row, path in enumerate(paths):
+                prim = stage.GetPrimAtPath(path)
+                for schema, applied in descriptors.applied.items():
+                    self.assertEqual(applied[row], prim.HasAPI(schema), (path, schema))
+
+        paths, joints = parsed.physics[ObjectType.RevoluteJoint]
+        descriptors = parsed.descriptors[ObjectType.RevoluteJoint]
+        for row, joint in enumerate(joints):
+            prim = stage.GetPrimAtPath(joint.primPath)
+            self.assertEqual(descriptors.values["newton:armature"][row], prim.GetAttribute("newton:armature").Get() or 0.0)
+        mimic = paths.index(Sdf.Path("/World/RobotA/Joint3"))
+        self.assertEqual(descriptors.values["newton:mimicCoef1"][mimic], -1.0)
+        self.assertEqual(descriptors.targets["newton:mimicJoint"][mimic], (Sdf.Path("/World/RobotA/Joint1"),))
+        self.assertEqual(descriptors.targets["newton:mimicJoint"][paths.index(Sdf.Path("/World/RobotA/Joint2"))], ())
+        # rows without a schema hold its fallback
+        self.assertEqual(descriptors.values["newton:mimicCoef1"][paths.index(Sdf.Path("/World/RobotB/Joint0"))], 1.0)
+        self.assertTrue(parsed.descriptors[ObjectType.Scene].applied["NewtonSceneAPI"].all())
+
+        # each body is visited before its collider and joint
+        self.assertEqual(set(parsed.traversal_order), set(parsed.descriptors))
+        order = parsed.traversal_order
+        self.assertTrue((order[ObjectType.RigidBody] < order[ObjectType.CubeShape]).all())
+        self.assertTrue((order[ObjectType.CubeShape] < order[ObjectType.RevoluteJoint]).all())
+        self.assertTrue((np.diff(order[ObjectType.RevoluteJoint]) > 0).all())
+
+    def test_actuators(self):
+        parsed = load_newton_from_range(_stage(), ["/World"])
+        actuators = parsed.actuators
+        self.assertEqual(actuators.paths, (Sdf.Path("/World/RobotA/Actuator"), Sdf.Path("/World/RobotB/Actuator")))
+        self.assertTrue(actuators.applied["NewtonActuator"].all())
+        self.assertTrue(actuators.applied["NewtonPDControlAPI"].all())
+        self.assertFalse(actuators.applied["NewtonPIDControlAPI"].any())
+        np.testing.assert_array_equal(actuators.values["newton:kp"], [100.0, 100.0])
+        self.assertEqual(actuators.targets["newton:targets"][1], (Sdf.Path("/World/RobotB/Joint1"),))
+
+    def test_actuator_arrays(self):
+        stage = _stage()
+        array = stage.DefinePrim("/World/RobotA/Actuators", "NewtonActuatorArray")
+        array.GetRelationship("newton:targets").SetTargets(["/World/RobotA/Joint1", "/World/RobotA/Joint2"])
+        array.GetAttribute("newton:kp").Set([10.0, 20.0])
+        parsed = load_newton_from_range(stage, ["/World"])
+        self.assertEqual(len(parsed.actuators), 2)
+        arrays = parsed.actuator_arrays
+        self.assertEqual(arrays.paths, (Sdf.Path("/World/RobotA/Actuators"),))
+        self.assertTrue(arrays.applied["NewtonActuatorArray"].all())
+        np.testing.assert_array_equal(arrays.values["newton:kp"][0], [10.0, 20.0])
+        self.assertEqual(len(arrays.values["newton:kd"][0]), 0)
+        self.assertEqual(arrays.targets["newton:targets"][0], (Sdf.Path("/World/RobotA/Joint1"), Sdf.Path("/World/RobotA/Joint2")))
+        self.assertEqual(len(load_newton_from_range(stage, ["/World/RobotB"]).actuator_arrays), 0)
+
+    def test_read_newton_descriptors(self):
+        stage = _stage()
+        prims = [stage.GetPrimAtPath(path) for path in ("/World/RobotA/Joint0", "/World/RobotA/Joint1", "/World/RobotA/Actuator")]
+        descriptors = read_newton_descriptors(prims, ("NewtonJointAPI", "NewtonActuator"))
+        self.assertEqual(descriptors.paths, tuple(prim.GetPath() for prim in prims))
+        np.testing.assert_array_equal(descriptors.applied["NewtonJointAPI"], [False, True, False])
+        np.testing.assert_array_equal(descriptors.applied["NewtonActuator"], [False, False, True])
+        np.testing.assert_array_equal(descriptors.values["newton:armature"], [0.0, 0.5, 0.0])
+        self.assertEqual(descriptors.targets["newton:targets"], ((), (), (Sdf.Path("/World/RobotA/Joint1"),)))
+        self.assertEqual(len(read_newton_descriptors([], ("NewtonJointAPI",))), 0)
+
+    def test_range(self):
+        stage = _stage()
+        parsed = load_newton_from_range(stage, ["/World"], exclude_paths=["/World/RobotB"])
+        self.assertEqual(len(parsed.descriptors[ObjectType.RevoluteJoint]), 4)
+        self.assertEqual(len(parsed.actuators), 1)
+
+        # a precomputed result is reused as is
+        physics = load_newton_from_range(stage, ["/World/RobotB"]).physics
+        parsed = load_newton_from_range(stage, ["/World/RobotB"], physics=physics)
+        self.assertIs(parsed.physics, physics)
+        self.assertEqual(len(parsed.descriptors[ObjectType.RigidBody]), 3)
+        self.assertTrue(parsed.descriptors[ObjectType.RigidBody].applied["NewtonMassAPI"].all())
+
+    def test_instance_proxies(self):
+        prototype = Usd.Stage.CreateInMemory()
+        _robot(prototype, "/Robot", 2)
+        prototype.SetDefaultPrim(prototype.GetPrimAtPath("/Robot"))
+        stage = Usd.Stage.CreateInMemory()
+        for index in range(2):
+            clone = stage.DefinePrim(f"/World/Robot{index}")
+            clone.GetReferences().AddReference(prototype.GetRootLayer().identifier)
+            clone.SetInstanceable(True)
+        parsed = load_newton_from_range(stage, ["/World"])
+        descriptors = parsed.descriptors[ObjectType.RevoluteJoint]
+        self.assertEqual(len(descriptors), 4)
+        np.testing.assert_array_equal(descriptors.values["newton:armature"][descriptors.applied["NewtonJointAPI"]], [0.5, 0.5])
+        self.assertEqual(len(parsed.actuators), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -43,6 +43,37 @@ class TestNewtonPointsDeformableSimAPI(unittest.TestCase):
         self.assertTrue(attr.HasAuthoredValue())
         self.assertEqual(attr.Get(), masses)
 
+    def test_mpm_material_indices(self):
+        self.points.ApplyAPI("NewtonPointsDeformableSimAPI")
+        materials = self.points.GetRelationship("newton:mpm:materials")
+        self.assertTrue(materials)
+        self.assertEqual(materials.GetTargets(), [])
+        attr = self.points.GetAttribute("newton:mpm:materialIndices")
+        self.assertIsNotNone(attr)
+        self.assertEqual(attr.GetTypeName(), "int[]")
+        self.assertFalse(attr.HasAuthoredValue())
+        self.assertIsNone(attr.Get())
+
+        first = UsdShade.Material.Define(self.stage, "/First")
+        second = UsdShade.Material.Define(self.stage, "/Second")
+        self.assertTrue(materials.SetTargets([first.GetPath(), second.GetPath()]))
+        self.assertTrue(attr.Set(Vt.IntArray([0, 1, 1])))
+        self.assertEqual(materials.GetTargets(), [first.GetPath(), second.GetPath()])
+        self.assertEqual(attr.Get(), Vt.IntArray([0, 1, 1]))
+
+    def test_mpm_point_parameters(self):
+        self.points.ApplyAPI("NewtonPointsDeformableSimAPI")
+        for name in ("newton:mpm:youngsModulus", "newton:mpm:internalFriction", "newton:mpm:yieldPressure"):
+            attr = self.points.GetAttribute(name)
+            self.assertIsNotNone(attr)
+            self.assertEqual(attr.GetTypeName(), "float[]")
+            self.assertFalse(attr.HasAuthoredValue())
+            self.assertIsNone(attr.Get())
+
+            values = Vt.FloatArray([0.5, 1.5])
+            self.assertTrue(attr.Set(values))
+            self.assertEqual(attr.Get(), values)
+
     def test_sand_fixture(self):
         fixture = pathlib.Path(__file__).parent / "assets" / "sand.usda"
         stage = Usd.Stage.Open(fixture.as_posix())
@@ -0,0 +1,141 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+import pathlib
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+from pxr import Usd, UsdGeom
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas import particle_io
+from newton_usd_schemas.particle_cache import ParticleCache, write_particle_cache
+
+SAND_FIXTURE = pathlib.Path(__file__).parent / "assets" / "sand.usda"
+
+
+def _frame(value: float, count: int = 4) -> particle_io.ParticleArrays:
+    return particle_io.ParticleArrays(
+        points=np.full((count, 3), value, dtype=np.float32),
+        velocities=np.full((count, 3), -value, dtype=np.float32),
+    )
+
+
+class TestParticleCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = pathlib.Path(self.tmpdir.name)
+        shutil.copy(SAND_FIXTURE, self.root / "sand.usda")
+        self.cache_path = self.root / "rollout.usda"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _open_with_cache(self) -> Usd.Stage:
+        self.stage = Usd.Stage.Open((self.root / "sand.usda").as_posix())
+        self.stage.GetSessionLayer().subLayerPaths.append(self.cache_path.as_posix())
+        return self.stage
+
+    def test_write_layout(self):
+        frames = ((time, _frame(time)) for time in (0.0, 1.0, 2.0))
+        layer = write_particle_cache(self.cache_path, "/World/Sand", frames)
+        self.assertEqual(layer.startTimeCode, 0.0)
+        self.assertEqual(layer.endTimeCode, 2.0)
+        self.assertTrue((self.root / "rollout.manifest.usda").exists())
+        for index in range(3):
+            self.assertTrue((self.root / f"rollout.frame{index:05d}.usdc").exists())
+
+    def test_stage_playback(self):
+        write_particle_cache(self.cache_path, "/World/Sand", [(time, _frame(time)) for time in (0.0, 5.0, 10.0)])
+        stage = self._open_with_cache()
+        points = UsdGeom.Points(stage.GetPrimAtPath("/World/Sand"))
+        np.testing.assert_allclose(np.asarray(points.GetPointsAttr().Get(5.0)), 5.0)
+        np.testing.assert_allclose(np.asarray(points.GetVelocitiesAttr().Get(10.0)), -10.0)
+        # the static particle attributes still come from the asset
+        self.assertEqual(len(points.GetWidthsAttr().Get(5.0)), 4)
+
+    def test_random_access(self):
+        times = [float(time) for time in range(0, 20, 2)]
+        write_particle_cache(self.cache_path, "/World/Sand", [(time, _frame(time)) for time in times])
+        cache = ParticleCache(self._open_with_cache().GetPrimAtPath("/World/Sand"))
+        self.assertEqual(len(cache), 10)
+        np.testing.assert_array_equal(cache.times, times)
+
+        frame = cache.read_frame(7)
+        np.testing.assert_allclose(frame.points, 14.0)
+        np.testing.assert_allclose(frame.velocities, -14.0)
+        self.assertFalse(frame.points.flags.writeable)
+        np.testing.assert_allclose(cache.read_frame(-1).points, 18.0)
+
+        self.assertEqual(cache.frame_index(-5.0), 0)
+        self.assertEqual(cache.frame_index(3.0), 1)
+        self.assertEqual(cache.frame_index(4.0), 2)
+        self.assertEqual(cache.frame_index(100.0), 9)
+        np.testing.assert_allclose(cache.read_time(4.0).points, 4.0)
+        # times between frames are interpolated, as by the stage
+        np.testing.assert_allclose(cache.read_time(5.0).points, 5.0)
+
+    def test_read_time_matches_stage(self):
+        frames = [(0.0, _frame(0.0)), (1.0, _frame(1.0)), (2.0, _frame(2.0, count=5)), (3.0, particle_io.ParticleArrays(points=np.full((5, 3), 3.0)))]
+        write_particle_cache(self.cache_path, "/World/Sand", frames)
+        stage = self._open_with_cache()
+        prim = stage.GetPrimAtPath("/World/Sand")
+        points = UsdGeom.Points(prim)
+        cache = ParticleCache(prim)
+        frame = cache.read_time(0.5)
+        np.testing.assert_allclose(frame.points, 0.5)
+        np.testing.assert_allclose(frame.velocities, -0.5)
+        self.assertEqual(frame.points.dtype, np.float32)
+        for time in (-1.0, 0.0, 0.25, 1.5, 2.5, 3.0, 4.0):
+            frame = cache.read_time(time)
+            np.testing.assert_allclose(frame.points, points.GetPointsAttr().Get(time), err_msg=f"time {time}")
+            velocities = points.GetVelocitiesAttr().Get(time)
+            if velocities is None:
+                self.assertIsNone(frame.velocities)
+            else:
+                np.testing.assert_allclose(frame.velocities, velocities, err_msg=f"time {time}")
+
+        # the element count changes at frame 2, so the stage holds frame 1
+        np.testing.assert_allclose(cache.read_time(1.5).points, 1.0)
+        # frame 3 does not record velocities, so those of frame 2 are held
+        np.testing.assert_allclose(cache.read_time(2.5).points, 2.5)
+        np.testing.assert_allclose(cache.read_time(2.5).velocities, -2.0)
+
+        stage.SetInterpolationType(Usd.InterpolationTypeHeld)
+        np.testing.assert_allclose(cache.read_time(0.5).points, points.GetPointsAttr().Get(0.5))
+        np.testing.assert_allclose(cache.read_time(0.5).points, 0.0)
+
+    def test_optional_velocities(self):
+        frame = particle_io.ParticleArrays(points=np.zeros((2, 3), dtype=np.float32))
+        write_particle_cache(self.cache_path, "/World/Sand", [(0.0, frame)])
+        cache = ParticleCache(self._open_with_cache().GetPrimAtPath("/World/Sand"))
+        self.assertEqual(len(cache.read_frame(0)), 2)
+        self.assertIsNone(cache.read_frame(0).velocities)
+
+    def test_invalid_frames(self):
+        with self.assertRaisesRegex(ValueError, "at least one frame"):
+            write_particle_cache(self.cache_path, "/World/Sand", [])
+        with self.assertRaisesRegex(ValueError, "strictly increasing"):
+            write_particle_cache(self.root / "bad.usda", "/World/Sand", [(1.0, _frame(1.0)), (1.0, _frame(1.0))])
+
+    def test_open_layers_are_bounded(self):
+        write_particle_cache(self.cache_path, "/World/Sand", [(float(time), _frame(time)) for time in range(4)])
+        prim = self._open_with_cache().GetPrimAtPath("/World/Sand")
+        cache = ParticleCache(prim, max_open_layers=1)
+        frames = [cache.read_frame(index) for index in range(4)]
+        # evicted layers must not invalidate arrays which are still referenced
+        for index, frame in enumerate(frames):
+            np.testing.assert_allclose(frame.points, float(index))
+        with self.assertRaises(ValueError):
+            ParticleCache(prim, max_open_layers=0)
+
+    def test_missing_clip_set(self):
+        stage = Usd.Stage.Open(SAND_FIXTURE.as_posix())
+        with self.assertRaisesRegex(ValueError, "clip set"):
+            ParticleCache(stage.GetPrimAtPath("/World/Sand"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+import pathlib
+import tempfile
+import unittest
+
+import numpy as np
+from pxr import Sdf, Usd, UsdGeom, Vt
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas import particle_io
+
+SAND_FIXTURE = pathlib.Path(__file__).parent / "assets" / "sand.usda"
+
+
+class TestReadParticles(unittest.TestCase):
+    def setUp(self):
+        self.stage: Usd.Stage = Usd.Stage.CreateInMemory()
+        self.points = UsdGeom.Points.Define(self.stage, "/Particles")
+        self.prim: Usd.Prim = self.points.GetPrim()
+        self.prim.ApplyAPI("NewtonPointsDeformableSimAPI")
+        self.points.GetPointsAttr().Set(Vt.Vec3fArray([(0, 0, 0), (1, 0, 0), (2, 0, 0)]))
+
+    def test_sand_fixture(self):
+        stage = Usd.Stage.Open(SAND_FIXTURE.as_posix())
+        particles = particle_io.read_particles(stage.GetPrimAtPath("/World/Sand"))
+        self.assertEqual(len(particles), 4)
+        self.assertEqual(particles.points.shape, (4, 3))
+        self.assertEqual(particles.points.dtype, np.float32)
+        np.testing.assert_allclose(particles.points[1], (0.025, -0.025, 0.5))
+        np.testing.assert_array_equal(particles.velocities, np.zeros((4, 3)))
+        np.testing.assert_allclose(particles.radii, [0.025] * 4)
+        np.testing.assert_array_equal(particles.ids, [0, 1, 2, 3])
+        self.assertEqual(particles.ids.dtype, np.int64)
+        np.testing.assert_allclose(particles.masses, [0.2, 0.2, 0.2375, 0.2375])
+
+    def test_views_are_read_only(self):
+        particles = particle_io.read_particles(self.prim)
+        self.assertFalse(particles.points.flags.owndata)
+        self.assertFalse(particles.points.flags.writeable)
+        with self.assertRaises(ValueError):
+            particles.points[0, 0] = 1.0
+
+    def test_unauthored_attributes(self):
+        particles = particle_io.read_particles(self.prim)
+        self.assertEqual(len(particles), 3)
+        self.assertIsNone(particles.velocities)
+        self.assertIsNone(particles.radii)
+        self.assertIsNone(particles.ids)
+        self.assertIsNone(particles.masses)
+
+    def test_empty_points(self):
+        points = UsdGeom.Points.Define(self.stage, "/Empty").GetPrim()
+        points.ApplyAPI("NewtonPointsDeformableSimAPI")
+        particles = particle_io.read_particles(points)
+        self.assertEqual(len(particles), 0)
+        self.assertEqual(particles.points.shape, (0, 3))
+
+    def test_primvar_widths_take_precedence(self):
+        self.points.GetWidthsAttr().Set(Vt.FloatArray([1.0, 1.0, 1.0]))
+        primvar = UsdGeom.PrimvarsAPI(self.prim).CreatePrimvar("widths", Sdf.ValueTypeNames.FloatArray)
+        primvar.Set(Vt.FloatArray([0.2, 0.4, 0.6]))
+        particles = particle_io.read_particles(self.prim)
+        np.testing.assert_allclose(particles.radii, [0.1, 0.2, 0.3])
+
+    def test_constant_widths(self):
+        self.points.GetWidthsAttr().Set(Vt.FloatArray([0.5]))
+        self.points.SetWidthsInterpolation(UsdGeom.Tokens.constant)
+        particles = particle_io.read_particles(self.prim)
+        np.testing.assert_allclose(particles.radii, [0.25] * 3)
+
+    def test_mass_length_mismatch(self):
+        self.prim.GetAttribute("physics:masses").Set(Vt.FloatArray([1.0, 2.0]))
+        with self.assertRaisesRegex(ValueError, "physics:masses"):
+            particle_io.read_particles(self.prim)
+
+    def test_missing_api(self):
+        points = UsdGeom.Points.Define(self.stage, "/Plain").GetPrim()
+        with self.assertRaisesRegex(ValueError, "NewtonPointsDeformableSimAPI"):
+            particle_io.read_particles(points)
+
+    def test_time_samples(self):
+        attr = self.points.GetPointsAttr()
+        attr.Set(Vt.Vec3fArray([(0, 0, 1)] * 3), Usd.TimeCode(10))
+        particles = particle_io.read_particles(self.prim, Usd.TimeCode(10))
+        np.testing.assert_array_equal(particles.points[:, 2], [1, 1, 1])
+
+
+class TestIterParticleChunks(unittest.TestCase):
+    def setUp(self):
+        self.stage: Usd.Stage = Usd.Stage.CreateInMemory()
+        points = UsdGeom.Points.Define(self.stage, "/Particles")
+        self.prim: Usd.Prim = points.GetPrim()
+        self.prim.ApplyAPI("NewtonPointsDeformableSimAPI")
+        count = 10
+        positions = np.arange(count * 3, dtype=np.float32).reshape(count, 3)
+        points.GetPointsAttr().Set(Vt.Vec3fArray.FromNumpy(positions))
+        points.GetWidthsAttr().Set(Vt.FloatArray.FromNumpy(np.full(count, 0.1, dtype=np.float32)))
+        points.GetIdsAttr().Set(Vt.Int64Array.FromNumpy(np.arange(count, dtype=np.int64)))
+        self.prim.GetAttribute("physics:masses").Set(Vt.FloatArray.FromNumpy(np.ones(count, dtype=np.float32)))
+
+    def test_chunks_cover_all_points(self):
+        chunks = list(particle_io.iter_particle_chunks(self.prim, chunk_size=4))
+        self.assertEqual([len(chunk) for chunk in chunks], [4, 4, 2])
+        np.testing.assert_array_equal(np.concatenate([chunk.ids for chunk in chunks]), np.arange(10))
+        np.testing.assert_array_equal(
+            np.concatenate([chunk.points for chunk in chunks]),
+            particle_io.read_particles(self.prim).points,
+        )
+        for chunk in chunks:
+            self.assertIsNone(chunk.velocities)
+            np.testing.assert_allclose(chunk.radii, 0.05)
+            self.assertFalse(chunk.points.flags.owndata)
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            next(particle_io.iter_particle_chunks(self.prim, chunk_size=0))
+
+
+def _make_chunk(start: int, count: int) -> particle_io.ParticleArrays:
+    ids = np.arange(start, start + count, dtype=np.int64)
+    return particle_io.ParticleArrays(
+        points=np.stack([ids, ids, ids], axis=1).astype(np.float32),
+        velocities=np.zeros((count, 3), dtype=np.float32),
+        radii=np.full(count, 0.25, dtype=np.float32),
+        ids=ids,
+        masses=np.full(count, 2.0, dtype=np.float32),
+    )
+
+
+class TestWriteParticleAsset(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.tmpdir.name) / "sand.usda"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_round_trip(self):
+        chunks = (_make_chunk(start, 4) for start in range(0, 12, 4))
+        particle_io.write_particle_asset(self.path, chunks, simulation_owner="/World/PhysicsScene")
+        for index in range(3):
+            self.assertTrue((self.path.parent / f"sand.chunk{index:04d}.usdc").exists())
+
+        stage = Usd.Stage.Open(self.path.as_posix())
+        body = stage.GetDefaultPrim()
+        self.assertEqual(body.GetName(), "Particles")
+        self.assertIn("PhysicsDeformableBodyAPI", body.GetMetadata("apiSchemas").GetAddedOrExplicitItems())
+        self.assertEqual(body.GetRelationship("physics:simulationOwner").GetTargets(), ["/World/PhysicsScene"])
+
+        prims = particle_io.body_particle_prims(body)
+        self.assertEqual([prim.GetName() for prim in prims], ["Chunk0000", "Chunk0001", "Chunk0002"])
+        arrays = [particle_io.read_particles(prim) for prim in prims]
+        np.testing.assert_array_equal(np.concatenate([array.ids for array in arrays]), np.arange(12))
+        np.testing.assert_allclose(np.concatenate([array.radii for array in arrays]), 0.25)
+        np.testing.assert_allclose(np.concatenate([array.masses for array in arrays]), 2.0)
+        self.assertEqual(UsdGeom.Points(prims[0]).GetWidthsInterpolation(), UsdGeom.Tokens.vertex)
+
+        extent = UsdGeom.Points(prims[1]).GetExtentAttr().Get()
+        np.testing.assert_allclose(np.asarray(extent), [[3.75] * 3, [7.25] * 3])
+
+    def test_payloads_can_be_deferred(self):
+        particle_io.write_particle_asset(self.path, [_make_chunk(0, 2), _make_chunk(2, 2)])
+        stage = Usd.Stage.Open(self.path.as_posix(), Usd.Stage.LoadNone)
+        body = stage.GetDefaultPrim()
+        self.assertEqual(len(body.GetFilteredChildren(Usd.PrimAllPrimsPredicate)), 2)
+        self.assertEqual(particle_io.body_particle_prims(body), [])
+        stage.Load(body.GetPath())
+        self.assertEqual(len(particle_io.body_particle_prims(body)), 2)
+
+    def test_optional_arrays(self):
+        chunk = particle_io.ParticleArrays(points=np.zeros((3, 3), dtype=np.float32))
+        particle_io.write_particle_asset(self.path, [chunk], body_name="Body")
+        stage = Usd.Stage.Open(self.path.as_posix())
+        (prim,) = particle_io.body_particle_prims(stage.GetPrimAtPath("/Body"))
+        particles = particle_io.read_particles(prim)
+        self.assertEqual(len(particles), 3)
+        self.assertIsNone(particles.radii)
+        self.assertIsNone(particles.ids)
+
+    def test_chunk_length_mismatch(self):
+        chunk = particle_io.ParticleArrays(points=np.zeros((3, 3), dtype=np.float32), masses=np.ones(2, dtype=np.float32))
+        with self.assertRaisesRegex(ValueError, "masses"):
+            particle_io.write_particle_asset(self.path, [chunk])
+
+    def test_single_prim_body(self):
+        stage = Usd.Stage.Open(SAND_FIXTURE.as_posix())
+        sand = stage.GetPrimAtPath("/World/Sand")
+        self.assertEqual(particle_io.body_particle_prims(sand), [sand])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+import pathlib
+import tempfile
+import unittest
+
+from pxr import Sdf, Usd, UsdGeom, UsdLux, UsdPhysics, UsdShade
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.payloads import open_physics_payload, split_asset, split_assets
+
+
+def _write_robot(path: str) -> None:
+    stage = Usd.Stage.CreateNew(path)
+    UsdGeom.SetStageMetersPerUnit(stage, 0.01)
+    stage.SetDefaultPrim(UsdGeom.Xform.Define(stage, "/Robot").GetPrim())
+    UsdLux.DistantLight.Define(stage, "/Robot/Light")
+    look = UsdShade.Material.Define(stage, "/Robot/Looks/Paint")
+    UsdShade.Shader.Define(stage, "/Robot/Looks/Paint/Surface")
+
+    body = UsdGeom.Xform.Define(stage, "/Robot/Body")
+    body.AddTranslateOp().Set((0.0, 0.0, 1.0))
+    UsdPhysics.RigidBodyAPI.Apply(body.GetPrim())
+    visual = UsdGeom.Mesh.Define(stage, "/Robot/Body/Visual")
+    visual.CreatePointsAttr([(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0)])
+    UsdShade.MaterialBindingAPI.Apply(visual.GetPrim()).Bind(look)
+    collider = UsdGeom.Cube.Define(stage, "/Robot/Body/Collider")
+    collider.CreateSizeAttr(0.5)
+    collider.CreateDisplayColorAttr([(1.0, 0.0, 0.0)])
+    UsdPhysics.CollisionAPI.Apply(collider.GetPrim())
+    joint = UsdPhysics.RevoluteJoint.Define(stage, "/Robot/Joint")
+    joint.CreateBody1Rel().SetTargets(["/Robot/Body"])
+    joint.GetPrim().ApplyAPI("NewtonJointAPI")
+    joint.GetPrim().GetAttribute("newton:armature").Set(0.25)
+
+    points = UsdGeom.Points.Define(stage, "/Robot/Sand")
+    points.GetPrim().ApplyAPI("NewtonPointsDeformableSimAPI")
+    points.CreatePointsAttr([(0.0, 0.0, 0.0), (0.0, 0.0, 1.0)])
+    points.CreateWidthsAttr([0.1, 0.1])
+    points.CreateDisplayColorAttr([(0.8, 0.7, 0.5)])
+    stage.Save()
+
+
+def _paths(stage: Usd.Stage) -> list[str]:
+    return [str(prim.GetPath()) for prim in stage.Traverse()]
+
+
+class TestSplitAsset(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.asset = pathlib.Path(self.directory.name, "robot.usda").as_posix()
+        _write_robot(self.asset)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_split_asset(self):
+        split = split_asset(self.asset, pathlib.Path(self.directory.name, "split"))
+        self.assertEqual(split.physics.name, "robot.physics.usdc")
+        self.assertEqual(split.render.name, "robot.render.usdc")
+
+        original = Usd.Stage.Open(self.asset)
+        stage = Usd.Stage.Open(split.root.as_posix())
+        self.assertEqual(_paths(stage), _paths(original))
+        self.assertEqual(UsdGeom.GetStageMetersPerUnit(stage), 0.01)
+        for prim in original.Traverse():
+            composed = stage.GetPrimAtPath(prim.GetPath())
+            self.assertEqual(composed.GetTypeName(), prim.GetTypeName())
+            self.assertEqual(composed.GetAppliedSchemas(), prim.GetAppliedSchemas())
+            for attr in prim.GetAuthoredAttributes():
+                self.assertEqual(composed.GetAttribute(attr.GetName()).Get(), attr.Get(), attr.GetPath())
+
+        physics = open_physics_payload(split.root)
+        self.assertEqual(_paths(physics), ["/Robot", "/Robot/Body", "/Robot/Body/Collider", "/Robot/Joint", "/Robot/Sand"])
+        self.assertEqual(physics.GetPrimAtPath("/Robot/Body").GetAttribute("xformOp:translate").Get(), (0.0, 0.0, 1.0))
+        self.assertEqual(physics.GetPrimAtPath("/Robot/Joint").GetAttribute("newton:armature").Get(), 0.25)
+        self.assertEqual(len(physics.GetPrimAtPath("/Robot/Sand").GetAttribute("points").Get()), 2)
+        self.assertEqual(UsdGeom.GetStageMetersPerUnit(physics), 0.01)
+
+        # the physics layer only carries the properties Newton consumes
+        layer = Sdf.Layer.FindOrOpen(split.physics.as_posix())
+        self.assertIsNone(layer.GetPropertyAtPath("/Robot/Body/Collider.primvars:displayColor"))
+        self.assertIsNotNone(layer.GetPropertyAtPath("/Robot/Sand.widths"))
+        self.assertIsNone(layer.GetPrimAtPath("/Robot/Body/Visual"))
+        self.assertIsNone(layer.GetPrimAtPath("/Robot/Looks"))
+        render = Sdf.Layer.FindOrOpen(split.render.as_posix())
+        self.assertIsNotNone(render.GetPrimAtPath("/Robot/Looks/Paint/Surface"))
+        self.assertIsNone(render.GetPrimAtPath("/Robot/Joint"))
+
+    def test_particle_materials(self):
+        stage = Usd.Stage.Open(self.asset)
+        materials = {}
+        for name in ("Fine", "Coarse"):
+            materials[name] = UsdShade.Material.Define(stage, f"/Robot/Materials/{name}")
+            materials[name].GetPrim().ApplyAPI("NewtonMPMMaterialAPI")
+        sand = stage.GetPrimAtPath("/Robot/Sand")
+        sand.GetRelationship("newton:mpm:materials").SetTargets([materials["Fine"].GetPath()])
+        binding = UsdShade.MaterialBindingAPI.Apply(sand)
+        coarse = binding.CreateMaterialBindSubset("Coarse", [1], UsdGeom.Tokens.point)
+        UsdShade.MaterialBindingAPI.Apply(coarse.GetPrim()).Bind(materials["Coarse"], UsdShade.Tokens.weakerThanDescendants, "physics")
+        binding.CreateMaterialBindSubset("Highlight", [0], UsdGeom.Tokens.point)
+        stage.Save()
+
+        split = split_asset(self.asset, pathlib.Path(self.directory.name, "split"))
+        physics = open_physics_payload(split.root)
+        for path in ("/Robot/Materials/Fine", "/Robot/Materials/Coarse", "/Robot/Sand/Coarse"):
+            self.assertTrue(physics.GetPrimAtPath(path), path)
+        self.assertFalse(physics.GetPrimAtPath("/Robot/Sand/Highlight").IsLoaded())
+        subset = UsdGeom.Subset(physics.GetPrimAtPath("/Robot/Sand/Coarse"))
+        self.assertEqual(list(subset.GetIndicesAttr().Get()), [1])
+        self.assertEqual(UsdShade.MaterialBindingAPI(subset.GetPrim()).ComputeBoundMaterial("physics")[0].GetPath(), materials["Coarse"].GetPath())
+
+    def test_collection_bindings(self):
+        stage = Usd.Stage.Open(self.asset)
+        rubber = UsdShade.Material.Define(stage, "/Robot/Materials/Rubber")
+        UsdPhysics.MaterialAPI.Apply(rubber.GetPrim())
+        body = stage.GetPrimAtPath("/Robot/Body")
+        feet = Usd.CollectionAPI.Apply(body, "feet")
+        feet.CreateIncludesRel().AddTarget("/Robot/Body/Collider")
+        UsdShade.MaterialBindingAPI.Apply(body).Bind(feet, rubber, "feet", UsdShade.Tokens.weakerThanDescendants, "physics")
+        stage.Save()
+
+        split = split_asset(self.asset, pathlib.Path(self.directory.name, "split"))
+        # bindings with the physics purpose are physics properties
+        name = "material:binding:collection:physics:feet"
+        self.assertIsNotNone(Sdf.Layer.FindOrOpen(split.physics.as_posix()).GetPropertyAtPath(f"/Robot/Body.{name}"))
+        self.assertIsNone(Sdf.Layer.FindOrOpen(split.root.as_posix()).GetPropertyAtPath(f"/Robot/Body.{name}"))
+        physics = open_physics_payload(split.root)
+        collider = physics.GetPrimAtPath("/Robot/Body/Collider")
+        self.assertEqual(UsdShade.MaterialBindingAPI(collider).ComputeBoundMaterial("physics")[0].GetPath(), rubber.GetPath())
+
+    def test_instances(self):
+        scene = pathlib.Path(self.directory.name, "scene.usda").as_posix()
+        stage = Usd.Stage.CreateNew(scene)
+        stage.SetDefaultPrim(stage.DefinePrim("/World", "Xform"))
+        for index in range(2):
+            clone = stage.DefinePrim(f"/World/Robot{index}")
+            clone.GetReferences().AddReference("./robot.usda")
+            clone.SetInstanceable(True)
+        stage.Save()
+
+        split = split_asset(scene, pathlib.Path(self.directory.name, "split"))
+        physics = open_physics_payload(split.root)
+        for index in range(2):
+            prim = physics.GetPrimAtPath(f"/World/Robot{index}/Body/Collider")
+            self.assertTrue(prim.HasAPI(UsdPhysics.CollisionAPI))
+            self.assertFalse(prim.IsInstanceProxy())
+        self.assertFalse(physics.GetPrimAtPath("/World/Robot0/Body/Visual").IsLoaded())
+        # instances are expanded in place
+        instanced = [str(prim.GetPath()) for prim in Usd.PrimRange.Stage(stage, Usd.TraverseInstanceProxies())]
+        self.assertEqual(_paths(Usd.Stage.Open(split.root.as_posix())), instanced)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            split_asset(self.asset, self.directory.name)
+        with self.assertRaises(ValueError):
+            split_asset(pathlib.Path(self.directory.name, "missing.usda"), pathlib.Path(self.directory.name, "split"))
+        # physics relationships can not target prims outside the default prim
+        stage = Usd.Stage.Open(self.asset)
+        stage.GetPrimAtPath("/Robot/Joint").GetRelationship("physics:body0").SetTargets(["/World"])
+        stage.Save()
+        with self.assertRaisesRegex(ValueError, "outside the default prim"):
+            split_asset(self.asset, pathlib.Path(self.directory.name, "split"))
+        unanchored = pathlib.Path(self.directory.name, "unanchored.usda").as_posix()
+        Usd.Stage.CreateNew(unanchored).Save()
+        with self.assertRaises(ValueError):
+            split_asset(unanchored, pathlib.Path(self.directory.name, "split"))
+
+    def test_split_assets(self):
+        other = pathlib.Path(self.directory.name, "other", "robot.usdc").as_posix()
+        Sdf.Layer.FindOrOpen(self.asset).Export(other)
+        output = pathlib.Path(self.directory.name, "split")
+        with self.assertRaises(ValueError):
+            split_assets([self.asset, other], output)
+
+        copy = pathlib.Path(self.directory.name, "copy.usdc").as_posix()
+        Sdf.Layer.FindOrOpen(self.asset).Export(copy)
+        splits = split_assets([self.asset, copy], output, max_workers=2)
+        self.assertEqual([split.root.name for split in splits], ["robot.usda", "copy.usda"])
+        for split in splits:
+            stage = open_physics_payload(split.root)
+            self.assertTrue(stage.GetPrimAtPath("/Robot/Joint"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,7 @@
 import pathlib
 import unittest
 
-from pxr import Plug
+from pxr import Plug, Usd
 
 import newton_usd_schemas
 
@@ -15,6 +15,17 @@ class TestNewtonPlugin(unittest.TestCase):
         self.assertIsInstance(plugin, Plug.Plugin)
         self.assertEqual(plugin.resourcePath, pathlib.Path(newton_usd_schemas.__file__).parent.as_posix())
 
+    def test_warmup(self):
+        schemas = newton_usd_schemas.warmup()
+        self.assertEqual(len(schemas), len(Plug.Registry().GetPluginWithName("newton").metadata["Types"]))
+        self.assertIn("NewtonSceneAPI", schemas)
+        self.assertIn("NewtonActuator", schemas)
+        registry = Usd.SchemaRegistry()
+        for schema in schemas:
+            self.assertIsNotNone(registry.FindAppliedAPIPrimDefinition(schema) or registry.FindConcretePrimDefinition(schema), schema)
+        # warming up again is idempotent
+        self.assertEqual(newton_usd_schemas.warmup(), schemas)
+
 
 if __name__ == "__main__":
     unittest.main()
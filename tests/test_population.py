@@ -0,0 +1,205 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import pathlib
+import tempfile
+import unittest
+
+from pxr import Sdf, Usd, UsdGeom, UsdLux, UsdPhysics, UsdShade
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.population import (
+    clear_physics_mask_cache,
+    compute_physics_mask,
+    is_physics_prim,
+    open_physics_stage,
+    physics_population_mask,
+)
+
+
+def _scene(stage: Usd.Stage) -> None:
+    UsdPhysics.Scene.Define(stage, "/World/PhysicsScene").GetPrim().ApplyAPI("NewtonSceneAPI")
+    UsdLux.DistantLight.Define(stage, "/World/Lights/Key")
+    UsdShade.Material.Define(stage, "/World/Looks/Paint")
+    UsdGeom.Mesh.Define(stage, "/World/Set/Table")
+
+    physics_material = UsdShade.Material.Define(stage, "/World/PhysicsMaterials/Rubber")
+    UsdPhysics.MaterialAPI.Apply(physics_material.GetPrim())
+    unbound = UsdShade.Material.Define(stage, "/World/PhysicsMaterials/Unbound")
+    UsdPhysics.MaterialAPI.Apply(unbound.GetPrim())
+
+    body = UsdGeom.Xform.Define(stage, "/World/Robot/Body").GetPrim()
+    UsdPhysics.RigidBodyAPI.Apply(body)
+    UsdGeom.Mesh.Define(stage, "/World/Robot/Body/Visual")
+    collider = UsdGeom.Cube.Define(stage, "/World/Robot/Body/Collider").GetPrim()
+    UsdPhysics.CollisionAPI.Apply(collider)
+    UsdShade.MaterialBindingAPI.Apply(collider).Bind(physics_material, UsdShade.Tokens.weakerThanDescendants, "physics")
+    joint = UsdPhysics.RevoluteJoint.Define(stage, "/World/Robot/Joints/Joint")
+    joint.CreateBody0Rel().SetTargets(["/World/Anchor"])
+    joint.CreateBody1Rel().SetTargets(["/World/Robot/Body"])
+    UsdGeom.Xform.Define(stage, "/World/Anchor")
+    actuator = stage.DefinePrim("/World/Robot/Actuators/Actuator", "NewtonActuator")
+    actuator.GetRelationship("newton:targets").SetTargets(["/World/Robot/Joints/Joint"])
+    stage.DefinePrim("/World/Robot/Sensors/Site", "Cube").ApplyAPI("NewtonSiteAPI")
+    stage.DefinePrim("/World/Cloth", "Mesh").SetMetadata("apiSchemas", Sdf.TokenListOp.Create(prependedItems=["PhysicsDeformableBodyAPI"]))
+
+
+EXPECTED = [
+    "/World/Anchor",
+    "/World/Cloth",
+    "/World/PhysicsMaterials/Rubber",
+    "/World/PhysicsScene",
+    "/World/Robot/Actuators/Actuator",
+    "/World/Robot/Body",
+    "/World/Robot/Joints/Joint",
+    "/World/Robot/Sensors/Site",
+]
+
+
+class TestPhysicsPopulationMask(unittest.TestCase):
+    def setUp(self):
+        clear_physics_mask_cache()
+        self.stage = Usd.Stage.CreateInMemory()
+        _scene(self.stage)
+
+    def tearDown(self):
+        clear_physics_mask_cache()
+
+    def test_is_physics_prim(self):
+        stage = self.stage
+        # bound materials and joint bodies are populated as relationship targets
+        for path in set(EXPECTED) - {"/World/Anchor", "/World/PhysicsMaterials/Rubber"}:
+            self.assertTrue(is_physics_prim(stage.GetPrimAtPath(path)), path)
+        for path in ("/World/Lights/Key", "/World/Looks/Paint", "/World/Set/Table", "/World/Anchor", "/World/PhysicsMaterials/Rubber"):
+            self.assertFalse(is_physics_prim(stage.GetPrimAtPath(path)), path)
+
+    def test_compute_physics_mask(self):
+        mask = compute_physics_mask(self.stage)
+        self.assertEqual([str(path) for path in mask.GetPaths()], EXPECTED)
+        self.assertTrue(mask.Includes("/World/Robot/Body/Visual"))
+        self.assertFalse(mask.Includes("/World/Lights"))
+
+        masked = Usd.Stage.OpenMasked(self.stage.GetRootLayer(), mask)
+        self.assertTrue(masked.GetPrimAtPath("/World/Robot/Body/Collider"))
+        self.assertTrue(masked.GetPrimAtPath("/World/PhysicsMaterials/Rubber"))
+        for path in ("/World/Lights", "/World/Looks", "/World/Set", "/World/PhysicsMaterials/Unbound"):
+            self.assertFalse(masked.GetPrimAtPath(path), path)
+
+    def test_mpm_materials(self):
+        sand_material = UsdShade.Material.Define(self.stage, "/World/PhysicsMaterials/Sand")
+        sand_material.GetPrim().ApplyAPI("NewtonMPMMaterialAPI")
+        sand = UsdGeom.Points.Define(self.stage, "/World/Sand").GetPrim()
+        sand.ApplyAPI("NewtonPointsDeformableSimAPI")
+        sand.GetRelationship("newton:mpm:materials").SetTargets([sand_material.GetPath()])
+        mask = compute_physics_mask(self.stage)
+        self.assertIn(Sdf.Path("/World/Sand"), mask.GetPaths())
+        self.assertIn(Sdf.Path("/World/PhysicsMaterials/Sand"), mask.GetPaths())
+        self.assertFalse(mask.Includes("/World/PhysicsMaterials/Unbound"))
+
+    def test_inherited_bindings(self):
+        stage = self.stage
+        ice = UsdShade.Material.Define(stage, "/World/PhysicsMaterials/Ice")
+        UsdPhysics.MaterialAPI.Apply(ice.GetPrim())
+        steel = UsdShade.Material.Define(stage, "/World/PhysicsMaterials/Steel")
+        UsdPhysics.MaterialAPI.Apply(steel.GetPrim())
+        # an ancestor binding applies to the colliders beneath it
+        robot = stage.GetPrimAtPath("/World/Robot")
+        UsdShade.MaterialBindingAPI.Apply(robot).Bind(ice, UsdShade.Tokens.weakerThanDescendants, "physics")
+        # a collection binding on a render-only prim applies to the members of its collection
+        parts = Usd.CollectionAPI.Apply(stage.DefinePrim("/World/Parts"), "feet")
+        parts.CreateIncludesRel().AddTarget("/World/Robot/Body")
+        UsdShade.MaterialBindingAPI.Apply(stage.GetPrimAtPath("/World")).Bind(
+            parts, steel, "feet", UsdShade.Tokens.strongerThanDescendants, "physics"
+        )
+        # an all-purpose binding of a render material is not populated
+        visual = stage.GetPrimAtPath("/World/Robot/Body/Visual")
+        UsdShade.MaterialBindingAPI.Apply(visual).Bind(UsdShade.Material(stage.GetPrimAtPath("/World/Looks/Paint")))
+
+        mask = compute_physics_mask(stage)
+        self.assertTrue(mask.Includes("/World/PhysicsMaterials/Ice"))
+        self.assertTrue(mask.Includes("/World/PhysicsMaterials/Steel"))
+        self.assertTrue(mask.Includes("/World/Parts"))
+        self.assertFalse(mask.Includes("/World/Looks"))
+        self.assertFalse(mask.Includes("/World/PhysicsMaterials/Unbound"))
+
+    def test_unloaded_payloads(self):
+        with tempfile.TemporaryDirectory() as directory:
+            props = Usd.Stage.CreateNew(pathlib.Path(directory, "props.usda").as_posix())
+            UsdGeom.Mesh.Define(props, "/Props/Chair")
+            props.SetDefaultPrim(props.GetPrimAtPath("/Props"))
+            props.Save()
+            self.stage.DefinePrim("/World/Set/Props").GetPayloads().AddPayload(props.GetRootLayer().identifier)
+            self.stage.DefinePrim("/World/Lights/Props").GetPayloads().AddPayload(props.GetRootLayer().identifier)
+            self.stage.GetPrimAtPath("/World/Lights").SetActive(False)
+            self.stage.Unload("/World/Set/Props")
+
+            # the contents of an unloaded payload cannot be scanned, so it is masked whole
+            mask = compute_physics_mask(self.stage)
+            self.assertTrue(mask.Includes("/World/Set/Props/Chair"))
+            self.assertFalse(mask.Includes("/World/Set/Table"))
+            self.assertFalse(mask.Includes("/World/Lights"))
+            self.stage.Load("/World/Set/Props")
+            self.assertEqual([str(path) for path in compute_physics_mask(self.stage).GetPaths()], EXPECTED)
+
+    def test_instances(self):
+        robot = Usd.Stage.CreateInMemory()
+        body = UsdGeom.Xform.Define(robot, "/Robot/Body").GetPrim()
+        UsdPhysics.RigidBodyAPI.Apply(body)
+        UsdGeom.Mesh.Define(robot, "/Robot/Visual")
+        robot.SetDefaultPrim(robot.GetPrimAtPath("/Robot"))
+        for index in range(2):
+            instance = self.stage.DefinePrim(f"/World/Clones/Robot{index}")
+            instance.GetReferences().AddReference(robot.GetRootLayer().identifier)
+            instance.SetInstanceable(True)
+        paths = compute_physics_mask(self.stage).GetPaths()
+        self.assertIn(Sdf.Path("/World/Clones/Robot0"), paths)
+        self.assertIn(Sdf.Path("/World/Clones/Robot1"), paths)
+
+    def test_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            asset = pathlib.Path(directory, "scene.usda").as_posix()
+            self.stage.GetRootLayer().Export(asset)
+            mask = physics_population_mask(asset)
+            self.assertEqual([str(path) for path in mask.GetPaths()], EXPECTED)
+            self.assertIs(physics_population_mask(asset), mask)
+            self.assertIsNot(physics_population_mask(asset, refresh=True), mask)
+
+            stage = open_physics_stage(asset)
+            self.assertEqual(stage.GetPopulationMask(), mask)
+            self.assertFalse(stage.GetPrimAtPath("/World/Lights"))
+            self.assertTrue(stage.GetPrimAtPath("/World/Robot/Body"))
+
+            # modifying the asset invalidates its cached mask
+            stage = Usd.Stage.Open(asset)
+            stage.DefinePrim("/World/Body2", "Xform").ApplyAPI("PhysicsRigidBodyAPI")
+            stage.Save()
+            status = pathlib.Path(asset).stat()
+            os.utime(asset, (status.st_atime, status.st_mtime + 10))
+            self.assertIn(Sdf.Path("/World/Body2"), physics_population_mask(asset).GetPaths())
+
+        # modifying a sublayer of the asset invalidates its cached mask
+        with tempfile.TemporaryDirectory() as directory:
+            asset = pathlib.Path(directory, "scene.usda").as_posix()
+            sublayer = pathlib.Path(directory, "edits.usda").as_posix()
+            self.stage.GetRootLayer().Export(asset)
+            Sdf.Layer.CreateNew(sublayer).Save()
+            layer = Sdf.Layer.FindOrOpen(asset)
+            layer.subLayerPaths.append("./edits.usda")
+            layer.Save()
+            mask = physics_population_mask(asset)
+            self.assertIs(physics_population_mask(asset), mask)
+
+            stage = Usd.Stage.Open(sublayer)
+            stage.DefinePrim("/World/Body2", "Xform").ApplyAPI("PhysicsRigidBodyAPI")
+            stage.Save()
+            status = pathlib.Path(sublayer).stat()
+            os.utime(sublayer, (status.st_atime, status.st_mtime + 10))
+            self.assertIn(Sdf.Path("/World/Body2"), physics_population_mask(asset).GetPaths())
+
+        with self.assertRaises(ValueError):
+            physics_population_mask(pathlib.Path(directory, "missing.usda").as_posix())
+
+
+if __name__ == "__main__":
+    unittest.main()
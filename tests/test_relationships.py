@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+import numpy as np
+from pxr import Sdf, Usd, UsdGeom, UsdPhysics
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.actuators import read_actuator_arrays
+from newton_usd_schemas.extraction import extract_layout
+from newton_usd_schemas.relationships import PathIndex
+
+
+def _stage() -> Usd.Stage:
+    stage = Usd.Stage.CreateInMemory()
+    for index in range(3):
+        UsdPhysics.RigidBodyAPI.Apply(UsdGeom.Xform.Define(stage, f"/World/Body{index}").GetPrim())
+    UsdGeom.Xform.Define(stage, "/World/Anchor")
+    for index, (body0, body1) in enumerate((("Anchor", "Body0"), ("Body0", "Body1"), ("Body1", "Body2"), (None, "Missing"))):
+        joint = UsdPhysics.RevoluteJoint.Define(stage, f"/World/Joint{index}")
+        if body0:
+            joint.CreateBody0Rel().SetTargets([f"/World/{body0}"])
+        joint.CreateBody1Rel().SetTargets([f"/World/{body1}"])
+    return stage
+
+
+class TestPathIndex(unittest.TestCase):
+    def test_resolve_relationship(self):
+        stage = _stage()
+        layout = extract_layout(stage, ["PhysicsRigidBodyAPI", "PhysicsJoint"])
+        bodies = PathIndex(layout.paths["PhysicsRigidBodyAPI"])
+        self.assertEqual(len(bodies), 3)
+        self.assertEqual(bodies.index(Sdf.Path("/World/Body1")), 1)
+        self.assertEqual(bodies.index(Sdf.Path("/World/Anchor")), -1)
+
+        body0 = bodies.resolve_relationship(stage, layout.paths["PhysicsJoint"], "physics:body0")
+        self.assertEqual(body0.first().dtype, np.int32)
+        np.testing.assert_array_equal(body0.first(), [-1, 0, 1, -1])
+        np.testing.assert_array_equal(body0.offsets, [0, 1, 2, 3, 3])
+        self.assertEqual(body0.dangling, ((Sdf.Path("/World/Joint0"), Sdf.Path("/World/Anchor")),))
+
+        body1 = bodies.resolve_relationship(stage, layout.paths["PhysicsJoint"], "physics:body1")
+        np.testing.assert_array_equal(body1.first(), [0, 1, 2, -1])
+        self.assertEqual(body1.dangling, ((Sdf.Path("/World/Joint3"), Sdf.Path("/World/Missing")),))
+        self.assertIn("1 of 4 `physics:body1` targets of 4 prims are dangling: /World/Joint3 -> /World/Missing", body1.summary())
+
+        mimic = bodies.resolve_relationship(stage, [Sdf.Path("/World/Joint0"), Sdf.Path("/World/Nowhere")], "newton:mimicJoint")
+        np.testing.assert_array_equal(mimic.first(), [-1, -1])
+        self.assertEqual(mimic.summary(), "")
+
+    def test_resolve(self):
+        stage = Usd.Stage.CreateInMemory()
+        joints = [UsdPhysics.RevoluteJoint.Define(stage, f"/World/Joint{index}").GetPath() for index in range(3)]
+        actuators = stage.DefinePrim("/World/Actuators", "NewtonActuatorArray")
+        actuators.GetRelationship("newton:targets").SetTargets([joints[2], joints[0], "/World/Gone"])
+        arrays = read_actuator_arrays(stage)
+
+        index = PathIndex(joints)
+        resolved = index.resolve([arrays.targets], "newton:targets", arrays.prims)
+        np.testing.assert_array_equal(resolved.indices, [2, 0, -1])
+        self.assertEqual(resolved.dangling, ((Sdf.Path("/World/Actuators"), Sdf.Path("/World/Gone")),))
+
+        many = index.resolve([[joints[1]]] * 7, "newton:targets")
+        self.assertEqual(len(many), 7)
+        np.testing.assert_array_equal(many.first(), [1] * 7)
+        dangling = index.resolve([[Sdf.Path(f"/Gone{row}")] for row in range(7)], "newton:targets")
+        self.assertTrue(dangling.summary().endswith("and 2 more"))
+        with self.assertRaises(ValueError):
+            index.resolve([[joints[0]]], sources=[])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+import numpy as np
+from pxr import Gf, Sdf, Usd, UsdPhysics
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.replication import replicate
+
+
+class TestReplicate(unittest.TestCase):
+    def setUp(self):
+        self.stage: Usd.Stage = Usd.Stage.CreateInMemory()
+        self.layer = self.stage.GetRootLayer()
+        self.stage.DefinePrim("/Template", "Xform")
+        joint = UsdPhysics.RevoluteJoint.Define(self.stage, "/Template/Joint").GetPrim()
+        joint.ApplyAPI("NewtonJointAPI")
+        joint.GetAttribute("newton:armature").Set(0.5)
+        actuator = self.stage.DefinePrim("/Template/Actuator", "NewtonActuator")
+        actuator.ApplyAPI("NewtonPDControlAPI")
+        actuator.GetRelationship("newton:targets").SetTargets(["/Template/Joint"])
+        self.clones = [f"/World/envs/env_{index}" for index in range(4)]
+
+    def test_clones(self):
+        paths = replicate(self.layer, "/Template", self.clones)
+        self.assertEqual(paths, tuple(Sdf.Path(clone) for clone in self.clones))
+        self.assertEqual(self.stage.GetPrimAtPath("/World/envs").GetSpecifier(), Sdf.SpecifierDef)
+        for clone in self.clones:
+            joint = self.stage.GetPrimAtPath(f"{clone}/Joint")
+            self.assertTrue(joint.HasAPI("NewtonJointAPI"))
+            self.assertEqual(joint.GetAttribute("newton:armature").Get(), 0.5)
+            # relationships to prims within the template are retargeted to the clone
+            targets = self.stage.GetPrimAtPath(f"{clone}/Actuator").GetRelationship("newton:targets").GetTargets()
+            self.assertEqual(targets, [Sdf.Path(f"{clone}/Joint")])
+        # the template is unchanged
+        self.assertFalse(self.stage.GetPrimAtPath("/Template/Joint").GetAttribute("newton:friction").HasAuthoredValue())
+
+    def test_overrides(self):
+        friction = np.array([0.1, 0.2, 0.3, 0.4], dtype=np.float32)
+        kp = np.array([10.0, 20.0, 30.0, 40.0])
+        armature = np.array([1.0, 2.0, 3.0, 4.0], dtype=np.float32)
+        replicate(
+            self.layer,
+            "/Template",
+            self.clones,
+            {"Joint.newton:friction": friction, "Actuator.newton:kp": kp, "Joint.newton:armature": armature},
+        )
+        for index, clone in enumerate(self.clones):
+            joint = self.stage.GetPrimAtPath(f"{clone}/Joint")
+            self.assertAlmostEqual(joint.GetAttribute("newton:friction").Get(), float(friction[index]), places=6)
+            self.assertEqual(joint.GetAttribute("newton:armature").Get(), float(armature[index]))
+            self.assertEqual(self.stage.GetPrimAtPath(f"{clone}/Actuator").GetAttribute("newton:kp").Get(), kp[index])
+        self.assertEqual(self.layer.GetAttributeAtPath("/World/envs/env_0/Joint.newton:friction").typeName, Sdf.ValueTypeNames.Float)
+        self.assertFalse(self.stage.GetPrimAtPath("/Template/Actuator").GetAttribute("newton:kp").HasAuthoredValue())
+
+    def test_tuple_and_array_overrides(self):
+        inertia = np.arange(24, dtype=np.float64).reshape(4, 6)
+        gravity = np.tile(np.array([0.0, 0.0, -1.0], dtype=np.float32), (4, 1))
+        prim = self.stage.GetPrimAtPath("/Template")
+        prim.ApplyAPI("NewtonMassAPI")
+        prim.CreateAttribute("custom:direction", Sdf.ValueTypeNames.Float3).Set(Gf.Vec3f(1.0, 0.0, 0.0))
+        replicate(self.layer, "/Template", self.clones, {".newton:inertia": inertia, ".custom:direction": gravity})
+        clone = self.stage.GetPrimAtPath(self.clones[2])
+        np.testing.assert_array_equal(np.asarray(clone.GetAttribute("newton:inertia").Get()), inertia[2])
+        self.assertEqual(clone.GetAttribute("custom:direction").Get(), Gf.Vec3f(0.0, 0.0, -1.0))
+
+    def test_typed_schema_overrides(self):
+        # the type of an unauthored attribute of a prim without applied API schemas comes from its prim type
+        UsdPhysics.FixedJoint.Define(self.stage, "/Template/Fixed")
+        replicate(self.layer, "/Template", self.clones, {"Fixed.physics:jointEnabled": [True, False, True, False]})
+        enabled = [self.stage.GetPrimAtPath(f"{clone}/Fixed").GetAttribute("physics:jointEnabled").Get() for clone in self.clones]
+        self.assertEqual(enabled, [True, False, True, False])
+        with self.assertRaisesRegex(ValueError, "`.custom:value` is neither authored"):
+            replicate(Sdf.Layer.CreateAnonymous(), "/Template", self.clones, {".custom:value": np.zeros(4)}, template_layer=self.layer)
+
+    def test_referenced_overrides(self):
+        # the joint, its type and its applied schemas only come from the referenced robot
+        robot = Usd.Stage.CreateInMemory()
+        joint = UsdPhysics.PrismaticJoint.Define(robot, "/Robot/Joint").GetPrim()
+        joint.ApplyAPI("NewtonJointAPI")
+        joint.CreateAttribute("custom:gain", Sdf.ValueTypeNames.Double).Set(1.0)
+        template = self.stage.DefinePrim("/Referencing")
+        template.GetReferences().AddReference(robot.GetRootLayer().identifier, "/Robot")
+        overrides = {
+            "Joint.newton:friction": [0.1, 0.2, 0.3, 0.4],
+            "Joint.physics:lowerLimit": [-1.0, -2.0, -3.0, -4.0],
+            "Joint.custom:gain": np.ones(4),
+        }
+        replicate(self.layer, "/Referencing", self.clones, overrides)
+        for index, clone in enumerate(self.clones):
+            joint = self.stage.GetPrimAtPath(f"{clone}/Joint")
+            self.assertTrue(joint.IsA(UsdPhysics.PrismaticJoint))
+            self.assertAlmostEqual(joint.GetAttribute("newton:friction").Get(), overrides["Joint.newton:friction"][index], places=6)
+            self.assertEqual(joint.GetAttribute("physics:lowerLimit").Get(), overrides["Joint.physics:lowerLimit"][index])
+        spec = self.layer.GetPrimAtPath("/World/envs/env_0/Joint")
+        self.assertEqual(spec.specifier, Sdf.SpecifierOver)
+        self.assertEqual(spec.attributes["newton:friction"].typeName, Sdf.ValueTypeNames.Float)
+        self.assertEqual(spec.attributes["custom:gain"].typeName, Sdf.ValueTypeNames.Double)
+        with self.assertRaisesRegex(ValueError, "`Joint.newton:unknown` is neither authored"):
+            replicate(self.layer, "/Referencing", self.clones, {"Joint.newton:unknown": np.zeros(4)})
+
+    def test_template_layer(self):
+        layer = Sdf.Layer.CreateAnonymous()
+        replicate(layer, "/Template", ["/envs/env_0"], {"Joint.newton:damping": [2.0]}, template_layer=self.layer)
+        self.assertTrue(layer.GetPrimAtPath("/envs/env_0/Actuator"))
+        self.assertEqual(layer.GetAttributeAtPath("/envs/env_0/Joint.newton:damping").default, 2.0)
+        self.assertFalse(self.layer.GetPrimAtPath("/envs"))
+
+    def test_invalid(self):
+        with self.assertRaisesRegex(ValueError, "is not a prim spec"):
+            replicate(self.layer, "/Missing", self.clones)
+        with self.assertRaisesRegex(ValueError, "has 2 values but there are 4 clones"):
+            replicate(self.layer, "/Template", self.clones, {"Joint.newton:friction": [0.0, 1.0]})
+        with self.assertRaisesRegex(ValueError, "`Joint.newton:unknown` is neither authored"):
+            replicate(self.layer, "/Template", self.clones, {"Joint.newton:unknown": np.zeros(4)})
+        self.assertFalse(self.stage.GetPrimAtPath("/World"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,7 @@
 
 import unittest
 
-from pxr import Plug, Usd, UsdPhysics
+from pxr import Plug, Sdf, Usd, UsdPhysics
 
 import newton_usd_schemas  # noqa: F401
 
@@ -89,6 +89,17 @@ class TestNewtonSceneAPI(unittest.TestCase):
         self.assertTrue(attr.HasAuthoredValue())
         self.assertEqual(attr.Get(), False)
 
+    def test_time_sampled_gravity(self):
+        self.scene.ApplyAPI("NewtonSceneAPI")
+        attr = self.scene.GetAttribute("newton:gravityEnabled")
+        self.assertEqual(attr.GetVariability(), Sdf.VariabilityVarying)
+        self.assertTrue(attr.Set(False, 10.0))
+        self.assertTrue(attr.Set(True, 20.0))
+        # bool samples are held between time samples
+        self.assertEqual(attr.Get(15.0), False)
+        self.assertEqual(attr.Get(25.0), True)
+        self.assertEqual(self.scene.GetAttribute("newton:maxSolverIterations").GetVariability(), Sdf.VariabilityUniform)
+
 
 if __name__ == "__main__":
     unittest.main()
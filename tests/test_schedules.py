@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+import numpy as np
+from pxr import Gf, Sdf, Usd, UsdPhysics
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.schedules import compile_scene_schedule
+
+
+class TestSceneSchedule(unittest.TestCase):
+    def setUp(self):
+        self.stage: Usd.Stage = Usd.Stage.CreateInMemory()
+        self.scene = UsdPhysics.Scene.Define(self.stage, "/Scene")
+        self.scene.GetPrim().ApplyAPI("NewtonSceneAPI")
+        self.gravity = self.scene.GetPrim().GetAttribute("newton:gravityEnabled")
+
+    def test_default_attributes(self):
+        schedule = compile_scene_schedule(self.scene.GetPrim())
+        self.assertEqual(schedule.scene_path, Sdf.Path("/Scene"))
+        self.assertEqual(sorted(schedule.parameters), ["newton:gravityEnabled", "physics:gravityDirection", "physics:gravityMagnitude"])
+        # unsampled attributes hold their value
+        gravity = schedule.parameters["newton:gravityEnabled"]
+        np.testing.assert_array_equal(gravity.times, [0.0])
+        self.assertTrue(gravity.evaluate(100.0))
+
+    def test_held_values(self):
+        self.gravity.Set(True, 0.0)
+        self.gravity.Set(False, 10.0)
+        self.gravity.Set(True, 20.0)
+        schedule = compile_scene_schedule(self.scene.GetPrim(), ["newton:gravityEnabled"]).parameters["newton:gravityEnabled"]
+        self.assertFalse(schedule.linear)
+        np.testing.assert_array_equal(schedule.times, [0.0, 10.0, 20.0])
+
+        times = np.array([-5.0, 0.0, 9.9, 10.0, 15.0, 20.0, 100.0])
+        expected = [self.gravity.Get(time) for time in times]
+        np.testing.assert_array_equal(schedule.evaluate(times), expected)
+        self.assertEqual(schedule.evaluate(12.0).shape, ())
+
+    def test_linear_values(self):
+        magnitude = self.scene.GetGravityMagnitudeAttr()
+        magnitude.Set(0.0, 0.0)
+        magnitude.Set(9.81, 100.0)
+        direction = self.scene.GetGravityDirectionAttr()
+        direction.Set(Gf.Vec3f(0, 0, -1), 0.0)
+        direction.Set(Gf.Vec3f(0, -1, 0), 10.0)
+
+        schedule = compile_scene_schedule(self.scene.GetPrim(), ["physics:gravityMagnitude", "physics:gravityDirection"])
+        np.testing.assert_array_equal(schedule.keyframe_times, [0.0, 10.0, 100.0])
+        times = np.array([-1.0, 0.0, 2.5, 50.0, 100.0, 150.0])
+        values = schedule.evaluate(times)
+        np.testing.assert_allclose(values["physics:gravityMagnitude"], [magnitude.Get(time) for time in times], rtol=1e-6)
+        self.assertEqual(values["physics:gravityDirection"].shape, (6, 3))
+        np.testing.assert_allclose(values["physics:gravityDirection"], [direction.Get(time) for time in times], rtol=1e-6)
+
+        self.stage.SetInterpolationType(Usd.InterpolationTypeHeld)
+        held = compile_scene_schedule(self.scene.GetPrim(), ["physics:gravityMagnitude"]).parameters["physics:gravityMagnitude"]
+        self.assertAlmostEqual(float(held.evaluate(50.0)), magnitude.Get(50.0))
+
+    def test_invalid_attributes(self):
+        with self.assertRaisesRegex(ValueError, "uniform"):
+            compile_scene_schedule(self.scene.GetPrim(), ["newton:maxSolverIterations"])
+        with self.assertRaisesRegex(ValueError, "does not have"):
+            compile_scene_schedule(self.scene.GetPrim(), ["newton:bogus"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+import importlib.util
+import pathlib
+import unittest
+
+from pxr import Plug, Sdf, Usd, UsdGeom, UsdPhysics
+
+from newton_usd_schemas import schemas
+
+TOOL = pathlib.Path(__file__).parent.parent / "tools" / "generate_schema_wrappers.py"
+
+
+def _definition(schema: type[schemas._SchemaBase]) -> Usd.PrimDefinition:
+    registry = Usd.SchemaRegistry()
+    if issubclass(schema, schemas._TypedSchemaBase):
+        return registry.FindConcretePrimDefinition(schema.schemaName)
+    return registry.FindAppliedAPIPrimDefinition(schema.schemaName)
+
+
+def _local_properties(schema: type[schemas._SchemaBase]) -> set[str]:
+    definition = _definition(schema)
+    names = set(definition.GetPropertyNames())
+    registry = Usd.SchemaRegistry()
+    for api_schema in definition.GetAppliedAPISchemas():
+        if api_schema != schema.schemaName:
+            names -= set(registry.FindAppliedAPIPrimDefinition(api_schema).GetPropertyNames())
+    return names
+
+
+def _accessor(name: str) -> str:
+    return "".join(word[0].upper() + word[1:] for word in name.split(":")[1:])
+
+
+class TestSchemaWrappers(unittest.TestCase):
+    def test_up_to_date(self):
+        spec = importlib.util.spec_from_file_location("generate_schema_wrappers", TOOL)
+        tool = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(tool)
+        self.assertEqual(tool.generate(), pathlib.Path(schemas.__file__).read_text())
+
+    def test_every_schema_has_a_wrapper(self):
+        types = Plug.Registry().GetPluginWithName("newton").metadata["Types"]
+        names = {info["schemaIdentifier"] for info in types.values()}
+        self.assertEqual(names, set(schemas.__all__) - {"Tokens"})
+        for name in names:
+            schema = getattr(schemas, name)
+            self.assertEqual(schema.schemaName, name)
+            self.assertIsNotNone(_definition(schema), name)
+
+    def test_properties_match_registry(self):
+        for name in set(schemas.__all__) - {"Tokens"}:
+            schema = getattr(schemas, name)
+            definition = _definition(schema)
+            self.assertEqual(set(schema.GetSchemaAttributeNames()) | set(schema.GetSchemaRelationshipNames()), _local_properties(schema), name)
+            for attr_name in schema.GetSchemaAttributeNames():
+                attr = definition.GetAttributeDefinition(attr_name)
+                self.assertTrue(attr, attr_name)
+            for rel_name in schema.GetSchemaRelationshipNames():
+                self.assertTrue(definition.GetRelationshipDefinition(rel_name), rel_name)
+
+    def test_created_attributes_match_registry(self):
+        stage = Usd.Stage.CreateInMemory()
+        for name in set(schemas.__all__) - {"Tokens"}:
+            schema = getattr(schemas, name)
+            definition = _definition(schema)
+            prim = stage.OverridePrim(f"/{name}")
+            wrapper = schema(prim)
+            for attr_name in schema.GetSchemaAttributeNames():
+                accessor = _accessor(attr_name)
+                attr = getattr(wrapper, f"Create{accessor}Attr")()
+                self.assertEqual(attr.GetName(), attr_name)
+                expected = definition.GetAttributeDefinition(attr_name)
+                self.assertEqual(attr.GetTypeName(), expected.GetTypeName(), attr_name)
+                self.assertEqual(attr.GetVariability(), expected.GetVariability(), attr_name)
+                self.assertEqual(getattr(wrapper, f"Get{accessor}Attr")(), attr)
+            for rel_name in schema.GetSchemaRelationshipNames():
+                accessor = _accessor(rel_name)
+                rel = getattr(wrapper, f"Create{accessor}Rel")()
+                self.assertEqual(rel.GetName(), rel_name)
+                self.assertEqual(getattr(wrapper, f"Get{accessor}Rel")(), rel)
+
+    def test_tokens(self):
+        self.assertEqual(schemas.Tokens.NewtonJointAPI, "NewtonJointAPI")
+        self.assertEqual(schemas.Tokens.newtonArmature, "newton:armature")
+        self.assertEqual(schemas.Tokens.physicsMasses, "physics:masses")
+        self.assertEqual(schemas.Tokens.gaussSeidelSoa, "gauss-seidel-soa")
+        self.assertIs(schemas.Tokens.newtonArmature, schemas.NewtonJointAPI.GetSchemaAttributeNames()[0])
+
+    def test_apply(self):
+        stage = Usd.Stage.CreateInMemory()
+        joint = UsdPhysics.RevoluteJoint.Define(stage, "/Joint").GetPrim()
+        self.assertFalse(schemas.NewtonJointAPI(joint))
+        self.assertTrue(schemas.NewtonJointAPI.CanApply(joint))
+        api = schemas.NewtonJointAPI.Apply(joint)
+        self.assertTrue(api)
+        self.assertTrue(joint.HasAPI("NewtonJointAPI"))
+        self.assertEqual(api.GetPrim(), joint)
+        self.assertEqual(api.GetPath(), Sdf.Path("/Joint"))
+        self.assertAlmostEqual(api.GetArmatureAttr().Get(), 0.0)
+        api.CreateArmatureAttr(0.5)
+        self.assertAlmostEqual(schemas.NewtonJointAPI.Get(stage, "/Joint").GetArmatureAttr().Get(), 0.5)
+
+        mesh = UsdGeom.Mesh.Define(stage, "/Mesh").GetPrim()
+        self.assertFalse(schemas.NewtonJointAPI.CanApply(mesh))
+        invalid = schemas.NewtonJointAPI.Apply(stage.GetPrimAtPath("/Missing"))
+        self.assertFalse(invalid)
+        self.assertFalse(invalid.GetPrim())
+        self.assertFalse(schemas.NewtonJointAPI.Get(stage, "/Missing"))
+
+    def test_define(self):
+        stage = Usd.Stage.CreateInMemory()
+        array = schemas.NewtonActuatorArray.Define(stage, "/Actuators")
+        self.assertTrue(array)
+        self.assertEqual(array.GetPrim().GetTypeName(), "NewtonActuatorArray")
+        array.CreateTargetsRel().SetTargets([Sdf.Path("/Joint")])
+        array.CreateKpAttr([1.0])
+        self.assertEqual(array.GetTargetsRel().GetTargets(), [Sdf.Path("/Joint")])
+        self.assertEqual(list(array.GetKpAttr().Get()), [1.0])
+        self.assertFalse(schemas.NewtonActuatorArray(stage.DefinePrim("/Xform", "Xform")))
+
+    def test_slots(self):
+        api = schemas.NewtonJointAPI()
+        self.assertFalse(api)
+        with self.assertRaises(AttributeError):
+            api.value = 1
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import multiprocessing
+import unittest
+
+import numpy as np
+from pxr import Gf, Usd, UsdGeom, UsdPhysics
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.actuators import read_actuator_arrays
+from newton_usd_schemas.parsing import load_newton_from_range
+from newton_usd_schemas.particle_io import ParticleArrays
+from newton_usd_schemas.shared import attach_shared_arrays, collect_arrays, export_shared_arrays
+
+
+def _actuator_stage() -> Usd.Stage:
+    stage = Usd.Stage.CreateInMemory()
+    joints = [UsdPhysics.RevoluteJoint.Define(stage, f"/World/Joint{index}").GetPath() for index in range(3)]
+    actuators = stage.DefinePrim("/World/Actuators", "NewtonActuatorArray")
+    actuators.GetRelationship("newton:targets").SetTargets(joints)
+    actuators.GetAttribute("newton:kp").Set([10.0, 20.0, 30.0])
+    actuators.GetAttribute("newton:delaySteps").Set([1, 2, 3])
+    return stage
+
+
+def _worker_sum(manifest: str, queue) -> None:
+    with attach_shared_arrays(manifest) as arrays:
+        queue.put((float(arrays["actuators"]["parameters/kp"].sum()), arrays["particles"]["points"].flags.writeable))
+
+
+class TestSharedArrays(unittest.TestCase):
+    def test_collect_arrays(self):
+        arrays = read_actuator_arrays(_actuator_stage())
+        collected = collect_arrays(arrays)
+        self.assertEqual(set(collected), {"offsets", *(f"parameters/{name}" for name in arrays.parameters)})
+        particles = collect_arrays(ParticleArrays(points=np.zeros((4, 3), dtype=np.float32), ids=np.arange(4)))
+        self.assertEqual(set(particles), {"points", "ids"})
+        self.assertEqual(set(collect_arrays({"a": np.zeros(2), "b": None})), {"a"})
+        with self.assertRaises(TypeError):
+            collect_arrays([np.zeros(2)])
+
+    def test_export_and_attach(self):
+        actuators = read_actuator_arrays(_actuator_stage())
+        materials = np.zeros(3, dtype=[("density", "<f4"), ("friction", "<f4", (2,))])
+        materials["density"] = [1.0, 2.0, 3.0]
+        points = np.arange(12, dtype=np.float32).reshape(4, 3)
+        shared = export_shared_arrays(
+            {"actuators": actuators, "particles": {"points": points, "empty": np.zeros(0)}, "materials": {"table": materials}}
+        )
+        try:
+            manifest = json.loads(json.dumps(shared.manifest))
+            self.assertEqual(set(shared), {"actuators", "particles", "materials"})
+            with attach_shared_arrays(json.dumps(manifest)) as attached:
+                self.assertEqual(attached.name, shared.name)
+                np.testing.assert_array_equal(attached["actuators"]["parameters/kp"], [10.0, 20.0, 30.0])
+                self.assertEqual(attached["actuators"]["parameters/delay_steps"].dtype, np.int32)
+                np.testing.assert_array_equal(attached["particles"]["points"], points)
+                self.assertEqual(attached["particles"]["empty"].shape, (0,))
+                np.testing.assert_array_equal(attached["materials"]["table"]["density"], [1.0, 2.0, 3.0])
+                self.assertEqual(attached["materials"]["table"].dtype, materials.dtype)
+                for group in attached.values():
+                    for array in group.values():
+                        self.assertFalse(array.flags.writeable)
+                        self.assertEqual(array.ctypes.data % 64, attached["actuators"]["offsets"].ctypes.data % 64)
+                with self.assertRaises(ValueError):
+                    attached["particles"]["points"][0, 0] = 1.0
+                # views keep the block mapped, so they are released before it is closed
+                del group, array
+        finally:
+            shared.close()
+        with self.assertRaises(FileNotFoundError):
+            attach_shared_arrays(manifest)
+
+    def test_close_with_views(self):
+        shared = export_shared_arrays({"particles": {"points": np.ones((4, 3), dtype=np.float32)}})
+        manifest = shared.manifest
+        points = shared["particles"]["points"]
+        # the block is unlinked even though a view keeps this process' handle open
+        with self.assertRaises(BufferError):
+            shared.close()
+        with self.assertRaises(FileNotFoundError):
+            attach_shared_arrays(manifest)
+        self.assertEqual(points.sum(), 12.0)
+        del points
+        shared.close()
+
+    def test_export_parse(self):
+        stage = _actuator_stage()
+        for index in range(2):
+            body = UsdGeom.Xform.Define(stage, f"/World/Body{index}").GetPrim()
+            UsdPhysics.RigidBodyAPI.Apply(body)
+            body.ApplyAPI("NewtonMassAPI")
+        stage.GetPrimAtPath("/World/Body1").GetAttribute("physics:principalAxes").Set(Gf.Quatf(0.0, 1.0, 0.0, 0.0))
+        joint = stage.GetPrimAtPath("/World/Joint0")
+        joint.ApplyAPI("NewtonJointAPI")
+        joint.GetAttribute("newton:dof:armature").Set([0.5])
+        parsed = load_newton_from_range(stage, ["/World"])
+        bodies = parsed.descriptors[UsdPhysics.ObjectType.RigidBody]
+        joints = parsed.descriptors[UsdPhysics.ObjectType.RevoluteJoint]
+        self.assertTrue(bodies.values["physics:principalAxes"].dtype.hasobject)
+
+        collected = collect_arrays(joints)
+        self.assertIn("values/newton:armature", collected)
+        # the joints' DOF arrays have different lengths, so they can not be shared
+        self.assertNotIn("values/newton:dof:armature", collected)
+        with export_shared_arrays({"bodies": bodies, "joints": joints, "actuators": parsed.actuators}) as shared:
+            axes = shared["bodies"]["values/physics:principalAxes"]
+            self.assertEqual(axes.dtype, np.float32)
+            # the first body holds the schema fallback
+            np.testing.assert_array_equal(axes, [[0.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]])
+            np.testing.assert_array_equal(shared["bodies"]["applied/NewtonMassAPI"], [True, True])
+            self.assertEqual(shared["actuators"]["values/newton:kp"].shape, (0,))
+            del axes
+        # quaternion columns of mappings are converted as well
+        quaternions = np.empty(1, dtype=object)
+        quaternions[0] = Gf.Quatd(1.0)
+        self.assertEqual(collect_arrays({"axes": quaternions})["axes"].dtype, np.float64)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            export_shared_arrays({"values": {"ragged": np.array([[1.0], [1.0, 2.0]], dtype=object)}})
+        with self.assertRaises(ValueError):
+            attach_shared_arrays({"version": 0})
+
+    def test_other_process(self):
+        points = np.ones((8, 3), dtype=np.float32)
+        with export_shared_arrays({"actuators": read_actuator_arrays(_actuator_stage()), "particles": {"points": points}}) as shared:
+            context = multiprocessing.get_context("spawn")
+            queue = context.Queue()
+            process = context.Process(target=_worker_sum, args=(json.dumps(shared.manifest), queue))
+            process.start()
+            total, writeable = queue.get(timeout=60)
+            process.join(timeout=60)
+            self.assertEqual(process.exitcode, 0)
+            self.assertEqual(total, 60.0)
+            self.assertFalse(writeable)
+            # the block outlives the worker, which does not own it
+            with attach_shared_arrays(shared.manifest) as attached:
+                self.assertEqual(attached["particles"]["points"].sum(), 24.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import pathlib
+import tempfile
+import unittest
+
+from pxr import Sdf, Usd, UsdPhysics, Vt
+
+import newton_usd_schemas  # noqa: F401
+from newton_usd_schemas.sweeps import iter_scene_sweep, write_rheology_sweep, write_sweep_manifest
+
+SAND_FIXTURE = pathlib.Path(__file__).parent / "assets" / "sand.usda"
+
+
+class TestRheologySweep(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = pathlib.Path(self.tmpdir.name)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_variants(self):
+        sequences = [["auto"], ["jacobi", "conjugate-gradient"]]
+        variants = write_rheology_sweep(SAND_FIXTURE, self.root / "sweep", sequences, tolerances=[1e-3, 1e-5], max_iterations=[50])
+        self.assertEqual(len(variants), 4)
+        self.assertEqual([variant.name for variant in variants], ["variant0000", "variant0001", "variant0002", "variant0003"])
+        self.assertEqual(
+            variants[3].parameters,
+            {"newton:mpm:rheologySolvers": ["jacobi", "conjugate-gradient"], "newton:mpm:tolerance": 1e-5, "newton:maxSolverIterations": 50},
+        )
+
+        stage = Usd.Stage.Open(variants[3].path.as_posix())
+        scene = stage.GetPrimAtPath("/World/PhysicsScene")
+        self.assertEqual(scene.GetAttribute("newton:mpm:rheologySolvers").Get(), Vt.TokenArray(["jacobi", "conjugate-gradient"]))
+        self.assertAlmostEqual(scene.GetAttribute("newton:mpm:tolerance").Get(), 1e-5)
+        self.assertEqual(scene.GetAttribute("newton:maxSolverIterations").Get(), 50)
+        # everything else is composed from the unmodified asset
+        self.assertAlmostEqual(scene.GetAttribute("newton:mpm:voxelSize").Get(), 0.05)
+        self.assertTrue(stage.GetPrimAtPath("/World/Sand"))
+
+        # variant layers only author the swept attributes
+        layer = Sdf.Layer.FindOrOpen(variants[3].path.as_posix())
+        self.assertEqual(layer.GetPrimAtPath("/World").specifier, Sdf.SpecifierOver)
+        self.assertEqual(len(layer.GetPrimAtPath("/World/PhysicsScene").attributes), 3)
+
+    def test_manifest(self):
+        variants = write_rheology_sweep(SAND_FIXTURE, self.root, [["gauss-seidel"], ["auto"]])
+        manifest = json.loads((self.root / "manifest.json").read_text())
+        self.assertEqual(manifest["scene"], "/World/PhysicsScene")
+        self.assertEqual((self.root / manifest["asset"]).resolve(), SAND_FIXTURE.resolve())
+        self.assertEqual([entry["layer"] for entry in manifest["variants"]], [variant.path.name for variant in variants])
+        self.assertEqual(manifest["variants"][1]["parameters"], {"newton:mpm:rheologySolvers": ["auto"]})
+
+        # unswept parameters keep the authored values
+        stage = Usd.Stage.Open(variants[0].path.as_posix())
+        self.assertEqual(stage.GetPrimAtPath("/World/PhysicsScene").GetAttribute("newton:maxSolverIterations").Get(), 100)
+
+        # sweeps can be regenerated in place
+        variants = write_rheology_sweep(SAND_FIXTURE, self.root, [["jacobi"]])
+        stage.Reload()
+        self.assertEqual(stage.GetPrimAtPath("/World/PhysicsScene").GetAttribute("newton:mpm:rheologySolvers").Get(), Vt.TokenArray(["jacobi"]))
+
+    def test_invalid_values(self):
+        with self.assertRaisesRegex(ValueError, "at least one solver"):
+            write_rheology_sweep(SAND_FIXTURE, self.root, [[]])
+        with self.assertRaisesRegex(ValueError, "multigrid"):
+            write_rheology_sweep(SAND_FIXTURE, self.root, [["jacobi", "multigrid"]])
+        with self.assertRaisesRegex(ValueError, "newton:mpm:tolerance"):
+            write_rheology_sweep(SAND_FIXTURE, self.root, [["auto"]], tolerances=[-1.0])
+        with self.assertRaisesRegex(ValueError, "newton:maxSolverIterations"):
+            write_rheology_sweep(SAND_FIXTURE, self.root, [["auto"]], max_iterations=[-2])
+        self.assertFalse((self.root / "manifest.json").exists())
+
+    def test_scene_path(self):
+        asset = self.root / "two_scenes.usda"
+        stage = Usd.Stage.CreateNew(asset.as_posix())
+        for path in ("/First", "/Second"):
+            UsdPhysics.Scene.Define(stage, path).GetPrim().ApplyAPI("NewtonMPMSceneAPI")
+        stage.Save()
+
+        with self.assertRaisesRegex(ValueError, "found 2"):
+            write_rheology_sweep(asset, self.root / "sweep", [["auto"]])
+        variants = write_rheology_sweep(asset, self.root / "sweep", [["jacobi"]], scene_path="/Second")
+        composed = Usd.Stage.Open(variants[0].path.as_posix())
+        self.assertEqual(composed.GetPrimAtPath("/Second").GetAttribute("newton:mpm:rheologySolvers").Get(), Vt.TokenArray(["jacobi"]))
+        self.assertEqual(composed.GetPrimAtPath("/First").GetAttribute("newton:mpm:rheologySolvers").Get(), Vt.TokenArray(["auto"]))
+
+
+class TestSceneSweep(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = pathlib.Path(self.tmpdir.name)
+        self.asset = self.root / "scene.usda"
+        stage = Usd.Stage.CreateNew(self.asset.as_posix())
+        UsdPhysics.Scene.Define(stage, "/World/Xpbd").GetPrim().ApplyAPI("NewtonXpbdSceneAPI")
+        UsdPhysics.Scene.Define(stage, "/World/Kamino").GetPrim().ApplyAPI("NewtonKaminoSceneAPI")
+        stage.GetPrimAtPath("/World/Kamino").GetAttribute("newton:kamino:padmm:warmstarting").Set("none")
+        stage.Save()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_anonymous_variants(self):
+        grid = {"newton:xpbd:softBodyRelaxation": [0.5, 1.5], "newton:xpbd:jointLinearCompliance": [-1.0, 1e-4]}
+        variants = iter_scene_sweep(self.asset, "NewtonXpbdSceneAPI", grid)
+        first = next(variants)
+        self.assertEqual(first.scene_path, Sdf.Path("/World/Xpbd"))
+        self.assertIsNone(first.path)
+        # values are clamped to the hard limits
+        self.assertEqual(first.parameters, {"newton:xpbd:softBodyRelaxation": 0.5, "newton:xpbd:jointLinearCompliance": 0.0})
+        # every variant shares the asset layer, which is kept open by the generator
+        base = Sdf.Layer.Find(self.asset.as_posix())
+        self.assertIsNotNone(base)
+        stages = []
+        for variant in [first, *variants]:
+            stages.append(Usd.Stage.Open(variant.identifier))
+            self.assertIn(base, stages[-1].GetLayerStack())
+        self.assertEqual(len(stages), 4)
+        self.assertEqual(variant.parameters, {"newton:xpbd:softBodyRelaxation": 1.0, "newton:xpbd:jointLinearCompliance": 1e-4})
+        scene = stages[-1].GetPrimAtPath("/World/Xpbd")
+        self.assertAlmostEqual(scene.GetAttribute("newton:xpbd:softBodyRelaxation").Get(), 1.0)
+        self.assertAlmostEqual(scene.GetAttribute("newton:xpbd:jointLinearCompliance").Get(), 1e-4)
+        self.assertAlmostEqual(scene.GetAttribute("newton:xpbd:softContactRelaxation").Get(), 0.9)
+        # nothing is written to disk
+        self.assertEqual(list(self.root.iterdir()), [self.asset])
+
+    def test_streamed_variants(self):
+        parameters = (
+            {"newton:kamino:padmm:primalTolerance": tolerance, "newton:kamino:padmm:useAcceleration": tolerance > 1e-8}
+            for tolerance in (1e-4, 1e-6, 0.0)
+        )
+        variants = iter_scene_sweep(self.asset, "NewtonKaminoSceneAPI", parameters, output_dir=self.root / "sweep")
+        first = next(variants)
+        self.assertEqual(sorted(path.name for path in (self.root / "sweep").iterdir()), ["scene.variant0000.usda"])
+
+        listed = write_sweep_manifest(self.root / "manifest.json", [first, *variants])
+        self.assertEqual(len(listed), 3)
+        self.assertAlmostEqual(listed[2].parameters["newton:kamino:padmm:primalTolerance"], 1e-10, delta=1e-16)
+        manifest = json.loads((self.root / "manifest.json").read_text())
+        self.assertEqual(manifest["asset"], "scene.usda")
+        self.assertEqual(manifest["scene"], "/World/Kamino")
+        self.assertEqual(manifest["variants"][1]["layer"], "sweep/scene.variant0001.usda")
+
+        stage = Usd.Stage.Open((self.root / manifest["variants"][2]["layer"]).as_posix())
+        scene = stage.GetPrimAtPath("/World/Kamino")
+        self.assertAlmostEqual(scene.GetAttribute("newton:kamino:padmm:primalTolerance").Get(), 1e-10)
+        self.assertFalse(scene.GetAttribute("newton:kamino:padmm:useAcceleration").Get())
+        self.assertEqual(scene.GetAttribute("newton:kamino:padmm:warmstarting").Get(), "none")
+
+    def test_inherited_and_token_attributes(self):
+        grid = {"newton:maxSolverIterations": [-5, 10], "newton:kamino:padmm:warmstarting": ["internal"]}
+        variants = list(iter_scene_sweep(self.asset, "NewtonKaminoSceneAPI", grid))
+        self.assertEqual([variant.parameters["newton:maxSolverIterations"] for variant in variants], [-1, 10])
+        stage = Usd.Stage.Open(variants[1].identifier)
+        self.assertEqual(stage.GetPrimAtPath("/World/Kamino").GetAttribute("newton:kamino:padmm:warmstarting").Get(), "internal")
+
+    def test_invalid_sweeps(self):
+        with self.assertRaisesRegex(ValueError, "bogus"):
+            next(iter_scene_sweep(self.asset, "NewtonXpbdSceneAPI", {"newton:xpbd:bogus": [1.0]}))
+        with self.assertRaisesRegex(ValueError, "does not allow"):
+            next(iter_scene_sweep(self.asset, "NewtonKaminoSceneAPI", {"newton:kamino:padmm:warmstarting": ["always"]}))
+        with self.assertRaisesRegex(ValueError, "not a registered"):
+            next(iter_scene_sweep(self.asset, "NewtonBogusSceneAPI", {}))
+        with self.assertRaisesRegex(ValueError, "not a registered"):
+            next(iter_scene_sweep(self.asset, "PhysicsScene", {}))
+        with self.assertRaisesRegex(ValueError, "found 0"):
+            next(iter_scene_sweep(self.asset, "NewtonMPMSceneAPI", {}))
+        anonymous = iter_scene_sweep(self.asset, "NewtonXpbdSceneAPI", {"newton:xpbd:angularDamping": [0.1]})
+        with self.assertRaisesRegex(ValueError, "anonymous"):
+            write_sweep_manifest(self.root / "manifest.json", anonymous)
+
+
+if __name__ == "__main__":
+    unittest.main()
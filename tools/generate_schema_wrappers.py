@@ -0,0 +1,268 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Generate `newton_usd_schemas/schemas.py`, typed Python wrappers of the codeless Newton schemas.
+
+The wrappers are generated from `generatedSchema.usda` and `plugInfo.json`, and must be
+regenerated whenever either changes. Use `--check` to verify that the generated module is
+up to date.
+"""
+
+import argparse
+import json
+import keyword
+import pathlib
+import re
+import sys
+import textwrap
+
+from pxr import Sdf
+
+PACKAGE = pathlib.Path(__file__).parent.parent / "newton_usd_schemas"
+OUTPUT = PACKAGE / "schemas.py"
+
+HEADER = '''# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Typed wrappers of the Newton schemas.
+
+GENERATED FILE: do not edit. Run `python tools/generate_schema_wrappers.py` to regenerate it
+from `generatedSchema.usda` whenever the schemas change.
+
+The Newton schemas are codeless, so this module provides lightweight wrapper classes in the
+style of the compiled USD schema classes, e.g. `NewtonJointAPI(prim).GetArmatureAttr()` or
+`NewtonJointAPI.Apply(prim)`. Every schema, property and allowed token name is a constant of
+`Tokens`, interned once at import, so loops never build or retype property names.
+
+The USD Python bindings convert names to `TfToken` on every call, so hot loops should resolve
+an attribute once (e.g. with `Get*Attr`) and reuse the `Usd.Attribute`, rather than looking it
+up by name per prim and per frame.
+"""
+
+import sys
+from typing import TypeVar
+
+from pxr import Sdf, Usd
+
+__all__ = [
+{exports}
+]
+
+_Schema = TypeVar("_Schema", bound="_SchemaBase")
+
+
+class Tokens:
+    """The names of the Newton schemas, their properties and allowed token values."""
+
+    __slots__ = ()
+
+{tokens}
+
+
+class _SchemaBase:
+    __slots__ = ("_prim",)
+
+    schemaName = ""
+    _attributeNames: tuple[str, ...] = ()
+    _relationshipNames: tuple[str, ...] = ()
+
+    def __init__(self, prim: Usd.Prim | None = None):
+        self._prim = Usd.Prim() if prim is None else prim
+
+    def __repr__(self) -> str:
+        return f"{{type(self).__name__}}({{self._prim}})"
+
+    def GetPrim(self) -> Usd.Prim:
+        """Get the wrapped prim."""
+        return self._prim
+
+    def GetPath(self) -> Sdf.Path:
+        """Get the path of the wrapped prim."""
+        return self._prim.GetPath()
+
+    @classmethod
+    def Get(cls: type[_Schema], stage: Usd.Stage, path: Sdf.Path | str) -> _Schema:
+        """Wrap the prim at `path` on `stage`, which may be invalid."""
+        return cls(stage.GetPrimAtPath(path))
+
+    @classmethod
+    def GetSchemaAttributeNames(cls) -> tuple[str, ...]:
+        """Get the names of the attributes declared by this schema, excluding those of included API schemas."""
+        return cls._attributeNames
+
+    @classmethod
+    def GetSchemaRelationshipNames(cls) -> tuple[str, ...]:
+        """Get the names of the relationships declared by this schema, excluding those of included API schemas."""
+        return cls._relationshipNames
+
+    def _CreateAttr(self, name: str, type_name: Sdf.ValueTypeName, variability: Sdf.Variability, default_value) -> Usd.Attribute:
+        attr = self._prim.CreateAttribute(name, type_name, False, variability)
+        if default_value is not None:
+            attr.Set(default_value)
+        return attr
+
+
+class _APISchemaBase(_SchemaBase):
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return self._prim.IsValid() and self._prim.HasAPI(self.schemaName)
+
+    @classmethod
+    def CanApply(cls, prim: Usd.Prim) -> bool:
+        """Check whether the schema can be applied to `prim`."""
+        return prim.CanApplyAPI(cls.schemaName)
+
+    @classmethod
+    def Apply(cls: type[_Schema], prim: Usd.Prim) -> _Schema:
+        """Apply the schema to `prim`, returning an invalid wrapper if it could not be applied."""
+        return cls(prim) if prim.IsValid() and prim.ApplyAPI(cls.schemaName) else cls()
+
+
+class _TypedSchemaBase(_SchemaBase):
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return self._prim.IsValid() and self._prim.IsA(self.schemaName)
+
+    @classmethod
+    def Define(cls: type[_Schema], stage: Usd.Stage, path: Sdf.Path | str) -> _Schema:
+        """Define a prim of this type at `path` on `stage`."""
+        return cls(stage.DefinePrim(path, cls.schemaName))
+'''
+
+
+def _identifier(name: str, capitalize: bool) -> str:
+    words = [word for word in re.split(r"[^0-9A-Za-z]+", name) if word]
+    identifier = "".join(word[0].upper() + word[1:] for word in words)
+    if not capitalize:
+        identifier = identifier[0].lower() + identifier[1:]
+    return identifier
+
+
+def _accessor(name: str) -> str:
+    # the namespace prefix (e.g. `newton:`) is implied by the schema
+    return _identifier(name.split(":", 1)[1] if ":" in name else name, capitalize=True)
+
+
+def _value_type_names() -> dict[str, str]:
+    names = {}
+    for attr in dir(Sdf.ValueTypeNames):
+        value = getattr(Sdf.ValueTypeNames, attr)
+        if isinstance(value, Sdf.ValueTypeName):
+            names.setdefault(str(value), attr)
+    return names
+
+
+def _docstring(doc: str) -> str:
+    paragraph = doc.strip().split("\n\n")[0]
+    summary = " ".join(line.strip() for line in paragraph.splitlines()).replace('"""', "'''").replace("\\", "\\\\")
+    if len(summary) + 10 <= 150:
+        return f'    """{summary}"""'
+    lines = textwrap.wrap(summary, width=142)
+    return '    """' + lines[0] + "".join(f"\n    {line}" for line in lines[1:]) + '\n    """'
+
+
+def generate() -> str:
+    """Generate the source of the wrapper module."""
+    layer = Sdf.Layer.OpenAsAnonymous((PACKAGE / "generatedSchema.usda").as_posix())
+    plugin_types = json.loads((PACKAGE / "plugInfo.json").read_text())["Plugins"][0]["Info"]["Types"]
+    kinds = {info["schemaIdentifier"]: info["schemaKind"] for info in plugin_types.values()}
+    type_names = _value_type_names()
+
+    tokens: dict[str, str] = {}
+
+    def token(value: str, capitalize: bool = False) -> str:
+        identifier = _identifier(value, capitalize) if not capitalize else value
+        if identifier[0].isdigit() or keyword.iskeyword(identifier):
+            identifier = f"_{identifier}"
+        if tokens.setdefault(identifier, value) != value:
+            raise ValueError(f"`{value}` and `{tokens[identifier]}` have the same token identifier `{identifier}`")
+        return identifier
+
+    classes = []
+    for prim in layer.rootPrims:
+        schema = prim.name
+        if schema not in kinds:
+            continue
+        schema_token = token(schema, capitalize=True)
+        base = "_TypedSchemaBase" if kinds[schema] == "concreteTyped" else "_APISchemaBase"
+        attributes = []
+        relationships = []
+        methods = []
+        for prop in prim.properties:
+            name = prop.name
+            name_token = token(name)
+            accessor = _accessor(name)
+            if isinstance(prop, Sdf.AttributeSpec):
+                attributes.append(name_token)
+                for allowed in prop.GetInfo("allowedTokens") if prop.HasInfo("allowedTokens") else ():
+                    token(allowed)
+                variability = "Sdf.VariabilityUniform" if prop.variability == Sdf.VariabilityUniform else "Sdf.VariabilityVarying"
+                uniform = "uniform " if prop.variability == Sdf.VariabilityUniform else ""
+                methods.append(f"""
+    def Get{accessor}Attr(self) -> Usd.Attribute:
+        \"\"\"Get the `{uniform}{prop.typeName} {name}` attribute.\"\"\"
+        return self._prim.GetAttribute(Tokens.{name_token})
+
+    def Create{accessor}Attr(self, defaultValue=None) -> Usd.Attribute:
+        \"\"\"Create the `{name}` attribute, and set its value if `defaultValue` is not `None`.\"\"\"
+        return self._CreateAttr(Tokens.{name_token}, Sdf.ValueTypeNames.{type_names[str(prop.typeName)]}, {variability}, defaultValue)
+""")
+            else:
+                relationships.append(name_token)
+                methods.append(f"""
+    def Get{accessor}Rel(self) -> Usd.Relationship:
+        \"\"\"Get the `{name}` relationship.\"\"\"
+        return self._prim.GetRelationship(Tokens.{name_token})
+
+    def Create{accessor}Rel(self) -> Usd.Relationship:
+        \"\"\"Create the `{name}` relationship.\"\"\"
+        return self._prim.CreateRelationship(Tokens.{name_token}, False)
+""")
+
+        def names(items: list[str]) -> str:
+            if not items:
+                return "()"
+            return "(" + ", ".join(f"Tokens.{item}" for item in items) + ("," if len(items) == 1 else "") + ")"
+
+        body = [
+            _docstring(prim.documentation),
+            "",
+            "    __slots__ = ()",
+            "",
+            f"    schemaName = Tokens.{schema_token}",
+        ]
+        attribute_names = names(attributes)
+        relationship_names = names(relationships)
+        for field, value in (("_attributeNames", attribute_names), ("_relationshipNames", relationship_names)):
+            if value == "()":
+                continue
+            line = f"    {field} = {value}"
+            if len(line) > 150:
+                items = value[1:-1].split(", ")
+                line = f"    {field} = (\n" + "".join(f"        {item.rstrip(',')},\n" for item in items) + "    )"
+            body.append(line)
+        classes.append(f"\n\nclass {schema}({base}):\n" + "\n".join(body) + "\n" + "".join(methods))
+
+    exports = "\n".join(f'    "{name}",' for name in sorted([*(prim.name for prim in layer.rootPrims if prim.name in kinds), "Tokens"]))
+    token_lines = "\n".join(f'    {identifier} = sys.intern("{value}")' for identifier, value in tokens.items())
+    return HEADER.format(exports=exports, tokens=token_lines) + "".join(classes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--check", action="store_true", help="check that the generated module is up to date, without writing it")
+    args = parser.parse_args()
+
+    source = generate()
+    if args.check:
+        if not OUTPUT.exists() or OUTPUT.read_text() != source:
+            print(f"{OUTPUT} is out of date, run `python tools/generate_schema_wrappers.py`", file=sys.stderr)
+            sys.exit(1)
+        return
+    OUTPUT.write_text(source)
+
+
+if __name__ == "__main__":
+    main()